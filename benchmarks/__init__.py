@@ -0,0 +1,3 @@
+"""
+Benchmark suite for the hot paths of the backtesting engine, run with `invoke bench` or `python -m benchmarks`.
+"""
@@ -0,0 +1,29 @@
+"""
+This module defines constants used by the benchmark suite.
+"""
+
+import os
+
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)  # bars per dataset
+QUICK_SIZES = (1_000, 10_000)
+ENGINE_MAX_BARS = 100_000  # the engine's per-bar loop takes minutes on larger datasets
+CACHE_MAX_BARS = 1_000_000  # every cache write pickles the whole cache file
+
+DEFAULT_REPEAT = 5  # timed repetitions of each case; the fastest is compared against the baseline
+LARGE_CASE_REPEAT = 3  # for cases on more than LARGE_CASE_BARS bars
+LARGE_CASE_BARS = 100_000
+
+QUEUE_SIMS = 16  # sims per queue in the QueueManager throughput cases
+QUEUE_SIM_DATES = ("2015-01-01", "2020-01-01")
+
+STRONG_SCALING_SIMS = 32  # total sims at every worker count in the strong scaling sweep
+WEAK_SCALING_SIMS_PER_WORKER = 4  # sims per worker in the weak scaling sweep
+SCALING_REPEAT = 3  # timed runs at each worker count; the fastest is reported
+SCALING_EFFICIENCY_TARGET = 0.8  # parallel efficiency below which a worker count is reported as no longer scaling
+
+DEFAULT_THRESHOLD = 0.25  # a case regresses when it is this much slower than the baseline
+MIN_REGRESSION_SECONDS = 0.001  # and slower by at least this, so timer noise on tiny cases does not fail a run
+
+RESULTS_DIR = os.path.join("benchmarks", "results")
+BASELINE_FILE = os.path.join("benchmarks", "baseline.json")
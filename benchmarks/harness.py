@@ -0,0 +1,196 @@
+"""
+This module implements the timing, result storage and baseline comparison of the benchmark suite.
+
+Each case is timed over several repetitions, with an untimed setup before each one, and the fastest repetition is
+what is compared against the baseline: it is the least disturbed by whatever else the machine was doing. Results are
+stored as JSON with a description of the machine they were measured on, since a baseline only means something on the
+machine it was recorded on.
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.constants import DEFAULT_REPEAT, MIN_REGRESSION_SECONDS
+
+
+@dataclass
+class BenchmarkCase:
+    name: str  # e.g. "strategy.sma_crossover"
+    params: dict[str, Any]
+    run: Callable[[Any], Any]  # timed; receives what setup returned
+    setup: Callable[[], Any] = lambda: None  # untimed, before every repetition
+    repeat: int = DEFAULT_REPEAT
+    warmup: bool = False  # run once, untimed, before the repetitions
+    items: Optional[int] = None  # units of work per repetition (e.g. sims), to report a throughput
+    skip_reason: Optional[str] = None  # why the case is not run at these params; it is recorded as skipped instead
+
+    @property
+    def key(self) -> str:
+        params = ",".join(f"{name}={value}" for name, value in self.params.items())
+        return f"{self.name}[{params}]"
+
+
+@dataclass
+class BenchmarkResult:
+    key: str
+    name: str
+    params: dict[str, Any]
+    times: list[float]  # seconds per repetition
+    min: float = 0.0
+    median: float = 0.0
+    mean: float = 0.0
+    stdev: float = 0.0
+    throughput: Optional[float] = None  # items per second, from the fastest repetition
+
+    def __post_init__(self) -> None:
+        self.min = min(self.times)
+        self.median = statistics.median(self.times)
+        self.mean = statistics.fmean(self.times)
+        self.stdev = statistics.stdev(self.times) if len(self.times) > 1 else 0.0
+
+
+@dataclass
+class Regression:
+    key: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+
+@dataclass
+class SkippedCase:
+    key: str
+    reason: str
+
+
+@dataclass
+class BenchmarkRun:
+    machine: dict[str, Any]
+    created: str
+    results: list[BenchmarkResult] = field(default_factory=list)
+    skipped: list[SkippedCase] = field(default_factory=list)
+
+
+def run_case(case: BenchmarkCase) -> BenchmarkResult:
+    """Time a case over its repetitions."""
+    if case.warmup:
+        case.run(case.setup())
+
+    times = []
+    for _ in range(case.repeat):
+        state = case.setup()
+        start = time.perf_counter()
+        case.run(state)
+        times.append(time.perf_counter() - start)
+
+    result = BenchmarkResult(key=case.key, name=case.name, params=case.params, times=times)
+    if case.items:
+        result.throughput = case.items / result.min
+    return result
+
+
+def _get_cpu_model() -> str:
+    try:
+        with open("/proc/cpuinfo", "r") as file:
+            for line in file:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or "unknown"
+
+
+def _get_git_commit() -> Optional[str]:
+    try:
+        output = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip()
+
+
+def get_machine_info() -> dict[str, Any]:
+    """What a result depends on besides the code: hardware, operating system and library versions."""
+    total_memory = None
+    if hasattr(os, "sysconf") and "SC_PHYS_PAGES" in os.sysconf_names:
+        total_memory = os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    return {
+        "cpu_model": _get_cpu_model(),
+        "cpu_count": os.cpu_count(),
+        "usable_cpus": len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count(),
+        "total_memory": total_memory,
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "git_commit": _get_git_commit(),
+    }
+
+
+def new_run() -> BenchmarkRun:
+    return BenchmarkRun(machine=get_machine_info(), created=datetime.now(timezone.utc).isoformat())
+
+
+def save_run(run: BenchmarkRun, path: str) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w") as file:
+        json.dump(asdict(run), file, indent=2)
+
+
+def load_run(path: str) -> BenchmarkRun:
+    with open(path, "r") as file:
+        fields = json.load(file)
+    results = [BenchmarkResult(**result) for result in fields.pop("results")]
+    skipped = [SkippedCase(**case) for case in fields.pop("skipped", [])]
+    return BenchmarkRun(**fields, results=results, skipped=skipped)
+
+
+def get_threshold(key: str, threshold: float, overrides: dict[str, float]) -> float:
+    """The threshold of a case: that of the longest override naming a prefix of its key, or the default."""
+    matches = [prefix for prefix in overrides if key.startswith(prefix)]
+    return overrides[max(matches, key=len)] if matches else threshold
+
+
+def compare_runs(
+    current: BenchmarkRun,
+    baseline: BenchmarkRun,
+    threshold: float,
+    overrides: Optional[dict[str, float]] = None,
+    min_seconds: float = MIN_REGRESSION_SECONDS,
+) -> list[Regression]:
+    """
+    The cases of the current run that are slower than in the baseline by more than their threshold, a fraction of
+    the baseline's time, and by at least min_seconds. Cases missing from either run are not compared.
+    """
+    baseline_times = {result.key: result.min for result in baseline.results}
+    regressions = []
+    for result in current.results:
+        if result.key not in baseline_times:
+            continue
+        allowed = baseline_times[result.key] * (1 + get_threshold(result.key, threshold, overrides or {}))
+        if result.min > allowed and result.min - baseline_times[result.key] >= min_seconds:
+            regressions.append(Regression(result.key, baseline_times[result.key], result.min))
+    return regressions
+
+
+def get_machine_differences(current: BenchmarkRun, baseline: BenchmarkRun) -> list[str]:
+    """Hardware and library differences that make a comparison with the baseline unreliable."""
+    keys = ["cpu_model", "usable_cpus", "python", "numpy", "pandas"]
+    return [
+        f"{key}: {baseline.machine.get(key)} -> {current.machine.get(key)}"
+        for key in keys
+        if current.machine.get(key) != baseline.machine.get(key)
+    ]
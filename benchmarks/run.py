@@ -0,0 +1,140 @@
+"""
+Run the benchmark suite, store its results and compare them against a baseline.
+
+    python -m benchmarks                        # every case, compared against benchmarks/baseline.json
+    python -m benchmarks --quick                # small sizes only, for a quick check
+    python -m benchmarks --filter strategy.     # only the cases whose key contains "strategy."
+    python -m benchmarks --save-baseline        # make this run the baseline
+    python -m benchmarks --threshold 0.1 --threshold-for queue.=0.5
+
+Results are written to benchmarks/results/<timestamp>.json. The run exits with status 1 when any case is slower than
+its baseline by more than its threshold.
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import tempfile
+
+from datetime import datetime
+from typing import Optional
+
+from backtesting_engine.constants import PACKAGE_LOGGER
+from benchmarks.constants import BASELINE_FILE, DEFAULT_SIZES, DEFAULT_THRESHOLD, QUICK_SIZES, RESULTS_DIR
+from benchmarks.harness import (
+    BenchmarkResult,
+    SkippedCase,
+    compare_runs,
+    get_machine_differences,
+    load_run,
+    new_run,
+    run_case,
+    save_run,
+)
+from benchmarks.suite import build_suite, get_worker_counts
+
+
+def parse_threshold_overrides(values: list[str]) -> dict[str, float]:
+    """Thresholds by key prefix from PREFIX=THRESHOLD values, e.g. "queue.=0.5"."""
+    overrides = {}
+    for value in values:
+        prefix, _, threshold = value.partition("=")
+        if not prefix or not threshold:
+            raise argparse.ArgumentTypeError(f"Expected PREFIX=THRESHOLD, got {value!r}")
+        try:
+            overrides[prefix] = float(threshold)
+        except ValueError as e:
+            raise argparse.ArgumentTypeError(
+                f"Expected a number as the threshold of {prefix!r}, got {threshold!r}"
+            ) from e
+        if overrides[prefix] < 0:
+            raise argparse.ArgumentTypeError(f"Expected a threshold of at least 0 for {prefix!r}, got {threshold!r}")
+    return overrides
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark the engine's hot paths.")
+    parser.add_argument("--quick", action="store_true", help=f"only run the sizes {QUICK_SIZES}")
+    parser.add_argument("--sizes", type=int, nargs="+", help=f"dataset sizes in bars (default {DEFAULT_SIZES})")
+    parser.add_argument("--workers", type=int, help="most workers in the queue cases (default: usable CPUs, 0 to skip)")
+    parser.add_argument("--filter", default="", help="only run cases whose key contains this")
+    parser.add_argument("--output", help="results file (default benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="results to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="also write the results to the baseline file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed slowdown, e.g. 0.25")
+    parser.add_argument(
+        "--threshold-for", action="append", default=[], metavar="PREFIX=THRESHOLD", help="threshold of some cases"
+    )
+    args = parser.parse_args(argv)
+    try:  # checked before the suite runs rather than once it is over
+        args.threshold_overrides = parse_threshold_overrides(args.threshold_for)
+    except argparse.ArgumentTypeError as error:
+        parser.error(str(error))
+    return args
+
+
+def format_result(result: BenchmarkResult) -> str:
+    line = f"  {result.key:<58} min {result.min * 1000:10.3f}ms  median {result.median * 1000:10.3f}ms"
+    if result.throughput is not None:
+        line += f"  {result.throughput:8.2f}/s"
+    return line
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+    logging.getLogger(PACKAGE_LOGGER).setLevel(logging.WARNING)  # only the results are printed, not each sim's progress
+    sizes = args.sizes or (QUICK_SIZES if args.quick else DEFAULT_SIZES)
+    usable_cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+    max_workers = usable_cpus if args.workers is None else args.workers
+    worker_counts = get_worker_counts(max_workers) if max_workers > 0 else []
+    if args.quick:
+        worker_counts = worker_counts[:1]
+
+    run = new_run()
+    work_dir = tempfile.mkdtemp(prefix="btx_bench_")
+    print(f"Benchmarking on {run.machine['cpu_model']} ({run.machine['usable_cpus']} usable CPUs):")
+    try:
+        for case in build_suite(sizes, worker_counts, work_dir):
+            if args.filter not in case.key:
+                continue
+            if case.skip_reason:
+                run.skipped.append(SkippedCase(case.key, case.skip_reason))
+                print(f"  {case.key:<58} skipped, {case.skip_reason}", flush=True)
+                continue
+            result = run_case(case)
+            run.results.append(result)
+            print(format_result(result), flush=True)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{datetime.now():%Y%m%d_%H%M%S}.json")
+    save_run(run, output)
+    if run.skipped:
+        print(f"\n{len(run.skipped)} case(s) skipped at sizes beyond their limit, listed in the results file.")
+    print(f"\nResults written to {output}")
+    if args.save_baseline:
+        save_run(run, args.baseline)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to record one.")
+        return 0
+
+    baseline = load_run(args.baseline)
+    for difference in get_machine_differences(run, baseline):
+        print(f"Warning: the baseline was recorded on a different setup ({difference})")
+
+    regressions = compare_runs(run, baseline, args.threshold, args.threshold_overrides)
+    if not regressions:
+        print(f"No regressions against {args.baseline}.")
+        return 0
+
+    print(f"\n{len(regressions)} regression(s) against {args.baseline}:")
+    for regression in regressions:
+        print(
+            f"  {regression.key:<58} {regression.baseline * 1000:10.3f}ms -> {regression.current * 1000:10.3f}ms "
+            f"({regression.ratio:.2f}x)"
+        )
+    return 1
@@ -0,0 +1,219 @@
+"""
+Measure how QueueManager scales with the number of its workers.
+
+    python -m benchmarks.scaling                             # strong and weak scaling at 1, 2, 4, ... usable CPUs
+    python -m benchmarks.scaling --mode strong --workers 1 2 3 4 --sims 64
+    python -m benchmarks.scaling --mode weak --sims-per-worker 8
+
+Strong scaling runs the same queue at every worker count, so ideally n workers finish it in 1/n of the time one takes.
+Weak scaling gives every worker the same number of sims, so ideally n workers take as long as one. Speedup and
+parallel efficiency are relative to the smallest worker count of the sweep.
+
+The worker time of a run, its wall time times its workers, is split into starting the workers, loading data, computing
+backtests, storing their output and what is left: the queue's overhead of dispatching sims, passing results back and
+workers waiting for work. Each run starts its workers afresh, on a data cache filled by an untimed first run.
+
+Results are written to benchmarks/results/scaling_<timestamp>.json.
+"""
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Optional
+
+from backtesting_engine.constants import COMPUTE_STAGES, LOAD_STAGE, OUTPUT_STAGE, PACKAGE_LOGGER, PLOTTING_STAGE
+from backtesting_engine.managers import QueueManager
+from benchmarks.constants import (
+    RESULTS_DIR,
+    SCALING_EFFICIENCY_TARGET,
+    SCALING_REPEAT,
+    STRONG_SCALING_SIMS,
+    WEAK_SCALING_SIMS_PER_WORKER,
+)
+from benchmarks.harness import get_machine_info
+from benchmarks.suite import get_worker_counts, write_queue_file
+
+
+STRONG = "strong"
+WEAK = "weak"
+STARTUP = "startup"
+QUEUE = "queue"
+LOAD = "load"
+COMPUTE = "compute"  # the engine's signals, execution and metrics stages
+OUTPUT = "output"  # rendering plots and storing results
+SHARES = (STARTUP, QUEUE, LOAD, COMPUTE, OUTPUT)
+
+
+@dataclass
+class ScalingPoint:
+    mode: str
+    workers: int
+    sims: int
+    wall: float  # seconds from the start of run_all to its return
+    startup: float  # seconds taken to start the workers
+    load: float  # seconds spent loading data, summed over the sims
+    compute: float
+    output: float
+    speedup: float = 0.0
+    efficiency: float = 0.0
+
+    @property
+    def worker_seconds(self) -> float:
+        return self.wall * self.workers
+
+    def get_shares(self) -> dict[str, float]:
+        """The share of the worker time spent in each part of the run."""
+        startup = self.startup * self.workers  # every worker is idle until all of them have started
+        queue = max(self.worker_seconds - startup - self.load - self.compute - self.output, 0.0)
+        seconds = {
+            STARTUP: startup,
+            QUEUE: queue,
+            LOAD: self.load,
+            COMPUTE: self.compute,
+            OUTPUT: self.output,
+        }
+        return {name: seconds[name] / self.worker_seconds for name in SHARES}
+
+
+def run_queue(queue_file: str, workers: int) -> tuple[float, QueueManager]:
+    manager = QueueManager(queue_file, max_workers=workers, resume=False, prefetch=False)
+    start = time.perf_counter()
+    manager.run_all()
+    wall = time.perf_counter() - start
+
+    errors = [result.error for result in manager.results if result.error]
+    if errors:
+        raise RuntimeError(f"{len(errors)} sims failed, e.g. {errors[0]}")
+    return wall, manager
+
+
+def measure(mode: str, workers: int, sims: int, work_dir: str, repeat: int = SCALING_REPEAT) -> ScalingPoint:
+    """The fastest of `repeat` runs of a queue of `sims` sims on `workers` workers."""
+    queue_file = write_queue_file(work_dir, sims)
+    run_queue(queue_file, workers)  # fills the data cache
+
+    points = []
+    for _ in range(repeat):
+        wall, manager = run_queue(queue_file, workers)
+        timings = [result.timings for result in manager.results]
+        points.append(
+            ScalingPoint(
+                mode=mode,
+                workers=workers,
+                sims=sims,
+                wall=wall,
+                startup=manager.executor.pool.last_startup_time,
+                load=sum(timing.get(LOAD_STAGE, 0.0) for timing in timings),
+                compute=sum(timing.get(stage, 0.0) for timing in timings for stage in COMPUTE_STAGES),
+                output=sum(timing.get(stage, 0.0) for timing in timings for stage in (PLOTTING_STAGE, OUTPUT_STAGE)),
+            )
+        )
+    return min(points, key=lambda point: point.wall)
+
+
+def set_speedups(points: list[ScalingPoint]) -> None:
+    """Speedup and efficiency of each point of a sweep, relative to the sweep's smallest worker count."""
+    base = min(points, key=lambda point: point.workers)
+    for point in points:
+        if point.mode == STRONG:
+            point.speedup = base.wall / point.wall * base.workers
+            point.efficiency = point.speedup / point.workers
+        else:  # weak scaling: n times the work in the same time is a speedup of n
+            point.efficiency = base.wall / point.wall
+            point.speedup = point.efficiency * point.workers
+
+
+def sweep(mode: str, worker_counts: list[int], sims: int, sims_per_worker: int, work_dir: str) -> list[ScalingPoint]:
+    points = []
+    for workers in worker_counts:
+        point_sims = sims if mode == STRONG else sims_per_worker * workers
+        points.append(measure(mode, workers, point_sims, work_dir))
+        print(f"  {mode:<6} workers {workers:>3}  sims {point_sims:>4}  {points[-1].wall:8.3f}s", flush=True)
+    set_speedups(points)
+    return points
+
+
+def format_table(points: list[ScalingPoint]) -> str:
+    header = f"  {'workers':>7} {'sims':>5} {'wall':>9} {'speedup':>8} {'effic.':>7}  " + " ".join(
+        f"{name:>8}" for name in SHARES
+    )
+    lines = [header]
+    for point in points:
+        shares = point.get_shares()
+        lines.append(
+            f"  {point.workers:>7} {point.sims:>5} {point.wall:>8.3f}s {point.speedup:>7.2f}x {point.efficiency:>6.0%}  "
+            + " ".join(f"{shares[name]:>8.1%}" for name in SHARES)
+        )
+    return "\n".join(lines)
+
+
+def describe_limit(points: list[ScalingPoint]) -> str:
+    """Where the sweep stops scaling, and what the worker time goes to there."""
+    below_target = [point for point in points if point.efficiency < SCALING_EFFICIENCY_TARGET]
+    if not below_target:
+        return f"Efficiency stays above {SCALING_EFFICIENCY_TARGET:.0%} up to {points[-1].workers} workers."
+
+    point = below_target[0]
+    shares = point.get_shares()
+    largest = max((name for name in SHARES if name != COMPUTE), key=lambda name: shares[name])
+    return (
+        f"Efficiency falls below {SCALING_EFFICIENCY_TARGET:.0%} at {point.workers} workers ({point.efficiency:.0%}); "
+        f"apart from compute, most worker time goes to {largest} ({shares[largest]:.1%})."
+    )
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.scaling", description="Measure QueueManager scaling.")
+    parser.add_argument("--mode", choices=[STRONG, WEAK, "both"], default="both")
+    parser.add_argument("--max-workers", type=int, help="sweep 1, 2, 4, ... up to this (default: usable CPUs)")
+    parser.add_argument("--workers", type=int, nargs="+", help="exact worker counts to sweep")
+    parser.add_argument("--sims", type=int, default=STRONG_SCALING_SIMS, help="sims in the strong scaling queue")
+    parser.add_argument(
+        "--sims-per-worker", type=int, default=WEAK_SCALING_SIMS_PER_WORKER, help="sims per worker in weak scaling"
+    )
+    parser.add_argument("--output", help="results file (default benchmarks/results/scaling_<timestamp>.json)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+    logging.getLogger(PACKAGE_LOGGER).setLevel(logging.WARNING)  # only the table is printed, not each sim's progress
+    machine = get_machine_info()
+    worker_counts = sorted(set(args.workers or get_worker_counts(args.max_workers or machine["usable_cpus"])))
+    modes = [STRONG, WEAK] if args.mode == "both" else [args.mode]
+
+    print(f"Scaling on {machine['cpu_model']} ({machine['usable_cpus']} usable CPUs):")
+    work_dir = tempfile.mkdtemp(prefix="btx_scaling_")
+    sweeps = {}
+    try:
+        for mode in modes:
+            sweeps[mode] = sweep(mode, worker_counts, args.sims, args.sims_per_worker, work_dir)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    for mode, points in sweeps.items():
+        print(f"\n{mode.capitalize()} scaling, share of worker time:")
+        print(format_table(points))
+        print(f"  {describe_limit(points)}")
+
+    output = args.output or os.path.join(RESULTS_DIR, f"scaling_{datetime.now():%Y%m%d_%H%M%S}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as file:
+        results = {
+            mode: [{**asdict(point), "shares": point.get_shares()} for point in points]
+            for mode, points in sweeps.items()
+        }
+        json.dump({"machine": machine, "created": datetime.now().isoformat(), "sweeps": results}, file, indent=2)
+    print(f"\nResults written to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
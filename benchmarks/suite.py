@@ -0,0 +1,224 @@
+"""
+This module defines the cases of the benchmark suite. Every case runs on synthetic data, so the suite needs no
+network access and times the same work on every run.
+
+    engine.backtest_single_ticker   the engine's per-bar loop over a frame of SMA crossover signals
+    strategy.<type>                 each registered strategy's generate_signals
+    metrics.backtest_metrics        BacktestMetricCreator over a portfolio value series
+    cache.set / cache.load          writing an entry to the persistent cache, and opening the cache file to read it
+    cache.memory_get                a hit in the in-memory tier
+    queue.run_all                   QueueManager throughput, in sims per second, for each worker count
+"""
+
+import functools
+import json
+import os
+
+from collections.abc import Iterator, Sequence
+
+import pandas as pd
+
+from backtesting_engine.analytics.metrics import BacktestMetricCreator
+from backtesting_engine.constants import TOTAL_VALUE_COLUMN
+from backtesting_engine.data.constants import SYNTHETIC_SOURCE
+from backtesting_engine.data.lru_cache import CacheKey, PersistentLRUCache
+from backtesting_engine.data.synthetic import make_synthetic_bars
+from backtesting_engine.data.tiered_cache import TieredCache
+from backtesting_engine.engine import BTXEngine
+from backtesting_engine.execution.runner import create_plot_generator
+from backtesting_engine.interfaces import EngineConfig, EngineContext
+from backtesting_engine.managers import QueueManager
+from backtesting_engine.strategies.registry import STRATEGIES
+from benchmarks.constants import (
+    CACHE_MAX_BARS,
+    DEFAULT_REPEAT,
+    ENGINE_MAX_BARS,
+    LARGE_CASE_BARS,
+    LARGE_CASE_REPEAT,
+    QUEUE_SIM_DATES,
+    QUEUE_SIMS,
+)
+from benchmarks.harness import BenchmarkCase
+
+
+TICKER = "BENCH"
+STRATEGY_FIELDS = {
+    "sma_crossover": {"short_window": 20, "long_window": 50},
+    "momentum": {"window": 20, "threshold": 0.02},
+    "mean_reversion": {"window": 20, "threshold": 0.02},
+    "buy_and_hold": {},
+}
+
+
+@functools.lru_cache(maxsize=2)  # cases are built size by size, so only the current size's data is kept
+def get_bars(bars: int) -> pd.DataFrame:
+    """Minute bars, so even 10M of them fit in the range of pandas timestamps."""
+    return make_synthetic_bars(TICKER, "2000-01-01", bars, interval="1m")
+
+
+@functools.lru_cache(maxsize=1)
+def get_signals(bars: int) -> pd.DataFrame:
+    data = get_bars(bars)
+    return STRATEGIES["sma_crossover"](data=data, **STRATEGY_FIELDS["sma_crossover"]).generate_signals()
+
+
+def get_repeat(bars: int) -> int:
+    return LARGE_CASE_REPEAT if bars > LARGE_CASE_BARS else DEFAULT_REPEAT
+
+
+def make_engine(data: pd.DataFrame) -> BTXEngine:
+    return BTXEngine(
+        config=EngineConfig(generate_output=False),
+        context=EngineContext(
+            sim_group="benchmark",
+            sim_id="benchmark",
+            data=data.iloc[:0],  # the engine copies its data on creation, which is not what is timed
+            ticker=TICKER,
+            strategy=STRATEGIES["sma_crossover"](data=data, **STRATEGY_FIELDS["sma_crossover"]),
+            metrics_creator=BacktestMetricCreator,
+            plot_generator=create_plot_generator,
+        ),
+    )
+
+
+def engine_cases(bars: int) -> Iterator[BenchmarkCase]:
+    yield BenchmarkCase(
+        name="engine.backtest_single_ticker",
+        params={"bars": bars},
+        setup=lambda: (make_engine(get_bars(bars)), get_signals(bars).copy()),
+        run=lambda state: state[0]._backtest_single_ticker(state[1], TICKER),
+        repeat=get_repeat(bars),
+        skip_reason=f"over ENGINE_MAX_BARS ({ENGINE_MAX_BARS:,})" if bars > ENGINE_MAX_BARS else None,
+    )
+
+
+def strategy_cases(bars: int) -> Iterator[BenchmarkCase]:
+    for strategy_type, fields in STRATEGY_FIELDS.items():
+        yield BenchmarkCase(
+            name=f"strategy.{strategy_type}",
+            params={"bars": bars},
+            setup=functools.partial(STRATEGIES[strategy_type], data=get_bars(bars), **fields),
+            run=lambda strategy: strategy.generate_signals(),
+            repeat=get_repeat(bars),
+        )
+
+
+def metrics_cases(bars: int) -> Iterator[BenchmarkCase]:
+    results = pd.DataFrame({TOTAL_VALUE_COLUMN: get_bars(bars)["Close"] * 1_000})
+    yield BenchmarkCase(
+        name="metrics.backtest_metrics",
+        params={"bars": bars},
+        run=lambda _: BacktestMetricCreator(results, TICKER).get_backtest_metrics(),
+        repeat=get_repeat(bars),
+    )
+
+
+def cache_cases(bars: int, work_dir: str) -> Iterator[BenchmarkCase]:
+    skip_reason = f"over CACHE_MAX_BARS ({CACHE_MAX_BARS:,})" if bars > CACHE_MAX_BARS else None
+    cache_dir = os.path.join(work_dir, f"cache_{bars}")
+    key = CacheKey(TICKER, "2000-01-01", str(bars))
+    data = get_bars(bars)
+
+    def fresh_cache() -> PersistentLRUCache:
+        cache = PersistentLRUCache(cache_dir=cache_dir)
+        cache.clear()
+        return cache
+
+    def filled_cache_dir() -> None:
+        fresh_cache().set(key, data)
+
+    def memory_tier() -> TieredCache:
+        cache = TieredCache(disk=PersistentLRUCache(cache_dir=cache_dir))
+        cache.get(key)  # promoted to the memory tier
+        return cache
+
+    yield BenchmarkCase(
+        name="cache.set",
+        params={"bars": bars},
+        setup=fresh_cache,
+        run=lambda cache: cache.set(key, data),
+        repeat=get_repeat(bars),
+        skip_reason=skip_reason,
+    )
+    yield BenchmarkCase(
+        name="cache.load",
+        params={"bars": bars},
+        setup=filled_cache_dir,
+        run=lambda _: PersistentLRUCache(cache_dir=cache_dir).get(key),
+        repeat=get_repeat(bars),
+        skip_reason=skip_reason,
+    )
+    yield BenchmarkCase(
+        name="cache.memory_get",
+        params={"bars": bars},
+        setup=memory_tier,
+        run=lambda cache: cache.get(key),
+        repeat=get_repeat(bars),
+        skip_reason=skip_reason,
+    )
+
+
+def write_queue_file(work_dir: str, sims: int) -> str:
+    start_date, end_date = QUEUE_SIM_DATES
+    queue = {
+        "sim_group": "benchmark",
+        "output_dir_location": os.path.join(work_dir, "out"),
+        "author": "benchmarks",
+        "sims": [
+            {
+                "sim_id": f"{i:03d}",
+                "strategy": {"type": "sma_crossover", "fields": STRATEGY_FIELDS["sma_crossover"]},
+                "data": {
+                    "source": SYNTHETIC_SOURCE,
+                    "ticker": f"Q{i:03d}",
+                    "start_date": start_date,
+                    "end_date": end_date,
+                },
+                "sim_config": {"initial_cash": 100_000, "slippage": 0.0, "commission": 0.001},
+            }
+            for i in range(sims)
+        ],
+    }
+    path = os.path.join(work_dir, f"queue_{sims}.json")
+    with open(path, "w") as file:
+        json.dump(queue, file)
+    return path
+
+
+def queue_cases(worker_counts: Sequence[int], work_dir: str, sims: int = QUEUE_SIMS) -> Iterator[BenchmarkCase]:
+    queue_file = write_queue_file(work_dir, sims)
+    for workers in worker_counts:
+
+        def make_manager(workers: int = workers) -> QueueManager:
+            return QueueManager(queue_file, max_workers=workers, resume=False, store_results=False)
+
+        yield BenchmarkCase(
+            name="queue.run_all",
+            params={"workers": workers, "sims": sims},
+            setup=make_manager,
+            run=lambda manager: manager.run_all(),
+            repeat=LARGE_CASE_REPEAT,
+            warmup=True,  # the first run fills the data cache
+            items=sims,
+        )
+
+
+def get_worker_counts(max_workers: int) -> list[int]:
+    """1, 2, 4, ... up to max_workers, and max_workers itself."""
+    counts = {max_workers}
+    workers = 1
+    while workers < max_workers:
+        counts.add(workers)
+        workers *= 2
+    return sorted(counts)
+
+
+def build_suite(sizes: Sequence[int], worker_counts: Sequence[int], work_dir: str) -> Iterator[BenchmarkCase]:
+    """Every case, size by size, then the queue throughput cases."""
+    for bars in sizes:
+        yield from engine_cases(bars)
+        yield from strategy_cases(bars)
+        yield from metrics_cases(bars)
+        yield from cache_cases(bars, work_dir)
+    if worker_counts:
+        yield from queue_cases(worker_counts, work_dir)
@@ -0,0 +1,85 @@
+"""
+Check the accuracy of compact backtests against float64 ones.
+
+Every strategy is backtested on a set of made-up tickers twice, once on float64 data and once in compact mode (float32
+prices, int8 signals, int64 positions, no indicator columns). The script reports the largest difference in each
+metric, the sims whose trades differ, and the memory of the backtest results in both modes.
+
+Run with: `uv run python scripts/check_compact_accuracy.py`
+"""
+
+import pandas as pd
+
+from backtesting_engine.analytics.metrics import BacktestMetricCreator
+from backtesting_engine.compact import compact_prices
+from backtesting_engine.data.fake_server import make_fake_bars
+from backtesting_engine.engine import BTXEngine
+from backtesting_engine.execution.runner import create_plot_generator
+from backtesting_engine.interfaces import EngineConfig, EngineContext
+from backtesting_engine.strategies.registry import STRATEGIES
+
+
+NUM_TICKERS = 20
+START_DATE, END_DATE = "2000-01-01", "2020-01-01"
+STRATEGY_FIELDS = {
+    "sma_crossover": {"short_window": 20, "long_window": 50},
+    "momentum": {"window": 20, "threshold": 0.02},
+    "mean_reversion": {"window": 20, "threshold": 0.02},
+    "buy_and_hold": {},
+}
+METRICS = ["total_return", "sharpe_ratio", "max_drawdown", "volatility"]
+
+
+def run_backtest(data: pd.DataFrame, strategy: str, compact: bool) -> BTXEngine:
+    if compact:
+        data = compact_prices(data)
+    engine = BTXEngine(
+        config=EngineConfig(commission=0.001, generate_output=False, compact=compact, keep_indicators=not compact),
+        context=EngineContext(
+            sim_group="compact_accuracy",
+            sim_id=strategy,
+            data=data,
+            ticker="CHECK",
+            strategy=STRATEGIES[strategy](data=data, **STRATEGY_FIELDS[strategy]),
+            metrics_creator=BacktestMetricCreator,
+            plot_generator=create_plot_generator,
+        ),
+    )
+    engine.run_backtest()
+    return engine
+
+
+def get_trades(engine: BTXEngine) -> list[tuple[pd.Timestamp, str, int]]:
+    return [(trade.timestamp, trade.action, trade.shares) for trade in engine.trade_log]
+
+
+def main() -> None:
+    max_diff = {metric: 0.0 for metric in METRICS}
+    trades_differ: list[str] = []
+    bytes_float64 = bytes_compact = 0
+
+    for i in range(NUM_TICKERS):
+        data = make_fake_bars(f"T{i:03d}", START_DATE, END_DATE)
+        for strategy in STRATEGY_FIELDS:
+            full = run_backtest(data, strategy, compact=False)
+            compact = run_backtest(data, strategy, compact=True)
+
+            for metric in METRICS:
+                diff = abs(getattr(full.metrics, metric) - getattr(compact.metrics, metric))
+                max_diff[metric] = max(max_diff[metric], diff)
+            if get_trades(full) != get_trades(compact):
+                trades_differ.append(f"T{i:03d}/{strategy}")
+
+            bytes_float64 += int(full.data.memory_usage(deep=True).sum())
+            bytes_compact += int(compact.data.memory_usage(deep=True).sum())
+
+    sims = NUM_TICKERS * len(STRATEGY_FIELDS)
+    print(f"\nCompact vs float64 over {sims} sims of {START_DATE} to {END_DATE}:")
+    for metric, diff in max_diff.items():
+        print(f"  max |difference| in {metric:<13} {diff:.2e}")
+    print(f"  sims whose trades differ:       {len(trades_differ)} {trades_differ if trades_differ else ''}")
+    print(f"  result memory:                  {bytes_float64 / 1e6:.1f}MB -> {bytes_compact / 1e6:.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
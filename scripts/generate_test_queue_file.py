@@ -20,7 +20,7 @@ OUTPUT_DIR_LOCATION = "data/performance_test_files/"
 
 sim_template = {
     "strategy": {"type": "sma_crossover", "fields": {"short_window": 50, "long_window": 100}},
-    "data": {"source": "yfinance", "ticker": "AAPL", "start_date": "2020-01-02", "end_date": "2023-01-01"},
+    "data": {"source": "synthetic", "ticker": "AAPL", "start_date": "2020-01-02", "end_date": "2023-01-01"},
     "sim_config": {"initial_cash": 100000, "slippage": 0.01, "commission": 0.001},
 }
 
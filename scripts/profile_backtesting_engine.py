@@ -18,14 +18,14 @@ def run_single_sim() -> None:
     """
     Run a single backtest simulation with a sample strategy.
 
-    This just runs sma_crossover strategy with AAPL data from 2020-01-01 to 2023-01-01.
+    This just runs sma_crossover strategy on synthetic AAPL data from 2020-01-01 to 2023-01-01, so it runs offline.
     """
     TICKER = "AAPL"
     START_DATE = "2020-01-01"
     END_DATE = "2023-01-01"
 
     data_loader = DataLoader(cache=PersistentLRUCache())
-    data = data_loader.load(ticker=TICKER, start_date=START_DATE, end_date=END_DATE, source="yfinance")
+    data = data_loader.load(ticker=TICKER, start_date=START_DATE, end_date=END_DATE, source="synthetic")
 
     engine = BTXEngine(
         config=EngineConfig(initial_cash=100_000.0, slippage=0.01, commission=0.001),
@@ -0,0 +1,122 @@
+"""
+Benchmark the throughput of the local executor with and without worker pinning.
+
+Each configuration runs the same batch of sims on one worker per CPU and reports sims per second. Two workloads are
+measured: a plain SMA crossover backtest, and the same backtest followed by a covariance matrix computation that
+goes through numpy's BLAS, which is where uncapped workers oversubscribe the cores with BLAS threads.
+
+Pinned workers also cap their BLAS/OpenMP threads, so pinning is compared against unpinned workers with the same
+caps, and the uncapped unpinned run shows what the caps alone are worth.
+
+Data is generated in-process so the benchmark needs no network access and measures only the execution.
+
+Run with: `uv run python scripts/run_affinity_benchmark.py`
+"""
+
+import multiprocessing as mp
+import time
+
+import numpy as np
+import pandas as pd
+
+from backtesting_engine.analytics.metrics import BacktestMetricCreator
+from backtesting_engine.analytics.plotter import PlotGenerator
+from backtesting_engine.engine import BTXEngine
+from backtesting_engine.execution.local import LocalProcessExecutor
+from backtesting_engine.interfaces import (
+    DataConfig,
+    EngineConfig,
+    EngineContext,
+    RunContext,
+    SimConfig,
+    SimItem,
+    SimResult,
+    StrategyConfig,
+)
+from backtesting_engine.strategies.sma_crossover import SMACrossoverStrategy
+
+
+NUM_SIMS = 200
+NUM_ROWS = 2_000  # about eight years of daily bars
+COVARIANCE_ASSETS = 400  # size of the matrix product in the BLAS workload
+CONTEXT = RunContext(sim_group="affinity_benchmark", output_dir_location="unused", store_results=False)
+
+
+def make_data(seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, NUM_ROWS)))
+    return pd.DataFrame({"Close": close}, index=pd.bdate_range("2015-01-01", periods=NUM_ROWS))
+
+
+def run_backtest(sim_item: SimItem) -> SimResult:
+    data = make_data(int(sim_item.sim_id))
+    engine = BTXEngine(
+        config=EngineConfig(initial_cash=100_000.0, slippage=0.01, commission=0.001, generate_output=False),
+        context=EngineContext(
+            sim_group=CONTEXT.sim_group,
+            sim_id=sim_item.sim_id,
+            data=data,
+            ticker=sim_item.data.ticker,
+            strategy=SMACrossoverStrategy(data=data, short_window=50, long_window=100),
+            metrics_creator=BacktestMetricCreator,
+            plot_generator=PlotGenerator,
+        ),
+    )
+    engine.run_backtest()
+    return SimResult(sim_id=sim_item.sim_id, ticker=sim_item.data.ticker, strategy=sim_item.strategy.type)
+
+
+def backtest_sim_runner(context: RunContext, sim_item: SimItem) -> SimResult:
+    return run_backtest(sim_item)
+
+
+def blas_sim_runner(context: RunContext, sim_item: SimItem) -> SimResult:
+    returns = np.random.default_rng(int(sim_item.sim_id)).normal(0, 0.01, (NUM_ROWS, COVARIANCE_ASSETS))
+    np.cov(returns, rowvar=False)
+    return run_backtest(sim_item)
+
+
+def make_sims() -> list[SimItem]:
+    return [
+        SimItem(
+            sim_id=str(i),
+            strategy=StrategyConfig(type="sma_crossover", fields={"short_window": 50, "long_window": 100}),
+            data=DataConfig(ticker="SYNTH", start_date="2015-01-01", end_date="2022-12-31"),
+            sim_config=SimConfig(initial_cash=100_000, slippage=0.01, commission=0.001),
+        )
+        for i in range(NUM_SIMS)
+    ]
+
+
+def measure_throughput(executor: LocalProcessExecutor) -> float:
+    """Sims per second completed by the executor."""
+    results: list[SimResult] = []
+    start = time.perf_counter()
+    executor.run(CONTEXT, make_sims(), results.append)
+    elapsed = time.perf_counter() - start
+
+    failed = [result for result in results if result.error]
+    if failed:
+        raise RuntimeError(f"{len(failed)} benchmark sims failed, e.g. {failed[0].error}")
+    return len(results) / elapsed
+
+
+if __name__ == "__main__":
+    num_workers = mp.cpu_count()
+    threads = 1  # one worker per CPU, so each pinned worker's core set is a single CPU
+    print(f"Running {NUM_SIMS} sims per configuration on {num_workers} workers, {threads} thread each when capped\n")
+
+    for workload, sim_runner in [("backtest", backtest_sim_runner), ("backtest + BLAS", blas_sim_runner)]:
+        uncapped = measure_throughput(LocalProcessExecutor(max_workers=num_workers, sim_runner=sim_runner))
+        capped = measure_throughput(
+            LocalProcessExecutor(max_workers=num_workers, sim_runner=sim_runner, threads_per_worker=threads)
+        )
+        pinned = measure_throughput(
+            LocalProcessExecutor(
+                max_workers=num_workers, sim_runner=sim_runner, pin_workers=True, threads_per_worker=threads
+            )
+        )
+
+        print(f"[{workload}] unpinned, uncapped: {uncapped:8.2f} sims/s")
+        print(f"[{workload}] unpinned, capped:   {capped:8.2f} sims/s ({(capped / uncapped - 1) * 100:+.1f}%)")
+        print(f"[{workload}] pinned, capped:     {pinned:8.2f} sims/s ({(pinned / capped - 1) * 100:+.1f}%)\n")
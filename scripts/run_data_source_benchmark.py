@@ -0,0 +1,60 @@
+"""
+Benchmark prefetching a queue's data from an HTTP data source under different pooling, batching and concurrency
+settings.
+
+Each configuration prefetches the same set of tickers from a local fake market data server that adds a fixed latency
+to every request, standing in for a remote service, so the benchmark needs no network access. It reports the
+datasets fetched per second, and the requests and TCP connections the server received.
+
+Run with: `uv run python scripts/run_data_source_benchmark.py`
+"""
+
+import tempfile
+import time
+
+from backtesting_engine.data.fake_server import FakeMarketDataServer
+from backtesting_engine.data.lru_cache import PersistentLRUCache
+from backtesting_engine.data.prefetch import DataPrefetcher
+from backtesting_engine.data.sources import HTTPSource
+from backtesting_engine.interfaces import DataConfig
+
+
+NUM_TICKERS = 200
+LATENCY = 0.02  # seconds per request
+DATA_CONFIGS = [DataConfig(f"T{i:03d}", "2015-01-01", "2020-01-01", source="http") for i in range(NUM_TICKERS)]
+
+CONFIGURATIONS = [  # (label, keep_alive, max_concurrency, max_batch_size)
+    ("new connection per request", False, 1, 1),
+    ("keep-alive", True, 1, 1),
+    ("keep-alive, 8 concurrent", True, 8, 1),
+    ("keep-alive, 8 concurrent, batches of 20", True, 8, 20),
+]
+
+
+def run_configuration(keep_alive: bool, max_concurrency: int, max_batch_size: int) -> tuple[float, int, int]:
+    with FakeMarketDataServer(latency=LATENCY) as server, tempfile.TemporaryDirectory() as cache_dir:
+        source = HTTPSource(
+            server.url, max_batch_size=max_batch_size, max_concurrency=max_concurrency, keep_alive=keep_alive
+        )
+        prefetcher = DataPrefetcher(
+            sources={"http": source}, cache=PersistentLRUCache(cache_dir=cache_dir), max_workers=max_concurrency
+        )
+
+        start = time.perf_counter()
+        prefetcher.prefetch(DATA_CONFIGS)
+        elapsed = time.perf_counter() - start
+        source.close()
+
+        return NUM_TICKERS / elapsed, server.requests, server.connections
+
+
+def main() -> None:
+    results = [(label, *run_configuration(*settings)) for label, *settings in CONFIGURATIONS]
+
+    print(f"\nPrefetching {NUM_TICKERS} tickers with {LATENCY * 1000:.0f}ms of latency per request:")
+    for label, throughput, requests, connections in results:
+        print(f"  {label:<42} {throughput:8.1f} datasets/s  {requests:4d} requests  {connections:4d} connections")
+
+
+if __name__ == "__main__":
+    main()
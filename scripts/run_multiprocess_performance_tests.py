@@ -52,7 +52,7 @@ def run_single_sim(sim_id: int) -> None:
     """
     Run a single backtest simulation with a sample strategy.
 
-    This just runs sma_crossover strategy with AAPL data from 2020-01-01 to 2023-01-01.
+    This just runs sma_crossover strategy on synthetic AAPL data from 2020-01-01 to 2023-01-01, so it runs offline.
     This is to match what is run on multiple simulation runs in `run_multiple_sims_with_multiprocessing`.
     """
     TICKER = "AAPL"
@@ -60,7 +60,7 @@ def run_single_sim(sim_id: int) -> None:
     END_DATE = "2023-01-01"
 
     data_loader = DataLoader(cache=PersistentLRUCache())
-    data = data_loader.load(ticker=TICKER, start_date=START_DATE, end_date=END_DATE, source="yfinance")
+    data = data_loader.load(ticker=TICKER, start_date=START_DATE, end_date=END_DATE, source="synthetic")
 
     engine = BTXEngine(
         config=EngineConfig(initial_cash=100_000.0, slippage=0.01, commission=0.001, generate_output=False),
@@ -96,10 +96,10 @@ def run_multiple_sims_with_multiprocessing(test_file_name: str) -> None:
     Run multiple simulations using the queue manager which handles multiprocessing.
 
     test_queue_config.json just contains a repetition of the same simulation for testing purposes. It
-    is currently just sma_crossover strategy with AAPL data from 2020-01-01 to 2023-01-01. This is to
+    is currently just sma_crossover strategy with synthetic AAPL data from 2020-01-01 to 2023-01-01. This is to
     match what is run on single simulation runs in `run_single_sim`.
     """
-    queue_manager = QueueManager(queue_file_path=test_file_name)
+    queue_manager = QueueManager(queue_file_path=test_file_name, resume=False)  # time every sim on every run
     queue_manager.run_all()
 
 
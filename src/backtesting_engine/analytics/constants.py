@@ -3,6 +3,10 @@ This module defines constants used in the analytics package of the backtesting e
 """
 
 OUTPUT_DIR = "out"  # Directory where output files will be saved
+PLOT_MAX_POINTS = 5_000  # points per plot trace, on top of the signal and drawdown bars that are always kept
+PLOT_MAX_MARKERS = 500  # buy markers, and sell markers, per plot when its traces are downsampled
+PLOTLY_JS_FILE = "plotly.min.js"  # plotly.js bundle shared by the plots of a sim group, in <output_dir>/<sim_group>/
+SHARPE_RATIO_METRIC = "Sharpe Ratio"  # metric sims are ranked by when picking which to plot
 
 # New column names for backtest results
 BUY_AND_HOLD_COLUMN = "Buy_and_Hold"
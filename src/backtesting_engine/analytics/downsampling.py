@@ -0,0 +1,77 @@
+"""
+This module picks the points of a long series worth plotting.
+
+A minute-bar backtest over several years has millions of bars, far more than a chart is wide, and plotting every one
+makes pages of hundreds of MB. The series is split into equal buckets and only the lowest and highest point of each is
+kept, along with the first and last points, so every spike and dip a full-resolution chart would show is still drawn.
+Points that must always be drawn, such as the bars of trade markers, are added on top of the budget, so markers are
+thinned the same way first: at most one per bucket.
+
+Buckets are found by reshaping the series into a (buckets, bucket size) array, so picking the points of a 10M-point
+series is a handful of vectorised passes over it rather than a Python loop.
+"""
+
+from collections.abc import Iterable
+from typing import Optional
+
+import numpy as np
+
+
+def get_min_max_indices(values: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Sorted positions of at most `max_points` points that keep the shape of a series: its first and last points and
+    the minimum and maximum of each bucket in between. NaNs are never picked unless a bucket holds nothing else.
+    """
+    n = len(values)
+    if n <= max_points:
+        return np.arange(n)
+
+    buckets = max((max_points - 2) // 2, 1)
+    inner = values[1:-1].astype(float, copy=False)
+    size = -(-len(inner) // buckets)  # ceil, so the last bucket holds at least one point
+    padding = buckets * size - len(inner)
+    nan = np.isnan(inner)
+
+    lows = np.pad(np.where(nan, np.inf, inner), (0, padding), constant_values=np.inf).reshape(buckets, size)
+    highs = np.pad(np.where(nan, -np.inf, inner), (0, padding), constant_values=-np.inf).reshape(buckets, size)
+    starts = np.arange(buckets) * size + 1  # positions in `values` of each bucket's first point
+    picked = np.concatenate(([0], starts + lows.argmin(axis=1), starts + highs.argmax(axis=1), [n - 1]))
+    return np.unique(np.minimum(picked, n - 1))
+
+
+def get_drawdown_extremes(values: np.ndarray) -> np.ndarray:
+    """Positions of the peak and the trough of a value series' maximum drawdown."""
+    if len(values) == 0:
+        return np.array([], dtype=int)
+    filled = np.nan_to_num(values.astype(float, copy=False), nan=-np.inf)
+    running_max = np.maximum.accumulate(filled)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        drawdown = np.where(np.isfinite(filled) & (running_max > 0), filled / running_max, 1.0)
+    trough = int(np.argmin(drawdown))
+    peak = int(np.argmax(filled[: trough + 1]))
+    return np.array(sorted({peak, trough}))
+
+
+def get_plot_indices(values: np.ndarray, max_points: Optional[int], keep: Iterable[np.ndarray] = ()) -> np.ndarray:
+    """
+    Positions of the points to plot: the shape-preserving `max_points` of the series plus every position in `keep`.
+    Without a budget every point is plotted.
+    """
+    if max_points is None or len(values) <= max_points:
+        return np.arange(len(values))
+    indices = get_min_max_indices(values, max_points)
+    for positions in keep:
+        indices = np.union1d(indices, positions)
+    return indices
+
+
+def thin_positions(positions: np.ndarray, length: int, max_points: Optional[int]) -> np.ndarray:
+    """
+    At most `max_points` of the sorted positions in a series of `length` points: the series is split into
+    `max_points` equal buckets and the first position in each is kept. Without a budget every position is kept.
+    """
+    if max_points is None or len(positions) <= max_points:
+        return positions
+    buckets = positions * max_points // max(length, 1)
+    _, first = np.unique(buckets, return_index=True)
+    return positions[first]
@@ -53,6 +53,15 @@ class IMetricsCreator(ABC):
         pass
 
 
+@dataclass
+class PlotTarget:
+    """The sim a plot generator renders for, when it renders from stored results rather than inside the engine."""
+
+    sim_group: str
+    sim_id: str
+    ticker: str
+
+
 class IPlotGenerator(ABC):
     @abstractmethod
     def generate(self) -> None:
@@ -22,7 +22,8 @@ class BacktestMetricCreator(IMetricsCreator):
 
     def __init__(self, backtest_results_df: pd.DataFrame, ticker: str) -> None:
         self.ticker = ticker
-        self.portfolio_value: pd.Series = backtest_results_df.loc[:, TOTAL_VALUE_COLUMN].copy()
+        # computed in float64 whatever the results' dtypes, so compact results give the same metrics
+        self.portfolio_value: pd.Series = backtest_results_df.loc[:, TOTAL_VALUE_COLUMN].astype("float64")
 
     def get_total_return(self) -> float:
         """
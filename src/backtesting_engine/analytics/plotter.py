@@ -1,12 +1,26 @@
 import os
+import tempfile
 
 from enum import Enum
+from typing import Optional, Union
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objs as go
 
-from backtesting_engine.analytics.constants import BUY_AND_HOLD_COLUMN, DRAWDOWN_COLUMN, OUTPUT_DIR, ROLLING_MAX_COLUMN
-from backtesting_engine.analytics.interfaces import IPlotGenerator
+from plotly.offline import get_plotlyjs
+
+from backtesting_engine.analytics.constants import (
+    BUY_AND_HOLD_COLUMN,
+    DRAWDOWN_COLUMN,
+    OUTPUT_DIR,
+    PLOT_MAX_MARKERS,
+    PLOT_MAX_POINTS,
+    PLOTLY_JS_FILE,
+    ROLLING_MAX_COLUMN,
+)
+from backtesting_engine.analytics.downsampling import get_drawdown_extremes, get_plot_indices, thin_positions
+from backtesting_engine.analytics.interfaces import IPlotGenerator, PlotTarget
 from backtesting_engine.constants import CASH_COLUMN, CLOSE_COLUMN, SIGNAL_COLUMN, TOTAL_VALUE_COLUMN
 from backtesting_engine.interfaces import EngineContext
 
@@ -29,17 +43,42 @@ class PlotColors(Enum):
 
 
 class PlotGenerator(IPlotGenerator):
-    """Class to generate plots for backtesting results."""
+    """
+    Class to generate plots for backtesting results.
+
+    Buy and sell markers are drawn on the bars where the signal turns to 1 or -1, i.e. where a trade may happen,
+    rather than on every bar the signal holds. Each trace is downsampled to `max_points` (see analytics.downsampling),
+    keeping those bars and the peak and trough of the maximum drawdown; the markers of each kind are first thinned to
+    `max_markers`, at most one per equal stretch of bars. Pass max_points=None to plot every bar and every marker.
+    """
 
-    def __init__(self, backtest_results_df: pd.DataFrame, strategy_name: str, context: EngineContext) -> None:
+    def __init__(
+        self,
+        backtest_results_df: pd.DataFrame,
+        strategy_name: str,
+        context: Union[EngineContext, PlotTarget],
+        output_dir: str = OUTPUT_DIR,
+        max_points: Optional[int] = PLOT_MAX_POINTS,
+        max_markers: int = PLOT_MAX_MARKERS,
+    ) -> None:
         self.backtest_results_df = backtest_results_df.copy()
         self.strategy_name = strategy_name
         self.ticker = context.ticker.lower()
         self.sim_group = context.sim_group
         self.sim_id = context.sim_id
-        self.x_axis_date_values = self.backtest_results_df.index.tolist()
+        self.output_dir = output_dir
+        self.max_points = max_points
+        self.max_markers: Optional[int] = max_markers if max_points is not None else None
+        self.paths: list[str] = []  # of the plots written by generate
 
         self._add_buy_and_hold_column()
+        # strategies hold their signal for as long as the position lasts, so a trade is a bar where the signal changes
+        signals = np.nan_to_num(self.backtest_results_df[SIGNAL_COLUMN].to_numpy(dtype=float), nan=0.0)
+        changes = np.flatnonzero(np.diff(signals, prepend=0.0) != 0)
+        self.buy_positions = thin_positions(changes[signals[changes] == 1], len(signals), self.max_markers)
+        self.sell_positions = thin_positions(changes[signals[changes] == -1], len(signals), self.max_markers)
+        self.signal_positions = np.union1d(self.buy_positions, self.sell_positions)
+        self.drawdown_extremes = get_drawdown_extremes(self.backtest_results_df[TOTAL_VALUE_COLUMN].to_numpy())
 
     def _add_buy_and_hold_column(self) -> None:
         """
@@ -51,6 +90,12 @@ class PlotGenerator(IPlotGenerator):
             initial_cash / self.backtest_results_df[CLOSE_COLUMN].iloc[0]
         ) * self.backtest_results_df[CLOSE_COLUMN]
 
+    def _downsample(self, series: pd.Series, *keep: np.ndarray) -> pd.Series:
+        """The points of a series to plot, with the bars at the positions in `keep` always among them."""
+        if self.max_points is None or len(series) <= self.max_points:
+            return series
+        return series.iloc[get_plot_indices(series.to_numpy(dtype=float), self.max_points, keep)]
+
     def generate(self) -> None:
         """
         Generate all plots for the backtesting results and save them to the output directory.
@@ -65,26 +110,32 @@ class PlotGenerator(IPlotGenerator):
 
         This chart shows how the strategy performs compared to just holding the stock.
         """
-        buy_signals = self.backtest_results_df[self.backtest_results_df[SIGNAL_COLUMN] == 1]
-        sell_signals = self.backtest_results_df[self.backtest_results_df[SIGNAL_COLUMN] == -1]
+        buy_signals = self.backtest_results_df.iloc[self.buy_positions]
+        sell_signals = self.backtest_results_df.iloc[self.sell_positions]
+
+        buy_x = buy_signals.index
+        sell_x = sell_signals.index
 
-        buy_x = buy_signals.index.tolist()
-        sell_x = sell_signals.index.tolist()
+        # the signal markers sit on the buy & hold line, so it keeps their bars
+        buy_and_hold = self._downsample(self.backtest_results_df[BUY_AND_HOLD_COLUMN], self.signal_positions)
+        portfolio_value = self._downsample(
+            self.backtest_results_df[TOTAL_VALUE_COLUMN], self.signal_positions, self.drawdown_extremes
+        )
 
         fig = go.Figure()
 
         fig.add_trace(
             go.Scatter(
-                x=self.x_axis_date_values,
-                y=self.backtest_results_df[BUY_AND_HOLD_COLUMN],
+                x=buy_and_hold.index,
+                y=buy_and_hold,
                 name="Buy & Hold Value",
                 line=dict(color=PlotColors.BLUE.value),
             )
         )
         fig.add_trace(
             go.Scatter(
-                x=self.x_axis_date_values,
-                y=self.backtest_results_df[TOTAL_VALUE_COLUMN],
+                x=portfolio_value.index,
+                y=portfolio_value,
                 name="Portfolio Value",
                 line=dict(color=PlotColors.MINT.value),
             )
@@ -124,12 +175,12 @@ class PlotGenerator(IPlotGenerator):
         Generate a plot of daily returns for the strategy in percentage terms.
         This shows the daily performance of the strategy.
         """
-        daily_returns = self.backtest_results_df[TOTAL_VALUE_COLUMN].pct_change().dropna()
+        daily_returns = self._downsample(self.backtest_results_df[TOTAL_VALUE_COLUMN].pct_change().dropna())
 
         fig = go.Figure()
 
         fig.add_trace(
-            go.Bar(x=self.x_axis_date_values, y=daily_returns, name="Daily Returns", marker_color=PlotColors.MINT.value)
+            go.Bar(x=daily_returns.index, y=daily_returns, name="Daily Returns", marker_color=PlotColors.MINT.value)
         )
 
         self._update_background_colors_dark_mode(
@@ -153,13 +204,15 @@ class PlotGenerator(IPlotGenerator):
         self.backtest_results_df[DRAWDOWN_COLUMN] = (
             self.backtest_results_df[TOTAL_VALUE_COLUMN] - self.backtest_results_df[ROLLING_MAX_COLUMN]
         ) / self.backtest_results_df[ROLLING_MAX_COLUMN]
+        portfolio_value = self._downsample(self.backtest_results_df[TOTAL_VALUE_COLUMN], self.drawdown_extremes)
+        drawdown = self._downsample(self.backtest_results_df[DRAWDOWN_COLUMN], self.drawdown_extremes)
 
         fig = go.Figure()
 
         fig.add_trace(
             go.Scatter(
-                x=self.x_axis_date_values,
-                y=self.backtest_results_df[TOTAL_VALUE_COLUMN],
+                x=portfolio_value.index,
+                y=portfolio_value,
                 name="Portfolio Value",
                 line=dict(color=PlotColors.LIGHT_GRAY.value, width=2, dash="dash"),
                 yaxis="y1",
@@ -168,8 +221,8 @@ class PlotGenerator(IPlotGenerator):
 
         fig.add_trace(
             go.Scatter(
-                x=self.x_axis_date_values,
-                y=self.backtest_results_df[DRAWDOWN_COLUMN],
+                x=drawdown.index,
+                y=drawdown,
                 name="Drawdown",
                 line=dict(color=PlotColors.RED.value),
                 yaxis="y2",
@@ -206,17 +259,21 @@ class PlotGenerator(IPlotGenerator):
 
     def _save(self, fig: go.Figure, filename: str) -> None:
         """
-        Save the plot to the structured output directory: out/<sim_group>/<ticker>_<filename>.html
+        Save the plot to the structured output directory: <output_dir>/<sim_group>/<ticker>/<sim_id>_<filename>.html
+
+        Rather than embedding plotly.js, each page loads the copy shared by the sim group.
         """
-        sim_dir = os.path.join(OUTPUT_DIR, self.sim_group, self.ticker)
+        sim_dir = os.path.join(self.output_dir, self.sim_group, self.ticker)
         os.makedirs(sim_dir, exist_ok=True)
+        plotly_js_path = write_plotly_js(os.path.join(self.output_dir, self.sim_group))
 
         filename = f"{self.sim_id}_{self.strategy_name.lower()}_{filename}.html"
         full_output_path = os.path.join(sim_dir, filename)
 
         # Note: needed to swtich to `write_html` temporarily instead of `write_image` for HTML output
         # because kalaedo was causing issues with multiprocessing.
-        fig.write_html(full_output_path)
+        fig.write_html(full_output_path, include_plotlyjs=os.path.relpath(plotly_js_path, sim_dir))
+        self.paths.append(full_output_path)
 
     def _update_background_colors_dark_mode(
         self, fig: go.Figure, title: str, xaxis_title: str, yaxis_title: str
@@ -244,3 +301,19 @@ class PlotGenerator(IPlotGenerator):
                 tickcolor=PlotColors.GRAY.value,
             ),
         )
+
+
+def write_plotly_js(directory: str) -> str:
+    """
+    Write the plotly.js bundle to a directory unless it is already there, and return its path. The bundle is written
+    to a temporary file and moved into place, so workers writing it at the same time never leave a partial copy.
+    """
+    path = os.path.join(directory, PLOTLY_JS_FILE)
+    if os.path.exists(path):
+        return path
+
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", dir=directory, suffix=".tmp", delete=False, encoding="utf-8") as file:
+        file.write(get_plotlyjs())
+    os.replace(file.name, path)
+    return path
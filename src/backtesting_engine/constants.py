@@ -9,6 +9,22 @@ POSITION_COLUMN = "Position"  # how many shares of the asset are held
 HOLDINGS_COLUMN = "Holdings"  # value of the asset held
 TOTAL_VALUE_COLUMN = "Total_Value"  # total value of the portfolio including cash and holdings
 
+# Compact dtypes (see backtesting_engine.compact)
+PRICE_COLUMNS = ("Open", "High", "Low", "Close", "Adj Close")
+COMPACT_PRICE_DTYPE = "float32"  # ~7 significant digits, well inside the precision prices are quoted to
+COMPACT_SIGNAL_DTYPE = "int8"
+COMPACT_POSITION_DTYPE = "int64"  # share counts of large portfolios in cheap assets overflow int32
+
+# Sim stage constants, the keys of SimResult.timings (see backtesting_engine.timing)
+LOAD_STAGE = "load"  # loading the sim's market data
+SIGNALS_STAGE = "signals"  # the strategy's generate_signals
+EXECUTION_STAGE = "execution"  # the engine's per-bar loop
+METRICS_STAGE = "metrics"
+PLOTTING_STAGE = "plotting"
+OUTPUT_STAGE = "output"  # storing the sim's backtest results
+COMPUTE_STAGES = (SIGNALS_STAGE, EXECUTION_STAGE, METRICS_STAGE)
+STAGE_PERCENTILES = (50, 95, 99)
+
 BUY = "BUY"
 SELL = "SELL"
 HOLD = "HOLD"
@@ -32,3 +48,33 @@ SLIPPAGE = "slippage"
 COMMISSION = "commission"
 TYPE = "type"
 FIELDS = "fields"
+JOURNAL_FILE_SUFFIX = ".journal.jsonl"  # run journal written to the output directory as <sim_group>.journal.jsonl
+JOURNAL_TAIL_CHUNK = 64 * 1024  # bytes read back at a time when looking for the end of the last whole record
+STAGE_TIMINGS_FILE_SUFFIX = ".stage_timings.csv"  # stage percentiles written next to the journal
+
+# Memory accounting constants, the keys of SimResult.memory in bytes (see backtesting_engine.memory)
+PEAK_RSS = "peak_rss"  # the worker's peak resident set size while it ran the sim
+TRACEMALLOC_PEAK = "tracemalloc_peak"  # peak of the Python allocations traced during the sim
+DATA_BYTES = "data_bytes"  # the sim's market data
+RESULT_BYTES = "result_bytes"  # the backtest results DataFrame
+WORKER_PEAK_RSS = "worker_peak_rss"  # highest peak RSS of any sim the worker has run so far
+WORKER_PID = "worker_pid"  # process id of the worker, not a size
+MEMORY_FILE_SUFFIX = ".memory.csv"  # per-sim memory report written next to the journal
+
+# Logging constants (see backtesting_engine.logging_config)
+PACKAGE_LOGGER = "backtesting_engine"  # every module logs to a child of this logger
+LOG_LEVEL_ENV_VAR = "BTX_LOG_LEVEL"  # logging configuration handed to worker processes
+LOG_FORMAT_ENV_VAR = "BTX_LOG_FORMAT"
+JSON_LOG_FORMAT = "json"
+TEXT_LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+PROGRESS_INTERVAL = 10.0  # seconds between progress reports of a run
+
+# Profiling constants (see backtesting_engine.profiling)
+PROFILE_DIR_NAME = "profiles"  # per-sim profiles are written to <output_dir>/<sim_group>/profiles/
+PROFILE_FILE_SUFFIX = ".prof"  # cProfile stats, per sim and merged for the group as <sim_group>.prof
+ALLOCATIONS_FILE_SUFFIX = ".allocations.txt"  # tracemalloc report of a sim
+
+# Live metrics constants (see backtesting_engine.metrics_server)
+METRICS_HOST = "127.0.0.1"  # the endpoint is local unless a host is given
+METRICS_PREFIX = "btx"  # prefix of every exported metric name
+STAGE_LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 60.0)  # upper bounds in seconds
@@ -0,0 +1,72 @@
+"""
+This module defines constants used by the data layer of the backtesting engine.
+"""
+
+import os
+
+
+# Persistent data cache constants
+DISK_CACHE_MAX_BYTES = 2 * 1024**3  # measured size of the frames the disk cache may hold
+CACHE_FILE_FORMAT = 2  # version of the cache file layout; files without one hold the entries alone
+
+# Series store constants
+SERIES_STORE_DIR = os.path.join(".cache", "series")
+SERIES_MANIFEST_FILE = "manifest.json"
+SERIES_MAX_SHARDS = 64  # appended shards a series may have before it is compacted into one
+SERIES_READ_ATTEMPTS = 3  # lock-free reads of a series whose shards a compaction removed, before taking the lock
+
+# CSV constants
+CSV_CACHE_DIR = os.path.join(".cache", "csv")
+CSV_META_FILE = "meta.json"
+CSV_REPORT_DIR = "reports"  # validation reports of the ranges loaded from a binary copy, one file each
+CSV_CHUNK_ROWS = 1_000_000  # rows parsed at a time when converting a file
+CSV_MAX_HEADER_ROWS = 10
+CSV_DTYPES = {
+    "Open": "float64",
+    "High": "float64",
+    "Low": "float64",
+    "Close": "float64",
+    "Adj Close": "float64",
+    "Volume": "float64",  # yfinance reports fractional volumes for some instruments
+}
+
+# In-memory data cache constants
+MEMORY_CACHE_MAX_BYTES = 512 * 1024**2  # decoded frames each process keeps in front of the disk cache
+MEMORY_TIER = "memory"
+DISK_TIER = "disk"
+
+# Prefetch constants
+PREFETCH_MAX_WORKERS = 4  # upper bound on concurrent requests, whatever the source allows
+YFINANCE_MAX_BATCH_SIZE = 50  # tickers per yf.download call
+YFINANCE_DOWNLOAD_THREADS = 8  # threads yf.download uses within one call
+
+# Data source constants
+YFINANCE_SOURCE = "yfinance"
+HTTP_SOURCE = "http"
+CSV_SOURCE = "csv"  # read from a file by the loader, not through a data source
+HTTP_SOURCE_URL_ENV_VAR = "BTX_DATA_SOURCE_URL"  # base URL of the default HTTP source
+HTTP_MAX_BATCH_SIZE = 100  # tickers per request
+HTTP_MAX_CONCURRENCY = 8  # requests in flight, and pooled keep-alive connections, per process
+HTTP_RETRIES = 3
+HTTP_RETRY_BACKOFF = 0.2  # seconds, doubled on every retry
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+HTTP_TIMEOUT = 30.0  # seconds
+
+# Validation constants
+STRICT_VALIDATION = "strict"  # any issue fails the load
+LENIENT_VALIDATION = "lenient"  # repairable issues are repaired, and every issue is reported
+VALIDATION_ATTR = "validation"  # DataFrame.attrs key of the validation report, which is cached with the data
+VALIDATION_VERSION = 1  # bump when the checks change, so cached data is validated again
+OHLC_TOLERANCE = 1e-6  # relative slack for rounding in the OHLC consistency check
+
+# Synthetic data constants
+SYNTHETIC_SOURCE = "synthetic"
+GBM_MODEL = "gbm"
+JUMP_DIFFUSION_MODEL = "jump_diffusion"
+REGIME_SWITCHING_MODEL = "regime_switching"
+SYNTHETIC_EPOCH = "2000-01-01"  # every synthetic series starts here, so any range of it comes out the same
+SYNTHETIC_SEED = 0
+SYNTHETIC_MAX_BATCH_SIZE = 1000  # tickers per fetch; generating costs no round trips, so batches can be large
+TRADING_DAYS_PER_YEAR = 252
+TRADING_HOURS_PER_DAY = 6.5
+SESSION_OPEN = "09:30:00"  # time of a session's first intraday bar
@@ -0,0 +1,265 @@
+"""
+This module implements the binary cache CSV price files are converted to on first load.
+
+Parsing a CSV is by far the slowest part of loading one, so the first load streams the file through pandas in chunks,
+with explicit dtypes and ISO 8601 date parsing, and writes each column out as a raw binary array. Later loads memory
+map those arrays and copy out only the rows of the requested date range, so a file far larger than the memory of a
+worker can back any number of sims. The binary copy is keyed by the file's path, modification time and size, and is
+rebuilt when the file changes.
+
+    <cache_dir>/<hash of the file's path>/<mtime_ns>_<size>/meta.json, index.bin, 0.bin, 1.bin, ...
+    <cache_dir>/<hash of the file's path>/<mtime_ns>_<size>/reports/<hash of the range and mode>.json
+
+A range that passed validation has its report saved next to the binary copy, so it is not validated again until the
+file changes.
+
+CSV files written by pandas from yfinance downloads, with extra header rows for the ticker and the index name, are
+read as if they had a single header row.
+"""
+
+import csv
+import hashlib
+import json
+import logging
+import os
+import shutil
+
+from dataclasses import asdict, replace
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from filelock import FileLock
+
+from backtesting_engine.data.constants import (
+    CSV_CACHE_DIR,
+    CSV_CHUNK_ROWS,
+    CSV_DTYPES,
+    CSV_MAX_HEADER_ROWS,
+    CSV_META_FILE,
+    CSV_REPORT_DIR,
+    VALIDATION_VERSION,
+)
+from backtesting_engine.data.validation import ValidationReport
+from backtesting_engine.exceptions import InvalidDataError
+
+
+logger = logging.getLogger(__name__)
+
+
+def _is_date(value: str) -> bool:
+    try:
+        return pd.Timestamp(value) is not pd.NaT
+    except (ValueError, OverflowError):
+        return False
+
+
+def sniff_header(path: str) -> tuple[int, Optional[str]]:
+    """
+    Count the header rows of a CSV file and find the name of its index column.
+
+    pandas writes frames with several column levels (e.g. yfinance downloads) with one header row per level, then a
+    row holding only the index name. Every row before the first one that starts with a date is a header row.
+    """
+    with open(path, "r", newline="") as file:
+        rows = []
+        for row in csv.reader(file):
+            if row and _is_date(row[0]):
+                break
+            rows.append(row)
+            if len(rows) > CSV_MAX_HEADER_ROWS:
+                raise InvalidDataError(f"CSV file {path} has no rows starting with a date.")
+
+    if not rows:
+        raise InvalidDataError(f"CSV file {path} has no header row.")
+
+    index_name = rows[0][0] or None
+    if len(rows) > 1 and not any(rows[-1][1:]):  # a row holding only the index name
+        index_name = rows[-1][0] or index_name
+    return len(rows), index_name
+
+
+def parse_datetime_index(values: Any, tz: Optional[str] = None) -> pd.DatetimeIndex:
+    """
+    Parse ISO 8601 timestamps. Timestamps with UTC offsets, which change across daylight saving time, are converted
+    to UTC. Pass the timezone of the earlier chunks so every chunk of a file comes out the same.
+    """
+    has_offset = tz is not None or (len(values) > 0 and pd.Timestamp(values[0]).tz is not None)
+    return pd.DatetimeIndex(pd.to_datetime(values, format="ISO8601", utc=has_offset)).as_unit("ns")
+
+
+class CSVStore:
+    """Binary, column-per-file copies of CSV price files, built on first load and reused until the file changes."""
+
+    def __init__(
+        self,
+        cache_dir: str = CSV_CACHE_DIR,
+        dtypes: Optional[dict[str, str]] = None,
+        chunk_rows: int = CSV_CHUNK_ROWS,
+    ) -> None:
+        """
+        Args:
+            cache_dir (str): Directory the binary copies are kept in.
+            dtypes (Optional[dict[str, str]]): dtype of each known column, the OHLCV columns as float64 by default.
+                Other numeric columns are stored as float64, so missing values in later chunks fit; text columns are
+                left out.
+            chunk_rows (int): Rows parsed at a time while converting, which bounds the memory a conversion needs.
+        """
+        self.cache_dir = cache_dir
+        self.dtypes = dtypes if dtypes is not None else CSV_DTYPES
+        self.chunk_rows = chunk_rows
+
+    def load(self, path: str, start_date: Optional[str] = None, end_date: Optional[str] = None) -> pd.DataFrame:
+        """The rows of a CSV file dated from start_date through end_date, converting the file first if needed."""
+        return self.read(self.convert(path), start_date, end_date)
+
+    def read(self, version_dir: str, start_date: Optional[str] = None, end_date: Optional[str] = None) -> pd.DataFrame:
+        """The rows of a converted file, in the copy's directory, dated from start_date through end_date."""
+        with open(os.path.join(version_dir, CSV_META_FILE), "r") as file:
+            meta = json.load(file)
+
+        rows, tz = meta["rows"], meta["tz"]
+        index = self._map(version_dir, "index.bin", "int64", rows)
+        start = self._get_bound(start_date, tz, days=0) if start_date else None
+        end = self._get_bound(end_date, tz, days=1) if end_date else None
+
+        if meta["sorted"]:
+            lo = int(np.searchsorted(index, start)) if start is not None else 0
+            hi = int(np.searchsorted(index, end)) if end is not None else rows
+            rows_wanted: Any = slice(lo, hi)
+        else:
+            mask = np.ones(rows, dtype=bool)
+            if start is not None:
+                mask &= index >= start
+            if end is not None:
+                mask &= index < end
+            rows_wanted = mask
+
+        df_index = pd.DatetimeIndex(np.array(index[rows_wanted]).view("datetime64[ns]"), name=meta["index_name"])
+        if tz is not None:
+            df_index = df_index.tz_localize("UTC").tz_convert(tz)
+
+        columns = {
+            column["name"]: np.array(self._map(version_dir, column["file"], column["dtype"], rows)[rows_wanted])
+            for column in meta["columns"]
+        }
+        return pd.DataFrame(columns, index=df_index)
+
+    def convert(self, path: str) -> str:
+        """Convert a CSV file to its binary copy unless an up-to-date one exists. Returns the copy's directory."""
+        stat = os.stat(path)
+        file_dir = os.path.join(self.cache_dir, hashlib.sha1(os.path.abspath(path).encode()).hexdigest()[:16])
+        version_dir = os.path.join(file_dir, f"{stat.st_mtime_ns}_{stat.st_size}")
+        if os.path.exists(os.path.join(version_dir, CSV_META_FILE)):
+            return version_dir
+
+        os.makedirs(file_dir, exist_ok=True)
+        with FileLock(os.path.join(file_dir, "convert.lock")):  # workers loading the same file convert it once
+            if os.path.exists(os.path.join(version_dir, CSV_META_FILE)):
+                return version_dir
+
+            logger.info("[CSV LOAD] Converting %s to a binary cache", path)
+            tmp_dir = version_dir + ".tmp"
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            os.makedirs(tmp_dir)
+            self._write_columns(path, tmp_dir)
+            os.replace(tmp_dir, version_dir)
+
+            for name in os.listdir(file_dir):  # copies of earlier versions of the file
+                stale = os.path.join(file_dir, name)
+                if os.path.isdir(stale) and stale != version_dir:
+                    shutil.rmtree(stale, ignore_errors=True)
+
+        return version_dir
+
+    def get_report(
+        self, version_dir: str, ticker: str, start_date: Optional[str], end_date: Optional[str], mode: str
+    ) -> Optional[ValidationReport]:
+        """The report saved for a range of a converted file, if the range passed validation by the current checks."""
+        try:
+            with open(self._get_report_path(version_dir, start_date, end_date, mode), "r") as file:
+                report = ValidationReport(**json.load(file))
+        except (OSError, ValueError, TypeError):  # no report yet, or one the fields have changed since
+            return None
+        return replace(report, ticker=ticker) if report.version == VALIDATION_VERSION else None
+
+    def save_report(
+        self, version_dir: str, start_date: Optional[str], end_date: Optional[str], report: ValidationReport
+    ) -> None:
+        """Save the report of a range of a converted file that passed validation."""
+        report_path = self._get_report_path(version_dir, start_date, end_date, report.mode)
+        os.makedirs(os.path.dirname(report_path), exist_ok=True)
+        tmp_path = f"{report_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as file:
+            json.dump(asdict(report), file)
+        os.replace(tmp_path, report_path)  # a concurrent reader sees the whole report or none
+
+    def _write_columns(self, path: str, out_dir: str) -> None:
+        header_rows, index_name = sniff_header(path)
+        reader = pd.read_csv(
+            path,
+            header=0,
+            skiprows=range(1, header_rows),
+            index_col=0,
+            dtype=self.dtypes,
+            chunksize=self.chunk_rows,
+        )
+
+        columns: list[dict[str, str]] = []
+        tz: Optional[str] = None
+        rows, is_sorted, last = 0, True, None
+        for i, chunk in enumerate(reader):
+            index = parse_datetime_index(chunk.index, tz)
+            if i == 0:
+                tz = str(index.tz) if index.tz is not None else None
+                columns = self._get_column_layout(chunk)
+
+            values = index.asi8
+            if len(values):
+                in_order = bool(np.all(values[1:] >= values[:-1])) and (last is None or bool(values[0] >= last))
+                is_sorted = is_sorted and in_order
+                last = int(values[-1])
+            rows += len(values)
+
+            with open(os.path.join(out_dir, "index.bin"), "ab") as file:
+                np.ascontiguousarray(values, dtype="int64").tofile(file)
+            for column in columns:
+                with open(os.path.join(out_dir, column["file"]), "ab") as file:
+                    np.ascontiguousarray(chunk[column["name"]].to_numpy(), dtype=column["dtype"]).tofile(file)
+
+        meta = {"rows": rows, "sorted": is_sorted, "tz": tz, "index_name": index_name, "columns": columns}
+        with open(os.path.join(out_dir, CSV_META_FILE), "w") as file:
+            json.dump(meta, file)
+
+    def _get_column_layout(self, chunk: pd.DataFrame) -> list[dict[str, str]]:
+        layout = []
+        for name in chunk.columns:
+            if name in self.dtypes:
+                dtype = np.dtype(self.dtypes[name])
+            elif pd.api.types.is_numeric_dtype(chunk[name].dtype):
+                dtype = np.dtype("float64")
+            else:
+                logger.warning("[CSV LOAD] Leaving out non-numeric column %r", name)
+                continue
+            layout.append({"name": str(name), "dtype": dtype.str, "file": f"{len(layout)}.bin"})
+        return layout
+
+    @staticmethod
+    def _map(version_dir: str, file: str, dtype: str, rows: int) -> np.ndarray:
+        if rows == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(os.path.join(version_dir, file), dtype=dtype, mode="r", shape=(rows,))
+
+    @staticmethod
+    def _get_bound(date: str, tz: Optional[str], days: int) -> int:
+        """Nanosecond timestamp of the start of a date, `days` later, in the file's timezone."""
+        bound = pd.Timestamp(date) + pd.Timedelta(days=days)
+        if tz is not None and bound.tz is None:
+            bound = bound.tz_localize(tz)
+        return bound.value
+
+    @staticmethod
+    def _get_report_path(version_dir: str, start_date: Optional[str], end_date: Optional[str], mode: str) -> str:
+        key = hashlib.sha1(f"{start_date}|{end_date}|{mode}".encode()).hexdigest()[:16]
+        return os.path.join(version_dir, CSV_REPORT_DIR, f"{key}.json")
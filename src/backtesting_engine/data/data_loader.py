@@ -1,96 +1,173 @@
 """
-Loads historical stock data from Yahoo Finance and caches it using a persistent LRU cache.
-This allows for efficient retrieval of data without repeated network requests.
+Loads historical stock data from a registered data source (Yahoo Finance by default) and caches it using a
+persistent LRU cache. This allows for efficient retrieval of data without repeated network requests.
+
+Data is validated before it is cached, and the validation report is cached with it, so a cache hit is not validated
+again. A range of a CSV file that passed validation has its report saved with the file's binary copy, so it is only
+validated again once the file changes.
 """
 
-from typing import Literal, Optional
+import logging
+
+from collections.abc import Mapping
+from typing import Optional
 
 import pandas as pd
-import yfinance as yf
 
-from backtesting_engine.constants import CLOSE_COLUMN
-from backtesting_engine.data.interfaces import IDataLoader, ILocalCache
+from backtesting_engine.data.constants import CSV_SOURCE, STRICT_VALIDATION, VALIDATION_ATTR, YFINANCE_SOURCE
+from backtesting_engine.data.csv_store import CSVStore
+from backtesting_engine.data.interfaces import IDataLoader, IDataSource, ILocalCache
 from backtesting_engine.data.lru_cache import CacheKey, PersistentLRUCache
-from backtesting_engine.exceptions import InvalidDataError
+from backtesting_engine.data.registry import DATA_SOURCES
+from backtesting_engine.data.series_store import SeriesStore
+from backtesting_engine.data.validation import (
+    ValidationReport,
+    get_cached_mode,
+    get_cached_report,
+    validate_market_data,
+)
+
+
+logger = logging.getLogger(__name__)
 
 
 class DataLoader(IDataLoader):
     """
     DataLoader is responsible for loading historical stock data from various sources.
 
-    It supports loading from Yahoo Finance or a CSV file, and utilizes a persistent LRU cache
-    to avoid redundant data fetching.
+    It supports loading from any registered data source or a CSV file, and utilizes a persistent LRU cache
+    to avoid redundant data fetching. With a series store, a range that misses the cache but extends a ticker's
+    stored history only downloads the bars the store does not have yet.
     """
 
-    def __init__(self, cache: Optional[ILocalCache] = None) -> None:
+    def __init__(
+        self,
+        cache: Optional[ILocalCache] = None,
+        sources: Optional[Mapping[str, IDataSource]] = None,
+        store: Optional[SeriesStore] = None,
+        csv_store: Optional[CSVStore] = None,
+        validation: str = STRICT_VALIDATION,
+    ) -> None:
         self.cache = cache or PersistentLRUCache()
+        self.sources = sources if sources is not None else DATA_SOURCES
+        self.store = store
+        self.csv_store = csv_store or CSVStore()
+        self.validation = validation  # "strict" or "lenient", see data.validation
+        self.reports: dict[str, ValidationReport] = {}  # validation report of each ticker loaded
+        self.cache_hits = 0  # loads served from the cache
+        self.cache_misses = 0  # loads that had to go to the series store or the source
 
     def load(
         self,
         ticker: str,
         start_date: str,
         end_date: str,
-        source: Literal["yfinance", "csv"] = "yfinance",
+        source: str = YFINANCE_SOURCE,
         csv_path: Optional[str] = None,
+        interval: str = "1d",
     ) -> pd.DataFrame:
         """
-        Load historical stock data from either Yahoo Finance or a CSV file.
+        Load historical stock data from a registered data source, e.g. "yfinance", or a CSV file.
+
+        Data from a source covers start_date up to, but excluding, end_date. From a CSV file it is the rows dated
+        start_date through end_date.
+
+        Raises:
+            InvalidDataError: If the data fails validation.
         """
 
-        if source == "csv":
+        if source == CSV_SOURCE:
             if not csv_path:
                 raise ValueError("csv_path must be provided when source='csv'")
-            df = self._load_from_csv(csv_path)
+            df = self._load_from_csv(csv_path, ticker, start_date, end_date)
         else:
-            df = self._load_from_yfinance(ticker, start_date, end_date)
-
-        self.validate_data(df)
+            df = self._load_from_source(source, ticker, start_date, end_date, interval)
 
         return df
 
     def validate_data(self, df: pd.DataFrame) -> None:
-        """Validate the loaded data to ensure it meets the expected format."""
-        if df.empty:
-            raise InvalidDataError("Loaded DataFrame is empty.")
-
-        if not isinstance(df.index, pd.DatetimeIndex):
-            raise InvalidDataError("DataFrame index must be a DatetimeIndex.")
-
-        if CLOSE_COLUMN not in df.columns:
-            raise InvalidDataError(
-                "Data must contain a 'Close' column for SMA calculations."
-            )
-
-        if df[CLOSE_COLUMN].isnull().any():
-            raise InvalidDataError(
-                "Data contains NaN values in the 'Close' column, which is not allowed."
-            )
+        """Validate the loaded data to ensure it meets the expected format, failing on any issue."""
+        validate_market_data(df, mode=STRICT_VALIDATION)
 
-    def _load_from_yfinance(self, ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
-        cache_key = CacheKey(ticker, start_date, end_date)
-
-        if self.cache.has(cache_key):
-            print(f"[CACHE HIT] {ticker} {start_date} to {end_date}")
-            return self.cache.get(cache_key)
+    def _validate(self, df: pd.DataFrame, ticker: str) -> pd.DataFrame:
+        df, report = validate_market_data(df, ticker, self.validation)
+        self._record(report)
+        return df
 
-        print(f"[CACHE MISS] Downloading {ticker} from Yahoo Finance")
-        df = yf.download(ticker, start=start_date, end=end_date)
+    def _record(self, report: ValidationReport) -> None:
+        self.reports[report.ticker] = report
+        if not report.ok:
+            logger.warning("[VALIDATION] %s", report.summary(), extra={"ticker": report.ticker})
 
-        # Ensure the DataFrame has a single level of columns as we only deal with single ticker data
-        if df is not None and isinstance(df.columns, pd.MultiIndex):
-            df.columns = df.columns.droplevel(1)
+    def _load_from_source(
+        self, source: str, ticker: str, start_date: str, end_date: str, interval: str = "1d"
+    ) -> pd.DataFrame:
+        cache_key = CacheKey(ticker, start_date, end_date, interval, source, self.validation)
+
+        cached = self.cache.get(cache_key) if self.cache.has(cache_key) else None
+        # entries cached before keys had a validation mode may hold a frame repaired in lenient mode; never serve
+        # one to a load in another mode
+        if cached is not None and get_cached_mode(cached) in (None, self.validation):
+            self.cache_hits += 1
+            logger.debug("[CACHE HIT] %s %s to %s", ticker, start_date, end_date, extra={"ticker": ticker})
+            report = get_cached_report(cached, self.validation)
+            if report is not None:
+                self._record(report)
+                return cached
+
+            df = self._validate(cached, ticker)  # cached without a report, or with one from older checks
+            self.cache.set(cache_key, df)
+            return df
+
+        if source not in self.sources:
+            raise ValueError(f"Unknown data source: {source}")
+
+        self.cache_misses += 1
+        if self.store is not None:
+            df = self._load_through_store(self.store, source, ticker, start_date, end_date, interval)
+        else:
+            logger.debug("[CACHE MISS] Downloading %s from %s", ticker, source, extra={"ticker": ticker})
+            df = self.sources[source].fetch([ticker], start_date, end_date, interval).get(ticker)
 
         if df is None:
             raise ValueError(f"No data found for {ticker} from {start_date} to {end_date}")
 
+        df = self._validate(df, ticker)
         self.cache.set(cache_key, df)
         return df
 
-    def _load_from_csv(self, path: str) -> pd.DataFrame:
-        print(f"[CSV LOAD] Loading data from {path}")
-        df = pd.read_csv(path, index_col=0, parse_dates=True)
-
-        if isinstance(df.columns, pd.MultiIndex):
-            df.columns = df.columns.droplevel(1)
-
+    def _load_through_store(
+        self, store: SeriesStore, source: str, ticker: str, start_date: str, end_date: str, interval: str
+    ) -> Optional[pd.DataFrame]:
+        missing = store.get_missing_range(source, ticker, interval, start_date, end_date)
+        if missing is not None:
+            logger.debug(
+                "[CACHE MISS] Downloading %s %s to %s from %s",
+                ticker,
+                missing[0],
+                missing[1],
+                source,
+                extra={"ticker": ticker},
+            )
+            df = self.sources[source].fetch([ticker], missing[0], missing[1], interval).get(ticker)
+            store.update(source, ticker, interval, df, missing[0], missing[1])
+
+        df = store.read(source, ticker, interval, start_date, end_date)
+        return None if df is None or df.empty else df
+
+    def _load_from_csv(self, path: str, ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
+        logger.debug("[CSV LOAD] Loading data from %s", path)
+        version_dir = self.csv_store.convert(path)
+        df = self.csv_store.read(version_dir, start_date, end_date)
+
+        report = self.csv_store.get_report(version_dir, ticker, start_date, end_date, self.validation)
+        if report is not None:
+            df.attrs[VALIDATION_ATTR] = report
+            self._record(report)
+            return df
+
+        df = self._validate(df, ticker)
+        report = df.attrs[VALIDATION_ATTR]
+        if report.ok:  # a range with issues is repaired again on every load in lenient mode
+            self.csv_store.save_report(version_dir, start_date, end_date, report)
         return df
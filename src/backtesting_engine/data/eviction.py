@@ -0,0 +1,65 @@
+"""
+This module implements the eviction policies available to the persistent cache.
+
+- LRU evicts the entry used longest ago.
+- LFU evicts the entry with the fewest hits, breaking ties by recency.
+- GDSF (Greedy-Dual-Size-Frequency) evicts the entry with the lowest frequency per byte, aged by an inflation value
+  that rises with every eviction. Small, frequently used frames stay cached ahead of large, rarely used ones, so a
+  few minute-bar datasets cannot push out many daily ones.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Union
+
+from backtesting_engine.data.interfaces import CacheEntryMeta, IEvictionPolicy
+
+
+class LRUPolicy(IEvictionPolicy):
+    def select_victim(self, entries: list[tuple[Any, CacheEntryMeta]]) -> Any:
+        return min(entries, key=lambda entry: entry[1].last_access)[0]
+
+
+class LFUPolicy(IEvictionPolicy):
+    def select_victim(self, entries: list[tuple[Any, CacheEntryMeta]]) -> Any:
+        return min(entries, key=lambda entry: (entry[1].hits, entry[1].last_access))[0]
+
+
+class GDSFPolicy(IEvictionPolicy):
+    def __init__(self) -> None:
+        self.inflation = 0.0  # priority of the last evicted entry
+
+    def _update_priority(self, meta: CacheEntryMeta) -> None:
+        meta.priority = self.inflation + (meta.hits + 1) / max(meta.nbytes, 1)
+
+    def on_load(self, entries: Mapping[Any, CacheEntryMeta]) -> None:
+        # the inflation value is not persisted; the lowest surviving priority is a lower bound on it
+        self.inflation = min((meta.priority for meta in entries.values()), default=0.0)
+
+    def on_insert(self, meta: CacheEntryMeta) -> None:
+        self._update_priority(meta)
+
+    def on_access(self, meta: CacheEntryMeta) -> None:
+        self._update_priority(meta)
+
+    def select_victim(self, entries: list[tuple[Any, CacheEntryMeta]]) -> Any:
+        key, meta = min(entries, key=lambda entry: entry[1].priority)
+        self.inflation = meta.priority
+        return key
+
+
+EVICTION_POLICIES: dict[str, type[IEvictionPolicy]] = {
+    "lru": LRUPolicy,
+    "lfu": LFUPolicy,
+    "gdsf": GDSFPolicy,
+}
+
+
+def get_eviction_policy(policy: Union[str, IEvictionPolicy]) -> IEvictionPolicy:
+    """Resolve a policy given by name ("lru", "lfu" or "gdsf") or pass an instance through."""
+    if isinstance(policy, IEvictionPolicy):
+        return policy
+
+    policy_cls = EVICTION_POLICIES.get(policy.lower())
+    if policy_cls is None:
+        raise ValueError(f"Unknown eviction policy: {policy}. Expected one of {sorted(EVICTION_POLICIES)}.")
+    return policy_cls()
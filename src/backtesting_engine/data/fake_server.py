@@ -0,0 +1,170 @@
+"""
+This module implements a local stand-in for a REST market data service, speaking the protocol HTTPSource expects.
+
+It serves deterministic made-up bars for any ticker, so the HTTP source, the prefetch stage and their behaviour under
+concurrency can be tested and benchmarked without network access:
+
+    with FakeMarketDataServer(latency=0.02) as server:
+        source = HTTPSource(server.url)
+        source.fetch(["AAPL", "MSFT"], "2020-01-01", "2021-01-01")
+
+The server counts the requests and the TCP connections it receives, to show how many connections the keep-alive
+pooling saves, and can answer the first requests with errors to exercise the client's retries.
+"""
+
+import json
+import threading
+import time
+import zlib
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+
+
+def make_fake_bars(ticker: str, start_date: str, end_date: str, interval: str = "1d") -> pd.DataFrame:
+    """
+    OHLCV bars from start_date up to, but excluding, end_date. Prices are a random walk seeded by the ticker, so a
+    ticker always gets the same bars for the same dates.
+    """
+    freq: Any = "B" if interval == "1d" else pd.Timedelta(interval)
+    index = pd.date_range(start_date, end_date, freq=freq, inclusive="left", name="Date")
+
+    rng = np.random.default_rng(zlib.crc32(ticker.encode()))
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, len(index))))
+    spread = np.abs(rng.normal(0, 0.005, len(index))) * close
+    open_ = close + rng.normal(0, 0.002, len(index)) * close
+    return pd.DataFrame(
+        {
+            "Open": open_,
+            "High": np.maximum(open_, close) + spread,
+            "Low": np.minimum(open_, close) - spread,
+            "Close": close,
+            "Volume": rng.integers(1_000_000, 10_000_000, len(index)),
+        },
+        index=index,
+    )
+
+
+class _FakeMarketDataHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep connections open between requests
+    server: "_FakeHTTPServer"
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.owner._count("connections")
+
+    def do_GET(self) -> None:
+        owner = self.server.owner
+        owner._count("requests")
+        if owner.latency:
+            time.sleep(owner.latency)
+
+        url = urlparse(self.path)
+        if url.path.rstrip("/") != "/bars":
+            self._send(404, {"error": f"Unknown path: {url.path}"})
+            return
+        if owner._take_failure():
+            self._send(503, {"error": "Injected failure"})
+            return
+
+        params = {name: values[0] for name, values in parse_qs(url.query).items()}
+        try:
+            tickers = [ticker for ticker in params["tickers"].split(",") if ticker]
+            start_date, end_date, interval = params["start"], params["end"], params.get("interval", "1d")
+            payload = {}
+            for ticker in tickers:
+                if ticker in owner.missing_tickers:
+                    continue
+                bars = make_fake_bars(ticker, start_date, end_date, interval)
+                payload[ticker] = json.loads(bars.to_json(orient="split", date_format="iso"))
+        except (KeyError, ValueError) as e:
+            self._send(400, {"error": repr(e)})
+            return
+
+        self._send(200, payload)
+
+    def _send(self, status: int, payload: dict[str, Any]) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass  # keep test and benchmark output readable
+
+
+class _FakeHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    owner: "FakeMarketDataServer"
+
+
+class FakeMarketDataServer:
+    """A fake market data service on a local port, served from a background thread."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        fail_first: int = 0,
+        missing_tickers: tuple[str, ...] = (),
+    ) -> None:
+        """
+        Args:
+            host (str): Interface to listen on.
+            port (int): Port to listen on, any free port by default.
+            latency (float): Seconds each request takes, to stand in for a remote service.
+            fail_first (int): Number of requests answered with a 503 before the server starts answering normally.
+            missing_tickers (tuple[str, ...]): Tickers the server has no data for.
+        """
+        self.latency = latency
+        self.missing_tickers = missing_tickers
+        self.requests = 0
+        self.connections = 0
+
+        self._failures_left = fail_first
+        self._lock = threading.Lock()
+        self._server = _FakeHTTPServer((host, port), _FakeMarketDataHandler)
+        self._server.owner = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> str:
+        """Start serving in the background. Returns the server's URL."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self.url
+
+    def shutdown(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _take_failure(self) -> bool:
+        with self._lock:
+            if self._failures_left <= 0:
+                return False
+            self._failures_left -= 1
+            return True
+
+    def __enter__(self) -> "FakeMarketDataServer":
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.shutdown()
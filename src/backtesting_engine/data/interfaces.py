@@ -2,12 +2,76 @@
 This module defines the interfaces used within the backtesting engine's data layer.
 '''
 
+import time
+
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, Iterable
 
 import pandas as pd
 
 
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    bytes_in_use: int = 0
+    loads: int = 0  # reads of the backing store
+    load_seconds: float = 0.0  # total time spent in those reads
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def mean_load_latency(self) -> float:
+        return self.load_seconds / self.loads if self.loads else 0.0
+
+    def to_dict(self) -> dict[str, float]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hit_ratio,
+            "evictions": self.evictions,
+            "bytes_in_use": self.bytes_in_use,
+            "loads": self.loads,
+            "mean_load_latency": self.mean_load_latency,
+        }
+
+
+@dataclass
+class CacheEntryMeta:
+    nbytes: int  # measured size of the cached value
+    hits: int = 0
+    last_access: float = field(default_factory=time.time)
+    priority: float = 0.0  # policy-specific, e.g. the GDSF value
+    write_id: int = 0  # when the value was written, in ns, telling a rewrite of the entry apart; 0 if never stamped
+
+
+class IEvictionPolicy(ABC):
+    """Decides which cache entry to evict when the cache is over budget."""
+
+    def on_load(self, entries: Mapping[Any, CacheEntryMeta]) -> None:
+        """Called with every entry after the cache is read from disk."""
+        pass
+
+    def on_insert(self, meta: CacheEntryMeta) -> None:
+        """Called when an entry is added or replaced."""
+        pass
+
+    def on_access(self, meta: CacheEntryMeta) -> None:
+        """Called after an entry's hit count and access time are updated."""
+        pass
+
+    @abstractmethod
+    def select_victim(self, entries: list[tuple[Any, CacheEntryMeta]]) -> Any:
+        """Pick the key to evict from the candidates, which are ordered from least to most recently used."""
+        pass
+
+
 class ILocalCache(ABC):
     @abstractmethod
     def get(self, key: Any) -> Any:
@@ -19,6 +83,11 @@ class ILocalCache(ABC):
         """Store an item in the cache."""
         pass
 
+    def set_many(self, items: Iterable[tuple[Any, Any]]) -> None:
+        """Store several items. Caches backed by a file override this to write it once."""
+        for key, value in items:
+            self.set(key, value)
+
     @abstractmethod
     def clear(self) -> None:
         """Clear the entire cache."""
@@ -30,6 +99,34 @@ class ILocalCache(ABC):
         pass
 
 
+class IDataSource(ABC):
+    """A market data provider. Sources that support it fetch several tickers in one request."""
+
+    max_batch_size: int = 1  # tickers per request
+    max_concurrency: int = 1  # requests that may be in flight at once
+
+    @property
+    def supports_batch(self) -> bool:
+        return self.max_batch_size > 1
+
+    @property
+    def session(self) -> Any:
+        """The pooled connection session requests go through, if the source manages one."""
+        return None
+
+    def close(self) -> None:
+        """Release the source's pooled connections."""
+        pass
+
+    @abstractmethod
+    def fetch(self, tickers: list[str], start_date: str, end_date: str, interval: str = "1d") -> dict[str, pd.DataFrame]:
+        """
+        Fetch the bars of each ticker from start_date up to, but excluding, end_date. Tickers without data are left
+        out of the result.
+        """
+        pass
+
+
 class IDataLoader (ABC):
     @abstractmethod
     def load(self, *args: Any, **kwargs: Any) -> pd.DataFrame:...
@@ -4,62 +4,153 @@ efficient caching of data, such as historical stock prices, to avoid repeated ne
 and improve performance in our backtesting engine especially when running multiple simulations
 sequentially or in parallel.
 
+Entries are evicted once the cache exceeds a byte budget, using the measured size of each entry, under a selectable
+eviction policy (see `data.eviction`).
+
 Pickle is used as we are storing complex objects (like DataFrames) that need to be serialized.
 """
 
+import logging
 import os
 import pickle
 import time
 
 from collections import OrderedDict
-from typing import Any, NamedTuple
+from typing import Any, Iterable, NamedTuple, Optional, Union
+
+import pandas as pd
 
 from filelock import FileLock
 
-from backtesting_engine.data.interfaces import ILocalCache
+from backtesting_engine.data.constants import CACHE_FILE_FORMAT, DISK_CACHE_MAX_BYTES, STRICT_VALIDATION
+from backtesting_engine.data.eviction import get_eviction_policy
+from backtesting_engine.data.interfaces import CacheEntryMeta, CacheStats, IEvictionPolicy, ILocalCache
+
+
+logger = logging.getLogger(__name__)
 
 
 class CacheKey(NamedTuple):
     ticker: str
     start_date: str
     end_date: str
+    interval: str = "1d"
+    source: str = "yfinance"  # data source the frame was fetched from; keys saved before sources existed load as this
+    validation: str = STRICT_VALIDATION  # mode the frame was validated in, as a lenient load may have repaired it
 
     def __str__(self) -> str:
         return f"{self.ticker}_{self.start_date}_{self.end_date}"
 
 
-class PersistentLRUCache(ILocalCache):
-    """A simple LRU cache implementation that persists to disk using pickle."""
+FileVersion = tuple[int, int, int]  # inode, mtime in ns and size of the cache file
+
 
-    def __init__(self, cache_dir: str = ".cache", cache_file: str = "lru_cache.pkl", max_size: int = 10) -> None:
+def get_nbytes(value: Any) -> int:
+    """Measured in-memory size of a cached value, including the contents of object columns."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    return len(pickle.dumps(value))
+
+
+class PersistentLRUCache(ILocalCache):
+    """
+    A simple LRU cache implementation that persists to disk using pickle.
+
+    The cache is bounded by the measured size of its entries (`max_bytes`) and optionally by their number
+    (`max_size`). Which entry is evicted when a bound is exceeded is decided by the eviction policy: "lru" (default),
+    "lfu" or the size-aware "gdsf". Hit counts and access times are kept per entry and saved with the next write.
+
+    The file is shared by every process using the cache. Each write re-reads the file first if another process has
+    changed it since this instance last read it, so concurrent writers add to each other's entries rather than
+    overwriting them.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = ".cache",
+        cache_file: str = "lru_cache.pkl",
+        max_size: Optional[int] = None,
+        max_bytes: Optional[int] = DISK_CACHE_MAX_BYTES,
+        policy: Union[str, IEvictionPolicy] = "lru",
+    ) -> None:
         self.cache_dir = cache_dir
         self.cache_path = os.path.join(cache_dir, cache_file)
         self.lock_path = self.cache_path + ".lock"
         self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.policy = get_eviction_policy(policy)
+        self.stats = CacheStats()
 
         os.makedirs(self.cache_dir, exist_ok=True)
-        self._cache = OrderedDict()
+        self._cache: OrderedDict[CacheKey, Any] = OrderedDict()
+        self._meta: dict[CacheKey, CacheEntryMeta] = {}
         self._lock = FileLock(self.lock_path)
+        self.version: FileVersion = (0, 0, 0)  # version of the file the in-memory entries were last synced with
+
+        self._load_cache()
 
+    def get_file_version(self) -> FileVersion:
+        """Current version of the cache file on disk. Changes whenever any process saves the cache."""
+        try:
+            stat = os.stat(self.cache_path)
+        except FileNotFoundError:
+            return (0, 0, 0)
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def reload_if_changed(self) -> bool:
+        """Re-read the cache file if another process has saved it since. Returns whether it was reloaded."""
+        if self.get_file_version() == self.version:
+            return False
         self._load_cache()
+        return True
 
     def _load_cache(self) -> None:
         """Load the cache from disk."""
         with self._lock:
             if os.path.exists(self.cache_path):
+                start = time.perf_counter()
                 try:
                     with open(self.cache_path, "rb") as f:
-                        self._cache = pickle.load(f)
+                        payload = pickle.load(f)
                 except (EOFError, pickle.UnpicklingError):
-                    print(f"Cache file {self.cache_path} is corrupted or empty. Starting with an empty cache.")
-                    self._cache = OrderedDict()
+                    logger.warning(
+                        "Cache file %s is corrupted or empty. Starting with an empty cache.", self.cache_path
+                    )
+                    payload = OrderedDict()
+
+                self._cache, meta = self._unpack(payload)
+                self._meta = self._merge_meta(meta)
+                self.policy.on_load(self._meta)
+
+                self.stats.loads += 1
+                self.stats.load_seconds += time.perf_counter() - start
+                self.stats.bytes_in_use = sum(entry.nbytes for entry in self._meta.values())
+            self.version = self.get_file_version()
+
+    def _unpack(self, payload: Any) -> tuple["OrderedDict[CacheKey, Any]", dict[CacheKey, CacheEntryMeta]]:
+        """Split a cache file into its entries and their metadata."""
+        if isinstance(payload, dict) and payload.get("format") == CACHE_FILE_FORMAT:
+            return payload["entries"], payload["meta"]
+
+        # files written before entries had metadata hold the entries alone
+        return payload, {key: CacheEntryMeta(nbytes=get_nbytes(value)) for key, value in payload.items()}
+
+    def _merge_meta(self, loaded: dict[CacheKey, CacheEntryMeta]) -> dict[CacheKey, CacheEntryMeta]:
+        """Keep the hits and accesses this process made since its last save, which the file does not have yet."""
+        for key, meta in loaded.items():
+            local = self._meta.get(key)
+            if local is not None and local.nbytes == meta.nbytes:
+                meta.hits = max(meta.hits, local.hits)
+                meta.last_access = max(meta.last_access, local.last_access)
+                meta.priority = max(meta.priority, local.priority)
+        return loaded
 
     def _save_cache(self) -> None:
         """Save the cache to disk atomically."""
         with self._lock:
             temp_path = self.cache_path + ".tmp"
             with open(temp_path, "wb") as f:
-                pickle.dump(self._cache, f)
+                pickle.dump({"format": CACHE_FILE_FORMAT, "entries": self._cache, "meta": self._meta}, f)
 
             for attempt in range(5):  # retry up to 5 times
                 try:
@@ -70,31 +161,81 @@ class PersistentLRUCache(ILocalCache):
                         raise
                     time.sleep(0.1)  # wait 100ms before retry
 
+            self.version = self.get_file_version()
+
     def get(self, key: CacheKey) -> Any:
         """Get an item from the cache."""
-        if key in self._cache:
-            self._cache.move_to_end(key)
-            # self._save_cache()
-            return self._cache[key]
-        return None
+        if key not in self._cache:
+            self.stats.misses += 1
+            return None
+
+        self._cache.move_to_end(key)
+        meta = self._meta[key]
+        meta.hits += 1
+        meta.last_access = time.time()
+        self.policy.on_access(meta)
+
+        self.stats.hits += 1
+        return self._cache[key]
 
     def set(self, key: CacheKey, value: Any) -> None:
         """Set an item in the cache."""
-        if key in self._cache:
-            self._cache.move_to_end(key)
-        self._cache[key] = value
+        self.set_many([(key, value)])
 
-        # Evict least recently used if over max_size
-        if len(self._cache) > self.max_size:
-            self._cache.popitem(last=False)
+    def set_many(self, items: Iterable[tuple[CacheKey, Any]]) -> None:
+        """Set several items, re-reading and saving the cache file once for all of them."""
+        with self._lock:  # held from re-read to save so no other process can write in between
+            self.reload_if_changed()
+            for key, value in items:
+                self._insert(key, value)
+            self._save_cache()
 
-        self._save_cache()
+    def _insert(self, key: CacheKey, value: Any) -> None:
+        self._remove(key)
+
+        meta = CacheEntryMeta(nbytes=get_nbytes(value), write_id=time.time_ns())
+        if self.max_bytes is not None and meta.nbytes > self.max_bytes:
+            logger.warning("[CACHE] %s is larger than the cache's byte budget and will not be cached.", key)
+            return
+
+        self._cache[key] = value
+        self._meta[key] = meta
+        self.policy.on_insert(meta)
+        self.stats.bytes_in_use += meta.nbytes
+
+        self._evict(exclude=key)
+
+    def _evict(self, exclude: CacheKey) -> None:
+        """Evict entries chosen by the policy until the cache is within its budgets."""
+        while self._is_over_budget():
+            candidates = [(key, self._meta[key]) for key in self._cache if key != exclude]
+            if not candidates:
+                return
+            self._remove(self.policy.select_victim(candidates))
+            self.stats.evictions += 1
+
+    def _is_over_budget(self) -> bool:
+        if self.max_size is not None and len(self._cache) > self.max_size:
+            return True
+        return self.max_bytes is not None and self.stats.bytes_in_use > self.max_bytes
+
+    def _remove(self, key: CacheKey) -> None:
+        if key in self._cache:
+            del self._cache[key]
+            self.stats.bytes_in_use -= self._meta.pop(key).nbytes
 
     def has(self, key: CacheKey) -> bool:
         """Check if an item exists in the cache."""
         return key in self._cache
 
+    def get_write_id(self, key: CacheKey) -> Optional[int]:
+        """Identifies the write that stored an item, so a copy of it can tell whether it was replaced since."""
+        meta = self._meta.get(key)
+        return meta.write_id if meta is not None else None
+
     def clear(self) -> None:
         """Clear the cache."""
         self._cache = OrderedDict()
+        self._meta = {}
+        self.stats.bytes_in_use = 0
         self._save_cache()
@@ -0,0 +1,243 @@
+"""
+This module implements the prefetch stage that fills the data cache before a queue's sims start.
+
+Left to themselves, workers download their sim's data on a cache miss, one ticker per request, and workers whose sims
+share a ticker download it several times over. The prefetcher instead collects the datasets of every pending sim,
+merges overlapping date ranges of the same ticker, and fetches them in multi-ticker requests through a bounded thread
+pool, keeping within the concurrency limit each data source declares. Each merged download is then sliced back into
+the exact date range of every sim that needs it and stored under that sim's cache key, so every worker finds its data
+in the cache.
+
+With a series store, only the part of each range the store does not hold yet is downloaded. A nightly refresh of a
+queue whose end date moved forward by a day then fetches one day of bars per ticker, in a few batched requests.
+"""
+
+import logging
+import threading
+import time
+
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import pandas as pd
+
+from backtesting_engine.data.constants import CSV_SOURCE, PREFETCH_MAX_WORKERS, YFINANCE_SOURCE
+from backtesting_engine.data.interfaces import IDataSource, ILocalCache
+from backtesting_engine.data.lru_cache import CacheKey, PersistentLRUCache
+from backtesting_engine.data.registry import DATA_SOURCES
+from backtesting_engine.data.series_store import SeriesStore, slice_date_range
+from backtesting_engine.data.validation import validate_market_data
+from backtesting_engine.exceptions import InvalidDataError
+from backtesting_engine.interfaces import DataConfig
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PrefetchRequest:
+    tickers: list[str]
+    start_date: str
+    end_date: str  # exclusive
+    interval: str = "1d"
+    source: str = YFINANCE_SOURCE
+
+
+@dataclass
+class PrefetchReport:
+    datasets: int = 0  # distinct datasets the sims need
+    cached: int = 0  # of which were already in the cache
+    fetched: int = 0  # of which were stored by the prefetch
+    requests: int = 0  # requests made to the source
+    failed: list[str] = field(default_factory=list)  # tickers the source returned no data for or errored on
+    seconds: float = 0.0
+
+
+def merge_date_ranges(data_configs: list[DataConfig]) -> dict[tuple[str, str], list[tuple[str, str]]]:
+    """
+    Merge the date ranges requested for each (ticker, interval) wherever they overlap or touch. Returns a mapping of
+    (ticker, interval) -> sorted, disjoint (start_date, end_date) ranges.
+    """
+    ranges: dict[tuple[str, str], list[tuple[str, str]]] = {}
+    for data in data_configs:
+        ranges.setdefault((data.ticker, data.interval), []).append((data.start_date, data.end_date))
+
+    merged: dict[tuple[str, str], list[tuple[str, str]]] = {}
+    for key, dates in ranges.items():
+        dates.sort(key=lambda dates: pd.Timestamp(dates[0]))
+        merged[key] = [dates[0]]
+        for start_date, end_date in dates[1:]:
+            last_start, last_end = merged[key][-1]
+            if pd.Timestamp(start_date) <= pd.Timestamp(last_end):
+                if pd.Timestamp(end_date) > pd.Timestamp(last_end):
+                    merged[key][-1] = (last_start, end_date)
+            else:
+                merged[key].append((start_date, end_date))
+    return merged
+
+
+def plan_requests(
+    data_configs: list[DataConfig],
+    max_batch_size: int,
+    source: str = YFINANCE_SOURCE,
+    store: Optional[SeriesStore] = None,
+) -> list[PrefetchRequest]:
+    """
+    Group the merged ranges of one source's datasets into requests for tickers sharing the same range, up to
+    max_batch_size at a time. With a series store, each range is first cut down to the part the store is missing.
+    """
+    tickers_by_range: dict[tuple[str, str, str], list[str]] = {}
+    for (ticker, interval), dates in merge_date_ranges(data_configs).items():
+        if store is not None:  # the store holds one contiguous history per ticker, so the gaps are fetched too
+            dates = [(dates[0][0], max((end_date for _, end_date in dates), key=pd.Timestamp))]
+
+        for start_date, end_date in dates:
+            if store is not None:
+                missing = store.get_missing_range(source, ticker, interval, start_date, end_date)
+                if missing is None:
+                    continue
+                start_date, end_date = missing
+            tickers_by_range.setdefault((start_date, end_date, interval), []).append(ticker)
+
+    requests = []
+    for (start_date, end_date, interval), tickers in tickers_by_range.items():
+        for i in range(0, len(tickers), max_batch_size):
+            requests.append(PrefetchRequest(tickers[i : i + max_batch_size], start_date, end_date, interval, source))
+    return requests
+
+
+class DataPrefetcher:
+    """Fills a cache with the datasets a list of sims needs, in as few source requests as possible."""
+
+    def __init__(
+        self,
+        sources: Optional[Mapping[str, IDataSource]] = None,
+        cache: Optional[ILocalCache] = None,
+        max_workers: int = PREFETCH_MAX_WORKERS,
+        store: Optional[SeriesStore] = None,
+    ) -> None:
+        """
+        Args:
+            sources (Optional[Mapping[str, IDataSource]]): Data sources by name, the registered ones by default.
+            cache (Optional[ILocalCache]): Cache to fill, the persistent disk cache the workers read by default.
+            max_workers (int): Most requests in flight at once over all sources. Each source's own limit also
+                applies.
+            store (Optional[SeriesStore]): Series store to extend with the downloads, so only the bars it is
+                missing are fetched.
+        """
+        self.sources = sources if sources is not None else DATA_SOURCES
+        self.cache = cache or PersistentLRUCache()
+        self.max_workers = max(1, max_workers)
+        self.store = store
+
+    def prefetch(self, data_configs: list[DataConfig]) -> PrefetchReport:
+        """Fetch every dataset not already cached. Failures are reported, and left for the sims to retry."""
+        start = time.perf_counter()
+        report = PrefetchReport()
+
+        distinct = list(
+            {self._get_cache_key(data): data for data in data_configs if data.source != CSV_SOURCE}.values()
+        )
+        report.datasets = len(distinct)
+        missing = [data for data in distinct if not self.cache.has(self._get_cache_key(data))]
+        report.cached = report.datasets - len(missing)
+
+        requests: list[PrefetchRequest] = []
+        limits: dict[str, threading.BoundedSemaphore] = {}
+        for name in sorted({data.source for data in missing}):
+            if name not in self.sources:
+                logger.warning("[PREFETCH] Unknown data source: %s", name)
+                continue
+            source = self.sources[name]
+            limits[name] = threading.BoundedSemaphore(max(1, source.max_concurrency))
+            source_configs = [data for data in missing if data.source == name]
+            requests.extend(plan_requests(source_configs, max(1, source.max_batch_size), name, self.store))
+
+        report.requests = len(requests)
+        fetched: dict[tuple[str, str, str], list[tuple[PrefetchRequest, pd.DataFrame]]] = {}
+
+        if requests:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(requests))) as pool:
+                futures = {pool.submit(self._fetch, request, limits[request.source]): request for request in requests}
+                for future in as_completed(futures):
+                    request = futures[future]
+                    try:
+                        frames = future.result()
+                    except Exception as e:
+                        logger.warning("[PREFETCH] Request for %s failed: %r", ", ".join(request.tickers), e)
+                        continue
+
+                    if self.store is not None:
+                        for ticker in request.tickers:
+                            self.store.update(
+                                request.source,
+                                ticker,
+                                request.interval,
+                                frames.get(ticker),
+                                request.start_date,
+                                request.end_date,
+                            )
+                        continue
+
+                    for ticker in request.tickers:
+                        if ticker in frames:
+                            key = (request.source, ticker, request.interval)
+                            fetched.setdefault(key, []).append((request, frames[ticker]))
+
+        # the cache is written from this thread only, once for every dataset
+        items: list[tuple[CacheKey, Any]] = []
+        failed: set[str] = set()
+        for data in missing:
+            if self.store is not None:
+                df = self.store.read(data.source, data.ticker, data.interval, data.start_date, data.end_date)
+            else:
+                df = self._slice_for(data, fetched.get((data.source, data.ticker, data.interval), []))
+            if df is None or df.empty:
+                failed.add(data.ticker)
+                continue
+            try:  # validated here so the report is cached with the data and the sims do not validate it again
+                df, _ = validate_market_data(df, data.ticker, data.validation)
+            except InvalidDataError as e:
+                logger.warning("[PREFETCH] %s", e)
+                failed.add(data.ticker)
+                continue
+            items.append((self._get_cache_key(data), df))
+
+        if items:
+            self.cache.set_many(items)
+        report.fetched = len(items)
+        report.failed = sorted(failed)
+        report.seconds = time.perf_counter() - start
+
+        logger.info(
+            "[PREFETCH] %d of %d datasets fetched in %d requests (%.2fs), %d already cached.",
+            report.fetched,
+            report.datasets,
+            report.requests,
+            report.seconds,
+            report.cached,
+        )
+        if report.failed:
+            logger.warning("[PREFETCH] No data for %s; their sims will retry the download.", ", ".join(report.failed))
+        return report
+
+    def _fetch(self, request: PrefetchRequest, limit: threading.BoundedSemaphore) -> dict[str, pd.DataFrame]:
+        with limit:
+            return self.sources[request.source].fetch(
+                request.tickers, request.start_date, request.end_date, request.interval
+            )
+
+    @staticmethod
+    def _get_cache_key(data: DataConfig) -> CacheKey:
+        return CacheKey(data.ticker, data.start_date, data.end_date, data.interval, data.source, data.validation)
+
+    @staticmethod
+    def _slice_for(data: DataConfig, downloads: list[tuple[PrefetchRequest, pd.DataFrame]]) -> Optional[pd.DataFrame]:
+        """Cut a dataset out of the merged download that covers its date range."""
+        start, end = pd.Timestamp(data.start_date), pd.Timestamp(data.end_date)
+        for request, df in downloads:
+            if pd.Timestamp(request.start_date) <= start and end <= pd.Timestamp(request.end_date):
+                return slice_date_range(df, data.start_date, data.end_date).copy()
+        return None
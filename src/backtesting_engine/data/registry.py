@@ -0,0 +1,43 @@
+"""
+This module defines the registry of data sources a sim can name in its queue file.
+
+Each source is created the first time a sim asks for it, once per process, so a worker process keeps a single
+source, and a single pool of connections, for all its sims.
+"""
+
+from typing import Union
+
+from backtesting_engine.data.constants import HTTP_SOURCE, SYNTHETIC_SOURCE, YFINANCE_SOURCE
+from backtesting_engine.data.interfaces import IDataSource
+from backtesting_engine.registry import LazyRegistry
+
+
+class DataSourceRegistry(LazyRegistry[IDataSource]):
+    """
+    Maps source names to data sources, given as sources or as the import path "package.module:ClassName" of a source
+    class that can be created without arguments.
+    """
+
+    def __init__(self, sources: dict[str, Union[str, IDataSource]]) -> None:
+        super().__init__(sources, factory=lambda source_cls: source_cls())
+
+    def register(self, name: str, source: Union[str, IDataSource]) -> None:
+        """Add a source, or replace the one registered under the same name, closing it."""
+        previous = self._resolved.get(name)
+        super().register(name, source)
+        if previous is not None and previous is not source:
+            previous.close()
+
+    def close(self) -> None:
+        """Release the connections of every source created so far."""
+        for source in self._resolved.values():
+            source.close()
+
+
+DATA_SOURCES = DataSourceRegistry(
+    {
+        YFINANCE_SOURCE: "backtesting_engine.data.sources:YFinanceSource",
+        HTTP_SOURCE: "backtesting_engine.data.sources:HTTPSource",  # at the URL in BTX_DATA_SOURCE_URL
+        SYNTHETIC_SOURCE: "backtesting_engine.data.synthetic:SyntheticSource",  # generated GBM bars, for benchmarks
+    }
+)
@@ -0,0 +1,214 @@
+"""
+This module implements an append-only store of each ticker's price history, kept as a series of shard files.
+
+The data cache is keyed by the exact date range of a sim, so moving a queue's end date forward by a day misses the
+cache and used to download the full history again. The series store keeps, per (source, interval, ticker), the range
+it has downloaded and the timestamp of its latest bar. A later request whose range starts inside that history only
+fetches the missing tail, from the date of the latest bar (which is fetched again, in case it was still forming),
+and writes it to a new shard file. The shards already on disk are never rewritten, except when a series grows past
+SERIES_MAX_SHARDS shards and is compacted into one.
+
+Each series lives in its own directory with a small JSON manifest:
+
+    <root_dir>/<source>/<interval>/<ticker>/manifest.json
+    <root_dir>/<source>/<interval>/<ticker>/shard_00000.pkl, shard_00001.pkl, ...
+"""
+
+import json
+import os
+
+from dataclasses import asdict, dataclass, field
+from typing import Any, Optional
+
+import pandas as pd
+
+from filelock import FileLock
+
+from backtesting_engine.data.constants import (
+    SERIES_MANIFEST_FILE,
+    SERIES_MAX_SHARDS,
+    SERIES_READ_ATTEMPTS,
+    SERIES_STORE_DIR,
+)
+
+
+def slice_date_range(df: pd.DataFrame, start_date: str, end_date: str) -> pd.DataFrame:
+    """Rows from start_date up to, but excluding, end_date, matching what a download of that range returns."""
+    start, end = pd.Timestamp(start_date), pd.Timestamp(end_date)
+    tz = getattr(df.index, "tz", None)
+    if tz is not None:  # intraday bars carry the exchange's timezone
+        start, end = start.tz_localize(tz), end.tz_localize(tz)
+    return df[(df.index >= start) & (df.index < end)]
+
+
+@dataclass
+class ShardInfo:
+    file: str
+    first: str  # timestamps of the shard's first and last bars
+    last: str
+    rows: int
+
+
+@dataclass
+class SeriesManifest:
+    coverage_start: str  # the range downloaded so far, end exclusive; bars may be missing inside it (e.g. weekends)
+    coverage_end: str
+    last: Optional[str] = None  # timestamp of the latest bar held
+    next_shard: int = 0
+    shards: list[ShardInfo] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, fields: dict[str, Any]) -> "SeriesManifest":
+        shards = [ShardInfo(**shard) for shard in fields.pop("shards", [])]
+        return cls(**fields, shards=shards)
+
+
+class SeriesStore:
+    """Per-ticker price history on disk, extended by appending shards for the bars each refresh adds."""
+
+    def __init__(self, root_dir: str = SERIES_STORE_DIR, max_shards: int = SERIES_MAX_SHARDS) -> None:
+        """
+        Args:
+            root_dir (str): Directory the series are stored under.
+            max_shards (int): Shards a series may grow to before it is compacted into one.
+        """
+        self.root_dir = root_dir
+        self.max_shards = max_shards
+
+    def get_missing_range(
+        self, source: str, ticker: str, interval: str, start_date: str, end_date: str
+    ) -> Optional[tuple[str, str]]:
+        """
+        The range to download so the series covers start_date to end_date, or None if it already does. That is the
+        tail from the latest bar held when the series already starts early enough, or the whole range otherwise.
+        """
+        manifest = self._read_manifest(self._get_series_dir(source, ticker, interval))
+        return self._get_missing_range(manifest, start_date, end_date)
+
+    @staticmethod
+    def _get_missing_range(
+        manifest: Optional[SeriesManifest], start_date: str, end_date: str
+    ) -> Optional[tuple[str, str]]:
+        if manifest is None or pd.Timestamp(start_date) < pd.Timestamp(manifest.coverage_start):
+            end = end_date if manifest is None else max(end_date, manifest.coverage_end, key=pd.Timestamp)
+            return start_date, end
+        if pd.Timestamp(end_date) <= pd.Timestamp(manifest.coverage_end):
+            return None
+
+        tail_start = pd.Timestamp(manifest.last).strftime("%Y-%m-%d") if manifest.last else manifest.coverage_end
+        return tail_start, end_date
+
+    def update(
+        self, source: str, ticker: str, interval: str, df: Optional[pd.DataFrame], start_date: str, end_date: str
+    ) -> None:
+        """
+        Record the bars downloaded for start_date to end_date. A range starting inside the series' history is
+        appended as a new shard, where bars overlapping the latest ones replace them; any other range replaces the
+        series. A tail download with no bars (e.g. over a weekend) still extends the covered range, but one that
+        would replace the series leaves it as it was.
+        """
+        series_dir = self._get_series_dir(source, ticker, interval)
+        os.makedirs(series_dir, exist_ok=True)
+
+        with FileLock(os.path.join(series_dir, SERIES_MANIFEST_FILE + ".lock")):
+            manifest = self._read_manifest(series_dir)
+            replace = (
+                manifest is None
+                or pd.Timestamp(start_date) < pd.Timestamp(manifest.coverage_start)
+                or pd.Timestamp(start_date) > pd.Timestamp(manifest.coverage_end)
+            )
+            if replace and (df is None or df.empty):
+                return
+            if manifest is None or replace:
+                old_files = [shard.file for shard in manifest.shards] if manifest else []
+                next_shard = manifest.next_shard if manifest else 0  # new shards never reuse a replaced file's name
+                manifest = SeriesManifest(coverage_start=start_date, coverage_end=end_date, next_shard=next_shard)
+            else:
+                old_files = []
+                manifest.coverage_end = max(manifest.coverage_end, end_date, key=pd.Timestamp)
+
+            if df is not None and not df.empty:
+                self._write_shard(series_dir, manifest, df)
+            if len(manifest.shards) > self.max_shards:
+                old_files += self._compact(series_dir, manifest)
+
+            self._write_manifest(series_dir, manifest)
+            for file in old_files:  # only removed once the manifest no longer lists them
+                os.remove(os.path.join(series_dir, file))
+
+    def read(self, source: str, ticker: str, interval: str, start_date: str, end_date: str) -> Optional[pd.DataFrame]:
+        """
+        The bars from start_date up to, but excluding, end_date, or None if the series does not cover the range.
+
+        Reads take no lock: a compaction may remove the shards of the manifest a read started from, in which case it
+        starts again from the new manifest, and only takes the lock after SERIES_READ_ATTEMPTS such races.
+        """
+        series_dir = self._get_series_dir(source, ticker, interval)
+        for _ in range(SERIES_READ_ATTEMPTS):
+            try:
+                return self._read_range(series_dir, start_date, end_date)
+            except FileNotFoundError:
+                continue
+        with FileLock(os.path.join(series_dir, SERIES_MANIFEST_FILE + ".lock")):
+            return self._read_range(series_dir, start_date, end_date)
+
+    def _read_range(self, series_dir: str, start_date: str, end_date: str) -> Optional[pd.DataFrame]:
+        manifest = self._read_manifest(series_dir)
+        if manifest is None or self._get_missing_range(manifest, start_date, end_date) is not None:
+            return None
+
+        start, end = pd.Timestamp(start_date), pd.Timestamp(end_date)
+        shards = [
+            shard
+            for shard in manifest.shards
+            if pd.Timestamp(shard.last).tz_localize(None) >= start and pd.Timestamp(shard.first).tz_localize(None) < end
+        ]
+        if not shards:
+            return pd.DataFrame()
+
+        df = self._concat([pd.read_pickle(os.path.join(series_dir, shard.file)) for shard in shards])
+        return slice_date_range(df, start_date, end_date)
+
+    def _get_series_dir(self, source: str, ticker: str, interval: str) -> str:
+        return os.path.join(self.root_dir, source, interval, ticker.replace(os.sep, "_"))
+
+    @staticmethod
+    def _concat(frames: list[pd.DataFrame]) -> pd.DataFrame:
+        """Join shards in the order they were written, keeping the latest download of any bar fetched twice."""
+        df = pd.concat(frames) if len(frames) > 1 else frames[0]
+        return df[~df.index.duplicated(keep="last")]
+
+    def _write_shard(self, series_dir: str, manifest: SeriesManifest, df: pd.DataFrame) -> None:
+        file = f"shard_{manifest.next_shard:05d}.pkl"
+        df.to_pickle(os.path.join(series_dir, file))
+        manifest.next_shard += 1
+        manifest.shards.append(
+            ShardInfo(file=file, first=df.index[0].isoformat(), last=df.index[-1].isoformat(), rows=len(df))
+        )
+
+        if manifest.last is None or df.index[-1] >= pd.Timestamp(manifest.last):
+            manifest.last = df.index[-1].isoformat()
+
+    def _compact(self, series_dir: str, manifest: SeriesManifest) -> list[str]:
+        """Rewrite the series as a single shard. Returns the files it replaces."""
+        old_files = [shard.file for shard in manifest.shards]
+        df = self._concat([pd.read_pickle(os.path.join(series_dir, file)) for file in old_files])
+        manifest.shards = []
+        self._write_shard(series_dir, manifest, df)
+        return old_files
+
+    @staticmethod
+    def _read_manifest(series_dir: str) -> Optional[SeriesManifest]:
+        path = os.path.join(series_dir, SERIES_MANIFEST_FILE)
+        if not os.path.exists(path):
+            return None
+        with open(path, "r") as file:
+            return SeriesManifest.from_dict(json.load(file))
+
+    @staticmethod
+    def _write_manifest(series_dir: str, manifest: SeriesManifest) -> None:
+        """Write the manifest to a temporary file first, so readers only ever see a complete one."""
+        path = os.path.join(series_dir, SERIES_MANIFEST_FILE)
+        with open(path + ".tmp", "w") as file:
+            json.dump(asdict(manifest), file)
+        os.replace(path + ".tmp", path)
@@ -0,0 +1,197 @@
+"""
+This module implements the market data sources the engine can fetch from.
+"""
+
+import os
+import threading
+
+from typing import Any, Optional
+
+import pandas as pd
+
+from backtesting_engine.data.constants import (
+    HTTP_MAX_BATCH_SIZE,
+    HTTP_MAX_CONCURRENCY,
+    HTTP_RETRIES,
+    HTTP_RETRY_BACKOFF,
+    HTTP_RETRY_STATUSES,
+    HTTP_SOURCE_URL_ENV_VAR,
+    HTTP_TIMEOUT,
+    YFINANCE_DOWNLOAD_THREADS,
+    YFINANCE_MAX_BATCH_SIZE,
+)
+from backtesting_engine.data.interfaces import IDataSource
+
+
+def split_by_ticker(df: pd.DataFrame, tickers: list[str]) -> dict[str, pd.DataFrame]:
+    """
+    Split a multi-ticker download into one frame per ticker. The ticker may be on either level of the columns,
+    depending on how the download was grouped. Rows a ticker has no data for (e.g. before it listed) are dropped.
+    """
+    if not isinstance(df.columns, pd.MultiIndex):
+        return {tickers[0]: df} if len(tickers) == 1 and not df.empty else {}
+
+    frames: dict[str, pd.DataFrame] = {}
+    for level in range(df.columns.nlevels):
+        names = set(df.columns.get_level_values(level))
+        for ticker in tickers:
+            if ticker in names:
+                frame = df.xs(ticker, axis=1, level=level).dropna(how="all")
+                if not frame.empty:
+                    frames[ticker] = frame
+        if frames:
+            break
+    return frames
+
+
+def frame_from_split(payload: dict[str, Any]) -> pd.DataFrame:
+    """Build a frame of bars from pandas' "split" JSON layout: {"index": [...], "columns": [...], "data": [...]}."""
+    index = pd.DatetimeIndex(pd.to_datetime(payload["index"]), name="Date")
+    return pd.DataFrame(payload["data"], index=index, columns=payload["columns"])
+
+
+class YFinanceSource(IDataSource):
+    """
+    Yahoo Finance, through yfinance. One call downloads a batch of tickers on yfinance's own threads, over the
+    session yfinance keeps for the whole process.
+
+    yf.download keeps its results in module-level state, so calls must not overlap and the source allows a single
+    request in flight.
+    """
+
+    max_batch_size = YFINANCE_MAX_BATCH_SIZE
+    max_concurrency = 1
+
+    def fetch(
+        self, tickers: list[str], start_date: str, end_date: str, interval: str = "1d"
+    ) -> dict[str, pd.DataFrame]:
+        import yfinance as yf  # slow to import and unused when every dataset is cached
+
+        if len(tickers) == 1:
+            df = yf.download(tickers[0], start=start_date, end=end_date, interval=interval)
+            if df is None:
+                return {}
+
+            # a single ticker's columns carry the ticker as a second level, which is dropped
+            if isinstance(df.columns, pd.MultiIndex):
+                df.columns = df.columns.droplevel(1)
+            return {tickers[0]: df}
+
+        df = yf.download(
+            tickers,
+            start=start_date,
+            end=end_date,
+            interval=interval,
+            group_by="ticker",
+            threads=YFINANCE_DOWNLOAD_THREADS,
+            progress=False,
+        )
+        if df is None:
+            return {}
+        return split_by_ticker(df, tickers)
+
+
+class HTTPSource(IDataSource):
+    """
+    A REST market data service, queried as
+
+        GET <base_url>/bars?tickers=AAPL,MSFT&start=2020-01-01&end=2021-01-01&interval=1d
+
+    which answers with a JSON object mapping each ticker to its bars in pandas' "split" layout. Tickers the service
+    has no data for are left out of the answer.
+
+    Requests go through one keep-alive session per process, whose connection pool holds `max_concurrency`
+    connections, and are retried with exponential backoff on connection errors and on 429 and 5xx responses.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        max_batch_size: int = HTTP_MAX_BATCH_SIZE,
+        max_concurrency: int = HTTP_MAX_CONCURRENCY,
+        retries: int = HTTP_RETRIES,
+        retry_backoff: float = HTTP_RETRY_BACKOFF,
+        timeout: float = HTTP_TIMEOUT,
+        keep_alive: bool = True,
+    ) -> None:
+        """
+        Args:
+            base_url (Optional[str]): Root URL of the service. Defaults to the BTX_DATA_SOURCE_URL environment
+                variable, which is how worker processes pick up the URL.
+            max_batch_size (int): Tickers per request.
+            max_concurrency (int): Requests in flight at once, and size of the connection pool.
+            retries (int): Retries of a failed request before giving up.
+            retry_backoff (float): Seconds to wait before the first retry, doubled on every retry after.
+            timeout (float): Seconds to wait for the service to connect and to answer.
+            keep_alive (bool): Reuse connections between requests. Only worth turning off to measure what the
+                pooling saves.
+        """
+        base_url = base_url or os.environ.get(HTTP_SOURCE_URL_ENV_VAR)
+        if not base_url:
+            raise ValueError(f"HTTPSource needs a base_url or the {HTTP_SOURCE_URL_ENV_VAR} environment variable.")
+
+        self.base_url = base_url.rstrip("/")
+        self.max_batch_size = max_batch_size
+        self.max_concurrency = max_concurrency
+        self.retries = retries
+        self.retry_backoff = retry_backoff
+        self.timeout = timeout
+        self.keep_alive = keep_alive
+
+        self._session: Any = None
+        self._session_pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> Any:
+        """The process's requests session, created on first use. A forked process gets its own connections."""
+        with self._lock:
+            if self._session is None or self._session_pid != os.getpid():
+                self._session = self._create_session()
+                self._session_pid = os.getpid()
+            return self._session
+
+    def _create_session(self) -> Any:
+        import requests
+
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retry = Retry(
+            total=self.retries,
+            backoff_factor=self.retry_backoff,
+            status_forcelist=HTTP_RETRY_STATUSES,
+            allowed_methods=["GET"],
+            raise_on_status=False,  # the final response is returned, and raised on below
+        )
+        # a blocking pool never opens more than max_concurrency connections, whatever the number of threads
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrency, max_retries=retry, pool_block=True)
+
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def fetch(
+        self, tickers: list[str], start_date: str, end_date: str, interval: str = "1d"
+    ) -> dict[str, pd.DataFrame]:
+        response = self.session.get(
+            f"{self.base_url}/bars",
+            params={"tickers": ",".join(tickers), "start": start_date, "end": end_date, "interval": interval},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+
+        frames = {}
+        for ticker, payload in response.json().items():
+            if ticker in tickers and payload["data"]:
+                frames[ticker] = frame_from_split(payload)
+        return frames
+
+    def close(self) -> None:
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
@@ -0,0 +1,241 @@
+"""
+This module implements a data source that generates market data instead of downloading it.
+
+Benchmarks run against Yahoo Finance depend on the network and are limited to the history of real tickers. The
+synthetic source generates OHLCV bars for any ticker, daily or intraday and of any length, from one of three price
+models:
+
+    - gbm: geometric Brownian motion, log-normal returns with constant drift and volatility.
+    - jump_diffusion: Merton's model, GBM plus jumps arriving as a Poisson process with normally distributed sizes.
+    - regime_switching: GBM whose drift and volatility switch between a calm and a turbulent regime, each lasting a
+      geometrically distributed number of bars.
+
+Generation is vectorised: every random component is drawn as one array, and prices are a cumulative sum of log
+returns. Each component has its own random stream, seeded by the source's seed and the ticker, so a ticker's bars are
+the same however many bars are generated, and every series starts at SYNTHETIC_EPOCH, so a range of a series comes
+out the same whichever range was requested around it.
+"""
+
+import zlib
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from backtesting_engine.data.constants import (
+    GBM_MODEL,
+    JUMP_DIFFUSION_MODEL,
+    REGIME_SWITCHING_MODEL,
+    SESSION_OPEN,
+    SYNTHETIC_EPOCH,
+    SYNTHETIC_MAX_BATCH_SIZE,
+    SYNTHETIC_SEED,
+    SYNTHETIC_SOURCE,
+    TRADING_DAYS_PER_YEAR,
+    TRADING_HOURS_PER_DAY,
+)
+from backtesting_engine.data.interfaces import IDataSource
+from backtesting_engine.data.series_store import SeriesStore, slice_date_range
+
+
+# one random stream per component, so drawing more bars of one never shifts the draws of another
+_DIFFUSION, _JUMP_COUNTS, _JUMP_SIZES, _REGIMES, _GAPS, _HIGHS, _LOWS, _VOLUMES = range(8)
+
+
+@dataclass
+class SyntheticParams:
+    initial_price: float = 100.0
+    drift: float = 0.08  # annualised
+    volatility: float = 0.2  # annualised
+    jump_intensity: float = 3.0  # jump_diffusion: expected jumps per year
+    jump_mean: float = -0.02  # jump_diffusion: mean log size of a jump
+    jump_std: float = 0.06
+    turbulent_drift: float = -0.15  # regime_switching: drift and volatility of the turbulent regime
+    turbulent_volatility: float = 0.4
+    calm_years: float = 3.0  # regime_switching: mean duration of each regime
+    turbulent_years: float = 0.5
+    volume: float = 5_000_000  # median volume per daily bar
+
+
+def get_bar_length(interval: str) -> pd.Timedelta:
+    """Length of an intraday bar. Bars of a day or longer, other than "1d", cannot be generated."""
+    try:
+        length = pd.Timedelta(interval)
+    except ValueError:
+        length = None
+    if length is None or length >= pd.Timedelta(days=1):
+        raise ValueError(f"Synthetic data has daily (1d) or intraday bars, not {interval} bars")
+    return length
+
+
+def get_session_bars(interval: str) -> int:
+    """Number of bars in a 6.5h session, the last one cut short by the close if the bars do not divide it."""
+    if interval == "1d":
+        return 1
+    return int(np.ceil(pd.Timedelta(hours=TRADING_HOURS_PER_DAY) / get_bar_length(interval)))
+
+
+def get_bar_years(interval: str) -> float:
+    """Length of a bar in trading years: a daily bar is 1/252 of one, an intraday bar its share of a session."""
+    return 1 / (get_session_bars(interval) * TRADING_DAYS_PER_YEAR)
+
+
+def get_bar_index(start_date: str, periods: int, interval: str = "1d") -> pd.DatetimeIndex:
+    """
+    Timestamps of periods bars from start_date: one per business day for daily bars, and for intraday bars a session
+    of them from SESSION_OPEN on each business day, as an exchange would publish them.
+    """
+    if interval == "1d":
+        return pd.date_range(start_date, periods=periods, freq="B", name="Date")
+    session_bars = get_session_bars(interval)
+    days = pd.bdate_range(start_date, periods=-(-periods // session_bars))
+    bar_length = get_bar_length(interval).to_timedelta64()
+    offsets = pd.Timedelta(SESSION_OPEN).to_timedelta64() + np.arange(session_bars) * bar_length
+    timestamps = (days.to_numpy()[:, None] + offsets[None, :]).ravel()[:periods]
+    return pd.DatetimeIndex(timestamps, name="Date")
+
+
+def count_bars(start_date: str, end_date: str, interval: str = "1d") -> int:
+    """Number of bars from start_date up to, but excluding, end_date."""
+    if pd.Timestamp(end_date) <= pd.Timestamp(start_date):
+        return 0
+    days = int(np.busday_count(pd.Timestamp(start_date).date(), pd.Timestamp(end_date).date()))
+    return days * get_session_bars(interval)
+
+
+def _get_rng(seed: int, ticker: str, component: int) -> np.random.Generator:
+    return np.random.default_rng([seed, zlib.crc32(ticker.encode()), component])
+
+
+def _get_regimes(rng: np.random.Generator, periods: int, mean_bars: tuple[float, float]) -> np.ndarray:
+    """Regime of each bar, 0 (calm) or 1 (turbulent), starting calm, with geometric regime durations."""
+    durations: list[np.ndarray] = []
+    total = 0
+    while total < periods:  # draws continue the same stream, so a longer series extends a shorter one
+        chunk = rng.geometric(1 / np.repeat([[mean_bars[0], mean_bars[1]]], 64, axis=0).ravel())
+        durations.append(chunk)
+        total += int(chunk.sum())
+    lengths = np.concatenate(durations)
+    regimes = np.resize(np.array([0, 1], dtype=np.int8), len(lengths))
+    return np.repeat(regimes, lengths)[:periods]
+
+
+def generate_log_returns(
+    ticker: str, periods: int, interval: str, model: str, params: SyntheticParams, seed: int
+) -> np.ndarray:
+    """Log returns of periods bars of a ticker under a price model."""
+    dt = get_bar_years(interval)
+    shocks = _get_rng(seed, ticker, _DIFFUSION).standard_normal(periods)
+
+    if model == REGIME_SWITCHING_MODEL:
+        mean_bars = (max(params.calm_years / dt, 1.0), max(params.turbulent_years / dt, 1.0))
+        turbulent = _get_regimes(_get_rng(seed, ticker, _REGIMES), periods, mean_bars).astype(bool)
+        drift = np.where(turbulent, params.turbulent_drift, params.drift)
+        volatility = np.where(turbulent, params.turbulent_volatility, params.volatility)
+        return (drift - 0.5 * volatility**2) * dt + volatility * np.sqrt(dt) * shocks
+
+    returns = (params.drift - 0.5 * params.volatility**2) * dt + params.volatility * np.sqrt(dt) * shocks
+    if model == JUMP_DIFFUSION_MODEL:
+        jumps = _get_rng(seed, ticker, _JUMP_COUNTS).poisson(params.jump_intensity * dt, periods)
+        sizes = _get_rng(seed, ticker, _JUMP_SIZES).standard_normal(periods)
+        returns += jumps * params.jump_mean + np.sqrt(jumps) * params.jump_std * sizes  # sum of `jumps` jumps
+    elif model != GBM_MODEL:
+        raise ValueError(f"Unknown synthetic price model: {model}")
+    return returns
+
+
+def make_synthetic_bars(
+    ticker: str,
+    start_date: str,
+    periods: int,
+    interval: str = "1d",
+    model: str = GBM_MODEL,
+    params: Optional[SyntheticParams] = None,
+    seed: int = SYNTHETIC_SEED,
+) -> pd.DataFrame:
+    """
+    OHLCV bars of a ticker, periods bars from start_date. Each bar opens near the previous close, and its High and
+    Low bound its Open and Close.
+    """
+    params = params or SyntheticParams()
+    dt = get_bar_years(interval)
+    bar_volatility = params.volatility * np.sqrt(dt)
+
+    log_close = np.log(params.initial_price) + np.cumsum(
+        generate_log_returns(ticker, periods, interval, model, params, seed)
+    )
+    close = np.exp(log_close)
+    previous_close = np.concatenate(([params.initial_price], close[:-1]))
+    open_ = previous_close * np.exp(0.1 * bar_volatility * _get_rng(seed, ticker, _GAPS).standard_normal(periods))
+    high = np.maximum(open_, close) * np.exp(
+        np.abs(0.5 * bar_volatility * _get_rng(seed, ticker, _HIGHS).standard_normal(periods))
+    )
+    low = np.minimum(open_, close) * np.exp(
+        -np.abs(0.5 * bar_volatility * _get_rng(seed, ticker, _LOWS).standard_normal(periods))
+    )
+    volume = params.volume * dt * TRADING_DAYS_PER_YEAR * _get_rng(seed, ticker, _VOLUMES).lognormal(0, 0.3, periods)
+
+    return pd.DataFrame(
+        {"Open": open_, "High": high, "Low": low, "Close": close, "Volume": volume.astype(np.int64)},
+        index=get_bar_index(start_date, periods, interval),
+    )
+
+
+class SyntheticSource(IDataSource):
+    """Generated bars for any ticker, deterministic for a given model, parameters and seed."""
+
+    max_batch_size = SYNTHETIC_MAX_BATCH_SIZE
+    max_concurrency = 4  # NumPy releases the GIL while it generates
+
+    def __init__(
+        self,
+        model: str = GBM_MODEL,
+        params: Optional[SyntheticParams] = None,
+        seed: int = SYNTHETIC_SEED,
+        epoch: str = SYNTHETIC_EPOCH,
+    ) -> None:
+        """
+        Args:
+            model (str): Price model, "gbm", "jump_diffusion" or "regime_switching".
+            params (Optional[SyntheticParams]): Parameters of the model, the defaults if not given.
+            seed (int): Seed of every series the source generates.
+            epoch (str): Date every series starts at. A range is generated from the epoch, so the time a fetch takes
+                grows with the bars between the epoch and the range's end; move it forward for long intraday ranges.
+        """
+        if model not in (GBM_MODEL, JUMP_DIFFUSION_MODEL, REGIME_SWITCHING_MODEL):
+            raise ValueError(f"Unknown synthetic price model: {model}")
+        self.model = model
+        self.params = params or SyntheticParams()
+        self.seed = seed
+        self.epoch = epoch
+
+    def fetch(
+        self, tickers: list[str], start_date: str, end_date: str, interval: str = "1d"
+    ) -> dict[str, pd.DataFrame]:
+        periods = count_bars(self.epoch, end_date, interval)
+        frames = {}
+        for ticker in tickers:
+            df = make_synthetic_bars(ticker, self.epoch, periods, interval, self.model, self.params, self.seed)
+            df = slice_date_range(df, start_date, end_date)
+            if not df.empty:  # ranges before the epoch have no bars, like a ticker before it listed
+                frames[ticker] = df
+        return frames
+
+    def fill_store(
+        self,
+        store: SeriesStore,
+        tickers: list[str],
+        start_date: str,
+        end_date: str,
+        interval: str = "1d",
+        source: str = SYNTHETIC_SOURCE,
+    ) -> None:
+        """
+        Generate the tickers' bars straight into a series store, where every worker's loader finds them, without
+        going through the data cache.
+        """
+        for ticker in tickers:
+            df = self.fetch([ticker], start_date, end_date, interval).get(ticker)
+            store.update(source, ticker, interval, df, start_date, end_date)
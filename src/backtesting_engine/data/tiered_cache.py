@@ -0,0 +1,167 @@
+"""
+This module implements a process-level, in-memory tier in front of the persistent disk cache.
+
+Every sim a worker runs used to open its own PersistentLRUCache, unpickling the whole cache file under the file lock
+each time. The tiered cache is created once per process instead and keeps recently used frames decoded in memory,
+bounded by their measured size. The disk file is only re-read when another process has saved it since (its inode,
+mtime or size changed). A memory entry remembers which write stored it, and after the file changes it is checked
+against that entry alone: it is kept if the entry was not rewritten, and dropped if the entry was replaced or
+evicted, so a worker never serves stale data and a write of one ticker does not flush the rest of the tier.
+"""
+
+import os
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional
+
+from backtesting_engine.data.constants import DISK_TIER, MEMORY_CACHE_MAX_BYTES, MEMORY_TIER
+from backtesting_engine.data.interfaces import CacheStats, ILocalCache
+from backtesting_engine.data.lru_cache import CacheKey, FileVersion, PersistentLRUCache, get_nbytes
+
+
+@dataclass
+class _MemoryEntry:
+    value: Any
+    nbytes: int
+    write_id: Optional[int]  # the disk cache's write of the entry the value came from, None if it was not cached there
+    version: FileVersion  # latest version of the disk cache the write was found still current in
+
+
+class TieredCache(ILocalCache):
+    """Two-tier cache: a size-bounded LRU of decoded values in memory, backed by the persistent disk cache."""
+
+    def __init__(
+        self, disk: Optional[PersistentLRUCache] = None, max_memory_bytes: int = MEMORY_CACHE_MAX_BYTES
+    ) -> None:
+        self.disk = disk or PersistentLRUCache()
+        self.max_memory_bytes = max_memory_bytes
+        self.memory_stats = CacheStats()
+
+        self._memory: OrderedDict[CacheKey, _MemoryEntry] = OrderedDict()
+
+    @property
+    def stats(self) -> dict[str, CacheStats]:
+        """Statistics of each tier. The disk tier's include the lookups made by other users of the disk cache."""
+        return {MEMORY_TIER: self.memory_stats, DISK_TIER: self.disk.stats}
+
+    @property
+    def memory_bytes(self) -> int:
+        return self.memory_stats.bytes_in_use
+
+    def reset_stats(self) -> None:
+        """Start counting from zero, keeping the current sizes of the tiers."""
+        self.memory_stats = CacheStats(bytes_in_use=self.memory_stats.bytes_in_use)
+        self.disk.stats = CacheStats(bytes_in_use=self.disk.stats.bytes_in_use)
+
+    def _get_from_memory(self, key: CacheKey, version: FileVersion) -> Optional[_MemoryEntry]:
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        if entry.version != version:  # the file was saved since, perhaps with this entry replaced or evicted
+            self.disk.reload_if_changed()
+            if self.disk.get_write_id(key) != entry.write_id:
+                self._remove(key)
+                return None
+            entry.version = version
+
+        self._memory.move_to_end(key)
+        return entry
+
+    def get(self, key: CacheKey) -> Any:
+        """Get an item from the fastest tier that has it."""
+        entry = self._get_from_memory(key, self.disk.get_file_version())
+        if entry is not None:
+            self.memory_stats.hits += 1
+            return entry.value
+        self.memory_stats.misses += 1
+
+        self.disk.reload_if_changed()
+        value = self.disk.get(key)
+        if value is None:
+            return None
+
+        self._store(key, value)
+        return value
+
+    def set(self, key: CacheKey, value: Any) -> None:
+        """Set an item in both tiers."""
+        self.disk.set(key, value)
+        self._store(key, value)
+
+    def set_many(self, items: Iterable[tuple[CacheKey, Any]]) -> None:
+        """Set several items in both tiers, writing the disk cache once."""
+        items = list(items)
+        self.disk.set_many(items)
+        for key, value in items:
+            self._store(key, value)
+
+    def has(self, key: CacheKey) -> bool:
+        """Check if an item exists in either tier."""
+        if self._get_from_memory(key, self.disk.get_file_version()) is not None:
+            return True
+
+        self.disk.reload_if_changed()
+        return self.disk.has(key)
+
+    def clear(self) -> None:
+        """Clear both tiers."""
+        self._memory.clear()
+        self.memory_stats.bytes_in_use = 0
+        self.disk.clear()
+
+    def format_stats(self) -> str:
+        """One-line summary of the hit ratio of each tier."""
+        return ", ".join(
+            f"{tier} {stats.hit_ratio:.1%} hits ({stats.hits}/{stats.hits + stats.misses})"
+            for tier, stats in self.stats.items()
+        )
+
+    def _store(self, key: CacheKey, value: Any) -> None:
+        self._remove(key)
+
+        nbytes = get_nbytes(value)
+        if nbytes > self.max_memory_bytes:
+            return  # larger than the whole tier, so only kept on disk
+
+        self._memory[key] = _MemoryEntry(
+            value=value, nbytes=nbytes, write_id=self.disk.get_write_id(key), version=self.disk.version
+        )
+        self.memory_stats.bytes_in_use += nbytes
+        while self.memory_stats.bytes_in_use > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self.memory_stats.bytes_in_use -= evicted.nbytes
+            self.memory_stats.evictions += 1
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._memory.pop(key, None)
+        if entry is not None:
+            self.memory_stats.bytes_in_use -= entry.nbytes
+
+
+_process_cache: Optional[TieredCache] = None
+_process_cache_pid: Optional[int] = None
+
+
+def get_process_cache() -> TieredCache:
+    """
+    The tiered cache shared by everything running in this process, created on first use.
+
+    A process forked from one that already has a cache (e.g. pool workers forked from a preloaded forkserver) starts
+    from a copy of its memory tier, with fresh statistics.
+    """
+    global _process_cache, _process_cache_pid
+
+    if _process_cache is None:
+        _process_cache = TieredCache()
+    if _process_cache_pid != os.getpid():
+        _process_cache_pid = os.getpid()
+        _process_cache.reset_stats()
+    return _process_cache
+
+
+def get_process_cache_stats() -> Optional[str]:
+    """Hit ratio summary of this process's cache, or None if it has not been used."""
+    if _process_cache is None or _process_cache_pid != os.getpid():
+        return None
+    return _process_cache.format_stats()
@@ -0,0 +1,160 @@
+"""
+This module implements the validation of market data before it is backtested.
+
+A dataset must be non-empty, indexed by timestamps and have a Close column; data failing those checks cannot be
+backtested at all. Beyond them, every bar is checked, in one vectorised pass over the index and a single array of the
+price columns, for:
+
+    - timestamps out of order or repeated,
+    - missing Close prices,
+    - prices that are zero or negative,
+    - High and Low prices that do not bound the bar's Open, Close and each other.
+
+In strict mode any of these fails the load. In lenient mode bars with a repeated timestamp (all but the last), a
+missing Close or a non-positive price are dropped, the bars are sorted, and every issue is reported; inconsistent
+OHLC bars are kept, as the Close the strategies trade on may still be right.
+
+The report is stored in the DataFrame's attrs, so it is cached with the data and a cache hit does not validate again.
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from backtesting_engine.constants import CLOSE_COLUMN, PRICE_COLUMNS
+from backtesting_engine.data.constants import (
+    LENIENT_VALIDATION,
+    OHLC_TOLERANCE,
+    STRICT_VALIDATION,
+    VALIDATION_ATTR,
+    VALIDATION_VERSION,
+)
+from backtesting_engine.exceptions import InvalidDataError
+
+
+UNSORTED_INDEX = "unsorted_index"
+DUPLICATE_TIMESTAMPS = "duplicate_timestamps"
+MISSING_CLOSE = "missing_close"
+NON_POSITIVE_PRICES = "non_positive_prices"
+INCONSISTENT_OHLC = "inconsistent_ohlc"
+
+ISSUE_DESCRIPTIONS = {
+    UNSORTED_INDEX: "bars out of time order",
+    DUPLICATE_TIMESTAMPS: "bars with a repeated timestamp",
+    MISSING_CLOSE: "bars with NaN values in the 'Close' column",
+    NON_POSITIVE_PRICES: "bars with a zero or negative price",
+    INCONSISTENT_OHLC: "bars whose High and Low do not bound their prices",
+}
+
+
+@dataclass
+class ValidationReport:
+    ticker: str
+    mode: str
+    rows: int = 0  # bars checked
+    issues: dict[str, int] = field(default_factory=dict)  # issue -> bars affected, for issues found
+    rows_dropped: int = 0  # bars a lenient validation removed
+    version: int = VALIDATION_VERSION
+
+    @property
+    def ok(self) -> bool:
+        return not self.issues
+
+    def summary(self) -> str:
+        if self.ok:
+            return f"{self.ticker}: {self.rows} bars, no issues"
+        issues = ", ".join(f"{count} {ISSUE_DESCRIPTIONS[issue]}" for issue, count in self.issues.items())
+        dropped = f" ({self.rows_dropped} dropped)" if self.rows_dropped else ""
+        return f"{self.ticker}: {self.rows} bars, {issues}{dropped}"
+
+
+def check_structure(df: pd.DataFrame) -> None:
+    """Raise if the data cannot be backtested at all, whatever the validation mode."""
+    if df.empty:
+        raise InvalidDataError("Loaded DataFrame is empty.")
+
+    if not isinstance(df.index, pd.DatetimeIndex):
+        raise InvalidDataError("DataFrame index must be a DatetimeIndex.")
+
+    if CLOSE_COLUMN not in df.columns:
+        raise InvalidDataError("Data must contain a 'Close' column for SMA calculations.")
+
+
+def find_issues(df: pd.DataFrame) -> dict[str, np.ndarray]:
+    """A boolean mask of the bars affected by each issue, in a single pass over the data."""
+    timestamps = df.index.asi8
+    price_columns = [column for column in PRICE_COLUMNS if column in df.columns]
+    prices = df[price_columns].to_numpy(dtype="float64")
+    column = {name: prices[:, i] for i, name in enumerate(price_columns)}
+
+    with np.errstate(invalid="ignore"):  # NaN prices compare False, so they only count as missing Close prices
+        inconsistent = np.zeros(len(df), dtype=bool)
+        if "High" in column and "Low" in column:
+            high, low = column["High"], column["Low"]
+            inconsistent |= high < low
+            for name in ("Open", CLOSE_COLUMN):
+                if name in column:
+                    inconsistent |= high < column[name] * (1 - OHLC_TOLERANCE)
+                    inconsistent |= low > column[name] * (1 + OHLC_TOLERANCE)
+
+        return {
+            UNSORTED_INDEX: np.concatenate(([False], timestamps[1:] < timestamps[:-1])),
+            DUPLICATE_TIMESTAMPS: df.index.duplicated(keep="last"),
+            MISSING_CLOSE: np.isnan(column[CLOSE_COLUMN]),
+            NON_POSITIVE_PRICES: (prices <= 0).any(axis=1),
+            INCONSISTENT_OHLC: inconsistent,
+        }
+
+
+def validate_market_data(
+    df: pd.DataFrame, ticker: str = "", mode: str = STRICT_VALIDATION
+) -> tuple[pd.DataFrame, ValidationReport]:
+    """
+    Validate a dataset. Returns the data, repaired in lenient mode, with the report stored in its attrs.
+
+    Raises:
+        InvalidDataError: If the data cannot be backtested, or has any issue in strict mode.
+    """
+    if mode not in (STRICT_VALIDATION, LENIENT_VALIDATION):
+        raise ValueError(f"Unknown validation mode: {mode}")
+
+    check_structure(df)
+    masks = find_issues(df)
+    report = ValidationReport(
+        ticker=ticker,
+        mode=mode,
+        rows=len(df),
+        issues={issue: int(mask.sum()) for issue, mask in masks.items() if mask.any()},
+    )
+
+    if mode == STRICT_VALIDATION and not report.ok:
+        raise InvalidDataError(f"Data failed validation: {report.summary()}")
+
+    if not report.ok:
+        drop = masks[DUPLICATE_TIMESTAMPS] | masks[MISSING_CLOSE] | masks[NON_POSITIVE_PRICES]
+        if drop.any():
+            df = df[~drop]
+        if report.issues.get(UNSORTED_INDEX):
+            df = df.sort_index(kind="stable")
+        report.rows_dropped = int(drop.sum())
+        if df.empty:
+            raise InvalidDataError(f"No valid bars left after validation: {report.summary()}")
+
+    df.attrs[VALIDATION_ATTR] = report
+    return df, report
+
+
+def get_cached_mode(df: pd.DataFrame) -> Optional[str]:
+    """The mode a cached dataset was validated in, or None if it was cached without a report."""
+    report = df.attrs.get(VALIDATION_ATTR)
+    return report.mode if isinstance(report, ValidationReport) else None
+
+
+def get_cached_report(df: pd.DataFrame, mode: str) -> Optional[ValidationReport]:
+    """The report cached with a dataset, if it is from a validation in the same mode by the current checks."""
+    report = df.attrs.get(VALIDATION_ATTR)
+    if isinstance(report, ValidationReport) and report.mode == mode and report.version == VALIDATION_VERSION:
+        return report
+    return None
@@ -2,22 +2,30 @@
 This module implements the backtesting engine for executing trading strategies.
 """
 
-from typing import Callable, cast
+from typing import Callable, Optional, cast
 
+import numpy as np
 import pandas as pd
 
-from backtesting_engine.analytics.interfaces import IMetricsCreator, IPlotGenerator
+from backtesting_engine.analytics.interfaces import BacktestMetrics, IMetricsCreator, IPlotGenerator
+from backtesting_engine.compact import compact_results, compact_signals
 from backtesting_engine.constants import (
     BUY,
     CASH_COLUMN,
     CLOSE_COLUMN,
+    COMPACT_POSITION_DTYPE,
+    EXECUTION_STAGE,
     HOLDINGS_COLUMN,
+    METRICS_STAGE,
+    PLOTTING_STAGE,
     POSITION_COLUMN,
     SELL,
     SIGNAL_COLUMN,
+    SIGNALS_STAGE,
     TOTAL_VALUE_COLUMN,
 )
 from backtesting_engine.interfaces import EngineConfig, EngineContext, TradeLogEntry
+from backtesting_engine.timing import StageTimer
 
 
 class BTXEngine:
@@ -44,24 +52,44 @@ class BTXEngine:
         self.config = config
 
         self.trade_log: list[TradeLogEntry] = []
+        self.metrics: Optional[BacktestMetrics] = None
+
+        self.timer = StageTimer(enabled=config.time_stages)
+
+    @property
+    def timings(self) -> dict[str, float]:
+        """Seconds the last backtest spent in each stage, empty unless the config times stages."""
+        return self.timer.timings
 
     def run_backtest(self) -> pd.DataFrame:
         """
         Run main backtest loop.
         """
-        df = self.strategy.generate_signals()
-        df = self._backtest_single_ticker(df, self.ticker)
+        self.timer.reset()
+        with self.timer.stage(SIGNALS_STAGE):
+            df = self.strategy.generate_signals()
+            if not self.config.keep_indicators:
+                df = df.drop(columns=[column for column in self.strategy.indicator_columns if column in df.columns])
+            if self.config.compact:
+                df[SIGNAL_COLUMN] = compact_signals(df[SIGNAL_COLUMN])
+
+        with self.timer.stage(EXECUTION_STAGE):
+            df = self._backtest_single_ticker(df, self.ticker)
+            if self.config.compact:
+                df = compact_results(df)
         self.data = df
 
         # Calculate performance metrics after the backtest is complete
-        metrics_creator = self.metrics_creator(df, self.ticker)
-        metrics_creator.get_backtest_metrics()
+        with self.timer.stage(METRICS_STAGE):
+            metrics_creator = self.metrics_creator(df, self.ticker)
+            self.metrics = metrics_creator.get_backtest_metrics()
         # performance_metrics.pretty_print()
 
         # Generate plots for the backtest results
         if self.config.generate_output:
-            plot_generator = self.plot_generator(df, self.strategy.__class__.__name__, self.context)
-            plot_generator.generate()
+            with self.timer.stage(PLOTTING_STAGE):
+                plot_generator = self.plot_generator(df, self.strategy.__class__.__name__, self.context)
+                plot_generator.generate()
 
         return df
 
@@ -71,10 +99,19 @@ class BTXEngine:
 
         This method updates the DataFrame with trading signals and portfolio values.
         """
-        df.at[df.index[0], POSITION_COLUMN] = 0
-        df.at[df.index[0], CASH_COLUMN] = float(self.initial_cash)
-        df.at[df.index[0], HOLDINGS_COLUMN] = 0.0
-        df.at[df.index[0], TOTAL_VALUE_COLUMN] = float(self.initial_cash)  # all cash on day 0
+        # the portfolio columns are allocated whole before the loop, in compact mode with positions as int64 from the
+        # start, rather than growing the frame one column at a time and casting the positions afterwards
+        if self.config.compact:
+            df[POSITION_COLUMN] = np.zeros(len(df), dtype=COMPACT_POSITION_DTYPE)
+        else:
+            df[POSITION_COLUMN] = np.full(len(df), np.nan)
+        for column in (CASH_COLUMN, HOLDINGS_COLUMN, TOTAL_VALUE_COLUMN):
+            df[column] = np.full(len(df), np.nan)
+
+        df.iat[0, df.columns.get_loc(POSITION_COLUMN)] = 0
+        df.iat[0, df.columns.get_loc(CASH_COLUMN)] = float(self.initial_cash)
+        df.iat[0, df.columns.get_loc(HOLDINGS_COLUMN)] = 0.0
+        df.iat[0, df.columns.get_loc(TOTAL_VALUE_COLUMN)] = float(self.initial_cash)  # all cash on day 0
 
         position = 0
         cash = self.initial_cash
@@ -82,7 +119,10 @@ class BTXEngine:
         for i in range(1, len(df)):
             price = df.at[df.index[i], CLOSE_COLUMN]
             if pd.isna(price):
+                if self.config.compact:  # an int64 position cannot be left NaN, so it carries the previous one
+                    df.iat[i, df.columns.get_loc(POSITION_COLUMN)] = position
                 continue
+            price = float(price)  # keeps cash in float64 arithmetic when prices are float32
 
             signal = df.at[df.index[i], SIGNAL_COLUMN]
             if pd.isna(signal):
@@ -0,0 +1,114 @@
+"""
+This module implements memory-aware admission control for the local executor.
+
+Each sim's peak memory is estimated from the size of its dataset and the engine mode it runs in. The executor only
+hands a sim to a worker once the estimate fits in the memory budget and the machine still has enough memory free,
+so a queue of large intraday sims runs at lower concurrency instead of getting its workers OOM-killed.
+"""
+
+import os
+
+from typing import Callable, Optional
+
+import numpy as np
+
+from backtesting_engine.execution.constants import (
+    BARS_PER_DAY,
+    BYTES_PER_CELL,
+    COLUMNS_PER_ROW,
+    DEFAULT_MEMORY_BUDGET_FRACTION,
+    DEFAULT_MIN_FREE_BYTES,
+    FRAME_COPIES,
+    PLOTTING_MEMORY_FACTOR,
+    WORKER_BASELINE_BYTES,
+)
+from backtesting_engine.interfaces import RunContext, SimItem
+
+
+def get_available_memory() -> int:
+    """
+    Memory in bytes that can be allocated without swapping.
+
+    Uses `MemAvailable` from /proc/meminfo on Linux, which accounts for reclaimable page cache, and falls back to
+    the free physical pages reported by sysconf elsewhere.
+    """
+    try:
+        with open("/proc/meminfo", "r") as file:
+            for line in file:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+
+
+class MemoryEstimator:
+    """Estimates the peak memory of a sim from its date range, bar interval and engine mode."""
+
+    def __init__(
+        self,
+        bytes_per_row: int = BYTES_PER_CELL * COLUMNS_PER_ROW,
+        frame_copies: int = FRAME_COPIES,
+        plotting_factor: float = PLOTTING_MEMORY_FACTOR,
+        baseline_bytes: int = WORKER_BASELINE_BYTES,
+    ) -> None:
+        self.bytes_per_row = bytes_per_row
+        self.frame_copies = frame_copies
+        self.plotting_factor = plotting_factor
+        self.baseline_bytes = baseline_bytes
+
+    def estimate_rows(self, sim_item: SimItem) -> int:
+        """Number of bars the sim's dataset is expected to hold."""
+        trading_days = int(np.busday_count(sim_item.data.start_date, sim_item.data.end_date))
+        bars_per_day = BARS_PER_DAY.get(sim_item.data.interval, 1.0)
+        return max(int(trading_days * bars_per_day), 1)
+
+    def estimate(self, sim_item: SimItem, context: RunContext) -> int:
+        """Estimated peak memory in bytes of the worker running the sim."""
+        frame_bytes = self.estimate_rows(sim_item) * self.bytes_per_row * self.frame_copies
+        if context.generate_output:
+            frame_bytes = int(frame_bytes * self.plotting_factor)
+        return self.baseline_bytes + frame_bytes
+
+
+class MemoryAdmissionController:
+    """
+    Decides whether another sim may start given the memory already committed to running sims.
+
+    A sim is admitted when its estimate fits in what is left of the budget and the machine would still have at
+    least `min_free_bytes` available afterwards. Available memory is re-read on every decision, so pressure from
+    outside the queue also lowers concurrency. One sim is always admitted when nothing is running, so a sim larger
+    than the budget still runs, alone, rather than blocking the queue forever.
+    """
+
+    def __init__(
+        self,
+        budget_bytes: Optional[int] = None,
+        budget_fraction: float = DEFAULT_MEMORY_BUDGET_FRACTION,
+        min_free_bytes: int = DEFAULT_MIN_FREE_BYTES,
+        available_memory_fn: Callable[[], int] = get_available_memory,
+    ) -> None:
+        self.available_memory_fn = available_memory_fn
+        self.budget_bytes = budget_bytes if budget_bytes is not None else int(available_memory_fn() * budget_fraction)
+        self.min_free_bytes = min_free_bytes
+
+        self.committed_bytes = 0
+        self.running = 0
+
+    def try_admit(self, estimate: int) -> bool:
+        """Reserve memory for a sim if it fits. Returns whether the sim may start."""
+        if self.running > 0:
+            if self.committed_bytes + estimate > self.budget_bytes:
+                return False
+            if self.available_memory_fn() - estimate < self.min_free_bytes:
+                return False
+
+        self.committed_bytes += estimate
+        self.running += 1
+        return True
+
+    def release(self, estimate: int) -> None:
+        """Return the memory reserved for a finished sim."""
+        self.committed_bytes = max(self.committed_bytes - estimate, 0)
+        self.running = max(self.running - 1, 0)
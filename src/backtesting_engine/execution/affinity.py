@@ -0,0 +1,109 @@
+"""
+This module pins local worker processes to CPU core sets and caps the threads used by numerical libraries inside
+them.
+
+Unpinned workers migrate between cores, and on multi-socket hosts between NUMA nodes, losing their caches and
+ending up far from the memory they allocated. NumPy's BLAS and OpenMP pools also start one thread per core in every
+worker, so N workers oversubscribe the machine N times over. Pinning gives each worker its own cores, spread evenly
+over the sockets, and sizes its thread pools to match.
+
+Affinity is only available on Linux. Elsewhere pinning is skipped and only the thread caps are applied.
+"""
+
+import os
+
+from collections import defaultdict
+from typing import Optional
+
+from backtesting_engine.execution.constants import CPU_SYSFS_DIR, THREAD_LIMIT_ENV_VARS
+
+
+def _read_topology_id(cpu: int, name: str) -> int:
+    try:
+        with open(os.path.join(CPU_SYSFS_DIR, f"cpu{cpu}", "topology", name), "r") as file:
+            return int(file.read().strip())
+    except (OSError, ValueError):
+        return 0
+
+
+def get_available_cpus() -> list[int]:
+    """CPUs this process may run on, which respects any cgroup or taskset restriction it was started under."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def get_cpu_topology(cpus: Optional[list[int]] = None) -> dict[int, list[int]]:
+    """
+    Group CPUs by the socket they belong to. Returns a mapping of socket id -> CPUs.
+
+    CPUs on each socket are ordered by physical core, so hyperthread siblings sit next to each other and a worker
+    given two CPUs gets both threads of one core rather than halves of two.
+    """
+    sockets: dict[int, list[tuple[int, int]]] = defaultdict(list)
+    for cpu in cpus if cpus is not None else get_available_cpus():
+        sockets[_read_topology_id(cpu, "physical_package_id")].append((_read_topology_id(cpu, "core_id"), cpu))
+
+    return {socket: [cpu for _, cpu in sorted(cores)] for socket, cores in sorted(sockets.items())}
+
+
+def plan_core_sets(num_workers: int, topology: Optional[dict[int, list[int]]] = None) -> list[list[int]]:
+    """
+    Assign each worker a set of CPUs, spreading the workers round-robin over the sockets.
+
+    Each socket's CPUs are split evenly between the workers placed on it. With more workers than CPUs on a socket,
+    workers share single CPUs.
+    """
+    topology = topology if topology is not None else get_cpu_topology()
+    sockets = list(topology)
+
+    workers_per_socket: dict[int, list[int]] = defaultdict(list)
+    for worker in range(num_workers):
+        workers_per_socket[sockets[worker % len(sockets)]].append(worker)
+
+    core_sets: list[list[int]] = [[] for _ in range(num_workers)]
+    for socket, workers in workers_per_socket.items():
+        cpus = topology[socket]
+        for i, worker in enumerate(workers):
+            start = i * len(cpus) // len(workers)
+            end = max((i + 1) * len(cpus) // len(workers), start + 1)
+            core_sets[worker] = cpus[start:end]
+
+    return core_sets
+
+
+def limit_threads(num_threads: int) -> None:
+    """
+    Cap the BLAS/OpenMP thread pools of the current process.
+
+    The environment variables cover libraries that have not been loaded yet. Libraries already loaded, e.g. numpy's
+    BLAS in a forked worker, are resized through threadpoolctl when it is installed.
+    """
+    for env_var in THREAD_LIMIT_ENV_VARS:
+        os.environ[env_var] = str(num_threads)
+
+    try:
+        from threadpoolctl import threadpool_limits
+    except ImportError:
+        return
+
+    threadpool_limits(limits=num_threads)
+
+
+def pin_current_process(cpus: list[int]) -> bool:
+    """Restrict the current process to the given CPUs. Returns False where affinity is not supported."""
+    if not hasattr(os, "sched_setaffinity"):
+        return False
+
+    os.sched_setaffinity(0, cpus)
+    return True
+
+
+def configure_worker(cpus: Optional[list[int]], threads_per_worker: Optional[int]) -> None:
+    """Pin a worker to its core set and cap its thread pools, by default to one thread per pinned CPU."""
+    if cpus:
+        pin_current_process(cpus)
+
+    num_threads = threads_per_worker or (len(cpus) if cpus else None)
+    if num_threads:
+        limit_threads(num_threads)
@@ -0,0 +1,59 @@
+"""
+This module defines constants used by the execution backends of the backtesting engine.
+"""
+
+# Distributed execution constants
+BROKER_TYPEID = "get_broker"  # name the sim broker is registered under on the manager server
+AUTHKEY_ENV_VAR = "BTX_BROKER_AUTHKEY"  # environment variable holding the shared broker authkey
+DEFAULT_BROKER_HOST = "127.0.0.1"
+DEFAULT_BROKER_PORT = 50_000
+DEFAULT_BATCH_SIZE = 4  # sims leased to a worker per request
+DEFAULT_HEARTBEAT_INTERVAL = 2.0  # seconds between worker heartbeats
+DEFAULT_LEASE_TIMEOUT = 10.0  # seconds without a heartbeat before a worker's leases are requeued
+DEFAULT_POLL_INTERVAL = 0.5  # seconds to wait before asking the broker again when nothing is pending
+
+# Local execution constants
+RESULT_POLL_INTERVAL = 0.5  # seconds to wait for a result before checking the workers are still alive
+PRELOAD_MODULE = "backtesting_engine.execution.preload"  # imported once by the forkserver, inherited by workers
+PRELOAD_DATASETS_ENV_VAR = "BTX_PRELOAD_DATASETS"  # JSON list of DataConfig fields for the forkserver to load
+
+# Warm data constants
+MAX_WARM_DATASETS = 32  # datasets each long-lived worker or engine keeps in memory between sims
+
+# ipyparallel execution constants
+IPP_DEFAULT_BATCH_SIZE = 8  # sims sent to an engine per task
+
+# Memory admission control constants
+BYTES_PER_CELL = 8  # float64
+COLUMNS_PER_ROW = 14  # OHLCV plus strategy indicator, signal and portfolio columns
+FRAME_COPIES = 4  # loaded data, strategy copy, engine copy and the metrics/series derived from it
+PLOTTING_MEMORY_FACTOR = 3.0  # plotly holds list copies of every plotted series while rendering
+WORKER_BASELINE_BYTES = 200 * 1024**2  # interpreter plus numpy/pandas imports in each worker
+DEFAULT_MEMORY_BUDGET_FRACTION = 0.8  # share of the memory available at start that sims may use
+DEFAULT_MIN_FREE_BYTES = 512 * 1024**2  # never admit a sim that would leave less than this free
+BARS_PER_DAY = {  # bars of a 6.5h session, as many as the source gives, the last one cut short by the close
+    "1m": 390,
+    "2m": 195,
+    "5m": 78,
+    "15m": 26,
+    "30m": 13,
+    "60m": 7,
+    "90m": 5,
+    "1h": 7,
+    "1d": 1.0,
+    "5d": 1 / 5,
+    "1wk": 1 / 5,
+    "1mo": 1 / 21,
+    "3mo": 1 / 63,
+}
+
+# CPU pinning constants
+CPU_SYSFS_DIR = "/sys/devices/system/cpu"
+THREAD_LIMIT_ENV_VARS = (  # thread pool sizes read by the BLAS/OpenMP libraries numpy may be linked against
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "BLIS_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
@@ -0,0 +1,433 @@
+"""
+This module implements a distributed execution mode so a queue of simulations can be spread across several hosts.
+
+A coordinator serves the sim stream from a TCP `multiprocessing.managers` broker. Workers on any host connect to the
+broker, lease batches of sims, push their results back and heartbeat while they work. When a worker stops heartbeating
+(e.g. the process or the host died) the sims it had leased are put back at the front of the queue for another worker.
+
+Usage:
+
+    # on the coordinator host
+    python -m backtesting_engine.execution.distributed coordinator data/test_queue_config.json --host 0.0.0.0
+
+    # on each worker host
+    python -m backtesting_engine.execution.distributed worker --host <coordinator-host> --processes 64
+
+Both sides must share the same authkey, passed with `--authkey` or the `BTX_BROKER_AUTHKEY` environment variable.
+"""
+
+import argparse
+import itertools
+import logging
+import multiprocessing as mp
+import os
+import socket
+import threading
+import time
+import uuid
+
+from collections import deque
+from multiprocessing.managers import BaseManager
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from backtesting_engine.execution.constants import (
+    AUTHKEY_ENV_VAR,
+    BROKER_TYPEID,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_BROKER_HOST,
+    DEFAULT_BROKER_PORT,
+    DEFAULT_HEARTBEAT_INTERVAL,
+    DEFAULT_LEASE_TIMEOUT,
+    DEFAULT_POLL_INTERVAL,
+)
+from backtesting_engine.execution.interfaces import IExecutor, Lease
+from backtesting_engine.execution.runner import SimRunner, run_sim, run_sim_safely
+from backtesting_engine.interfaces import RunContext, SimItem, SimResult
+from backtesting_engine.logging_config import configure_logging
+from backtesting_engine.managers import QueueManager
+
+
+logger = logging.getLogger(__name__)
+
+
+class SimBroker:
+    """
+    Coordinator-side state of a distributed run.
+
+    Tracks the sims still pending, the sims leased to each worker, the last heartbeat seen from every worker and
+    the results pushed back so far. All methods are called concurrently by the manager server threads, one per
+    connected worker, so every access is guarded by a single lock.
+    """
+
+    def __init__(self, context: RunContext, sims: list[SimItem], lease_timeout: float = DEFAULT_LEASE_TIMEOUT) -> None:
+        self.context = context
+        self.lease_timeout = lease_timeout
+        self.total = len(sims)
+
+        self._pending: deque[SimItem] = deque(sims)  # may still hold sims completed while they waited, see lease
+        self._pending_ids: set[str] = {sim.sim_id for sim in sims}  # sims in the pending queue not completed yet
+        self._leases: dict[str, Lease] = {}  # sim_id -> lease
+        self._last_seen: dict[str, float] = {}  # worker_id -> monotonic time of last heartbeat
+        self._results: dict[str, SimResult] = {}  # sim_id -> result
+        self._lock = threading.Lock()
+
+    def get_context(self) -> RunContext:
+        return self.context
+
+    def heartbeat(self, worker_id: str) -> None:
+        """Record that a worker is still alive."""
+        with self._lock:
+            self._last_seen[worker_id] = time.monotonic()
+
+    def lease(self, worker_id: str, batch_size: int) -> list[SimItem]:
+        """
+        Hand out up to `batch_size` pending sims to a worker.
+
+        Leasing also counts as a heartbeat, so a worker that has just been given work is never considered dead.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._last_seen[worker_id] = now
+
+            batch: list[SimItem] = []
+            while self._pending and len(batch) < batch_size:
+                sim = self._pending.popleft()
+                if sim.sim_id not in self._pending_ids:
+                    continue  # a late worker completed it after it was requeued
+                self._pending_ids.discard(sim.sim_id)
+                self._leases[sim.sim_id] = Lease(worker_id=worker_id, sim=sim, leased_at=now)
+                batch.append(sim)
+            return batch
+
+    def complete(self, worker_id: str, results: list[SimResult]) -> None:
+        """
+        Accept results pushed back by a worker.
+
+        A worker that was presumed dead may still deliver results for sims that have since been requeued. The first
+        result for a sim wins, and any copy of it still waiting in the pending queue is skipped when it comes up for
+        lease rather than searched for here.
+        """
+        with self._lock:
+            self._last_seen[worker_id] = time.monotonic()
+
+            for result in results:
+                if result.sim_id in self._results:
+                    continue
+
+                self._results[result.sim_id] = result
+                self._leases.pop(result.sim_id, None)
+                self._pending_ids.discard(result.sim_id)
+
+    def requeue_expired(self) -> list[str]:
+        """
+        Requeue the leases of every worker that has not heartbeated within the lease timeout.
+
+        Returns the ids of the workers that were declared dead.
+        """
+        with self._lock:
+            now = time.monotonic()
+            dead_workers = [w for w, seen in self._last_seen.items() if now - seen > self.lease_timeout]
+
+            for worker_id in dead_workers:
+                del self._last_seen[worker_id]
+
+            expired = [lease for lease in self._leases.values() if lease.worker_id in dead_workers]
+            for lease in expired:
+                del self._leases[lease.sim.sim_id]
+            # put them back at the front, in their original order, so requeued sims are not starved
+            self._pending.extendleft(reversed([lease.sim for lease in expired]))
+            self._pending_ids.update(lease.sim.sim_id for lease in expired)
+
+            return dead_workers
+
+    def is_done(self) -> bool:
+        with self._lock:
+            return len(self._results) == self.total
+
+    def get_status(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "pending": len(self._pending_ids),
+                "leased": len(self._leases),
+                "completed": len(self._results),
+                "workers": len(self._last_seen),
+            }
+
+    def get_results(self) -> list[SimResult]:
+        with self._lock:
+            return list(self._results.values())
+
+    def get_results_since(self, start: int) -> list[SimResult]:
+        """Results pushed back after the first `start`, in the order they arrived."""
+        with self._lock:
+            return list(itertools.islice(self._results.values(), start, None))
+
+
+class BrokerManager(BaseManager):
+    """Manager used both to serve the broker on the coordinator and to connect to it from the workers."""
+
+
+_broker: Optional[SimBroker] = None  # the broker instance living in the manager server process
+
+
+def _init_broker(context: RunContext, sims: list[SimItem], lease_timeout: float) -> None:
+    global _broker
+    _broker = SimBroker(context=context, sims=sims, lease_timeout=lease_timeout)
+
+
+def _get_broker() -> SimBroker:
+    if _broker is None:
+        raise RuntimeError("Broker has not been initialised in this process.")
+    return _broker
+
+
+BrokerManager.register(BROKER_TYPEID, callable=_get_broker)
+
+
+def _get_authkey(authkey: Optional[bytes]) -> bytes:
+    if authkey:
+        return authkey
+
+    env_authkey = os.environ.get(AUTHKEY_ENV_VAR)
+    if not env_authkey:
+        raise ValueError(f"An authkey must be provided or set in the {AUTHKEY_ENV_VAR} environment variable.")
+    return env_authkey.encode()
+
+
+class DistributedCoordinator:
+    """
+    Serves the sims of a queue to remote workers and collects their results.
+
+    The broker runs in a manager server process bound to `host:port`; the coordinator itself is a client of that
+    server and periodically asks it to requeue the leases of workers that stopped heartbeating.
+    """
+
+    def __init__(
+        self,
+        context: RunContext,
+        sims: list[SimItem],
+        host: str = DEFAULT_BROKER_HOST,
+        port: int = DEFAULT_BROKER_PORT,
+        authkey: Optional[bytes] = None,
+        lease_timeout: float = DEFAULT_LEASE_TIMEOUT,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ) -> None:
+        self.context = context
+        self.sims = sims
+        self.lease_timeout = lease_timeout
+        self.poll_interval = poll_interval
+
+        self._manager = BrokerManager(address=(host, port), authkey=_get_authkey(authkey))
+        self._broker: Any = None  # proxy to the SimBroker, available once started
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Address the broker is listening on. Useful when binding to port 0."""
+        return self._manager.address
+
+    def start(self) -> tuple[str, int]:
+        """Start the broker server and return the address it is listening on."""
+        self._manager.start(
+            initializer=_init_broker,
+            initargs=(self.context, self.sims, self.lease_timeout),
+        )
+        self._broker = getattr(self._manager, BROKER_TYPEID)()
+        return self.address
+
+    def wait(self, on_result: Optional[Callable[[SimResult], None]] = None) -> list[SimResult]:
+        """
+        Block until every sim has a result, requeueing the work of dead workers along the way. Results are passed to
+        `on_result` as they arrive, within a poll interval.
+        """
+        reported = 0
+        while True:
+            done = self._broker.is_done()  # checked first, so the results that finish the run are still reported
+            if on_result is not None:
+                results = self._broker.get_results_since(reported)
+                reported += len(results)
+                for result in results:
+                    on_result(result)
+            if done:
+                break
+
+            for worker_id in self._broker.requeue_expired():
+                logger.warning("[%s] Worker %s timed out, requeueing its sims.", self.context.sim_group, worker_id)
+            time.sleep(self.poll_interval)
+
+        return self._broker.get_results()
+
+    def shutdown(self) -> None:
+        self._manager.shutdown()
+
+    def serve(self, on_result: Optional[Callable[[SimResult], None]] = None) -> list[SimResult]:
+        """Start the broker, wait for the queue to drain and shut the broker down."""
+        self.start()
+        try:
+            return self.wait(on_result)
+        finally:
+            self.shutdown()
+
+
+class DistributedWorker:
+    """
+    Pulls batches of sims from a coordinator, runs them and pushes the results back.
+
+    A background thread heartbeats to the coordinator while sims are running so long sims do not lose their lease.
+    Exceptions raised by a sim are reported as a failed result rather than killing the worker.
+    """
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        authkey: Optional[bytes] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        heartbeat_interval: float = DEFAULT_HEARTBEAT_INTERVAL,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        worker_id: Optional[str] = None,
+        sim_runner: SimRunner = run_sim,
+    ) -> None:
+        self.address = address
+        self.authkey = _get_authkey(authkey)
+        self.batch_size = batch_size
+        self.heartbeat_interval = heartbeat_interval
+        self.poll_interval = poll_interval
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self.sim_runner = sim_runner
+
+    def run(self) -> int:
+        """Run sims until the coordinator reports the queue is done. Returns the number of sims this worker ran."""
+        manager = BrokerManager(address=self.address, authkey=self.authkey)
+        manager.connect()
+        broker = getattr(manager, BROKER_TYPEID)()
+        context = broker.get_context()
+
+        stop_heartbeat = threading.Event()
+        heartbeat_thread = threading.Thread(target=self._heartbeat, args=(broker, stop_heartbeat), daemon=True)
+        heartbeat_thread.start()
+
+        completed = 0
+        try:
+            while True:
+                batch: list[SimItem] = broker.lease(self.worker_id, self.batch_size)
+                if not batch:
+                    if broker.is_done():
+                        break
+                    # other workers still hold leases that may yet be requeued
+                    time.sleep(self.poll_interval)
+                    continue
+
+                results = [run_sim_safely(self.sim_runner, context, sim) for sim in batch]
+                broker.complete(self.worker_id, results)
+                completed += len(results)
+        finally:
+            stop_heartbeat.set()
+            heartbeat_thread.join()
+
+        return completed
+
+    def _heartbeat(self, broker: Any, stop: threading.Event) -> None:
+        while not stop.wait(self.heartbeat_interval):
+            broker.heartbeat(self.worker_id)
+
+
+class DistributedExecutor(IExecutor):
+    """
+    Execution backend that serves the sims of a queue to distributed workers through a coordinator.
+
+    Workers are started separately, on this or any other host, and connect to `host:port`.
+    """
+
+    def __init__(
+        self,
+        host: str = DEFAULT_BROKER_HOST,
+        port: int = DEFAULT_BROKER_PORT,
+        authkey: Optional[bytes] = None,
+        lease_timeout: float = DEFAULT_LEASE_TIMEOUT,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.authkey = authkey
+        self.lease_timeout = lease_timeout
+
+    def run(self, context: RunContext, sims: list[SimItem], on_result: Callable[[SimResult], None]) -> None:
+        coordinator = DistributedCoordinator(
+            context, sims, host=self.host, port=self.port, authkey=self.authkey, lease_timeout=self.lease_timeout
+        )
+        coordinator.serve(on_result)
+
+
+def _run_worker_process(address: tuple[str, int], authkey: bytes, batch_size: int, sim_runner: SimRunner) -> None:
+    DistributedWorker(address=address, authkey=authkey, batch_size=batch_size, sim_runner=sim_runner).run()
+
+
+def run_local_workers(
+    address: tuple[str, int],
+    num_workers: int,
+    authkey: Optional[bytes] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    sim_runner: SimRunner = run_sim,
+) -> list[mp.Process]:
+    """
+    Start `num_workers` worker processes on this host, all connected to the same coordinator.
+
+    The processes are returned already started so the caller can join them.
+    """
+    resolved_authkey = _get_authkey(authkey)
+    processes: list[mp.Process] = []
+    for _ in range(num_workers):
+        p = mp.Process(target=_run_worker_process, args=(address, resolved_authkey, batch_size, sim_runner))
+        p.start()
+        processes.append(p)
+    return processes
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run a queue of backtests across several hosts.")
+    subparsers = parser.add_subparsers(dest="role", required=True)
+
+    coordinator = subparsers.add_parser("coordinator", help="Serve the sims of a queue file to remote workers.")
+    coordinator.add_argument("queue_file_path")
+    coordinator.add_argument("--host", default=DEFAULT_BROKER_HOST)
+    coordinator.add_argument("--port", type=int, default=DEFAULT_BROKER_PORT)
+    coordinator.add_argument("--authkey", default=None)
+    coordinator.add_argument("--lease-timeout", type=float, default=DEFAULT_LEASE_TIMEOUT)
+
+    worker = subparsers.add_parser("worker", help="Connect to a coordinator and run sims from its queue.")
+    worker.add_argument("--host", default=DEFAULT_BROKER_HOST)
+    worker.add_argument("--port", type=int, default=DEFAULT_BROKER_PORT)
+    worker.add_argument("--authkey", default=None)
+    worker.add_argument("--processes", type=int, default=mp.cpu_count())
+    worker.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+    configure_logging()
+    authkey = args.authkey.encode() if args.authkey else None
+
+    if args.role == "coordinator":
+        executor = DistributedExecutor(
+            host=args.host, port=args.port, authkey=authkey, lease_timeout=args.lease_timeout
+        )
+        queue_manager = QueueManager(queue_file_path=args.queue_file_path, executor=executor)
+        results = queue_manager.run_all()
+
+        queue_config = queue_manager.queue_config
+        results_path = Path(queue_config.output_dir_location) / f"{queue_config.sim_group}_results.csv"
+        results.to_csv(results_path, index=False)
+
+        failed = int(results["Error"].notna().sum()) if not results.empty else 0
+        logger.info(
+            "[%s] %d sims finished (%d failed). Results: %s", queue_config.sim_group, len(results), failed, results_path
+        )
+    else:
+        processes = run_local_workers((args.host, args.port), args.processes, authkey, args.batch_size)
+        for p in processes:
+            p.join()
+
+
+if __name__ == "__main__":
+    main()
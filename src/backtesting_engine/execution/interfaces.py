@@ -0,0 +1,23 @@
+"""
+This module defines the interfaces for the execution package.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Callable
+
+from backtesting_engine.interfaces import RunContext, SimItem, SimResult
+
+
+@dataclass
+class Lease:
+    worker_id: str  # worker currently responsible for the sim
+    sim: SimItem
+    leased_at: float  # monotonic time on the coordinator when the lease was granted
+
+
+class IExecutor(ABC):
+    @abstractmethod
+    def run(self, context: RunContext, sims: list[SimItem], on_result: Callable[[SimResult], None]) -> None:
+        """Run every sim and pass each result to `on_result` as soon as it is available."""
+        pass
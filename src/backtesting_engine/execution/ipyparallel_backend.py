@@ -0,0 +1,75 @@
+"""
+This module implements an execution backend that dispatches sims to an ipyparallel cluster.
+
+Unlike the local backend, which starts fresh processes on every run, the cluster's engines are long-lived. Modules
+imported by a batch and datasets loaded by it stay in the engine's memory, so repeated runs from a notebook reuse a
+warm cluster instead of paying the import and data loading costs again.
+
+Start a local cluster with `ipcluster start -n 8` (or `ipp.Cluster(n=8)` from a notebook) and pass the connected
+client, or let the executor connect to the default profile:
+
+    client = ipp.Cluster(n=8).start_and_connect_sync()
+    results = QueueManager(queue_file_path, executor=IPyParallelExecutor(client=client)).run_all()
+"""
+
+from typing import Any, Callable, Optional
+
+from backtesting_engine.execution.constants import IPP_DEFAULT_BATCH_SIZE
+from backtesting_engine.execution.interfaces import IExecutor
+from backtesting_engine.execution.runner import SimRunner, clear_warm_data, run_sim_safely, run_sim_with_warm_data
+from backtesting_engine.interfaces import RunContext, SimItem, SimResult
+
+
+def run_batch(context: RunContext, sims: list[SimItem], sim_runner: SimRunner) -> list[SimResult]:
+    """Run a batch of sims on an engine. This is the task shipped to the cluster."""
+    return [run_sim_safely(sim_runner, context, sim) for sim in sims]
+
+
+class IPyParallelExecutor(IExecutor):
+    """
+    Dispatches batches of sims to the engines of an ipyparallel cluster through a load-balanced view.
+
+    Results are streamed back as each batch finishes, in completion order.
+    """
+
+    def __init__(
+        self,
+        client: Any = None,
+        profile: Optional[str] = None,
+        cluster_id: Optional[str] = None,
+        batch_size: int = IPP_DEFAULT_BATCH_SIZE,
+        sim_runner: SimRunner = run_sim_with_warm_data,
+    ) -> None:
+        if client is None:
+            try:
+                import ipyparallel as ipp
+            except ImportError as e:
+                raise ImportError("ipyparallel must be installed to use the IPyParallelExecutor.") from e
+
+            client = ipp.Client(profile=profile, cluster_id=cluster_id)
+
+        self.client = client
+        self.batch_size = batch_size
+        self.sim_runner = sim_runner
+
+    def run(self, context: RunContext, sims: list[SimItem], on_result: Callable[[SimResult], None]) -> None:
+        batches = [sims[i : i + self.batch_size] for i in range(0, len(sims), self.batch_size)]
+        if not batches:
+            return
+
+        view = self.client.load_balanced_view()
+        async_result = view.map_async(
+            run_batch,
+            [context] * len(batches),
+            batches,
+            [self.sim_runner] * len(batches),
+            ordered=False,
+        )
+
+        for batch_results in async_result:
+            for result in batch_results:
+                on_result(result)
+
+    def clear_warm_data(self) -> int:
+        """Release the datasets held in memory by every engine. Returns the total number released."""
+        return sum(self.client[:].apply_sync(clear_warm_data))
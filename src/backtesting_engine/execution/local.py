@@ -0,0 +1,204 @@
+"""
+This module implements the default execution backend, which runs sims in worker processes on the local machine.
+
+The parent process hands sims to workers one at a time, each through the worker's own task queue, so it always knows
+which sim every worker is running. That lets it hold sims back until they fit the memory budget, and report the sim
+a worker was running if the worker dies (e.g. is OOM-killed) instead of silently losing it.
+"""
+
+import logging
+import queue
+import time
+
+from collections import deque
+from typing import Callable, Optional
+
+from backtesting_engine.constants import WORKER_PEAK_RSS
+from backtesting_engine.execution.admission import MemoryAdmissionController, MemoryEstimator
+from backtesting_engine.execution.constants import RESULT_POLL_INTERVAL
+from backtesting_engine.execution.interfaces import IExecutor
+from backtesting_engine.execution.pool import DEFAULT_START_METHOD, WorkerPool, WorkerSlot
+from backtesting_engine.execution.runner import SimRunner, run_sim_with_warm_data
+from backtesting_engine.interfaces import RunContext, SimItem, SimResult
+
+
+logger = logging.getLogger(__name__)
+
+
+class LocalProcessExecutor(IExecutor):
+    """
+    Runs sims on a pool of worker processes on this machine, one per CPU core by default.
+
+    Sims are only started once their estimated peak memory fits the admission controller's budget, so concurrency
+    drops below `max_workers` when the sims are large or the machine is short on memory.
+
+    With `pin_workers`, each worker is pinned to its own core set, spread over the CPU sockets, and its BLAS/OpenMP
+    thread pools are capped to the size of that set (or to `threads_per_worker`).
+
+    The executor's workers are stopped at the end of each run unless `keep_workers` is set. A `pool` passed in is
+    left running for the caller to share between runs and close.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        sim_runner: SimRunner = run_sim_with_warm_data,
+        memory_budget_bytes: Optional[int] = None,
+        estimator: Optional[MemoryEstimator] = None,
+        admission_controller: Optional[MemoryAdmissionController] = None,
+        pin_workers: bool = False,
+        threads_per_worker: Optional[int] = None,
+        pool: Optional[WorkerPool] = None,
+        start_method: str = DEFAULT_START_METHOD,
+        keep_workers: bool = False,
+    ) -> None:
+        self.sim_runner = sim_runner
+        self.memory_budget_bytes = memory_budget_bytes
+        self.estimator = estimator or MemoryEstimator()
+        self.admission_controller = admission_controller
+
+        self.keep_workers = keep_workers or pool is not None
+        self.pool = pool or WorkerPool(
+            max_workers=max_workers,
+            start_method=start_method,
+            pin_workers=pin_workers,
+            threads_per_worker=threads_per_worker,
+        )
+
+        self.time_to_first_result: Optional[float] = None  # seconds from the start of the last run to its first result
+
+    def run(self, context: RunContext, sims: list[SimItem], on_result: Callable[[SimResult], None]) -> None:
+        if not sims:
+            return
+
+        # the budget is sized from the memory available when the run starts unless one was configured
+        admission = self.admission_controller or MemoryAdmissionController(budget_bytes=self.memory_budget_bytes)
+
+        run_start = time.perf_counter()
+        num_started = len(self.pool.slots)
+        self.pool.ensure_workers(len(sims))
+        num_started = len(self.pool.slots) - num_started
+        self.time_to_first_result = None
+
+        run_id = self.pool.new_run_id()
+        pending = deque(sims)
+        running: dict[str, WorkerSlot] = {}  # sim_id -> slot running it
+
+        try:
+            while pending or running:
+                self._dispatch(run_id, context, pending, running, admission)
+
+                try:
+                    result_run_id, result = self.pool.result_queue.get(timeout=RESULT_POLL_INTERVAL)
+                except queue.Empty:
+                    for failed in self._reap_dead_workers(context, running, admission):
+                        on_result(failed)
+                    continue
+
+                slot = running.pop(result.sim_id, None) if result_run_id == run_id else None
+                if slot is None:
+                    continue  # late result for a sim already reported as failed, or from an aborted run
+
+                if self.time_to_first_result is None:
+                    self.time_to_first_result = time.perf_counter() - run_start
+                    logger.info(
+                        "[%s] First sim completed %.2fs after the run started (%d workers started in %.2fs).",
+                        context.sim_group,
+                        self.time_to_first_result,
+                        num_started,
+                        self.pool.last_startup_time,
+                    )
+
+                admission.release(slot.estimate)
+                slot.sim = None
+                slot.peak_rss = result.memory.get(WORKER_PEAK_RSS, slot.peak_rss)
+                on_result(result)
+        finally:
+            if running:
+                self.pool.close(terminate=True)  # the run was aborted, so the busy workers' results are unwanted
+            elif not self.keep_workers:
+                self.pool.close()
+
+    def close(self) -> None:
+        """Stop the executor's workers."""
+        self.pool.close()
+
+    def _dispatch(
+        self,
+        run_id: int,
+        context: RunContext,
+        pending: "deque[SimItem]",
+        running: dict[str, WorkerSlot],
+        admission: MemoryAdmissionController,
+    ) -> None:
+        """Hand pending sims, in queue order, to idle workers for as long as they fit the memory budget."""
+        for slot in self.pool.slots:
+            if not pending:
+                return
+            if slot.sim is not None:
+                continue
+
+            estimate = self.estimator.estimate(pending[0], context)
+            if not admission.try_admit(estimate):
+                return  # wait for running sims to release memory
+
+            slot.sim = pending.popleft()
+            slot.estimate = estimate
+            running[slot.sim.sim_id] = slot
+            self.pool.submit(slot, run_id, context, self.sim_runner, slot.sim)
+
+    def _reap_dead_workers(
+        self, context: RunContext, running: dict[str, WorkerSlot], admission: MemoryAdmissionController
+    ) -> list[SimResult]:
+        """
+        Report the sims of workers that died mid-sim as failed and replace those workers. Workers that died idle are
+        dropped for the rest of the run, as a worker that failed to start would fail again if replaced; the run only
+        fails once no worker is left.
+        """
+        failed: list[SimResult] = []
+        for i in reversed(range(len(self.pool.slots))):
+            slot = self.pool.slots[i]
+            if slot.process.is_alive():
+                continue
+
+            sim = slot.sim
+            exitcode = slot.process.exitcode
+            if sim is None:
+                self.pool.drop_worker(i)
+                logger.warning(
+                    "[%s] An idle worker exited with code %s, continuing on %d workers.",
+                    context.sim_group,
+                    exitcode,
+                    len(self.pool.slots),
+                )
+                if not self.pool.slots:
+                    raise RuntimeError(f"Every worker process exited while idle, the last with code {exitcode}.")
+                continue
+
+            self.pool.replace_worker(i)  # the replacement keeps the dead worker's cores
+            logger.error(
+                "[%s:%s] Worker exited with code %s while running the sim.",
+                context.sim_group,
+                sim.sim_id,
+                exitcode,
+                extra={"sim_group": context.sim_group, "sim_id": sim.sim_id},
+            )
+            error = (
+                f"Worker process exited with code {exitcode} (a negative code is the signal that killed it, e.g. -9 "
+                f"from the OOM killer). The sim was estimated at {slot.estimate / 1024**2:.0f} MiB"
+            )
+            if slot.peak_rss:
+                error += f" and the worker's peak RSS over its earlier sims was {slot.peak_rss / 1024**2:.0f} MiB"
+            failed.append(
+                SimResult(
+                    sim_id=sim.sim_id,
+                    ticker=sim.data.ticker,
+                    strategy=sim.strategy.type,
+                    error=f"{error}.",
+                    memory={WORKER_PEAK_RSS: slot.peak_rss} if slot.peak_rss else {},
+                )
+            )
+            running.pop(sim.sim_id, None)
+            admission.release(slot.estimate)
+
+        return failed
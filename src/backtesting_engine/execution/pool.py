@@ -0,0 +1,220 @@
+"""
+This module implements the pool of worker processes the local executor runs sims on.
+
+Workers are started from a forkserver that has already imported the engine and its dependencies (see
+`execution.preload`). Forking a worker from it takes milliseconds, where a freshly spawned interpreter spends seconds
+importing pandas, yfinance and plotly. The pool can also outlive a single run: pass the same pool to several queue
+runs in a session and they reuse the running workers, and the datasets those workers keep in memory.
+
+    with WorkerPool(max_workers=8) as pool:
+        QueueManager("queue_a.json", pool=pool).run_all()
+        QueueManager("queue_b.json", pool=pool).run_all()  # no worker start-up cost
+"""
+
+import itertools
+import json
+import logging
+import multiprocessing as mp
+import multiprocessing.forkserver
+import os
+import time
+
+from dataclasses import asdict, dataclass
+from multiprocessing import Queue
+from multiprocessing.context import BaseContext
+from typing import TYPE_CHECKING, Any, Optional
+
+from backtesting_engine.data.tiered_cache import get_process_cache_stats
+from backtesting_engine.execution.affinity import configure_worker, plan_core_sets
+from backtesting_engine.execution.constants import PRELOAD_DATASETS_ENV_VAR, PRELOAD_MODULE
+from backtesting_engine.execution.runner import SimRunner, run_sim_safely
+from backtesting_engine.interfaces import DataConfig, RunContext, SimItem, SimResult
+from backtesting_engine.logging_config import configure_worker_logging
+
+
+logger = logging.getLogger(__name__)
+
+
+# forkserver is unavailable on Windows, where workers are spawned instead
+DEFAULT_START_METHOD = "forkserver" if "forkserver" in mp.get_all_start_methods() else "spawn"
+
+Task = tuple[int, RunContext, SimRunner, SimItem]  # run id, run context, sim runner, sim
+
+if TYPE_CHECKING:
+    TaskQueueType = Queue[Optional[Task]]  # For static type checking
+    ResultQueueType = Queue[tuple[int, SimResult]]
+else:
+    TaskQueueType = Queue
+    ResultQueueType = Queue
+
+
+def _worker(
+    task_queue: "TaskQueueType",
+    result_queue: "ResultQueueType",
+    cpus: Optional[list[int]] = None,
+    threads_per_worker: Optional[int] = None,
+) -> None:
+    configure_worker(cpus, threads_per_worker)
+    configure_worker_logging()
+
+    while True:
+        task = task_queue.get()
+        if task is None:
+            break  # the pool is closing
+
+        run_id, context, sim_runner, sim_item = task
+        logger.debug("[%s:%s] Starting...", context.sim_group, sim_item.sim_id)
+        result_queue.put((run_id, run_sim_safely(sim_runner, context, sim_item)))
+        logger.debug("[%s:%s] Completed.", context.sim_group, sim_item.sim_id)
+
+    cache_stats = get_process_cache_stats()
+    if cache_stats is not None:
+        logger.debug("[worker %d] Data cache: %s", os.getpid(), cache_stats)
+
+
+@dataclass
+class WorkerSlot:
+    process: Any  # multiprocessing process started from the pool's context
+    task_queue: "TaskQueueType"
+    cpus: Optional[list[int]] = None  # core set the worker is pinned to
+    sim: Optional[SimItem] = None  # sim currently assigned to the worker
+    estimate: int = 0  # memory reserved for that sim
+    peak_rss: int = 0  # the worker's high-water mark as of the last sim it reported
+
+
+class WorkerPool:
+    """
+    Long-lived local worker processes, each fed through its own task queue and reporting to a shared result queue.
+
+    Workers are started on demand, up to `max_workers`, and keep running until the pool is closed.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        start_method: str = DEFAULT_START_METHOD,
+        preload_datasets: Optional[list[DataConfig]] = None,
+        pin_workers: bool = False,
+        threads_per_worker: Optional[int] = None,
+    ) -> None:
+        """
+        Args:
+            max_workers (Optional[int]): Maximum number of workers, one per CPU core by default.
+            start_method (str): multiprocessing start method used for the workers.
+            preload_datasets (Optional[list[DataConfig]]): Datasets the forkserver loads once and shares with every
+                worker. Only applies if the pool starts the forkserver, i.e. it is the first forkserver pool in the
+                process.
+            pin_workers (bool): Pin each worker to its own set of cores, spread over the CPU sockets.
+            threads_per_worker (Optional[int]): BLAS/OpenMP threads per worker. Defaults to the size of the worker's
+                core set when pinned.
+        """
+        self.max_workers = max_workers if max_workers is not None else mp.cpu_count()
+        self.start_method = start_method
+        self.preload_datasets = preload_datasets or []
+        self.pin_workers = pin_workers
+        self.threads_per_worker = threads_per_worker
+
+        self.slots: list[WorkerSlot] = []
+        self.last_startup_time = 0.0  # seconds taken by the most recent call that had to start workers
+
+        self._mp_context: Optional[BaseContext] = None
+        self._result_queue: Optional["ResultQueueType"] = None
+        self._core_sets: list[Optional[list[int]]] = []
+        self._run_ids = itertools.count()
+
+    def _get_context(self) -> BaseContext:
+        if self._mp_context is None:
+            self._mp_context = mp.get_context(self.start_method)
+            if self.start_method == "forkserver":
+                self._start_forkserver()
+
+            self._core_sets = list(plan_core_sets(self.max_workers)) if self.pin_workers else [None] * self.max_workers
+        return self._mp_context
+
+    def _start_forkserver(self) -> None:
+        """Start the forkserver with the engine imported and the preload datasets in memory."""
+        multiprocessing.set_forkserver_preload([PRELOAD_MODULE])
+
+        previous = os.environ.get(PRELOAD_DATASETS_ENV_VAR)
+        os.environ[PRELOAD_DATASETS_ENV_VAR] = json.dumps([asdict(data) for data in self.preload_datasets])
+        try:
+            multiprocessing.forkserver.ensure_running()
+        finally:
+            if previous is None:
+                del os.environ[PRELOAD_DATASETS_ENV_VAR]
+            else:
+                os.environ[PRELOAD_DATASETS_ENV_VAR] = previous
+
+    @property
+    def result_queue(self) -> "ResultQueueType":
+        if self._result_queue is None:
+            self._result_queue = self._get_context().Queue()
+        return self._result_queue
+
+    def new_run_id(self) -> int:
+        """Id tagging the tasks of one run, so results left over from an earlier run can be told apart."""
+        return next(self._run_ids)
+
+    def ensure_workers(self, num_workers: int) -> None:
+        """
+        Start workers until at least `num_workers` (capped at `max_workers`) are running, first replacing any that
+        died since the last run.
+        """
+        start = time.perf_counter()
+        for i, slot in enumerate(self.slots):
+            if not slot.process.is_alive():
+                self.replace_worker(i)
+
+        target = min(num_workers, self.max_workers)
+        while len(self.slots) < target:
+            self.slots.append(self._start_worker(self._get_free_core_sets()[0]))
+        self.last_startup_time = time.perf_counter() - start
+
+    def _get_free_core_sets(self) -> list[Optional[list[int]]]:
+        """Core sets of the plan no running worker is pinned to, in plan order."""
+        self._get_context()
+        free = list(self._core_sets)
+        for slot in self.slots:
+            free.remove(slot.cpus)
+        return free
+
+    def _start_worker(self, cpus: Optional[list[int]]) -> WorkerSlot:
+        mp_context = self._get_context()
+        task_queue: "TaskQueueType" = mp_context.Queue()
+        process = mp_context.Process(  # type: ignore[attr-defined]
+            target=_worker, args=(task_queue, self.result_queue, cpus, self.threads_per_worker)
+        )
+        process.start()
+        return WorkerSlot(process=process, task_queue=task_queue, cpus=cpus)
+
+    def replace_worker(self, index: int) -> None:
+        """Start a new worker, on the same cores, in place of one that died."""
+        self.slots[index] = self._start_worker(self.slots[index].cpus)
+
+    def drop_worker(self, index: int) -> None:
+        """Forget a worker that died, leaving its cores to the next worker started."""
+        self.slots.pop(index)
+
+    def submit(self, slot: WorkerSlot, run_id: int, context: RunContext, sim_runner: SimRunner, sim: SimItem) -> None:
+        slot.task_queue.put((run_id, context, sim_runner, sim))
+
+    def close(self, terminate: bool = False) -> None:
+        """
+        Stop every worker. Idle workers exit after their current task; with `terminate` busy workers are killed.
+        """
+        for slot in self.slots:
+            if terminate and slot.sim is not None:
+                slot.process.terminate()
+            else:
+                slot.task_queue.put(None)
+        for slot in self.slots:
+            slot.process.join()
+
+        self.slots = []
+        self._result_queue = None
+
+    def __enter__(self) -> "WorkerPool":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
@@ -0,0 +1,46 @@
+"""
+This module is imported by the forkserver of the local worker pool before it forks any worker.
+
+Importing it pulls in everything a worker needs to run a sim: pandas, numpy, yfinance and plotly, the engine and the
+strategy registry. Datasets listed in the `BTX_PRELOAD_DATASETS` environment variable are also loaded into the warm
+data cache. Every worker forked from the server inherits all of it, with the datasets shared copy-on-write, instead of
+importing and loading it again.
+"""
+
+import json
+import logging
+import os
+
+import plotly.graph_objs  # noqa: F401 - imported to preload
+import yfinance  # noqa: F401 - imported to preload
+
+from backtesting_engine.analytics import plotter  # noqa: F401 - imported to preload
+from backtesting_engine.execution.constants import PRELOAD_DATASETS_ENV_VAR
+from backtesting_engine.execution.runner import STRATEGIES, load_warm_data
+from backtesting_engine.interfaces import DataConfig
+
+
+logger = logging.getLogger(__name__)
+
+
+def preload_datasets() -> int:
+    """
+    Load the datasets listed in the environment into the warm data cache. Returns the number loaded.
+
+    A dataset that fails to load is skipped, so one bad entry cannot stop the forkserver from starting. The sims
+    using it load it themselves, and report the error, when they run.
+    """
+    loaded = 0
+    for fields in json.loads(os.environ.get(PRELOAD_DATASETS_ENV_VAR, "[]")):
+        try:
+            load_warm_data(DataConfig(**fields))
+        except Exception as e:
+            logger.warning("[PRELOAD] Skipping %s: %r", fields.get("ticker"), e)
+            continue
+        loaded += 1
+
+    return loaded
+
+
+STRATEGIES.load_all()
+preload_datasets()
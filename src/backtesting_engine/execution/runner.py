@@ -0,0 +1,206 @@
+"""
+This module runs a single simulation from its queue item. It is shared by every execution backend so a sim behaves
+the same whether it runs in a local worker process, on a remote host or on an ipyparallel engine.
+"""
+
+import os
+
+from collections import OrderedDict
+from typing import Callable, Optional
+
+import pandas as pd
+
+from backtesting_engine.analytics.interfaces import IPlotGenerator
+from backtesting_engine.analytics.metrics import BacktestMetricCreator
+from backtesting_engine.compact import compact_prices
+from backtesting_engine.constants import DATA_BYTES, LOAD_STAGE, OUTPUT_STAGE, RESULT_BYTES, SIGNALS_STAGE
+from backtesting_engine.data.data_loader import DataLoader
+from backtesting_engine.data.interfaces import CacheStats
+from backtesting_engine.data.series_store import SeriesStore
+from backtesting_engine.data.tiered_cache import get_process_cache
+from backtesting_engine.engine import BTXEngine
+from backtesting_engine.execution.constants import MAX_WARM_DATASETS
+from backtesting_engine.interfaces import DataConfig, EngineConfig, EngineContext, RunContext, SimItem, SimResult
+from backtesting_engine.memory import MemoryTracker, check_memory_threshold
+from backtesting_engine.profiling import profile_sim, should_profile
+from backtesting_engine.strategies.registry import STRATEGIES
+from backtesting_engine.timing import StageTimer
+
+
+SimRunner = Callable[[RunContext, SimItem], SimResult]
+DataLoadFn = Callable[[DataConfig], pd.DataFrame]
+
+# Worker-side state: long-lived workers (pool workers, ipyparallel engines) keep these between sims and runs
+_warm_data: OrderedDict[tuple[str, str, str, str, str, Optional[str], str], pd.DataFrame] = OrderedDict()
+_load_stats = CacheStats()  # cache hits and misses of every load in this process, to tell whether a sim's data was cached
+
+
+def load_sim_data(data_config: DataConfig) -> pd.DataFrame:
+    """
+    Load the market data for a sim through this process's cache, backed by the persistent disk cache. On a miss, only
+    the bars the series store does not hold yet are downloaded.
+    """
+    data_loader = DataLoader(cache=get_process_cache(), store=SeriesStore(), validation=data_config.validation)
+    df = data_loader.load(
+        ticker=data_config.ticker,
+        start_date=data_config.start_date,
+        end_date=data_config.end_date,
+        source=data_config.source,
+        interval=data_config.interval,
+        csv_path=data_config.csv_path,
+    )
+    _load_stats.hits += data_loader.cache_hits
+    _load_stats.misses += data_loader.cache_misses
+    return df
+
+
+def load_warm_data(data_config: DataConfig) -> pd.DataFrame:
+    """Load a sim's data, keeping the most recently used datasets in the worker's memory."""
+    key = (
+        data_config.ticker,
+        data_config.start_date,
+        data_config.end_date,
+        data_config.source,
+        data_config.interval,
+        data_config.csv_path,
+        data_config.validation,
+    )
+    if key in _warm_data:
+        _warm_data.move_to_end(key)
+        _load_stats.hits += 1
+        return _warm_data[key]
+
+    df = load_sim_data(data_config)
+    _warm_data[key] = df
+    if len(_warm_data) > MAX_WARM_DATASETS:
+        _warm_data.popitem(last=False)
+    return df
+
+
+def clear_warm_data() -> int:
+    """Drop every dataset held by this worker. Returns the number of datasets released."""
+    released = len(_warm_data)
+    _warm_data.clear()
+    return released
+
+
+def create_plot_generator(
+    backtest_results_df: pd.DataFrame, strategy_name: str, context: EngineContext
+) -> IPlotGenerator:
+    """Build the plotly plot generator. plotly is only imported once a sim actually renders its plots."""
+    from backtesting_engine.analytics.plotter import PlotGenerator
+
+    return PlotGenerator(backtest_results_df, strategy_name, context)
+
+
+def get_result_path(context: RunContext, sim_item: SimItem) -> str:
+    """
+    Location of a sim's stored backtest results: <output_dir>/<sim_group>/<ticker>/<sim_id>_<strategy>_result.pkl
+    """
+    filename = f"{sim_item.sim_id}_{sim_item.strategy.type.lower()}_result.pkl"
+    return os.path.join(context.output_dir_location, context.sim_group, sim_item.data.ticker.lower(), filename)
+
+
+def run_sim(context: RunContext, sim_item: SimItem, load_data: DataLoadFn = load_sim_data) -> SimResult:
+    """
+    Load the data for a single sim, run its backtest and return a summary of the result.
+
+    When the run context asks for it, the full backtest DataFrame is pickled to the output directory so it can be
+    inspected or post-processed later without re-running the sim.
+
+    Unless the context turns timing off, the seconds the sim spent loading data, in each stage of the engine and
+    storing its output are reported in the result's timings. Likewise, its peak RSS and the size of its data and
+    results are reported in the result's memory, with a warning when the peak crossed the context's threshold.
+    Whether its data came from a cache is reported when the loader counts its cache lookups.
+    """
+    hits, misses = _load_stats.hits, _load_stats.misses
+    timer = StageTimer(enabled=context.time_stages)
+    tracker = MemoryTracker(enabled=context.track_memory, trace_allocations=context.trace_allocations)
+    with tracker:
+        with timer.stage(LOAD_STAGE):
+            data = load_data(sim_item.data)
+            if sim_item.sim_config.compact:
+                data = compact_prices(data)
+        tracker.add_frame(DATA_BYTES, data)
+        cache_hit = _get_cache_hit(hits, misses)
+
+        strategy_cls = STRATEGIES.get(sim_item.strategy.type.lower())
+        if not strategy_cls:
+            raise ValueError(f"Unknown strategy type: {sim_item.strategy.type}")
+
+        with timer.stage(SIGNALS_STAGE):  # strategies prepare their copy of the data on creation
+            strategy = strategy_cls(data=data, **sim_item.strategy.fields)
+
+        engine = BTXEngine(
+            config=EngineConfig(
+                initial_cash=sim_item.sim_config.initial_cash,
+                slippage=sim_item.sim_config.slippage,
+                commission=sim_item.sim_config.commission,
+                generate_output=context.generate_output,
+                compact=sim_item.sim_config.compact,
+                keep_indicators=sim_item.sim_config.keep_indicators,
+                time_stages=context.time_stages,
+            ),
+            context=EngineContext(
+                sim_group=context.sim_group,
+                sim_id=sim_item.sim_id,
+                data=data,
+                ticker=sim_item.data.ticker,
+                strategy=strategy,
+                metrics_creator=BacktestMetricCreator,
+                plot_generator=create_plot_generator,
+            ),
+        )
+        df = engine.run_backtest()
+        tracker.add_frame(RESULT_BYTES, df)
+        for stage, seconds in engine.timings.items():
+            timer.timings[stage] = timer.timings.get(stage, 0.0) + seconds
+
+        result_path: Optional[str] = None
+        if context.store_results:
+            with timer.stage(OUTPUT_STAGE):
+                result_path = get_result_path(context, sim_item)
+                os.makedirs(os.path.dirname(result_path), exist_ok=True)
+                df.to_pickle(result_path)
+
+    memory = tracker.get_report()
+    return SimResult(
+        sim_id=sim_item.sim_id,
+        ticker=sim_item.data.ticker,
+        strategy=sim_item.strategy.type,
+        metrics=engine.metrics.to_dict() if engine.metrics else {},
+        result_path=result_path,
+        timings=timer.timings,
+        memory=memory,
+        memory_warning=check_memory_threshold(memory, context.memory_threshold_bytes),
+        cache_hit=cache_hit,
+    )
+
+
+def _get_cache_hit(hits: int, misses: int) -> Optional[bool]:
+    """Whether the loads since the counts were taken were all cache hits, or None if none were counted."""
+    new_hits, new_misses = _load_stats.hits - hits, _load_stats.misses - misses
+    if not new_hits and not new_misses:
+        return None
+    return not new_misses
+
+
+def run_sim_with_warm_data(context: RunContext, sim_item: SimItem) -> SimResult:
+    """Run a sim on data kept in the worker's memory, so sims sharing a dataset only load it once per worker."""
+    return run_sim(context, sim_item, load_data=load_warm_data)
+
+
+def run_sim_safely(sim_runner: SimRunner, context: RunContext, sim_item: SimItem) -> SimResult:
+    """
+    Run a sim, reporting any exception it raises as a failed result instead of letting it kill the worker.
+
+    Sims the run context's profile config picks are run under the profilers.
+    """
+    try:
+        if context.profile is not None and should_profile(context.profile, sim_item.sim_id):
+            return profile_sim(sim_runner, context, sim_item)
+        return sim_runner(context, sim_item)
+    except Exception as e:
+        return SimResult(
+            sim_id=sim_item.sim_id, ticker=sim_item.data.ticker, strategy=sim_item.strategy.type, error=repr(e)
+        )
@@ -2,8 +2,8 @@
 This module defines the interfaces for the backtesting engine.
 """
 
-from dataclasses import dataclass
-from typing import Any, Literal
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
 
 import pandas as pd
 
@@ -17,6 +17,9 @@ class EngineConfig:
     commission: float = 0.0
     initial_cash: float = 100_000.0  # Default initial cash for backtesting
     generate_output: bool = True  # Whether to generate output files
+    compact: bool = False  # float32 prices, int8 signals and int64 positions (see backtesting_engine.compact)
+    keep_indicators: bool = True  # keep the strategy's intermediate indicator columns in the results
+    time_stages: bool = True  # time each stage of the backtest into BTXEngine.timings
 
 
 @dataclass
@@ -27,7 +30,7 @@ class EngineContext:
     ticker: str
     strategy: IStrategy
     metrics_creator: type[IMetricsCreator]
-    plot_generator: type[IPlotGenerator]
+    plot_generator: Callable[[pd.DataFrame, str, "EngineContext"], IPlotGenerator]  # class or factory
 
 
 @dataclass
@@ -50,7 +53,10 @@ class DataConfig:
     ticker: str
     start_date: str
     end_date: str
-    source: Literal["yfinance", "csv"] = "yfinance"
+    source: str = "yfinance"  # a registered data source (see data.registry), or "csv"
+    interval: str = "1d"  # bar size, e.g. "1m", "1h", "1d"
+    csv_path: Optional[str] = None  # file to read when source is "csv"
+    validation: str = "strict"  # "strict" fails on any data issue, "lenient" repairs what it can (see data.validation)
 
 
 @dataclass
@@ -58,6 +64,8 @@ class SimConfig:
     initial_cash: float
     slippage: float
     commission: float
+    compact: bool = False
+    keep_indicators: bool = True
 
 
 @dataclass
@@ -68,9 +76,56 @@ class SimItem:
     sim_config: SimConfig
 
 
+@dataclass
+class ProfileConfig:
+    sim_ids: tuple[str, ...] = ()  # sims that are always profiled
+    sample_fraction: float = 0.0  # share of the other sims, picked by a hash of their sim_id, that are profiled
+    seed: int = 0  # changes which sims the sample picks
+    trace_memory: bool = True  # also trace the sims' allocations with tracemalloc
+    top_allocations: int = 25  # source lines listed in each sim's allocation report
+
+
+@dataclass
+class RunContext:
+    sim_group: str
+    output_dir_location: str
+    store_results: bool = True  # persist each sim's backtest results to the output directory
+    generate_output: bool = False  # render plots for each sim
+    time_stages: bool = True  # time each stage of each sim into SimResult.timings
+    profile: Optional[ProfileConfig] = None  # profile some of the sims (see backtesting_engine.profiling)
+    track_memory: bool = True  # measure each sim's peak RSS and DataFrame sizes into SimResult.memory
+    trace_allocations: bool = False  # also trace each sim's Python allocations with tracemalloc, which is slow
+    memory_threshold_bytes: Optional[int] = None  # peak RSS above which a sim's result carries a memory warning
+
+
 @dataclass
 class QueueConfig:
     sim_group: str
     output_dir_location: str
     author: str
     sims: list[SimItem]
+
+
+@dataclass
+class SimResult:
+    sim_id: str
+    ticker: str
+    strategy: str
+    metrics: dict[str, str | float] = field(default_factory=dict)
+    result_path: Optional[str] = None  # where the full backtest results were stored, if they were
+    error: Optional[str] = None  # set when the sim raised instead of completing
+    profile_path: Optional[str] = None  # where the sim's cProfile stats were written, if it was profiled
+    timings: dict[str, float] = field(default_factory=dict)  # seconds the sim spent in each stage, e.g. "load"
+    memory: dict[str, int] = field(default_factory=dict)  # bytes the sim used, e.g. "peak_rss"
+    memory_warning: Optional[str] = None  # set when the sim's peak RSS crossed the run's threshold
+    cache_hit: Optional[bool] = None  # whether the sim's data came from a cache, None when not known
+
+    def to_dict(self) -> dict[str, Optional[str | float]]:
+        return {
+            "Sim ID": self.sim_id,
+            "Ticker": self.ticker,
+            "Strategy": self.strategy,
+            **self.metrics,
+            "Result Path": self.result_path,
+            "Error": self.error,
+        }
@@ -0,0 +1,132 @@
+"""
+This module implements an append-only journal of the sims completed in a queue run, so an interrupted run can be
+resumed without redoing the sims that had already finished.
+
+The journal is a JSON-lines file in the queue's output directory. It is only ever written by the parent process as
+results arrive, so no locking is needed. Each write is a single buffered line that is flushed to the OS straight away,
+which survives a crash of the process while staying cheap enough for thousands of sims per minute. A line half
+written when the process died is ignored when the journal is read back, and cut off before the next record is
+appended so the two do not run together.
+"""
+
+import hashlib
+import json
+import os
+
+from dataclasses import asdict
+from typing import Any, Optional, TextIO
+
+from backtesting_engine.constants import JOURNAL_FILE_SUFFIX, JOURNAL_TAIL_CHUNK
+from backtesting_engine.interfaces import SimItem, SimResult
+
+
+def get_sim_hash(sim_item: SimItem) -> str:
+    """
+    Fingerprint of a sim's full configuration.
+
+    A sim is only treated as done on resume if its configuration is unchanged, so editing a sim in the queue file
+    and restarting re-runs it instead of silently reusing the stale result.
+    """
+    payload = json.dumps(asdict(sim_item), sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+class RunJournal:
+    """Append-only record of the completed sims of a sim group."""
+
+    def __init__(self, output_dir_location: str, sim_group: str, fsync_every: int = 0) -> None:
+        """
+        Args:
+            output_dir_location (str): Directory the journal file lives in.
+            sim_group (str): Sim group the journal belongs to, used to name the file.
+            fsync_every (int): Force the journal to disk every N records. 0 leaves it to the OS, which protects
+                against process crashes but not power loss.
+        """
+        self.path = os.path.join(output_dir_location, f"{sim_group}{JOURNAL_FILE_SUFFIX}")
+        self.fsync_every = fsync_every
+
+        self._file: Optional[TextIO] = None
+        self._unsynced = 0
+
+    def load(self) -> dict[str, tuple[str, SimResult]]:
+        """
+        Read back the completed sims. Returns a mapping of sim_id -> (sim hash, result).
+        """
+        completed: dict[str, tuple[str, SimResult]] = {}
+        if not os.path.exists(self.path):
+            return completed
+
+        with open(self.path, "r") as file:
+            for line in file:
+                try:
+                    entry: dict[str, Any] = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # partial line from a crash mid-write
+
+                completed[entry["sim_id"]] = (entry["sim_hash"], SimResult(**entry["result"]))
+
+        return completed
+
+    def get_completed_results(
+        self, sims: list[SimItem], completed: Optional[dict[str, tuple[str, SimResult]]] = None
+    ) -> dict[str, SimResult]:
+        """
+        Results of the given sims that the journal shows as already completed with the same configuration. Pass what
+        `load` returned to avoid reading the journal again.
+        """
+        completed = completed if completed is not None else self.load()
+        return {
+            sim.sim_id: completed[sim.sim_id][1]
+            for sim in sims
+            if sim.sim_id in completed and completed[sim.sim_id][0] == get_sim_hash(sim)
+        }
+
+    def record(self, sim_item: SimItem, result: SimResult) -> None:
+        """Append a completed sim and the location of its result."""
+        if self._file is None:
+            self._file = self._open()
+
+        entry = {
+            "sim_id": sim_item.sim_id,
+            "sim_hash": get_sim_hash(sim_item),
+            "result_path": result.result_path,
+            "result": asdict(result),
+        }
+        self._file.write(json.dumps(entry, default=str) + "\n")
+        self._file.flush()
+
+        self._unsynced += 1
+        if self.fsync_every and self._unsynced >= self.fsync_every:
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+
+    def _open(self) -> TextIO:
+        """Open the journal for appending, first truncating any partial line a crash left at its end."""
+        if os.path.exists(self.path):
+            with open(self.path, "rb+") as file:
+                size = file.seek(0, os.SEEK_END)
+                end = size
+                while end > 0:
+                    start = max(end - JOURNAL_TAIL_CHUNK, 0)
+                    file.seek(start)
+                    newline = file.read(end - start).rfind(b"\n")
+                    if newline != -1:
+                        end = start + newline + 1
+                        break
+                    end = start
+                if end != size:
+                    file.truncate(end)
+        return open(self.path, "a")
+
+    def reset(self) -> None:
+        """Discard the journal so the next run starts from scratch."""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def close(self) -> None:
+        if self._file is not None:
+            if self.fsync_every:
+                os.fsync(self._file.fileno())
+            self._file.close()
+            self._file = None
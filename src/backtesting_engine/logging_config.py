@@ -0,0 +1,78 @@
+"""
+This module configures the logging of the backtesting engine.
+
+Every module logs to a logger named after it, under the "backtesting_engine" logger, and none of them configures
+logging itself. Until an application calls configure_logging, Python's defaults apply and only warnings and errors are
+shown. Per-sim messages, such as cache hits and sims starting and finishing, are logged at DEBUG, so they stay silent
+unless asked for.
+
+Structured output writes each record as one JSON object holding its time, level, logger and message, plus any fields
+passed in `extra`, e.g. the sim_group and sim_id. The configuration is also put in the environment, where the workers
+of the local pool pick it up when they start.
+"""
+
+import json
+import logging
+import os
+
+from datetime import datetime, timezone
+from typing import Optional, TextIO, Union
+
+from backtesting_engine.constants import (
+    JSON_LOG_FORMAT,
+    LOG_FORMAT_ENV_VAR,
+    LOG_LEVEL_ENV_VAR,
+    PACKAGE_LOGGER,
+    TEXT_LOG_FORMAT,
+)
+
+
+_RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "taskName"}
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats a record as a JSON object, with the fields passed in `extra` at the top level."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update({name: value for name, value in vars(record).items() if name not in _RECORD_ATTRIBUTES})
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class _PackageHandler(logging.StreamHandler):  # type: ignore[type-arg]
+    """The handler configure_logging installs, told apart from handlers the application added itself."""
+
+
+def configure_logging(
+    level: Union[int, str] = logging.INFO, structured: bool = False, stream: Optional[TextIO] = None
+) -> None:
+    """
+    Send the engine's records at `level` and above to `stream` (stderr by default), as text or as JSON. Calling it
+    again replaces the earlier configuration.
+    """
+    logger = logging.getLogger(PACKAGE_LOGGER)
+    for handler in [handler for handler in logger.handlers if isinstance(handler, _PackageHandler)]:
+        logger.removeHandler(handler)
+
+    handler = _PackageHandler(stream)
+    handler.setFormatter(JsonFormatter() if structured else logging.Formatter(TEXT_LOG_FORMAT))
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    logger.propagate = False
+
+    os.environ[LOG_LEVEL_ENV_VAR] = logging.getLevelName(logger.level)
+    os.environ[LOG_FORMAT_ENV_VAR] = JSON_LOG_FORMAT if structured else "text"
+
+
+def configure_worker_logging() -> None:
+    """Apply the configuration the parent process put in the environment, if it configured logging."""
+    level = os.environ.get(LOG_LEVEL_ENV_VAR)
+    if level:
+        configure_logging(level, structured=os.environ.get(LOG_FORMAT_ENV_VAR) == JSON_LOG_FORMAT)
@@ -11,6 +11,7 @@ from backtesting_engine.data.data_loader import DataLoader
 from backtesting_engine.data.lru_cache import PersistentLRUCache
 from backtesting_engine.engine import BTXEngine
 from backtesting_engine.interfaces import EngineConfig, EngineContext
+from backtesting_engine.logging_config import configure_logging
 from backtesting_engine.managers import QueueManager
 from backtesting_engine.strategies.buy_and_hold import BuyAndHoldStrategy
 from backtesting_engine.strategies.mean_reversion import MeanReversionStrategy
@@ -59,4 +60,5 @@ def run_multiple_sims() -> None:
 
 
 if __name__ == "__main__":
+    configure_logging()
     run_single_sim()
@@ -4,64 +4,137 @@ and running simulations based on the specified strategies and data.
 """
 
 import json
-import multiprocessing as mp
+import logging
 
-from multiprocessing import Queue
+from collections.abc import Sequence
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from typing import Optional
+
+import pandas as pd
 
-from backtesting_engine.analytics.metrics import BacktestMetricCreator
-from backtesting_engine.analytics.plotter import PlotGenerator
 from backtesting_engine.constants import (
     AUTHOR,
     DATA,
+    MEMORY_FILE_SUFFIX,
+    METRICS_HOST,
     OUTPUT_DIR_LOCATION,
+    PROFILE_FILE_SUFFIX,
+    PROGRESS_INTERVAL,
     SIM_CONFIG,
     SIM_GROUP,
     SIM_ID,
     SIMS,
+    STAGE_TIMINGS_FILE_SUFFIX,
     STRATEGY,
+    WORKER_PEAK_RSS,
+    WORKER_PID,
 )
-from backtesting_engine.data.data_loader import DataLoader
-from backtesting_engine.data.lru_cache import PersistentLRUCache
-from backtesting_engine.engine import BTXEngine
+from backtesting_engine.data.prefetch import DataPrefetcher
+from backtesting_engine.data.series_store import SeriesStore
+from backtesting_engine.execution.interfaces import IExecutor
+from backtesting_engine.execution.local import LocalProcessExecutor
+from backtesting_engine.execution.pool import WorkerPool
+from backtesting_engine.execution.runner import STRATEGIES  # noqa: F401 - kept importable from here
 from backtesting_engine.interfaces import (
     DataConfig,
-    EngineConfig,
-    EngineContext,
+    ProfileConfig,
     QueueConfig,
+    RunContext,
     SimConfig,
     SimItem,
+    SimResult,
     StrategyConfig,
 )
-from backtesting_engine.strategies.buy_and_hold import BuyAndHoldStrategy
-from backtesting_engine.strategies.mean_reversion import MeanReversionStrategy
-from backtesting_engine.strategies.momentum import MomentumStrategy
-from backtesting_engine.strategies.sma_crossover import SMACrossoverStrategy
-
+from backtesting_engine.journal import RunJournal
+from backtesting_engine.metrics_server import MetricsServer, RunMetrics
+from backtesting_engine.profiling import merge_profiles
+from backtesting_engine.progress import ProgressReporter
+from backtesting_engine.rendering import render_plots, select_sims
+from backtesting_engine.timing import get_stage_percentiles
 
-if TYPE_CHECKING:
-    JobQueueType = Queue[SimItem]  # For static type checking
-else:
-    JobQueueType = Queue
 
-
-STRATEGIES = {
-    "sma_crossover": SMACrossoverStrategy,
-    "mean_reversion": MeanReversionStrategy,
-    "momentum": MomentumStrategy,
-    "buy_and_hold": BuyAndHoldStrategy,
-}
+logger = logging.getLogger(__name__)
 
 
 class QueueManager:
     """Manages a queue loaded from a JSON file"""
 
-    def __init__(self, queue_file_path: str, max_workers: Optional[int] = None) -> None:
-        self.max_workers = max_workers if max_workers is not None else mp.cpu_count()
+    def __init__(
+        self,
+        queue_file_path: str,
+        max_workers: Optional[int] = None,
+        executor: Optional[IExecutor] = None,
+        resume: bool = True,
+        store_results: bool = True,
+        pin_workers: bool = False,
+        pool: Optional[WorkerPool] = None,
+        prefetch: bool = True,
+        prefetcher: Optional[DataPrefetcher] = None,
+        time_stages: bool = True,
+        profile: Optional[ProfileConfig] = None,
+        track_memory: bool = True,
+        trace_allocations: bool = False,
+        memory_threshold_bytes: Optional[int] = None,
+        progress_interval: float = PROGRESS_INTERVAL,
+        metrics_port: Optional[int] = None,
+        metrics_host: str = METRICS_HOST,
+        plot_top_n: Optional[int] = None,
+        plot_sim_ids: Sequence[str] = (),
+        plot_workers: Optional[int] = None,
+    ) -> None:
+        pool_options = {"max_workers": max_workers, "pin_workers": pin_workers, "pool": pool}
+        given = [name for name, value in pool_options.items() if value not in (None, False)]
+        if executor is not None and given:
+            raise ValueError(f"{', '.join(given)} configure the local worker pool, which the given executor replaces.")
+        if (plot_top_n or plot_sim_ids) and not store_results:
+            raise ValueError("plot_top_n and plot_sim_ids plot sims from their stored results, so need store_results.")
         self.queue_config = self._load_queue_config(queue_file_path=queue_file_path)
         self._create_output_directory()
 
+        # sims run in local worker processes, from a shared pool if given, unless another backend is supplied
+        self.executor = executor or LocalProcessExecutor(max_workers=max_workers, pin_workers=pin_workers, pool=pool)
+
+        self.context = RunContext(
+            sim_group=self.queue_config.sim_group,
+            output_dir_location=self.queue_config.output_dir_location,
+            store_results=store_results,
+            time_stages=time_stages,
+            profile=profile,
+            track_memory=track_memory,
+            trace_allocations=trace_allocations,
+            memory_threshold_bytes=memory_threshold_bytes,
+        )
+        self.resume = resume
+        self.prefetch = prefetch
+        self.prefetcher = prefetcher  # created on first use unless given
+        self.progress_interval = progress_interval  # seconds between progress lines
+        self.metrics = RunMetrics()  # counters updated as sims finish, served over HTTP during a run if a port is given
+        self.metrics_port = metrics_port
+        self.metrics_host = metrics_host
+        self.metrics_server: Optional[MetricsServer] = None  # while a run is serving its metrics
+        self.plot_workers = plot_workers or max_workers  # processes rendering plots after the run, one per CPU if None
+        self.plot_top_n = plot_top_n
+        self.plot_sim_ids = plot_sim_ids
+        self.plot_paths: dict[str, list[str]] = {}  # of the last run, the plots rendered by sim_id
+        self.journal = RunJournal(self.queue_config.output_dir_location, self.queue_config.sim_group)
+        self.results: list[SimResult] = []  # of the last run, in queue order
+        self.stage_percentiles = pd.DataFrame()  # of the last run, see get_stage_percentiles
+        self.profile_path: Optional[str] = None  # the group's merged profile, if any sims were profiled
+        self.worker_peak_rss: dict[int, int] = {}  # of the last run, highest peak RSS in bytes by worker process id
+
+    def _render_plots(self) -> None:
+        selected = select_sims(self.results, top_n=self.plot_top_n, sim_ids=self.plot_sim_ids)
+        self.plot_paths = (
+            render_plots(
+                selected,
+                self.queue_config.sim_group,
+                self.queue_config.output_dir_location,
+                max_workers=self.plot_workers,
+            )
+            if selected
+            else {}
+        )
+
     def _load_queue_config(self, queue_file_path: str) -> QueueConfig:
         """
         Loads the queue configuration from a JSON file and creates the output directory if it does not exist.
@@ -74,7 +147,11 @@ class QueueManager:
             raw_config = json.load(file)
 
         sims = []
+        sim_ids = set()
         for sim in raw_config[SIMS]:
+            if sim[SIM_ID] in sim_ids:  # resuming, results and output files all go by sim_id
+                raise ValueError(f"Queue file {queue_file_path} has more than one sim with sim_id {sim[SIM_ID]!r}.")
+            sim_ids.add(sim[SIM_ID])
             sims.append(
                 SimItem(
                     sim_id=sim[SIM_ID],
@@ -95,62 +172,141 @@ class QueueManager:
         output_dir = Path(self.queue_config.output_dir_location)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-    def _worker(self, job_queue: "JobQueueType") -> None:
-        while True:
-            try:
-                sim_item = job_queue.get_nowait()
-            except Exception:
-                break  # Queue is empty
-
-            data_loader = DataLoader(cache=PersistentLRUCache())
-            data = data_loader.load(
-                ticker=sim_item.data.ticker,
-                start_date=sim_item.data.start_date,
-                end_date=sim_item.data.end_date,
-                source=sim_item.data.source,
+    def _export_stage_percentiles(self) -> None:
+        self.stage_percentiles = get_stage_percentiles(result.timings for result in self.results)
+        if self.stage_percentiles.empty:
+            return
+
+        sim_group = self.queue_config.sim_group
+        path = Path(self.queue_config.output_dir_location) / f"{sim_group}{STAGE_TIMINGS_FILE_SUFFIX}"
+        self.stage_percentiles.to_csv(path)
+        slowest = self.stage_percentiles["p95"].idxmax()
+        logger.info(
+            "[%s] Slowest stage: %s (p95 %.3fs).", sim_group, slowest, self.stage_percentiles.at[slowest, "p95"]
+        )
+
+    def _export_memory_report(self) -> None:
+        rows = [
+            {SIM_ID: result.sim_id, **result.memory, "memory_warning": result.memory_warning}
+            for result in self.results
+            if result.memory
+        ]
+        self.worker_peak_rss = {}
+        for row in rows:
+            if WORKER_PID in row:
+                pid = int(row[WORKER_PID])
+                self.worker_peak_rss[pid] = max(self.worker_peak_rss.get(pid, 0), int(row[WORKER_PEAK_RSS]))
+        if not rows:
+            return
+
+        sim_group = self.queue_config.sim_group
+        path = Path(self.queue_config.output_dir_location) / f"{sim_group}{MEMORY_FILE_SUFFIX}"
+        pd.DataFrame(rows).to_csv(path, index=False)
+        if self.worker_peak_rss:
+            logger.info(
+                "[%s] Highest worker peak RSS: %.0f MiB.", sim_group, max(self.worker_peak_rss.values()) / 1024**2
             )
+        for result in self.results:
+            if result.memory_warning:
+                logger.warning(
+                    "[%s:%s] %s",
+                    sim_group,
+                    result.sim_id,
+                    result.memory_warning,
+                    extra={"sim_group": sim_group, "sim_id": result.sim_id},
+                )
+
+    def _merge_profiles(self) -> None:
+        profile_paths = [result.profile_path for result in self.results if result.profile_path]
+        if not profile_paths:
+            return
+
+        sim_group = self.queue_config.sim_group
+        merged_path = str(Path(self.queue_config.output_dir_location) / f"{sim_group}{PROFILE_FILE_SUFFIX}")
+        self.profile_path = merge_profiles(profile_paths, merged_path)
+        if self.profile_path:
+            logger.info("[%s] Merged %d sim profiles into %s.", sim_group, len(profile_paths), self.profile_path)
+
+    def run_all(self) -> pd.DataFrame:
+        """
+        Run every sim in the queue on the configured executor and return one row of results per sim.
+
+        Each completed sim is recorded in the run journal with a hash of its configuration. When resuming, sims the
+        journal already has with the same configuration are skipped and their earlier results are returned alongside
+        the new ones; a sim whose configuration changed since is run again.
+
+        Unless prefetching is disabled, the data of every pending sim is downloaded into the cache in bulk before
+        the first sim starts.
+
+        The stage timings of the sims are summarised into p50/p95/p99 seconds per stage, kept in `stage_percentiles`
+        and written next to the journal as <sim_group>.stage_timings.csv.
+
+        Each sim's peak RSS and DataFrame sizes are written next to the journal as <sim_group>.memory.csv, and the
+        sims whose peak crossed `memory_threshold_bytes` are reported.
+
+        When a profile config is given, the sims it picks are profiled in their workers and their profiles are merged
+        into <sim_group>.prof next to the journal (see backtesting_engine.profiling).
+
+        Progress is logged every `progress_interval` seconds and when the run ends: sims per second, the time left,
+        failures and how many sims found their data in a cache.
+
+        With a `metrics_port`, the same figures, per-stage latency histograms, worker peak RSS and the sims left are
+        served at http://<metrics_host>:<metrics_port>/metrics in the Prometheus text format for as long as the run
+        lasts (see backtesting_engine.metrics_server). They are taken from the sims' results, so they are updated as
+        each sim finishes rather than pushed by the workers while it runs; a worker's peak RSS is the one at the end
+        of its last finished sim.
+
+        Sims are not plotted while they run. Given `plot_top_n` or `plot_sim_ids`, the top N sims by Sharpe ratio and
+        the listed sims are plotted from their stored results once the run is over (see backtesting_engine.rendering).
+        """
+        sims = self.queue_config.sims
+        if not self.resume:
+            self.journal.reset()
 
-            strategy_cls = STRATEGIES.get(sim_item.strategy.type.lower())
-            if not strategy_cls:
-                raise ValueError(f"Unknown strategy type: {sim_item.strategy.type}")
-
-            strategy = strategy_cls(data=data, **sim_item.strategy.fields)
-
-            engine = BTXEngine(
-                config=EngineConfig(
-                    initial_cash=sim_item.sim_config.initial_cash,
-                    slippage=sim_item.sim_config.slippage,
-                    commission=sim_item.sim_config.commission,
-                    generate_output=False,
-                ),
-                context=EngineContext(
-                    sim_group=self.queue_config.sim_group,
-                    sim_id=sim_item.sim_id,
-                    data=data,
-                    ticker=sim_item.data.ticker,
-                    strategy=strategy,
-                    metrics_creator=BacktestMetricCreator,
-                    plot_generator=PlotGenerator,
-                ),
+        journaled = self.journal.load()
+        completed = self.journal.get_completed_results(sims, journaled)  # only sims whose configuration hash matches
+        pending = [sim for sim in sims if sim.sim_id not in completed]
+        if completed:
+            logger.info("[%s] Resuming: %d sims already completed.", self.queue_config.sim_group, len(completed))
+        changed = sum(sim.sim_id in journaled for sim in pending)
+        if changed:
+            logger.info(
+                "[%s] Re-running %d completed sims whose configuration changed.", self.queue_config.sim_group, changed
             )
 
-            print(f"[{self.queue_config.sim_group}:{sim_item.sim_id}] Starting...")
-            engine.run_backtest()
-            print(f"[{self.queue_config.sim_group}:{sim_item.sim_id}] Completed.")
+        sims_by_id = {sim.sim_id: sim for sim in pending}
+        results: list[SimResult] = list(completed.values())
+        progress = ProgressReporter(self.queue_config.sim_group, len(pending), interval=self.progress_interval)
 
-    def run_all(self) -> None:
-        manager = mp.Manager()
-        job_queue = manager.Queue()
+        def on_result(result: SimResult) -> None:
+            results.append(result)
+            progress.update(result)
+            self.metrics.observe(result)
+            if result.error is None:  # failed sims are retried on the next run
+                self.journal.record(sims_by_id[result.sim_id], result)
 
-        for sim in self.queue_config.sims:
-            job_queue.put(sim)
+        if self.prefetch and pending:
+            self.prefetcher = self.prefetcher or DataPrefetcher(store=SeriesStore())
+            self.prefetcher.prefetch([sim.data for sim in pending])
 
-        processes: list[mp.Process] = []
-        for _ in range(self.max_workers):
-            p = mp.Process(target=self._worker, args=(job_queue,))
-            p.start()
-            processes.append(p)
+        self.metrics.start_run(self.queue_config.sim_group, len(pending))
+        try:
+            if self.metrics_port is not None:
+                self.metrics_server = MetricsServer(self.metrics, self.metrics_port, self.metrics_host).start()
+            self.executor.run(self.context, pending, on_result)
+        finally:
+            if self.metrics_server is not None:
+                self.metrics_server.close()
+                self.metrics_server = None
+            self.journal.close()
+        if pending:
+            progress.finish()
 
-        # Wait for all workers to finish
-        for p in processes:
-            p.join()
+        queue_order = {sim.sim_id: i for i, sim in enumerate(sims)}
+        results.sort(key=lambda result: queue_order[result.sim_id])
+        self.results = results
+        self._export_stage_percentiles()
+        self._export_memory_report()
+        self._merge_profiles()
+        self._render_plots()
+        return pd.DataFrame([result.to_dict() for result in results])
@@ -0,0 +1,129 @@
+"""
+This module measures the memory a sim uses in the worker that runs it.
+
+The peak RSS of a sim is read from VmHWM in /proc/self/status after resetting it through /proc/self/clear_refs, which
+Linux allows a process to do for itself. Where that is not possible, the process's lifetime peak from getrusage is
+reported instead, which is an upper bound on the sim's. tracemalloc, which slows a sim down considerably, only runs
+when asked for. Each worker also keeps its own high-water mark across the sims it has run.
+"""
+
+import os
+import sys
+import tracemalloc
+
+from types import TracebackType
+from typing import Optional
+
+import pandas as pd
+
+from backtesting_engine.constants import PEAK_RSS, TRACEMALLOC_PEAK, WORKER_PEAK_RSS, WORKER_PID
+
+
+_worker_peak_rss = 0  # highest peak RSS of any sim this process has run
+
+
+def reset_peak_rss() -> bool:
+    """Reset the process's VmHWM to its current RSS. Returns False where the kernel does not support it."""
+    try:
+        with open("/proc/self/clear_refs", "w") as file:
+            file.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def get_peak_rss() -> int:
+    """Peak RSS in bytes since the last reset, or over the life of the process where resets are not supported."""
+    try:
+        with open("/proc/self/status", "r") as file:
+            for line in file:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    try:
+        import resource
+    except ImportError:  # Windows
+        return 0
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * 1024  # bytes on MacOS, KiB elsewhere
+
+
+def get_frame_bytes(df: pd.DataFrame) -> int:
+    """Memory held by a DataFrame's columns and index."""
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+def get_worker_peak_rss() -> int:
+    return _worker_peak_rss
+
+
+class MemoryTracker:
+    """
+    Measures the peak memory of the code run inside it. A disabled tracker measures nothing and reports nothing.
+
+        with MemoryTracker(trace_allocations=True) as tracker:
+            ...
+        tracker.get_report()  # {"peak_rss": ..., "tracemalloc_peak": ..., ...}
+    """
+
+    def __init__(self, enabled: bool = True, trace_allocations: bool = False) -> None:
+        self.enabled = enabled
+        self.trace_allocations = enabled and trace_allocations
+        self.peak_rss = 0
+        self.tracemalloc_peak: Optional[int] = None
+        self.frame_bytes: dict[str, int] = {}  # bytes of the DataFrames recorded with add_frame, by name
+        self._started_tracing = False
+
+    def add_frame(self, name: str, df: pd.DataFrame) -> None:
+        if self.enabled:
+            self.frame_bytes[name] = get_frame_bytes(df)
+
+    def __enter__(self) -> "MemoryTracker":
+        if not self.enabled:
+            return self
+        reset_peak_rss()
+        if self.trace_allocations:
+            self._started_tracing = not tracemalloc.is_tracing()  # a profiler may already be tracing
+            if self._started_tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        global _worker_peak_rss
+
+        if not self.enabled:
+            return
+        self.peak_rss = get_peak_rss()
+        _worker_peak_rss = max(_worker_peak_rss, self.peak_rss)
+        if self.trace_allocations:
+            self.tracemalloc_peak = tracemalloc.get_traced_memory()[1]
+            if self._started_tracing:
+                tracemalloc.stop()
+
+    def get_report(self) -> dict[str, int]:
+        """The sim's memory figures in bytes, with the worker's high-water mark and process id."""
+        if not self.enabled:
+            return {}
+        report = {PEAK_RSS: self.peak_rss}
+        if self.tracemalloc_peak is not None:
+            report[TRACEMALLOC_PEAK] = self.tracemalloc_peak
+        report.update(self.frame_bytes)
+        report[WORKER_PEAK_RSS] = _worker_peak_rss
+        report[WORKER_PID] = os.getpid()
+        return report
+
+
+def check_memory_threshold(report: dict[str, int], threshold_bytes: Optional[int]) -> Optional[str]:
+    """A warning when a sim's peak RSS crossed the threshold, or None."""
+    peak_rss = report.get(PEAK_RSS, 0)
+    if threshold_bytes is None or peak_rss <= threshold_bytes:
+        return None
+    return f"Peak RSS of {peak_rss / 1024**2:.0f} MiB is over the {threshold_bytes / 1024**2:.0f} MiB threshold."
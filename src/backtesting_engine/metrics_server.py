@@ -0,0 +1,221 @@
+"""
+This module serves the metrics of a queue run over HTTP, while it runs, in the Prometheus text format.
+
+Workers have no channel of their own to report them: every figure is taken from the results they already send back
+to the parent, which carry the sim's stage timings, memory report and whether its data came from a cache. So counting
+costs the workers nothing, and the parent a few additions per sim. The endpoint runs on a daemon thread of the parent
+and renders the counters when scraped.
+
+The metrics are therefore only as current as the last result: they move when a sim finishes, not while one runs. In
+particular a worker's peak RSS is the one measured at the end of its last finished sim, so a worker deep in a long sim
+shows the peak of the sim before it.
+
+    metrics = RunMetrics()
+    with MetricsServer(metrics, port=9100):
+        ...  # curl http://127.0.0.1:9100/metrics
+"""
+
+import logging
+import threading
+import time
+
+from collections.abc import Sequence
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import TracebackType
+from typing import Callable, Optional
+
+from backtesting_engine.constants import (
+    METRICS_HOST,
+    METRICS_PREFIX,
+    STAGE_LATENCY_BUCKETS,
+    WORKER_PEAK_RSS,
+    WORKER_PID,
+)
+from backtesting_engine.interfaces import SimResult
+
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _Histogram:
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)  # observations in each bucket alone, made cumulative when rendered
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.sum += value
+        self.count += 1
+
+
+class RunMetrics:
+    """Counters of the sims a queue has run, updated from their results and safe to read from another thread."""
+
+    def __init__(
+        self, buckets: Sequence[float] = STAGE_LATENCY_BUCKETS, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.buckets = tuple(buckets)
+        self.clock = clock
+        self._lock = threading.Lock()
+
+        self.sim_group = ""
+        self.queued = 0  # sims of the current run not finished yet
+        self.completed = 0
+        self.failed = 0
+        self.cache_hits = 0
+        self.cache_lookups = 0
+        self.stage_seconds: dict[str, _Histogram] = {}
+        self.worker_peak_rss: dict[int, int] = {}  # bytes, by worker process id
+        self.run_start: Optional[float] = None
+        self.run_done = 0  # sims finished in the current run, for its rate
+
+    def start_run(self, sim_group: str, sims: int) -> None:
+        with self._lock:
+            self.sim_group = sim_group
+            self.queued = sims
+            self.run_start = self.clock()
+            self.run_done = 0
+
+    def observe(self, result: SimResult) -> None:
+        with self._lock:
+            self.queued = max(self.queued - 1, 0)
+            self.run_done += 1
+            if result.error is None:
+                self.completed += 1
+            else:
+                self.failed += 1
+            if result.cache_hit is not None:
+                self.cache_lookups += 1
+                self.cache_hits += result.cache_hit
+            for stage, seconds in result.timings.items():
+                if stage not in self.stage_seconds:
+                    self.stage_seconds[stage] = _Histogram(self.buckets)
+                self.stage_seconds[stage].observe(seconds)
+            if WORKER_PID in result.memory:
+                self.worker_peak_rss[result.memory[WORKER_PID]] = result.memory.get(WORKER_PEAK_RSS, 0)
+
+    def get_sims_per_second(self) -> float:
+        if self.run_start is None:
+            return 0.0
+        elapsed = self.clock() - self.run_start
+        return self.run_done / elapsed if elapsed > 0 else 0.0
+
+    def render(self) -> str:
+        """The metrics in the Prometheus text exposition format."""
+        with self._lock:
+            group = f'sim_group="{_escape(self.sim_group)}"'
+            lines: list[str] = []
+
+            _add_header(lines, "sims_total", "counter", "Sims finished, by status.")
+            lines.append(f'{METRICS_PREFIX}_sims_total{{{group},status="completed"}} {self.completed}')
+            lines.append(f'{METRICS_PREFIX}_sims_total{{{group},status="failed"}} {self.failed}')
+
+            _add_header(lines, "sims_per_second", "gauge", "Sims finished per second in the current run.")
+            lines.append(f"{METRICS_PREFIX}_sims_per_second{{{group}}} {self.get_sims_per_second():.6g}")
+
+            _add_header(lines, "queue_depth", "gauge", "Sims of the current run not finished yet.")
+            lines.append(f"{METRICS_PREFIX}_queue_depth{{{group}}} {self.queued}")
+
+            _add_header(lines, "cache_lookups_total", "counter", "Sims that reported whether their data was cached.")
+            lines.append(f"{METRICS_PREFIX}_cache_lookups_total{{{group}}} {self.cache_lookups}")
+            _add_header(lines, "cache_hits_total", "counter", "Sims whose data came from a cache.")
+            lines.append(f"{METRICS_PREFIX}_cache_hits_total{{{group}}} {self.cache_hits}")
+            _add_header(lines, "cache_hit_ratio", "gauge", "Share of sims whose data came from a cache.")
+            ratio = self.cache_hits / self.cache_lookups if self.cache_lookups else 0.0
+            lines.append(f"{METRICS_PREFIX}_cache_hit_ratio{{{group}}} {ratio:.6g}")
+
+            _add_header(lines, "stage_seconds", "histogram", "Seconds a sim spent in each stage.")
+            for stage, histogram in self.stage_seconds.items():
+                labels = f'{group},stage="{_escape(stage)}"'
+                cumulative = 0
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    lines.append(f'{METRICS_PREFIX}_stage_seconds_bucket{{{labels},le="{bound:g}"}} {cumulative}')
+                lines.append(f'{METRICS_PREFIX}_stage_seconds_bucket{{{labels},le="+Inf"}} {histogram.count}')
+                lines.append(f"{METRICS_PREFIX}_stage_seconds_sum{{{labels}}} {histogram.sum:.6g}")
+                lines.append(f"{METRICS_PREFIX}_stage_seconds_count{{{labels}}} {histogram.count}")
+
+            _add_header(
+                lines, "worker_peak_rss_bytes", "gauge", "Peak RSS of each worker at the end of its last finished sim."
+            )
+            for pid, rss in sorted(self.worker_peak_rss.items()):
+                lines.append(f'{METRICS_PREFIX}_worker_peak_rss_bytes{{{group},pid="{pid}"}} {rss}')
+
+        return "\n".join(lines) + "\n"
+
+
+def _add_header(lines: list[str], name: str, metric_type: str, description: str) -> None:
+    lines.append(f"# HELP {METRICS_PREFIX}_{name} {description}")
+    lines.append(f"# TYPE {METRICS_PREFIX}_{name} {metric_type}")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsServer:
+    """
+    Serves a RunMetrics at /metrics from a daemon thread until closed. Port 0 picks a free port, which `port` reports
+    once the server has started.
+    """
+
+    def __init__(self, metrics: RunMetrics, port: int = 0, host: str = METRICS_HOST) -> None:
+        self.metrics = metrics
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "MetricsServer":
+        metrics = self.metrics
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                logger.debug("[METRICS] " + format, *args)
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="btx-metrics", daemon=True)
+        self._thread.start()
+        logger.info("[METRICS] Serving run metrics at http://%s:%d/metrics", self.host, self.port)
+        return self
+
+    def close(self) -> None:
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        self._server = None
+        self._thread = None
+
+    def __enter__(self) -> "MetricsServer":
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
@@ -0,0 +1,95 @@
+"""
+This module profiles selected sims of a queue inside the workers that run them.
+
+A sim is profiled when the run's ProfileConfig lists its sim_id, or when a hash of its sim_id falls in the sampled
+fraction. The hash does not depend on the worker or host that runs the sim, so every backend picks the same sims on
+every run. A profiled sim runs under cProfile, and tracemalloc unless that is turned off, and writes <sim_id>.prof and
+<sim_id>.allocations.txt to <output_dir>/<sim_group>/profiles/. The queue manager merges the .prof files of a group
+into <output_dir>/<sim_group>.prof, which pstats and snakeviz can read.
+
+Profiling makes a sim several times slower, so the stage timings of profiled sims are not comparable with the others.
+"""
+
+import cProfile
+import dataclasses
+import os
+import pstats
+import tracemalloc
+import zlib
+
+from collections.abc import Iterable
+from typing import Callable, Optional
+
+from backtesting_engine.constants import ALLOCATIONS_FILE_SUFFIX, PROFILE_DIR_NAME, PROFILE_FILE_SUFFIX
+from backtesting_engine.interfaces import ProfileConfig, RunContext, SimItem, SimResult
+
+
+def should_profile(profile: ProfileConfig, sim_id: str) -> bool:
+    """Whether a sim is listed for profiling or picked by the sample."""
+    if sim_id in profile.sim_ids:
+        return True
+    if profile.sample_fraction <= 0:
+        return False
+    return zlib.crc32(f"{profile.seed}:{sim_id}".encode()) / 2**32 < profile.sample_fraction
+
+
+def get_profile_dir(context: RunContext) -> str:
+    return os.path.join(context.output_dir_location, context.sim_group, PROFILE_DIR_NAME)
+
+
+def write_allocation_report(path: str, snapshot: tracemalloc.Snapshot, peak: int, top: int) -> None:
+    snapshot = snapshot.filter_traces(
+        [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, "<frozen importlib._bootstrap>")]
+    )
+    stats = snapshot.statistics("lineno")
+    with open(path, "w") as file:
+        file.write(f"Peak traced memory: {peak / 1024**2:.1f} MiB\n\n")
+        file.write(f"Top {top} source lines by memory still allocated when the sim finished:\n")
+        for stat in stats[:top]:
+            file.write(f"{stat}\n")
+
+
+def profile_sim(
+    sim_runner: Callable[[RunContext, SimItem], SimResult], context: RunContext, sim_item: SimItem
+) -> SimResult:
+    """
+    Run a sim under cProfile, and tracemalloc if the profile config asks for it, writing the sim's profile and
+    allocation report even if it raises.
+    """
+    profile = context.profile or ProfileConfig()
+    profile_dir = get_profile_dir(context)
+    os.makedirs(profile_dir, exist_ok=True)
+    profile_path = os.path.join(profile_dir, f"{sim_item.sim_id}{PROFILE_FILE_SUFFIX}")
+
+    trace_memory = profile.trace_memory and not tracemalloc.is_tracing()
+    if trace_memory:
+        tracemalloc.start()
+    profiler = cProfile.Profile()
+    try:
+        result = profiler.runcall(sim_runner, context, sim_item)
+    finally:
+        if trace_memory:  # before the profile is written, which allocates too
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            allocations_path = os.path.join(profile_dir, f"{sim_item.sim_id}{ALLOCATIONS_FILE_SUFFIX}")
+            write_allocation_report(allocations_path, snapshot, peak, profile.top_allocations)
+        profiler.dump_stats(profile_path)
+
+    return dataclasses.replace(result, profile_path=profile_path)
+
+
+def merge_profiles(profile_paths: Iterable[str], merged_path: str) -> Optional[str]:
+    """
+    Merge cProfile stats files into one. Files that are not on this machine, such as those written by remote workers,
+    are left out. Returns the merged file's path, or None when there was nothing to merge.
+    """
+    paths = [path for path in profile_paths if os.path.exists(path)]
+    if not paths:
+        return None
+
+    stats = pstats.Stats(paths[0])
+    if len(paths) > 1:
+        stats.add(*paths[1:])
+    stats.dump_stats(merged_path)
+    return merged_path
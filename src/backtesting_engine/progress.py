@@ -0,0 +1,101 @@
+"""
+This module reports the progress of a run from the parent process.
+
+Results are counted as they arrive, but progress is logged at most once per interval and once at the end, so a queue
+of thousands of tiny sims produces a handful of lines rather than one per sim. Each line carries the same figures as
+structured fields for JSON logging.
+"""
+
+import logging
+import time
+
+from typing import Callable, Optional
+
+from backtesting_engine.constants import PROGRESS_INTERVAL
+from backtesting_engine.interfaces import SimResult
+
+
+logger = logging.getLogger(__name__)
+
+
+class ProgressReporter:
+    """Tracks sims done per second, the time left, failures and the share of sims whose data came from a cache."""
+
+    def __init__(
+        self,
+        sim_group: str,
+        total: int,
+        interval: float = PROGRESS_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.sim_group = sim_group
+        self.total = total
+        self.interval = interval
+        self.clock = clock
+
+        self.done = 0
+        self.failed = 0
+        self.cache_hits = 0
+        self.cache_lookups = 0  # sims that reported whether their data came from a cache
+
+        self.start = clock()
+        self.last_report = self.start
+
+    def update(self, result: SimResult) -> None:
+        self.done += 1
+        if result.error is not None:
+            self.failed += 1
+        if result.cache_hit is not None:
+            self.cache_lookups += 1
+            self.cache_hits += result.cache_hit
+
+        now = self.clock()
+        if now - self.last_report >= self.interval and self.done < self.total:
+            self.last_report = now
+            self.report()
+
+    def get_snapshot(self) -> dict[str, Optional[float]]:
+        elapsed = self.clock() - self.start
+        rate = self.done / elapsed if elapsed > 0 else 0.0
+        return {
+            "sim_group": self.sim_group,
+            "done": self.done,
+            "total": self.total,
+            "failed": self.failed,
+            "elapsed_seconds": elapsed,
+            "sims_per_second": rate,
+            "eta_seconds": (self.total - self.done) / rate if rate > 0 else None,
+            "cache_hit_rate": self.cache_hits / self.cache_lookups if self.cache_lookups else None,
+        }
+
+    def report(self) -> None:
+        snapshot = self.get_snapshot()
+        eta = snapshot["eta_seconds"]
+        logger.info(
+            "[%s] %d/%d sims, %.1f sims/s, ETA %s, %d failed, cache hit rate %s",
+            self.sim_group,
+            self.done,
+            self.total,
+            snapshot["sims_per_second"],
+            f"{eta:.0f}s" if eta is not None else "unknown",
+            self.failed,
+            _format_rate(snapshot["cache_hit_rate"]),
+            extra=snapshot,
+        )
+
+    def finish(self) -> None:
+        snapshot = self.get_snapshot()
+        logger.info(
+            "[%s] Finished %d sims in %.1fs, %.1f sims/s, %d failed, cache hit rate %s",
+            self.sim_group,
+            self.done,
+            snapshot["elapsed_seconds"],
+            snapshot["sims_per_second"],
+            self.failed,
+            _format_rate(snapshot["cache_hit_rate"]),
+            extra=snapshot,
+        )
+
+
+def _format_rate(rate: Optional[float]) -> str:
+    return f"{rate:.0%}" if rate is not None else "unknown"
@@ -0,0 +1,60 @@
+"""
+This module implements the lazily resolved registry the strategy and data source registries are built on.
+
+Entries are registered by an import path, "package.module:Name", and only imported the first time they are looked
+up, so importing the engine does not import every registered module (and whatever those modules import) up front.
+"""
+
+import importlib
+
+from collections.abc import Iterator, Mapping
+from typing import Any, Callable, Optional, TypeVar, Union
+
+
+T = TypeVar("T")
+
+
+class LazyRegistry(Mapping[str, T]):
+    """Maps names to objects, resolving each from its import path on first lookup."""
+
+    def __init__(self, entries: Mapping[str, Union[str, T]], factory: Optional[Callable[[Any], T]] = None) -> None:
+        """
+        Args:
+            entries (Mapping[str, Union[str, T]]): Name -> object, or the import path of the object as
+                "package.module:Name".
+            factory (Optional[Callable[[Any], T]]): Makes the registered object from what an import path names, e.g.
+                creates an instance of the class. What the path names is registered as it is if not given.
+        """
+        self.factory = factory
+        self._paths: dict[str, str] = {}
+        self._resolved: dict[str, T] = {}
+        for name, entry in entries.items():
+            self.register(name, entry)
+
+    def register(self, name: str, entry: Union[str, T]) -> None:
+        """Add an entry, or replace the one registered under the same name."""
+        self._resolved.pop(name, None)
+        if isinstance(entry, str):
+            self._paths[name] = entry
+        else:
+            owner = entry if isinstance(entry, type) else type(entry)
+            self._paths[name] = f"{owner.__module__}:{owner.__qualname__}"
+            self._resolved[name] = entry
+
+    def __getitem__(self, name: str) -> T:
+        if name not in self._resolved:
+            module_name, attribute = self._paths[name].split(":")
+            resolved = getattr(importlib.import_module(module_name), attribute)
+            self._resolved[name] = self.factory(resolved) if self.factory else resolved
+        return self._resolved[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def load_all(self) -> None:
+        """Resolve every entry, e.g. to import them all before forking workers."""
+        for name in self._paths:
+            self[name]
@@ -0,0 +1,126 @@
+"""
+This module renders the plots of a queue's sims after the run, from the backtest results the sims stored.
+
+Rendering a sim's three Plotly figures takes longer than its backtest, and most sims of a sweep are never looked at.
+So queue runs do not plot in their workers: once the run is over, the sims worth looking at, such as the top N by
+Sharpe ratio, are read back from their stored results and rendered in a pool of their own. Every page loads the sim
+group's shared copy of plotly.js instead of embedding its own, which is several MB per page.
+
+    manager = QueueManager("queue.json")
+    manager.run_all()
+    render_plots(select_sims(manager.results, top_n=10), "my_sim_group", "out")
+"""
+
+import logging
+import multiprocessing as mp
+import time
+
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+import pandas as pd
+
+from backtesting_engine.analytics.constants import PLOT_MAX_POINTS, SHARPE_RATIO_METRIC
+from backtesting_engine.analytics.interfaces import PlotTarget
+from backtesting_engine.execution.pool import DEFAULT_START_METHOD
+from backtesting_engine.interfaces import SimResult
+from backtesting_engine.strategies.registry import STRATEGIES
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PlotTask:
+    target: PlotTarget
+    strategy_name: str  # the strategy's class name, as the engine names plots
+    result_path: str
+    output_dir: str
+    max_points: Optional[int] = PLOT_MAX_POINTS  # per trace, see analytics.downsampling
+
+
+def select_sims(
+    results: Iterable[SimResult],
+    top_n: Optional[int] = None,
+    sim_ids: Sequence[str] = (),
+    metric: str = SHARPE_RATIO_METRIC,
+) -> list[SimResult]:
+    """
+    The sims to plot: those listed in `sim_ids` and the `top_n` by `metric`, highest first. Only sims that completed
+    and stored their results can be plotted.
+    """
+    stored = [result for result in results if result.error is None and result.result_path]
+    selected = [result for result in stored if result.sim_id in sim_ids]
+    if top_n:
+        ranked = sorted(
+            (result for result in stored if isinstance(result.metrics.get(metric), (int, float))),
+            key=lambda result: result.metrics[metric],
+            reverse=True,
+        )
+        listed = {result.sim_id for result in selected}
+        selected += [result for result in ranked[:top_n] if result.sim_id not in listed]
+    return selected
+
+
+def get_strategy_name(strategy_type: str) -> str:
+    strategy_cls = STRATEGIES.get(strategy_type.lower())
+    return strategy_cls.__name__ if strategy_cls else strategy_type
+
+
+def render_sim(task: PlotTask) -> list[str]:
+    """Render the plots of one sim from its stored results. Returns the paths of the plots written."""
+    from backtesting_engine.analytics.plotter import PlotGenerator
+
+    df = pd.read_pickle(task.result_path)
+    plot_generator = PlotGenerator(
+        df, task.strategy_name, task.target, output_dir=task.output_dir, max_points=task.max_points
+    )
+    plot_generator.generate()
+    return plot_generator.paths
+
+
+def render_plots(
+    results: Iterable[SimResult],
+    sim_group: str,
+    output_dir: str,
+    max_workers: Optional[int] = None,
+    start_method: str = DEFAULT_START_METHOD,
+    max_points: Optional[int] = PLOT_MAX_POINTS,
+) -> dict[str, list[str]]:
+    """
+    Render the plots of the given sims in a pool of worker processes, one per CPU core by default. A single sim, or a
+    single worker, is rendered in this process rather than paying for a pool. Each trace is downsampled to
+    `max_points`, or not at all if it is None. Returns the plot paths by sim_id.
+    """
+    tasks = [
+        PlotTask(
+            target=PlotTarget(sim_group=sim_group, sim_id=result.sim_id, ticker=result.ticker),
+            strategy_name=get_strategy_name(result.strategy),
+            result_path=result.result_path,
+            output_dir=output_dir,
+            max_points=max_points,
+        )
+        for result in results
+        if result.result_path
+    ]
+    if not tasks:
+        return {}
+
+    start = time.perf_counter()
+    workers = min(max_workers or mp.cpu_count(), len(tasks))
+    if workers == 1:
+        paths = [render_sim(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context(start_method)) as pool:
+            paths = list(pool.map(render_sim, tasks))
+
+    logger.info(
+        "[%s] Rendered the plots of %d sims in %.2fs on %d workers.",
+        sim_group,
+        len(tasks),
+        time.perf_counter() - start,
+        workers,
+    )
+    return {task.target.sim_id: sim_paths for task, sim_paths in zip(tasks, paths)}
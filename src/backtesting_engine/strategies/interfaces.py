@@ -8,6 +8,8 @@ import pandas as pd
 
 
 class IStrategy(ABC):
+    indicator_columns: tuple[str, ...] = ()  # intermediate columns generate_signals adds, which results may drop
+
     @abstractmethod
     def generate_signals(self) -> pd.DataFrame:
         """
@@ -21,6 +21,8 @@ from backtesting_engine.strategies.interfaces import IStrategy
 
 
 class MeanReversionStrategy(IStrategy):
+    indicator_columns = (MA_COLUMN,)
+
     def __init__(self, data: pd.DataFrame, window: int, threshold: float) -> None:
         """
         Initialize the Mean Reversion Strategy.
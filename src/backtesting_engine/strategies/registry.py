@@ -0,0 +1,25 @@
+"""
+This module defines the registry of strategies a sim can name in its queue file.
+
+A strategy module is only imported when the first sim using it is created.
+"""
+
+from backtesting_engine.registry import LazyRegistry
+from backtesting_engine.strategies.interfaces import IStrategy
+
+
+class StrategyRegistry(LazyRegistry[type[IStrategy]]):
+    """
+    Maps strategy type names to strategy classes, given as classes or as import paths
+    "package.module:ClassName".
+    """
+
+
+STRATEGIES = StrategyRegistry(
+    {
+        "sma_crossover": "backtesting_engine.strategies.sma_crossover:SMACrossoverStrategy",
+        "mean_reversion": "backtesting_engine.strategies.mean_reversion:MeanReversionStrategy",
+        "momentum": "backtesting_engine.strategies.momentum:MomentumStrategy",
+        "buy_and_hold": "backtesting_engine.strategies.buy_and_hold:BuyAndHoldStrategy",
+    }
+)
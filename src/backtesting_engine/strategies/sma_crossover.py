@@ -32,6 +32,8 @@ from backtesting_engine.strategies.interfaces import IStrategy
 
 
 class SMACrossoverStrategy(IStrategy):
+    indicator_columns = (SHORT_MA_COLUMN, LONG_MA_COLUMN)
+
     def __init__(self, data: pd.DataFrame, short_window: int, long_window: int) -> None:
         """
         Initialize the SMA Crossover Strategy.
@@ -6,6 +6,7 @@ engine script. It uses the Invoke library to define and run tasks, making it eas
 """
 
 import os
+import shlex
 import shutil
 
 from invoke.context import Context
@@ -46,6 +47,30 @@ def test(c: Context) -> None:
     c.run("uv run pytest --cov=src/backtesting_engine --cov-report=term-missing -vv")
 
 
+@task(
+    help={
+        "quick": "Only run the small dataset sizes.",
+        "save_baseline": "Record this run as the baseline later runs are compared against.",
+        "threshold": "Allowed slowdown against the baseline before the run fails, e.g. 0.25.",
+        "match": "Only run the cases whose key contains this, e.g. 'strategy.'.",
+    }
+)
+def bench(c: Context, quick: bool = False, save_baseline: bool = False, threshold: str = "", match: str = "") -> None:
+    """
+    Run the benchmark suite, failing on regressions against the baseline.
+
+    Run with: `invoke bench`, `invoke bench --quick`, `invoke bench --match strategy.` or `invoke bench --save-baseline`
+    """
+    args = ["--quick"] if quick else []
+    if save_baseline:
+        args.append("--save-baseline")
+    if threshold:
+        args += ["--threshold", threshold]
+    if match:
+        args += ["--filter", match]
+    c.run(shlex.join(["uv", "run", "python", "-m", "benchmarks", *args]))
+
+
 @task
 def audit(c: Context) -> None:
     """
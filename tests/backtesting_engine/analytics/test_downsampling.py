@@ -0,0 +1,92 @@
+import numpy as np
+
+from backtesting_engine.analytics.downsampling import (
+    get_drawdown_extremes,
+    get_min_max_indices,
+    get_plot_indices,
+    thin_positions,
+)
+
+
+def test_short_series_are_kept_whole() -> None:
+    # Arrange
+    values = np.array([1.0, 2.0, 3.0])
+
+    # Act
+    indices = get_min_max_indices(values, max_points=10)
+
+    # Assert
+    assert list(indices) == [0, 1, 2]
+
+
+def test_min_max_keeps_the_ends_and_every_buckets_extremes() -> None:
+    # Arrange
+    rng = np.random.default_rng(0)
+    values = np.cumsum(rng.standard_normal(100_001))
+
+    # Act
+    indices = get_min_max_indices(values, max_points=1_000)
+
+    # Assert
+    assert len(indices) <= 1_000
+    assert indices[0] == 0 and indices[-1] == len(values) - 1
+    assert values.argmin() in indices and values.argmax() in indices
+    assert np.all(np.diff(indices) > 0)
+
+
+def test_min_max_skips_nans() -> None:
+    # Arrange
+    values = np.array([1.0, 5.0, np.nan, 2.0, np.nan, 0.0, 4.0])
+
+    # Act
+    indices = get_min_max_indices(values, max_points=4)
+
+    # Assert
+    assert list(indices) == [0, 1, 5, 6]
+
+
+def test_drawdown_extremes_are_the_peak_and_trough_of_the_largest_drawdown() -> None:
+    # Arrange
+    values = np.array([100.0, 120.0, 90.0, 130.0, 110.0, 140.0, 70.0, 80.0])
+
+    # Act
+    extremes = get_drawdown_extremes(values)
+
+    # Assert
+    assert list(extremes) == [5, 6]
+
+
+def test_plot_indices_always_include_the_kept_positions() -> None:
+    # Arrange
+    values = np.arange(10_000, dtype=float)
+    markers = np.array([17, 4_242, 9_001])
+
+    # Act
+    indices = get_plot_indices(values, max_points=100, keep=[markers])
+
+    # Assert
+    assert set(markers) <= set(indices)
+    assert len(indices) <= 100 + len(markers)
+
+
+def test_plot_indices_without_a_budget_keep_every_point() -> None:
+    # Arrange
+    values = np.arange(500, dtype=float)
+
+    # Act
+    indices = get_plot_indices(values, max_points=None)
+
+    # Assert
+    assert len(indices) == 500
+
+
+def test_thinned_positions_keep_the_first_in_each_bucket() -> None:
+    # Arrange
+    positions = np.array([0, 1, 2, 50, 51, 99])
+
+    # Act
+    thinned = thin_positions(positions, length=100, max_points=4)
+
+    # Assert
+    assert list(thinned) == [0, 50, 99]
+    assert list(thin_positions(positions, length=100, max_points=None)) == list(positions)
@@ -0,0 +1,73 @@
+import os
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from backtesting_engine.analytics.interfaces import PlotTarget
+from backtesting_engine.analytics.plotter import PlotGenerator
+from backtesting_engine.constants import CASH_COLUMN, CLOSE_COLUMN, SIGNAL_COLUMN, TOTAL_VALUE_COLUMN
+from backtesting_engine.strategies.sma_crossover import SMACrossoverStrategy
+
+
+def generate_fake_results_df(bars: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    idx = pd.date_range("2022-01-01", periods=bars, freq="min")
+    close = pd.DataFrame({CLOSE_COLUMN: 100 + np.cumsum(rng.standard_normal(bars))}, index=idx)
+    df = SMACrossoverStrategy(
+        close, short_window=20, long_window=100
+    ).generate_signals()  # a signal on almost every bar
+    df[CASH_COLUMN] = 1000.0
+    df[TOTAL_VALUE_COLUMN] = df[CLOSE_COLUMN] * 10
+    return df
+
+
+def test_markers_are_drawn_only_where_the_signal_changes() -> None:
+    # Arrange
+    df = generate_fake_results_df(1_000)
+    target = PlotTarget(sim_group="group", sim_id="001", ticker="TEST")
+    signals = df[SIGNAL_COLUMN].fillna(0).to_numpy()
+
+    # Act
+    plot_generator = PlotGenerator(df, "Strategy", target)
+
+    # Assert
+    assert np.count_nonzero(signals) > 800
+    assert 0 < len(plot_generator.signal_positions) < 100
+    assert all(signals[i] != signals[i - 1] for i in plot_generator.signal_positions)
+    assert all(signals[plot_generator.buy_positions] == 1)
+    assert all(signals[plot_generator.sell_positions] == -1)
+
+
+def test_markers_are_thinned_when_traces_are_downsampled() -> None:
+    # Arrange
+    df = generate_fake_results_df(20_000)
+    target = PlotTarget(sim_group="group", sim_id="001", ticker="TEST")
+
+    # Act
+    every_marker = PlotGenerator(df, "Strategy", target, max_points=None)
+    thinned = PlotGenerator(df, "Strategy", target, max_points=1_000, max_markers=10)
+
+    # Assert
+    assert len(every_marker.buy_positions) > 10
+    assert 0 < len(thinned.buy_positions) <= 10
+    assert 0 < len(thinned.sell_positions) <= 10
+    assert set(thinned.buy_positions) <= set(every_marker.buy_positions)
+
+
+def test_downsampled_plots_are_a_fraction_of_the_full_ones(tmp_path: Path) -> None:
+    # Arrange
+    df = generate_fake_results_df(200_000)
+    target = PlotTarget(sim_group="group", sim_id="001", ticker="TEST")
+    full = PlotGenerator(df, "Strategy", target, output_dir=str(tmp_path / "full"), max_points=None)
+    downsampled = PlotGenerator(df, "Strategy", target, output_dir=str(tmp_path / "downsampled"), max_points=500)
+
+    # Act
+    full.generate()
+    downsampled.generate()
+
+    # Assert
+    assert len(downsampled.signal_positions) < 10_000
+    for full_path, downsampled_path in zip(full.paths, downsampled.paths):
+        assert os.path.getsize(downsampled_path) < os.path.getsize(full_path) / 5
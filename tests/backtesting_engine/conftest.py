@@ -0,0 +1,80 @@
+from typing import Any, Callable, Optional
+
+import pytest
+
+from backtesting_engine.data.prefetch import DataPrefetcher, PrefetchReport
+from backtesting_engine.execution.interfaces import IExecutor
+from backtesting_engine.execution.runner import run_sim_safely
+from backtesting_engine.interfaces import DataConfig, RunContext, SimConfig, SimItem, SimResult, StrategyConfig
+
+
+SimFactory = Callable[..., SimItem]
+
+
+def _make_sim(
+    sim_id: str = "sim",
+    strategy_type: str = "buy_and_hold",
+    interval: str = "1d",
+    initial_cash: float = 1000,
+) -> SimItem:
+    return SimItem(
+        sim_id=sim_id,
+        strategy=StrategyConfig(type=strategy_type, fields={}),
+        data=DataConfig(ticker="TEST", start_date="2020-01-01", end_date="2020-12-31", interval=interval),
+        sim_config=SimConfig(initial_cash=initial_cash, slippage=0.0, commission=0.0),
+    )
+
+
+@pytest.fixture
+def make_sim() -> SimFactory:
+    """Factory of buy and hold sims of TEST over 2020, e.g. `make_sim("sim1", interval="1m")`."""
+    return _make_sim
+
+
+class StubExecutor(IExecutor):
+    """
+    Runs sims in this process without backtesting them, through run_sim_safely like every backend. Each sim's result
+    carries `result_fields`, e.g. its metrics or timings. The sim ids of every run are recorded, and `after_run` is
+    called at the end of each run while the queue manager is still running it.
+    """
+
+    def __init__(
+        self, result_fields: Optional[dict[str, Any]] = None, after_run: Optional[Callable[[], None]] = None
+    ) -> None:
+        self.result_fields = result_fields or {}
+        self.after_run = after_run
+        self.runs: list[list[str]] = []
+
+    def run(self, context: RunContext, sims: list[SimItem], on_result: Callable[[SimResult], None]) -> None:
+        self.runs.append([sim.sim_id for sim in sims])
+        for sim in sims:
+            on_result(run_sim_safely(self._run_sim, context, sim))
+        if self.after_run is not None:
+            self.after_run()
+
+    def _run_sim(self, context: RunContext, sim_item: SimItem) -> SimResult:
+        return SimResult(
+            sim_id=sim_item.sim_id, ticker=sim_item.data.ticker, strategy=sim_item.strategy.type, **self.result_fields
+        )
+
+
+@pytest.fixture
+def make_executor() -> Callable[..., StubExecutor]:
+    """Factory of StubExecutors, e.g. `make_executor(result_fields={"metrics": {"Sharpe Ratio": 1.5}})`."""
+    return StubExecutor
+
+
+class RecordingPrefetcher(DataPrefetcher):
+    """Prefetches nothing, only recording the tickers of each call."""
+
+    def __init__(self) -> None:
+        self.prefetched: list[list[str]] = []
+
+    def prefetch(self, data_configs: list[DataConfig]) -> PrefetchReport:
+        self.prefetched.append([data.ticker for data in data_configs])
+        return PrefetchReport()
+
+
+@pytest.fixture
+def prefetcher() -> RecordingPrefetcher:
+    return RecordingPrefetcher()
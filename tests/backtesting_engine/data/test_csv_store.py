@@ -0,0 +1,96 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtesting_engine.data.csv_store import CSVStore, sniff_header
+
+
+@pytest.fixture
+def prices() -> pd.DataFrame:
+    index = pd.bdate_range("2020-01-01", periods=300, name="Date")
+    return pd.DataFrame(
+        {"Open": np.arange(300.0), "Close": np.arange(300.0) + 0.5, "Volume": np.arange(300) * 100, "Note": "x"},
+        index=index,
+    )
+
+
+@pytest.fixture
+def csv_path(tmp_path: Path, prices: pd.DataFrame) -> str:
+    path = tmp_path / "prices.csv"
+    prices.to_csv(path)
+    return str(path)
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> CSVStore:
+    return CSVStore(cache_dir=str(tmp_path / "cache"), chunk_rows=64)
+
+
+def test_load_converts_in_chunks_with_explicit_dtypes(store: CSVStore, csv_path: str, prices: pd.DataFrame) -> None:
+    # Act
+    df = store.load(csv_path)
+
+    # Assert
+    expected = prices.drop(columns="Note").astype("float64")  # text columns are left out of the binary copy
+    pd.testing.assert_frame_equal(df, expected, check_freq=False)
+
+
+def test_later_loads_skip_parsing(store: CSVStore, csv_path: str) -> None:
+    # Arrange
+    store.load(csv_path)
+
+    # Act
+    with patch("pandas.read_csv") as read_csv:
+        df = store.load(csv_path)
+
+    # Assert
+    read_csv.assert_not_called()
+    assert len(df) == 300
+
+
+def test_changed_file_is_converted_again(store: CSVStore, csv_path: str, prices: pd.DataFrame) -> None:
+    # Arrange
+    store.load(csv_path)
+    prices.iloc[:10].to_csv(csv_path)
+
+    # Act
+    df = store.load(csv_path)
+
+    # Assert
+    assert len(df) == 10
+
+
+def test_load_selects_the_date_range_inclusive_of_the_end_date(store: CSVStore, csv_path: str) -> None:
+    # Act
+    df = store.load(csv_path, "2020-02-03", "2020-02-07")
+
+    # Assert
+    assert list(df.index.strftime("%Y-%m-%d")) == ["2020-02-03", "2020-02-04", "2020-02-05", "2020-02-06", "2020-02-07"]
+
+
+def test_timestamps_with_utc_offsets_load_in_utc(store: CSVStore, tmp_path: Path) -> None:
+    # Arrange
+    path = tmp_path / "intraday.csv"
+    path.write_text("Datetime,Close\n2020-03-06 09:30:00-05:00,1.0\n2020-03-09 09:30:00-04:00,2.0\n")
+
+    # Act
+    df = store.load(str(path))
+
+    # Assert
+    assert str(df.index.tz) == "UTC"
+    assert list(df.index.hour) == [14, 13]
+
+
+def test_sniff_header_skips_the_extra_header_rows_of_yfinance_exports(tmp_path: Path) -> None:
+    # Arrange
+    path = tmp_path / "aapl.csv"
+    path.write_text("Price,Close,Open\nTicker,AAPL,AAPL\nDate,,\n2020-01-02,1.0,2.0\n")
+
+    # Act
+    header_rows, index_name = sniff_header(str(path))
+
+    # Assert
+    assert (header_rows, index_name) == (3, "Date")
@@ -8,8 +8,13 @@ from unittest.mock import patch
 import pandas as pd
 import pytest
 
+from backtesting_engine.data.csv_store import CSVStore
 from backtesting_engine.data.data_loader import DataLoader
+from backtesting_engine.data.fake_server import FakeMarketDataServer
+from backtesting_engine.data.interfaces import IDataSource
 from backtesting_engine.data.lru_cache import CacheKey, PersistentLRUCache
+from backtesting_engine.data.series_store import SeriesStore
+from backtesting_engine.data.sources import HTTPSource
 from backtesting_engine.exceptions import InvalidDataError
 
 
@@ -69,13 +74,13 @@ def test_load_from_csv_valid(temp_path: Any, sample_df: pd.DataFrame) -> None:
     # Arrange
     csv_path = os.path.join(temp_path, "sample.csv")
     sample_df.to_csv(csv_path)
-    loader = DataLoader()
+    loader = DataLoader(csv_store=CSVStore(cache_dir=os.path.join(temp_path, "csv")))
 
     # Act
     df = loader.load(ticker="DUMMY", start_date="2022-01-01", end_date="2022-01-02", source="csv", csv_path=csv_path)
 
     # Assert
-    pd.testing.assert_frame_equal(df, sample_df)
+    pd.testing.assert_frame_equal(df, sample_df.astype("float64"))  # OHLCV columns are read as float64
 
 
 def test_load_from_csv_missing_path_raises() -> None:
@@ -87,7 +92,7 @@ def test_load_from_csv_missing_path_raises() -> None:
         loader.load(ticker="AAPL", start_date="2022-01-01", end_date="2022-01-02", source="csv")
 
 
-@patch("backtesting_engine.data.data_loader.yf.download")
+@patch("yfinance.download")
 def test_load_from_yfinance_cache_miss(mock_download: Any, dataloader: DataLoader, sample_df: pd.DataFrame) -> None:
     # Arrange
     mock_download.return_value = sample_df
@@ -101,7 +106,7 @@ def test_load_from_yfinance_cache_miss(mock_download: Any, dataloader: DataLoade
     mock_download.assert_called_once()
 
 
-@patch("backtesting_engine.data.data_loader.yf.download")
+@patch("yfinance.download")
 def test_load_from_yfinance_cache_hit(mock_download: Any, dataloader: DataLoader, sample_df: pd.DataFrame) -> None:
     # Arrange
     key = CacheKey("AAPL", "2022-01-01", "2022-01-02")
@@ -115,7 +120,7 @@ def test_load_from_yfinance_cache_hit(mock_download: Any, dataloader: DataLoader
     mock_download.assert_not_called()
 
 
-@patch("backtesting_engine.data.data_loader.yf.download")
+@patch("yfinance.download")
 def test_load_from_yfinance_droplevel(mock_download: Any, dataloader: DataLoader, multiindex_df: pd.DataFrame) -> None:
     # Arrange
     mock_download.return_value = multiindex_df
@@ -129,18 +134,130 @@ def test_load_from_yfinance_droplevel(mock_download: Any, dataloader: DataLoader
     mock_download.assert_called_once()
 
 
-@patch("pandas.read_csv")
-def test_load_from_csv_droplevel(
-    mock_read_csv: Any, dataloader: DataLoader, multiindex_df: pd.DataFrame, tmp_path: Any
-) -> None:
+def test_load_from_csv_droplevel(dataloader: DataLoader, multiindex_df: pd.DataFrame, tmp_path: Any) -> None:
     # Arrange
-    mock_read_csv.return_value = multiindex_df
     csv_path = tmp_path / "dummy.csv"
+    multiindex_df.to_csv(csv_path)  # one header row per column level, as yfinance downloads are saved
+    loader = DataLoader(cache=dataloader.cache, csv_store=CSVStore(cache_dir=str(tmp_path / "csv")))
 
     # Act
-    df = dataloader.load("IGNORED", "2022-01-01", "2022-01-02", source="csv", csv_path=str(csv_path))
+    df = loader.load("IGNORED", "2022-01-01", "2022-01-02", source="csv", csv_path=str(csv_path))
 
     # Assert
     assert isinstance(df.columns, pd.Index)
     assert list(df.columns) == ["Open", "Close"]
-    mock_read_csv.assert_called_once_with(str(csv_path), index_col=0, parse_dates=True)
+    assert len(df) == 2
+
+
+def test_unchanged_csv_range_is_validated_once(sample_df: pd.DataFrame, tmp_path: Any) -> None:
+    # Arrange
+    csv_path = str(tmp_path / "sample.csv")
+    sample_df.to_csv(csv_path)
+    csv_store = CSVStore(cache_dir=str(tmp_path / "csv"))
+    DataLoader(csv_store=csv_store).load("FIRST", "2022-01-01", "2022-01-02", source="csv", csv_path=csv_path)
+    loader = DataLoader(csv_store=csv_store)
+
+    # Act
+    with patch("backtesting_engine.data.data_loader.validate_market_data") as validate:
+        df = loader.load("SECOND", "2022-01-01", "2022-01-02", source="csv", csv_path=csv_path)
+
+    # Assert
+    validate.assert_not_called()
+    assert loader.reports["SECOND"].ok
+    assert len(df) == 2
+
+
+def test_changed_csv_is_validated_again(sample_df: pd.DataFrame, tmp_path: Any) -> None:
+    # Arrange
+    csv_path = str(tmp_path / "sample.csv")
+    sample_df.to_csv(csv_path)
+    loader = DataLoader(csv_store=CSVStore(cache_dir=str(tmp_path / "csv")))
+    loader.load("DUMMY", "2022-01-01", "2022-01-02", source="csv", csv_path=csv_path)
+    sample_df.assign(Close=[110, -1]).to_csv(csv_path)
+
+    # Act / Assert
+    with pytest.raises(InvalidDataError, match="zero or negative"):
+        loader.load("DUMMY", "2022-01-01", "2022-01-02", source="csv", csv_path=csv_path)
+
+
+def test_load_from_registered_source(tmp_path: Any) -> None:
+    # Arrange
+    with FakeMarketDataServer() as server:
+        cache = PersistentLRUCache(cache_dir=tmp_path)
+        loader = DataLoader(cache=cache, sources={"vendor": HTTPSource(server.url)})
+
+        # Act
+        df = loader.load("AAPL", "2022-01-01", "2022-02-01", source="vendor")
+
+    # Assert
+    assert not df.empty
+    assert cache.has(CacheKey("AAPL", "2022-01-01", "2022-02-01", "1d", "vendor"))
+    assert not cache.has(CacheKey("AAPL", "2022-01-01", "2022-02-01"))  # kept apart from Yahoo Finance data
+
+
+def test_load_from_unknown_source_raises(dataloader: DataLoader) -> None:
+    # Act & Assert
+    with pytest.raises(ValueError, match="Unknown data source"):
+        dataloader.load("AAPL", "2022-01-01", "2022-02-01", source="unknown")
+
+
+def test_load_through_series_store_downloads_only_the_tail(tmp_path: Any) -> None:
+    # Arrange
+    with FakeMarketDataServer() as server:
+        loader = DataLoader(
+            cache=PersistentLRUCache(cache_dir=tmp_path),
+            sources={"vendor": HTTPSource(server.url)},
+            store=SeriesStore(root_dir=str(tmp_path / "series")),
+        )
+        loader.load("AAPL", "2022-01-01", "2022-02-01", source="vendor")
+
+        # Act
+        with patch.object(HTTPSource, "fetch", wraps=loader.sources["vendor"].fetch) as fetch:
+            df = loader.load("AAPL", "2022-01-01", "2022-02-08", source="vendor")
+
+    # Assert
+    fetch.assert_called_once_with(["AAPL"], "2022-01-31", "2022-02-08", "1d")
+    assert df.index[0] == pd.Timestamp("2022-01-03")
+    assert df.index[-1] == pd.Timestamp("2022-02-07")
+    assert df.index.is_unique
+
+
+def test_cache_hit_reuses_the_cached_validation_report(tmp_path: Any) -> None:
+    # Arrange
+    with FakeMarketDataServer() as server:
+        cache = PersistentLRUCache(cache_dir=tmp_path)
+        DataLoader(cache=cache, sources={"vendor": HTTPSource(server.url)}).load(
+            "AAPL", "2022-01-01", "2022-02-01", source="vendor"
+        )
+        loader = DataLoader(cache=cache, sources={"vendor": HTTPSource(server.url)})
+
+        # Act
+        with patch("backtesting_engine.data.data_loader.validate_market_data") as validate:
+            loader.load("AAPL", "2022-01-01", "2022-02-01", source="vendor")
+
+    # Assert
+    validate.assert_not_called()
+    assert loader.reports["AAPL"].ok
+
+
+class BadBarSource(IDataSource):
+    def fetch(
+        self, tickers: list[str], start_date: str, end_date: str, interval: str = "1d"
+    ) -> dict[str, pd.DataFrame]:
+        idx = pd.date_range(start_date, periods=3, freq="D")
+        return {ticker: pd.DataFrame({"Close": [100.0, -1.0, 102.0]}, index=idx) for ticker in tickers}
+
+
+def test_strict_load_does_not_reuse_data_repaired_by_a_lenient_load(tmp_path: Any) -> None:
+    # Arrange
+    cache = PersistentLRUCache(cache_dir=tmp_path)
+    lenient = DataLoader(cache=cache, sources={"vendor": BadBarSource()}, validation="lenient")
+    strict = DataLoader(cache=cache, sources={"vendor": BadBarSource()}, validation="strict")
+    repaired = lenient.load("AAPL", "2022-01-01", "2022-01-04", source="vendor")
+
+    # Act & Assert
+    with pytest.raises(InvalidDataError):
+        strict.load("AAPL", "2022-01-01", "2022-01-04", source="vendor")
+    assert len(repaired) == 2
+    assert cache.has(CacheKey("AAPL", "2022-01-01", "2022-01-04", "1d", "vendor", "lenient"))
+    assert not cache.has(CacheKey("AAPL", "2022-01-01", "2022-01-04", "1d", "vendor", "strict"))
@@ -0,0 +1,51 @@
+import pytest
+
+from backtesting_engine.data.eviction import GDSFPolicy, LFUPolicy, LRUPolicy, get_eviction_policy
+from backtesting_engine.data.interfaces import CacheEntryMeta
+
+
+def test_lru_evicts_the_least_recently_used_entry() -> None:
+    # Arrange
+    entries = [("a", CacheEntryMeta(nbytes=1, last_access=2.0)), ("b", CacheEntryMeta(nbytes=1, last_access=1.0))]
+
+    # Act
+    victim = LRUPolicy().select_victim(entries)
+
+    # Assert
+    assert victim == "b"
+
+
+def test_lfu_evicts_the_least_frequently_used_entry() -> None:
+    # Arrange
+    entries = [
+        ("a", CacheEntryMeta(nbytes=1, hits=1, last_access=1.0)),
+        ("b", CacheEntryMeta(nbytes=1, hits=5, last_access=0.0)),
+    ]
+
+    # Act
+    victim = LFUPolicy().select_victim(entries)
+
+    # Assert
+    assert victim == "a"
+
+
+def test_gdsf_prefers_evicting_large_entries() -> None:
+    # Arrange
+    policy = GDSFPolicy()
+    small = CacheEntryMeta(nbytes=1_000)
+    large = CacheEntryMeta(nbytes=100_000, hits=10)
+    for meta in (small, large):
+        policy.on_insert(meta)
+
+    # Act
+    victim = policy.select_victim([("small", small), ("large", large)])
+
+    # Assert
+    assert victim == "large"
+    assert policy.inflation == large.priority
+
+
+def test_unknown_policy_is_rejected() -> None:
+    # Arrange / Act / Assert
+    with pytest.raises(ValueError, match="Unknown eviction policy"):
+        get_eviction_policy("fifo")
@@ -1,9 +1,12 @@
 import os
+import pickle
 import shutil
 import tempfile
 
+from collections import OrderedDict
 from typing import Any, Generator
 
+import pandas as pd
 import pytest
 
 from backtesting_engine.data.lru_cache import CacheKey, PersistentLRUCache
@@ -91,7 +94,7 @@ def test_overwrite_existing_key(temp_cache_dir: str) -> None:
     assert cache.get(key) == 456
 
 
-def test_corrupted_cache_file_handled_gracefully(temp_cache_dir: str, capsys: Any) -> None:
+def test_corrupted_cache_file_handled_gracefully(temp_cache_dir: str, caplog: Any) -> None:
     # Arrange
     bad_file_path = os.path.join(temp_cache_dir, "lru_cache.pkl")
     with open(bad_file_path, "wb") as f:
@@ -99,5 +102,79 @@ def test_corrupted_cache_file_handled_gracefully(temp_cache_dir: str, capsys: An
 
     # Act and Assert
     PersistentLRUCache(cache_dir=temp_cache_dir, max_size=3)
-    captured = capsys.readouterr()
-    assert "corrupted or empty" in captured.out
+    assert "corrupted or empty" in caplog.text
+
+
+def test_concurrent_writers_keep_each_others_entries(temp_cache_dir: str) -> None:
+    # Arrange
+    first = PersistentLRUCache(cache_dir=temp_cache_dir)
+    second = PersistentLRUCache(cache_dir=temp_cache_dir)
+    k1 = CacheKey("AAPL", "2023-01-01", "2023-01-31")
+    k2 = CacheKey("MSFT", "2023-01-01", "2023-01-31")
+
+    # Act
+    first.set(k1, 1)
+    second.set(k2, 2)
+
+    # Assert
+    reloaded = PersistentLRUCache(cache_dir=temp_cache_dir)
+    assert reloaded.has(k1)
+    assert reloaded.has(k2)
+
+
+def test_eviction_keeps_cache_within_byte_budget(temp_cache_dir: str) -> None:
+    # Arrange
+    frame = pd.DataFrame({"Close": [1.0] * 100})
+    frame_bytes = int(frame.memory_usage(deep=True).sum())
+    cache = PersistentLRUCache(cache_dir=temp_cache_dir, max_bytes=2 * frame_bytes)
+    keys = [CacheKey(ticker, "2023-01-01", "2023-01-31") for ticker in ["AAPL", "MSFT", "GOOG"]]
+
+    # Act
+    for key in keys:
+        cache.set(key, frame)
+
+    # Assert
+    assert not cache.has(keys[0])
+    assert cache.stats.bytes_in_use == 2 * frame_bytes
+    assert cache.stats.evictions == 1
+
+
+def test_entry_larger_than_budget_is_not_cached(temp_cache_dir: str) -> None:
+    # Arrange
+    cache = PersistentLRUCache(cache_dir=temp_cache_dir, max_bytes=10)
+    key = CacheKey("AAPL", "2023-01-01", "2023-01-31")
+
+    # Act
+    cache.set(key, pd.DataFrame({"Close": [1.0] * 100}))
+
+    # Assert
+    assert not cache.has(key)
+
+
+def test_stats_count_lookups_and_loads(temp_cache_dir: str) -> None:
+    # Arrange
+    PersistentLRUCache(cache_dir=temp_cache_dir).set(CacheKey("AAPL", "2023-01-01", "2023-01-31"), 1)
+    cache = PersistentLRUCache(cache_dir=temp_cache_dir)
+
+    # Act
+    cache.get(CacheKey("AAPL", "2023-01-01", "2023-01-31"))
+    cache.get(CacheKey("MSFT", "2023-01-01", "2023-01-31"))
+
+    # Assert
+    stats = cache.stats.to_dict()
+    assert (stats["hits"], stats["misses"], stats["loads"]) == (1, 1, 1)
+    assert stats["mean_load_latency"] > 0
+
+
+def test_cache_file_without_metadata_is_read(temp_cache_dir: str) -> None:
+    # Arrange
+    key = CacheKey("AAPL", "2023-01-01", "2023-01-31")
+    with open(os.path.join(temp_cache_dir, "lru_cache.pkl"), "wb") as f:
+        pickle.dump(OrderedDict([(key, 123)]), f)
+
+    # Act
+    cache = PersistentLRUCache(cache_dir=temp_cache_dir)
+
+    # Assert
+    assert cache.get(key) == 123
+    assert cache.stats.bytes_in_use > 0
@@ -0,0 +1,150 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from backtesting_engine.data.interfaces import IDataSource
+from backtesting_engine.data.lru_cache import CacheKey, PersistentLRUCache
+from backtesting_engine.data.prefetch import DataPrefetcher, merge_date_ranges, plan_requests
+from backtesting_engine.data.series_store import SeriesStore
+from backtesting_engine.data.sources import split_by_ticker
+from backtesting_engine.interfaces import DataConfig
+
+
+class FakeSource(IDataSource):
+    """Serves one bar per calendar day for any ticker, recording every request."""
+
+    max_batch_size = 10
+    max_concurrency = 2
+
+    def __init__(self, missing: tuple[str, ...] = ()) -> None:
+        self.missing = missing
+        self.calls: list[tuple[list[str], str, str, str]] = []
+
+    def fetch(
+        self, tickers: list[str], start_date: str, end_date: str, interval: str = "1d"
+    ) -> dict[str, pd.DataFrame]:
+        self.calls.append((sorted(tickers), start_date, end_date, interval))
+        index = pd.date_range(start_date, end_date, inclusive="left")
+        return {
+            ticker: pd.DataFrame({"Close": range(1, len(index) + 1)}, index=index, dtype=float)
+            for ticker in tickers
+            if ticker not in self.missing
+        }
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> PersistentLRUCache:
+    return PersistentLRUCache(cache_dir=str(tmp_path))
+
+
+def test_overlapping_ranges_of_a_ticker_are_merged() -> None:
+    # Arrange
+    configs = [
+        DataConfig("AAPL", "2020-03-01", "2020-09-01"),
+        DataConfig("AAPL", "2020-01-01", "2020-06-01"),
+        DataConfig("AAPL", "2021-01-01", "2021-02-01"),
+    ]
+
+    # Act
+    merged = merge_date_ranges(configs)
+
+    # Assert
+    assert merged == {("AAPL", "1d"): [("2020-01-01", "2020-09-01"), ("2021-01-01", "2021-02-01")]}
+
+
+def test_tickers_sharing_a_range_are_batched() -> None:
+    # Arrange
+    configs = [DataConfig(ticker, "2020-01-01", "2020-12-31") for ticker in ["A", "B", "C"]]
+
+    # Act
+    requests = plan_requests(configs, max_batch_size=2)
+
+    # Assert
+    assert [request.tickers for request in requests] == [["A", "B"], ["C"]]
+
+
+def test_prefetch_stores_each_sim_range_from_one_merged_download(cache: PersistentLRUCache) -> None:
+    # Arrange
+    source = FakeSource()
+    configs = [
+        DataConfig("AAPL", "2020-01-01", "2020-01-21"),
+        DataConfig("AAPL", "2020-01-11", "2020-01-31"),
+        DataConfig("MSFT", "2020-01-01", "2020-01-21"),
+    ]
+
+    # Act
+    report = DataPrefetcher(sources={"yfinance": source}, cache=cache).prefetch(configs)
+
+    # Assert
+    assert sorted(source.calls) == [
+        (["AAPL"], "2020-01-01", "2020-01-31", "1d"),
+        (["MSFT"], "2020-01-01", "2020-01-21", "1d"),
+    ]
+    assert report.fetched == 3
+    later = cache.get(CacheKey("AAPL", "2020-01-11", "2020-01-31"))
+    assert later.index[0] == pd.Timestamp("2020-01-11")
+    assert later.index[-1] == pd.Timestamp("2020-01-30")  # the end date is exclusive, as for a direct download
+
+
+def test_prefetch_skips_cached_and_csv_datasets(cache: PersistentLRUCache) -> None:
+    # Arrange
+    source = FakeSource()
+    cache.set(CacheKey("AAPL", "2020-01-01", "2020-01-31"), pd.DataFrame({"Close": [1.0]}))
+    configs = [DataConfig("AAPL", "2020-01-01", "2020-01-31"), DataConfig("LOCAL", "2020-01-01", "2020-01-31", "csv")]
+
+    # Act
+    report = DataPrefetcher(sources={"yfinance": source}, cache=cache).prefetch(configs)
+
+    # Assert
+    assert source.calls == []
+    assert (report.datasets, report.cached, report.fetched) == (1, 1, 0)
+
+
+def test_prefetch_reports_tickers_without_data(cache: PersistentLRUCache) -> None:
+    # Arrange
+    source = FakeSource(missing=("GONE",))
+    configs = [DataConfig("AAPL", "2020-01-01", "2020-01-31"), DataConfig("GONE", "2020-01-01", "2020-01-31")]
+
+    # Act
+    report = DataPrefetcher(sources={"yfinance": source}, cache=cache).prefetch(configs)
+
+    # Assert
+    assert report.failed == ["GONE"]
+    assert cache.has(CacheKey("AAPL", "2020-01-01", "2020-01-31"))
+    assert not cache.has(CacheKey("GONE", "2020-01-01", "2020-01-31"))
+
+
+def test_split_by_ticker_handles_either_column_level() -> None:
+    # Arrange
+    index = pd.date_range("2020-01-01", periods=2)
+    by_ticker = pd.DataFrame([[1.0, 2.0]], columns=pd.MultiIndex.from_tuples([("A", "Close"), ("B", "Close")]))
+    by_price = pd.DataFrame(
+        [[1.0, None], [1.5, 2.0]], index=index, columns=pd.MultiIndex.from_tuples([("Close", "A"), ("Close", "B")])
+    )
+
+    # Act
+    grouped = split_by_ticker(by_ticker, ["A", "B"])
+    ungrouped = split_by_ticker(by_price, ["A", "B"])
+
+    # Assert
+    assert list(grouped["B"]["Close"]) == [2.0]
+    assert len(ungrouped["B"]) == 1  # the row B has no data for is dropped
+
+
+def test_refresh_with_a_series_store_fetches_only_the_new_bars(cache: PersistentLRUCache, tmp_path: Path) -> None:
+    # Arrange
+    source = FakeSource()
+    store = SeriesStore(root_dir=str(tmp_path / "series"))
+    prefetcher = DataPrefetcher(sources={"yfinance": source}, cache=cache, store=store)
+    prefetcher.prefetch([DataConfig(ticker, "2020-01-01", "2020-02-01") for ticker in ["A", "B", "C"]])
+
+    # Act
+    report = prefetcher.prefetch([DataConfig(ticker, "2020-01-01", "2020-02-03") for ticker in ["A", "B", "C"]])
+
+    # Assert
+    assert report.requests == 1
+    assert source.calls[-1] == (["A", "B", "C"], "2020-01-31", "2020-02-03", "1d")
+    refreshed = cache.get(CacheKey("B", "2020-01-01", "2020-02-03"))
+    assert len(refreshed) == 33
+    assert refreshed.index.is_unique
@@ -0,0 +1,48 @@
+import pandas as pd
+import pytest
+
+from backtesting_engine.data.interfaces import IDataSource
+from backtesting_engine.data.registry import DATA_SOURCES, DataSourceRegistry
+from backtesting_engine.data.sources import HTTPSource
+
+
+class DummySource(IDataSource):
+    def fetch(
+        self, tickers: list[str], start_date: str, end_date: str, interval: str = "1d"
+    ) -> dict[str, pd.DataFrame]:
+        return {}
+
+
+def test_source_is_created_once_on_first_lookup(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Arrange
+    monkeypatch.setenv("BTX_DATA_SOURCE_URL", "http://127.0.0.1:1")
+    registry = DataSourceRegistry({"http": "backtesting_engine.data.sources:HTTPSource"})
+
+    # Act
+    first = registry["http"]
+    second = registry["http"]
+
+    # Assert
+    assert isinstance(first, HTTPSource)
+    assert first is second
+    assert first.supports_batch
+
+
+def test_registered_source_is_returned_as_is() -> None:
+    # Arrange
+    registry = DataSourceRegistry({})
+    source = DummySource()
+
+    # Act
+    registry.register("dummy", source)
+
+    # Assert
+    assert registry["dummy"] is source
+    assert not source.supports_batch
+    assert list(registry) == ["dummy"]
+
+
+def test_unknown_source_is_not_found() -> None:
+    # Arrange / Act / Assert
+    assert DATA_SOURCES.get("unknown") is None
+    assert set(DATA_SOURCES) == {"yfinance", "http", "synthetic"}
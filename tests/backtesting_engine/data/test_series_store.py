@@ -0,0 +1,122 @@
+import os
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from backtesting_engine.data.series_store import SeriesStore
+
+
+def make_bars(start_date: str, end_date: str, value: float = 1.0) -> pd.DataFrame:
+    index = pd.bdate_range(start_date, end_date, inclusive="left", name="Date")
+    return pd.DataFrame({"Close": [value] * len(index)}, index=index)
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> SeriesStore:
+    store = SeriesStore(root_dir=str(tmp_path))
+    store.update("yfinance", "AAPL", "1d", make_bars("2020-01-01", "2020-02-01"), "2020-01-01", "2020-02-01")
+    return store
+
+
+def test_covered_range_needs_no_download(store: SeriesStore) -> None:
+    # Act
+    missing = store.get_missing_range("yfinance", "AAPL", "1d", "2020-01-10", "2020-02-01")
+    df = store.read("yfinance", "AAPL", "1d", "2020-01-10", "2020-02-01")
+
+    # Assert
+    assert missing is None
+    assert df is not None
+    assert df.index[0] == pd.Timestamp("2020-01-10")
+    assert df.index[-1] == pd.Timestamp("2020-01-31")
+
+
+def test_later_end_date_only_needs_the_tail_from_the_latest_bar(store: SeriesStore) -> None:
+    # Act
+    missing = store.get_missing_range("yfinance", "AAPL", "1d", "2020-01-01", "2020-02-05")
+
+    # Assert
+    assert missing == ("2020-01-31", "2020-02-05")
+
+
+def test_tail_is_appended_as_a_new_shard(store: SeriesStore, tmp_path: Path) -> None:
+    # Arrange
+    first_shard = tmp_path / "yfinance" / "1d" / "AAPL" / "shard_00000.pkl"
+    written_at = os.stat(first_shard).st_mtime_ns
+
+    # Act
+    store.update("yfinance", "AAPL", "1d", make_bars("2020-01-31", "2020-02-05", value=2.0), "2020-01-31", "2020-02-05")
+    df = store.read("yfinance", "AAPL", "1d", "2020-01-01", "2020-02-05")
+
+    # Assert
+    assert os.stat(first_shard).st_mtime_ns == written_at
+    assert df is not None
+    assert df.index.is_unique
+    assert df.loc["2020-01-30", "Close"] == 1.0
+    assert df.loc["2020-01-31", "Close"] == 2.0  # the bar fetched again replaces the stored one
+    assert df.index[-1] == pd.Timestamp("2020-02-04")
+
+
+def test_earlier_start_date_replaces_the_series(store: SeriesStore) -> None:
+    # Arrange
+    missing = store.get_missing_range("yfinance", "AAPL", "1d", "2019-12-01", "2020-01-15")
+
+    # Act
+    store.update("yfinance", "AAPL", "1d", make_bars(*missing, value=3.0), *missing)
+    df = store.read("yfinance", "AAPL", "1d", "2019-12-01", "2020-02-01")
+
+    # Assert
+    assert missing == ("2019-12-01", "2020-02-01")
+    assert df is not None
+    assert set(df["Close"]) == {3.0}
+
+
+def test_empty_tail_extends_the_covered_range(store: SeriesStore) -> None:
+    # Act
+    store.update("yfinance", "AAPL", "1d", None, "2020-01-31", "2020-02-03")
+
+    # Assert
+    assert store.get_missing_range("yfinance", "AAPL", "1d", "2020-01-01", "2020-02-03") is None
+
+
+def test_series_is_compacted_past_its_shard_limit(tmp_path: Path) -> None:
+    # Arrange
+    store = SeriesStore(root_dir=str(tmp_path), max_shards=2)
+    days = pd.bdate_range("2020-01-01", periods=5).strftime("%Y-%m-%d")
+
+    # Act
+    for start_date, end_date in zip(days[:-1], days[1:]):
+        store.update("yfinance", "AAPL", "1d", make_bars(start_date, end_date), start_date, end_date)
+    df = store.read("yfinance", "AAPL", "1d", days[0], days[-1])
+
+    # Assert
+    shards = sorted(file for file in os.listdir(tmp_path / "yfinance" / "1d" / "AAPL") if file.startswith("shard_"))
+    assert shards == ["shard_00003.pkl", "shard_00004.pkl"]  # the first three compacted into one, then one appended
+    assert df is not None
+    assert len(df) == 4
+
+
+def test_read_starts_again_when_a_compaction_removed_its_shards(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Arrange
+    store = SeriesStore(root_dir=str(tmp_path), max_shards=2)
+    days = pd.bdate_range("2020-01-01", periods=4).strftime("%Y-%m-%d")
+    for start_date, end_date in zip(days[:-2], days[1:-1]):
+        store.update("yfinance", "AAPL", "1d", make_bars(start_date, end_date), start_date, end_date)
+    series_dir = str(tmp_path / "yfinance" / "1d" / "AAPL")
+    stale = SeriesStore._read_manifest(series_dir)
+    store.update("yfinance", "AAPL", "1d", make_bars(days[-2], days[-1]), days[-2], days[-1])  # compacts
+    manifests = iter([stale])
+    read_manifest = SeriesStore._read_manifest
+    monkeypatch.setattr(
+        SeriesStore, "_read_manifest", staticmethod(lambda path: next(manifests, None) or read_manifest(path))
+    )
+
+    # Act
+    df = store.read("yfinance", "AAPL", "1d", days[0], days[-2])
+
+    # Assert
+    assert df is not None
+    assert len(df) == 2
@@ -0,0 +1,74 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Generator
+
+import pandas as pd
+import pytest
+
+from backtesting_engine.data.fake_server import FakeMarketDataServer, make_fake_bars
+from backtesting_engine.data.sources import HTTPSource
+
+
+@pytest.fixture
+def server() -> Generator[FakeMarketDataServer, None, None]:
+    with FakeMarketDataServer(missing_tickers=("GONE",)) as server:
+        yield server
+
+
+def test_http_source_fetches_a_batch_in_one_request(server: FakeMarketDataServer) -> None:
+    # Arrange
+    source = HTTPSource(server.url)
+
+    # Act
+    frames = source.fetch(["AAPL", "MSFT", "GONE"], "2020-01-01", "2020-02-01")
+
+    # Assert
+    assert server.requests == 1
+    assert set(frames) == {"AAPL", "MSFT"}
+    expected = make_fake_bars("AAPL", "2020-01-01", "2020-02-01")
+    pd.testing.assert_frame_equal(frames["AAPL"], expected, check_freq=False)
+
+
+def test_http_source_reuses_pooled_connections(server: FakeMarketDataServer) -> None:
+    # Arrange
+    source = HTTPSource(server.url, max_concurrency=2)
+
+    # Act
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda i: source.fetch([f"T{i}"], "2020-01-01", "2020-01-10"), range(20)))
+    source.close()
+
+    # Assert
+    assert server.requests == 20
+    assert server.connections <= 2
+
+
+def test_http_source_retries_failed_requests() -> None:
+    # Arrange
+    with FakeMarketDataServer(fail_first=2) as server:
+        source = HTTPSource(server.url, retry_backoff=0.0)
+
+        # Act
+        frames = source.fetch(["AAPL"], "2020-01-01", "2020-01-10")
+
+    # Assert
+    assert server.requests == 3
+    assert not frames["AAPL"].empty
+
+
+def test_http_source_gives_up_after_its_retries() -> None:
+    # Arrange
+    with FakeMarketDataServer(fail_first=5) as server:
+        source = HTTPSource(server.url, retries=1, retry_backoff=0.0)
+
+        # Act & Assert
+        with pytest.raises(Exception, match="503"):
+            source.fetch(["AAPL"], "2020-01-01", "2020-01-10")
+
+
+def test_http_source_needs_a_url(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Arrange
+    monkeypatch.delenv("BTX_DATA_SOURCE_URL", raising=False)
+
+    # Act & Assert
+    with pytest.raises(ValueError, match="BTX_DATA_SOURCE_URL"):
+        HTTPSource()
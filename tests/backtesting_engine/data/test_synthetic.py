@@ -0,0 +1,114 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtesting_engine.data.constants import GBM_MODEL, JUMP_DIFFUSION_MODEL, REGIME_SWITCHING_MODEL
+from backtesting_engine.data.registry import DATA_SOURCES
+from backtesting_engine.data.series_store import SeriesStore
+from backtesting_engine.data.synthetic import SyntheticParams, SyntheticSource, make_synthetic_bars
+from backtesting_engine.data.validation import validate_market_data
+
+
+MODELS = [GBM_MODEL, JUMP_DIFFUSION_MODEL, REGIME_SWITCHING_MODEL]
+
+
+@pytest.mark.parametrize("model", MODELS)
+def test_longer_series_extend_shorter_ones(model: str) -> None:
+    # Act
+    short = make_synthetic_bars("AAPL", "2020-01-01", 500, model=model)
+    long = make_synthetic_bars("AAPL", "2020-01-01", 1000, model=model)
+
+    # Assert
+    pd.testing.assert_frame_equal(short, long.iloc[:500])
+
+
+@pytest.mark.parametrize("model", MODELS)
+def test_generated_bars_pass_strict_validation(model: str) -> None:
+    # Arrange
+    df = make_synthetic_bars("AAPL", "2020-01-01", 5000, model=model)
+
+    # Act
+    _, report = validate_market_data(df, "AAPL")
+
+    # Assert
+    assert report.ok
+
+
+def test_seed_and_ticker_give_different_series() -> None:
+    # Act
+    base = make_synthetic_bars("AAPL", "2020-01-01", 100)
+    other_ticker = make_synthetic_bars("MSFT", "2020-01-01", 100)
+    other_seed = make_synthetic_bars("AAPL", "2020-01-01", 100, seed=1)
+
+    # Assert
+    assert not base["Close"].equals(other_ticker["Close"])
+    assert not base["Close"].equals(other_seed["Close"])
+
+
+def test_a_range_comes_out_the_same_whatever_range_is_fetched() -> None:
+    # Arrange
+    source = SyntheticSource(model=JUMP_DIFFUSION_MODEL)
+
+    # Act
+    narrow = source.fetch(["AAPL"], "2021-03-01", "2021-04-01")["AAPL"]
+    wide = source.fetch(["AAPL", "MSFT"], "2020-01-01", "2022-01-01")["AAPL"]
+
+    # Assert
+    pd.testing.assert_frame_equal(narrow, wide.loc["2021-03-01":"2021-03-31"])
+
+
+def test_intraday_bars_fill_the_sessions_of_business_days() -> None:
+    # Act
+    df = SyntheticSource().fetch(["AAPL"], "2021-03-05", "2021-03-09", interval="1h")["AAPL"]
+
+    # Assert
+    assert len(df) == 14  # 09:30 to 15:30 on Friday and Monday
+    assert set(df.index.dayofweek) == {0, 4}
+    assert df.index.min() == pd.Timestamp("2021-03-05 09:30")
+    assert df.index.max() == pd.Timestamp("2021-03-08 15:30")
+
+
+def test_intraday_returns_have_the_annualised_volatility_of_the_model() -> None:
+    # Arrange
+    params = SyntheticParams(volatility=0.2)
+
+    # Act
+    df = make_synthetic_bars("AAPL", "2000-01-01", 5 * 252 * 78, interval="5m", params=params)
+
+    # Assert
+    yearly_bars = (df.index.year == 2001).sum()
+    realised = np.log(df["Close"]).diff().std() * np.sqrt(yearly_bars)
+    assert realised == pytest.approx(0.2, rel=0.02)
+
+
+@pytest.mark.parametrize("interval", ["1wk", "1mo", "3mo", "5d"])
+def test_bars_longer_than_a_day_raise(interval: str) -> None:
+    # Act & Assert
+    with pytest.raises(ValueError, match=f"not {interval} bars"):
+        SyntheticSource().fetch(["AAPL"], "2021-01-01", "2021-06-01", interval=interval)
+
+
+def test_fill_store_writes_the_bars_a_fetch_returns(tmp_path: Path) -> None:
+    # Arrange
+    source = SyntheticSource()
+    store = SeriesStore(root_dir=str(tmp_path))
+
+    # Act
+    source.fill_store(store, ["AAPL", "MSFT"], "2021-01-01", "2022-01-01")
+
+    # Assert
+    stored = store.read("synthetic", "MSFT", "1d", "2021-01-01", "2022-01-01")
+    pd.testing.assert_frame_equal(stored, source.fetch(["MSFT"], "2021-01-01", "2022-01-01")["MSFT"])
+
+
+def test_synthetic_source_is_registered() -> None:
+    # Assert
+    assert isinstance(DATA_SOURCES["synthetic"], SyntheticSource)
+
+
+def test_unknown_model_raises() -> None:
+    # Act & Assert
+    with pytest.raises(ValueError, match="Unknown synthetic price model"):
+        SyntheticSource(model="random")
@@ -0,0 +1,106 @@
+import shutil
+import tempfile
+import time
+
+from typing import Generator
+
+import pandas as pd
+import pytest
+
+from backtesting_engine.data.constants import DISK_TIER, MEMORY_TIER
+from backtesting_engine.data.lru_cache import CacheKey, PersistentLRUCache
+from backtesting_engine.data.tiered_cache import TieredCache
+
+
+KEY = CacheKey("AAPL", "2023-01-01", "2023-01-31")
+
+
+@pytest.fixture
+def temp_cache_dir() -> Generator[str, None, None]:
+    """Creates a temporary cache directory and cleans it up after tests."""
+    dirpath = tempfile.mkdtemp()
+    yield dirpath
+    shutil.rmtree(dirpath)
+
+
+def make_frame(rows: int, value: float = 1.0) -> pd.DataFrame:
+    return pd.DataFrame({"Close": [value] * rows})
+
+
+def test_repeated_gets_are_served_from_memory(temp_cache_dir: str) -> None:
+    # Arrange
+    PersistentLRUCache(cache_dir=temp_cache_dir).set(KEY, make_frame(10))
+    cache = TieredCache(disk=PersistentLRUCache(cache_dir=temp_cache_dir))
+
+    # Act
+    first = cache.get(KEY)
+    second = cache.get(KEY)
+
+    # Assert
+    assert first is second
+    assert (cache.stats[DISK_TIER].hits, cache.stats[MEMORY_TIER].hits) == (1, 1)
+    assert cache.stats[MEMORY_TIER].hit_ratio == 0.5
+
+
+def test_memory_entry_is_refreshed_when_another_process_rewrites_the_disk_cache(temp_cache_dir: str) -> None:
+    # Arrange
+    cache = TieredCache(disk=PersistentLRUCache(cache_dir=temp_cache_dir))
+    cache.set(KEY, make_frame(10, value=1.0))
+    other_process = PersistentLRUCache(cache_dir=temp_cache_dir)
+    time.sleep(0.01)
+
+    # Act
+    other_process.set(KEY, make_frame(10, value=2.0))
+    value = cache.get(KEY)
+
+    # Assert
+    assert value["Close"].iloc[0] == 2.0
+    assert cache.stats[DISK_TIER].hits == 1
+
+
+def test_memory_tier_is_bounded_by_measured_size(temp_cache_dir: str) -> None:
+    # Arrange
+    frame_bytes = int(make_frame(100).memory_usage(deep=True).sum())
+    cache = TieredCache(disk=PersistentLRUCache(cache_dir=temp_cache_dir), max_memory_bytes=2 * frame_bytes)
+    keys = [CacheKey(ticker, "2023-01-01", "2023-01-31") for ticker in ["AAPL", "MSFT", "GOOG"]]
+
+    # Act
+    for key in keys:
+        cache.set(key, make_frame(100))
+
+    # Assert
+    assert cache.memory_bytes == 2 * frame_bytes
+    assert cache.get(keys[0]) is not None  # evicted from memory but still on disk
+    assert cache.stats[MEMORY_TIER].misses == 1
+
+
+def test_memory_entry_is_kept_when_another_process_writes_another_key(temp_cache_dir: str) -> None:
+    # Arrange
+    cache = TieredCache(disk=PersistentLRUCache(cache_dir=temp_cache_dir))
+    cache.set(KEY, make_frame(10))
+    first = cache.get(KEY)
+    other_process = PersistentLRUCache(cache_dir=temp_cache_dir)
+    time.sleep(0.01)
+
+    # Act
+    other_process.set(CacheKey("MSFT", "2023-01-01", "2023-01-31"), make_frame(10))
+    second = cache.get(KEY)
+
+    # Assert
+    assert second is first
+    assert cache.stats[MEMORY_TIER].hits == 2
+
+
+def test_memory_entry_is_dropped_when_another_process_evicts_it(temp_cache_dir: str) -> None:
+    # Arrange
+    cache = TieredCache(disk=PersistentLRUCache(cache_dir=temp_cache_dir))
+    cache.set(KEY, make_frame(10))
+    other_process = PersistentLRUCache(cache_dir=temp_cache_dir, max_size=1)
+    time.sleep(0.01)
+
+    # Act
+    other_process.set(CacheKey("MSFT", "2023-01-01", "2023-01-31"), make_frame(10))
+    value = cache.get(KEY)
+
+    # Assert
+    assert value is None
@@ -0,0 +1,92 @@
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtesting_engine.data.constants import LENIENT_VALIDATION, STRICT_VALIDATION, VALIDATION_ATTR
+from backtesting_engine.data.validation import (
+    DUPLICATE_TIMESTAMPS,
+    INCONSISTENT_OHLC,
+    ISSUE_DESCRIPTIONS,
+    MISSING_CLOSE,
+    NON_POSITIVE_PRICES,
+    UNSORTED_INDEX,
+    get_cached_report,
+    validate_market_data,
+)
+from backtesting_engine.exceptions import InvalidDataError
+
+
+def make_bars(dates: list[str], close: list[float]) -> pd.DataFrame:
+    close_values = np.array(close, dtype=float)
+    return pd.DataFrame(
+        {"Open": close_values, "High": close_values + 1, "Low": close_values - 1, "Close": close_values},
+        index=pd.to_datetime(dates),
+    )
+
+
+def test_clean_data_passes_with_its_report_attached() -> None:
+    # Arrange
+    df = make_bars(["2022-01-03", "2022-01-04"], [100.0, 101.0])
+
+    # Act
+    validated, report = validate_market_data(df, "AAPL")
+
+    # Assert
+    assert report.ok
+    assert report.rows == 2
+    assert validated.attrs[VALIDATION_ATTR] is report
+
+
+@pytest.mark.parametrize(
+    "df, issue",
+    [
+        (make_bars(["2022-01-04", "2022-01-03"], [100.0, 101.0]), UNSORTED_INDEX),
+        (make_bars(["2022-01-03", "2022-01-03"], [100.0, 101.0]), DUPLICATE_TIMESTAMPS),
+        (make_bars(["2022-01-03", "2022-01-04"], [100.0, -1.0]), NON_POSITIVE_PRICES),
+        (make_bars(["2022-01-03", "2022-01-04"], [100.0, np.nan]), MISSING_CLOSE),
+        (make_bars(["2022-01-03", "2022-01-04"], [100.0, 101.0]).assign(High=[100.5, 100.0]), INCONSISTENT_OHLC),
+    ],
+)
+def test_strict_validation_raises_on_any_issue(df: pd.DataFrame, issue: str) -> None:
+    # Act & Assert
+    with pytest.raises(InvalidDataError, match=re.escape(f"AAPL: 2 bars, 1 {ISSUE_DESCRIPTIONS[issue]}")):
+        validate_market_data(df, "AAPL", STRICT_VALIDATION)
+
+
+def test_lenient_validation_repairs_and_reports() -> None:
+    # Arrange
+    df = make_bars(
+        ["2022-01-05", "2022-01-03", "2022-01-04", "2022-01-04", "2022-01-06"], [103.0, 101.0, 0.0, 102.0, np.nan]
+    )
+
+    # Act
+    validated, report = validate_market_data(df, "AAPL", LENIENT_VALIDATION)
+
+    # Assert
+    assert list(validated.index) == list(pd.to_datetime(["2022-01-03", "2022-01-04", "2022-01-05"]))
+    assert validated["Close"].tolist() == [101.0, 102.0, 103.0]
+    assert report.issues == {UNSORTED_INDEX: 1, DUPLICATE_TIMESTAMPS: 1, MISSING_CLOSE: 1, NON_POSITIVE_PRICES: 1}
+    assert report.rows_dropped == 2
+
+
+def test_lenient_validation_keeps_inconsistent_ohlc_bars() -> None:
+    # Arrange
+    df = make_bars(["2022-01-03", "2022-01-04"], [100.0, 101.0]).assign(Low=[99.0, 102.0])
+
+    # Act
+    validated, report = validate_market_data(df, "AAPL", LENIENT_VALIDATION)
+
+    # Assert
+    assert len(validated) == 2
+    assert report.issues == {INCONSISTENT_OHLC: 1}
+
+
+def test_cached_report_is_only_reused_for_the_same_mode() -> None:
+    # Arrange
+    validated, report = validate_market_data(make_bars(["2022-01-03"], [100.0]), "AAPL", LENIENT_VALIDATION)
+
+    # Act & Assert
+    assert get_cached_report(validated, LENIENT_VALIDATION) is report
+    assert get_cached_report(validated, STRICT_VALIDATION) is None
@@ -0,0 +1,96 @@
+from typing import Callable
+
+import pytest
+
+from backtesting_engine.data.synthetic import SyntheticSource
+from backtesting_engine.execution.admission import MemoryAdmissionController, MemoryEstimator
+from backtesting_engine.interfaces import RunContext, SimItem
+
+
+GB = 1024**3
+
+
+CONTEXT = RunContext(sim_group="test_group", output_dir_location="unused")
+
+
+def test_estimate_grows_with_bar_frequency(make_sim: Callable[..., SimItem]) -> None:
+    # Arrange
+    estimator = MemoryEstimator(baseline_bytes=0)
+
+    # Act
+    daily = estimator.estimate(make_sim(interval="1d"), CONTEXT)
+    minutely = estimator.estimate(make_sim(interval="1m"), CONTEXT)
+
+    # Assert
+    assert estimator.estimate_rows(make_sim(interval="1d")) == 261
+    assert minutely == daily * 390
+
+
+@pytest.mark.parametrize("interval", ["1d", "1h", "5m"])
+def test_estimated_rows_match_the_bars_of_a_synthetic_dataset(interval: str, make_sim: Callable[..., SimItem]) -> None:
+    # Arrange
+    estimator = MemoryEstimator()
+    sim = make_sim(interval=interval)
+
+    # Act
+    df = SyntheticSource().fetch(["TEST"], sim.data.start_date, sim.data.end_date, interval)["TEST"]
+
+    # Assert
+    assert estimator.estimate_rows(sim) == len(df)
+
+
+def test_estimate_accounts_for_plotting(make_sim: Callable[..., SimItem]) -> None:
+    # Arrange
+    estimator = MemoryEstimator(baseline_bytes=0, plotting_factor=3.0)
+    plotting_context = RunContext(sim_group="test_group", output_dir_location="unused", generate_output=True)
+
+    # Act
+    without_plots = estimator.estimate(make_sim(), CONTEXT)
+    with_plots = estimator.estimate(make_sim(), plotting_context)
+
+    # Assert
+    assert with_plots == without_plots * 3
+
+
+def test_controller_admits_until_budget_is_used() -> None:
+    # Arrange
+    controller = MemoryAdmissionController(budget_bytes=3 * GB, min_free_bytes=0, available_memory_fn=lambda: 64 * GB)
+
+    # Act
+    admitted = [controller.try_admit(GB) for _ in range(4)]
+    controller.release(GB)
+    admitted_after_release = controller.try_admit(GB)
+
+    # Assert
+    assert admitted == [True, True, True, False]
+    assert admitted_after_release
+    assert controller.running == 3
+
+
+def test_controller_always_admits_a_sim_when_idle() -> None:
+    # Arrange
+    controller = MemoryAdmissionController(budget_bytes=GB, min_free_bytes=0, available_memory_fn=lambda: GB)
+
+    # Act
+    first = controller.try_admit(10 * GB)
+    second = controller.try_admit(1)
+
+    # Assert
+    assert first
+    assert not second
+
+
+def test_controller_backs_off_under_memory_pressure() -> None:
+    # Arrange
+    available = [16 * GB]
+    controller = MemoryAdmissionController(
+        budget_bytes=8 * GB, min_free_bytes=GB, available_memory_fn=lambda: available[0]
+    )
+    controller.try_admit(GB)
+
+    # Act
+    available[0] = 2 * GB  # another process on the host claimed most of the memory
+    admitted = controller.try_admit(2 * GB)
+
+    # Assert
+    assert not admitted
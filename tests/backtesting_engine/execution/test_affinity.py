@@ -0,0 +1,55 @@
+import os
+
+import pytest
+
+from backtesting_engine.execution.affinity import configure_worker, get_cpu_topology, plan_core_sets
+from backtesting_engine.execution.constants import THREAD_LIMIT_ENV_VARS
+
+
+DUAL_SOCKET = {0: [0, 1, 2, 3], 1: [4, 5, 6, 7]}
+
+
+def test_workers_are_spread_across_sockets() -> None:
+    # Arrange / Act
+    core_sets = plan_core_sets(4, DUAL_SOCKET)
+
+    # Assert
+    assert core_sets == [[0, 1], [4, 5], [2, 3], [6, 7]]
+
+
+def test_each_worker_gets_at_least_one_cpu_when_oversubscribed() -> None:
+    # Arrange / Act
+    core_sets = plan_core_sets(6, {0: [0, 1]})
+
+    # Assert
+    assert all(len(cpus) == 1 for cpus in core_sets)
+    assert {cpu for cpus in core_sets for cpu in cpus} == {0, 1}
+
+
+@pytest.mark.skipif(not hasattr(os, "sched_getaffinity"), reason="CPU affinity is only supported on Linux")
+def test_topology_covers_every_available_cpu() -> None:
+    # Arrange / Act
+    topology = get_cpu_topology()
+
+    # Assert
+    assert sorted(cpu for cpus in topology.values() for cpu in cpus) == sorted(os.sched_getaffinity(0))
+
+
+@pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="CPU affinity is only supported on Linux")
+def test_configure_worker_pins_and_caps_threads(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Arrange
+    original_cpus = os.sched_getaffinity(0)
+    cpu = min(original_cpus)
+    for env_var in THREAD_LIMIT_ENV_VARS:
+        monkeypatch.delenv(env_var, raising=False)
+
+    # Act
+    try:
+        configure_worker([cpu], threads_per_worker=None)
+        pinned_cpus = os.sched_getaffinity(0)
+    finally:
+        os.sched_setaffinity(0, original_cpus)
+
+    # Assert
+    assert pinned_cpus == {cpu}
+    assert all(os.environ[env_var] == "1" for env_var in THREAD_LIMIT_ENV_VARS)
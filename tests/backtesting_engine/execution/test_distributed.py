@@ -0,0 +1,164 @@
+import os
+import time
+
+from typing import Callable
+
+import pytest
+
+from backtesting_engine.execution.distributed import (
+    DistributedCoordinator,
+    SimBroker,
+    run_local_workers,
+)
+from backtesting_engine.interfaces import RunContext, SimItem, SimResult
+
+
+AUTHKEY = b"test-authkey"
+
+
+def fake_sim_runner(context: RunContext, sim_item: SimItem) -> SimResult:
+    return SimResult(sim_id=sim_item.sim_id, ticker=sim_item.data.ticker, strategy=sim_item.strategy.type)
+
+
+def crashing_sim_runner(context: RunContext, sim_item: SimItem) -> SimResult:
+    os._exit(1)  # simulate a worker host dying mid-sim
+
+
+CONTEXT = RunContext(sim_group="test_group", output_dir_location="unused", store_results=False)
+
+
+@pytest.fixture
+def sims(make_sim: Callable[..., SimItem]) -> list[SimItem]:
+    return [make_sim(f"sim{i}") for i in range(6)]
+
+
+def test_broker_leases_batches_and_collects_results(make_sim: Callable[..., SimItem]) -> None:
+    # Arrange
+    broker = SimBroker(CONTEXT, [make_sim("a"), make_sim("b"), make_sim("c")])
+
+    # Act
+    batch = broker.lease("worker-1", batch_size=2)
+    broker.complete("worker-1", [fake_sim_runner(CONTEXT, sim) for sim in batch])
+
+    # Assert
+    assert [sim.sim_id for sim in batch] == ["a", "b"]
+    assert broker.get_status() == {"pending": 1, "leased": 0, "completed": 2, "workers": 1}
+    assert not broker.is_done()
+
+
+def test_broker_requeues_leases_of_dead_workers(make_sim: Callable[..., SimItem]) -> None:
+    # Arrange
+    broker = SimBroker(CONTEXT, [make_sim("a"), make_sim("b"), make_sim("c")], lease_timeout=0.0)
+    broker.lease("worker-1", batch_size=2)
+    time.sleep(0.01)
+
+    # Act
+    dead_workers = broker.requeue_expired()
+    batch = broker.lease("worker-2", batch_size=3)
+
+    # Assert
+    assert dead_workers == ["worker-1"]
+    assert [sim.sim_id for sim in batch] == ["a", "b", "c"]
+
+
+def test_broker_ignores_duplicate_results_from_late_workers(make_sim: Callable[..., SimItem]) -> None:
+    # Arrange
+    broker = SimBroker(CONTEXT, [make_sim("a")], lease_timeout=0.0)
+    broker.lease("worker-1", batch_size=1)
+    time.sleep(0.01)
+    broker.requeue_expired()
+
+    # Act
+    broker.complete("worker-1", [fake_sim_runner(CONTEXT, make_sim("a"))])
+    batch = broker.lease("worker-2", batch_size=1)
+
+    # Assert
+    assert batch == []
+    assert broker.is_done()
+    assert len(broker.get_results()) == 1
+
+
+def test_sim_completed_while_requeued_is_skipped_when_leased(make_sim: Callable[..., SimItem]) -> None:
+    # Arrange
+    broker = SimBroker(CONTEXT, [make_sim("a"), make_sim("b")], lease_timeout=0.0)
+    broker.lease("worker-1", batch_size=1)
+    time.sleep(0.01)
+    broker.requeue_expired()
+    broker.complete("worker-1", [fake_sim_runner(CONTEXT, make_sim("a"))])
+
+    # Act
+    status = broker.get_status()
+    batch = broker.lease("worker-2", batch_size=2)
+
+    # Assert
+    assert status["pending"] == 1
+    assert [sim.sim_id for sim in batch] == ["b"]
+
+
+def test_local_workers_complete_every_sim(sims: list[SimItem]) -> None:
+    # Arrange
+    coordinator = DistributedCoordinator(CONTEXT, sims, port=0, authkey=AUTHKEY, poll_interval=0.05)
+    address = coordinator.start()
+
+    # Act
+    processes = run_local_workers(address, num_workers=3, authkey=AUTHKEY, batch_size=2, sim_runner=fake_sim_runner)
+    try:
+        results = coordinator.wait()
+    finally:
+        for p in processes:
+            p.join(timeout=10)
+        coordinator.shutdown()
+
+    # Assert
+    assert sorted(result.sim_id for result in results) == [f"sim{i}" for i in range(6)]
+    assert all(p.exitcode == 0 for p in processes)
+
+
+def test_sims_of_a_dead_worker_are_requeued(sims: list[SimItem]) -> None:
+    # Arrange
+    coordinator = DistributedCoordinator(CONTEXT, sims, port=0, authkey=AUTHKEY, lease_timeout=0.5, poll_interval=0.05)
+    address = coordinator.start()
+
+    # Act
+    try:
+        crashed = run_local_workers(address, 1, authkey=AUTHKEY, batch_size=2, sim_runner=crashing_sim_runner)
+        crashed[0].join(timeout=10)
+        healthy = run_local_workers(address, 2, authkey=AUTHKEY, batch_size=2, sim_runner=fake_sim_runner)
+        results = coordinator.wait()
+        for p in healthy:
+            p.join(timeout=10)
+    finally:
+        coordinator.shutdown()
+
+    # Assert
+    assert crashed[0].exitcode == 1
+    assert sorted(result.sim_id for result in results) == [f"sim{i}" for i in range(6)]
+
+
+def slow_sim_runner(context: RunContext, sim_item: SimItem) -> SimResult:
+    if sim_item.sim_id == "slow":
+        time.sleep(1.0)
+    return fake_sim_runner(context, sim_item)
+
+
+def test_results_are_reported_as_they_arrive(make_sim: Callable[..., SimItem]) -> None:
+    # Arrange
+    coordinator = DistributedCoordinator(
+        CONTEXT, [make_sim("fast"), make_sim("slow")], port=0, authkey=AUTHKEY, poll_interval=0.05
+    )
+    address = coordinator.start()
+    reported_at: dict[str, float] = {}
+
+    # Act
+    processes = run_local_workers(address, num_workers=1, authkey=AUTHKEY, batch_size=1, sim_runner=slow_sim_runner)
+    try:
+        coordinator.wait(lambda result: reported_at.setdefault(result.sim_id, time.monotonic()))
+        finished_at = time.monotonic()
+    finally:
+        for p in processes:
+            p.join(timeout=10)
+        coordinator.shutdown()
+
+    # Assert
+    assert set(reported_at) == {"fast", "slow"}
+    assert finished_at - reported_at["fast"] > 0.5  # reported while the slow sim was still running
@@ -0,0 +1,92 @@
+import os
+
+from pathlib import Path
+from typing import Any, Callable, Generator
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from backtesting_engine.execution import runner
+from backtesting_engine.execution.ipyparallel_backend import IPyParallelExecutor
+from backtesting_engine.execution.runner import load_warm_data
+from backtesting_engine.interfaces import DataConfig, RunContext, SimItem, SimResult
+
+
+CONTEXT = RunContext(sim_group="test_group", output_dir_location="unused", store_results=False)
+
+_runs_on_this_engine = 0  # module state on the engine, used to check it survives between runs
+
+
+def counting_sim_runner(context: RunContext, sim_item: SimItem) -> SimResult:
+    global _runs_on_this_engine
+    _runs_on_this_engine += 1
+    return SimResult(
+        sim_id=sim_item.sim_id,
+        ticker=sim_item.data.ticker,
+        strategy=sim_item.strategy.type,
+        metrics={"Runs On Engine": _runs_on_this_engine},
+    )
+
+
+@pytest.fixture(scope="module")
+def ipp_client() -> Generator[Any, None, None]:
+    """Starts a local two-engine cluster that can import both the package and this test module."""
+    ipp = pytest.importorskip("ipyparallel")
+
+    src_dir = Path(__file__).parents[3] / "src"
+    python_path = os.pathsep.join([str(src_dir), str(Path(__file__).parent), os.environ.get("PYTHONPATH", "")])
+    with patch.dict(os.environ, {"PYTHONPATH": python_path}):
+        cluster = ipp.Cluster(n=2, log_level=40)
+        client = cluster.start_and_connect_sync()
+
+    client.wait_for_engines(2, timeout=60)
+    yield client
+    cluster.stop_cluster_sync()
+
+
+@patch("backtesting_engine.execution.runner.load_sim_data")
+def test_warm_data_is_loaded_once_per_engine(mock_load: Any) -> None:
+    # Arrange
+    mock_load.return_value = pd.DataFrame({"Close": [1.0, 2.0]})
+    runner.clear_warm_data()
+    data_config = DataConfig(ticker="TEST", start_date="2020-01-01", end_date="2020-12-31")
+
+    # Act
+    first = load_warm_data(data_config)
+    second = load_warm_data(data_config)
+
+    # Assert
+    assert first is second
+    mock_load.assert_called_once_with(data_config)
+    assert runner.clear_warm_data() == 1
+
+
+def test_results_are_gathered_from_the_cluster(ipp_client: Any, make_sim: Callable[..., SimItem]) -> None:
+    # Arrange
+    executor = IPyParallelExecutor(client=ipp_client, batch_size=2, sim_runner=counting_sim_runner)
+    results: list[SimResult] = []
+
+    # Act
+    executor.run(CONTEXT, [make_sim(f"sim{i}") for i in range(6)], results.append)
+
+    # Assert
+    assert sorted(result.sim_id for result in results) == [f"sim{i}" for i in range(6)]
+
+
+def test_engines_stay_warm_between_runs(ipp_client: Any, make_sim: Callable[..., SimItem]) -> None:
+    # Arrange
+    executor = IPyParallelExecutor(client=ipp_client, batch_size=1, sim_runner=counting_sim_runner)
+    sims = [make_sim(f"sim{i}") for i in range(4)]
+    first_run: list[SimResult] = []
+    second_run: list[SimResult] = []
+
+    # Act
+    executor.run(CONTEXT, sims, first_run.append)
+    executor.run(CONTEXT, sims, second_run.append)
+
+    # Assert
+    # engines are reused, so the per-engine run counters keep growing across runs instead of starting over
+    max_first = max(float(result.metrics["Runs On Engine"]) for result in first_run)
+    max_second = max(float(result.metrics["Runs On Engine"]) for result in second_run)
+    assert max_second > max_first
@@ -0,0 +1,157 @@
+import os
+import threading
+import time
+
+from typing import Callable
+
+import pytest
+
+from backtesting_engine.constants import WORKER_PEAK_RSS
+from backtesting_engine.execution.affinity import plan_core_sets
+from backtesting_engine.execution.local import LocalProcessExecutor
+from backtesting_engine.interfaces import RunContext, SimItem, SimResult
+
+
+CONTEXT = RunContext(sim_group="test_group", output_dir_location="unused", store_results=False)
+
+
+def fake_sim_runner(context: RunContext, sim_item: SimItem) -> SimResult:
+    if sim_item.strategy.type == "broken":
+        raise ValueError("Unknown strategy type: broken")
+    return SimResult(sim_id=sim_item.sim_id, ticker=sim_item.data.ticker, strategy=sim_item.strategy.type)
+
+
+def test_every_result_is_reported(make_sim: Callable[..., SimItem]) -> None:
+    # Arrange
+    executor = LocalProcessExecutor(max_workers=2, sim_runner=fake_sim_runner)
+    results: list[SimResult] = []
+
+    # Act
+    executor.run(CONTEXT, [make_sim(f"sim{i}") for i in range(5)], results.append)
+
+    # Assert
+    assert sorted(result.sim_id for result in results) == [f"sim{i}" for i in range(5)]
+    assert all(result.error is None for result in results)
+
+
+def test_failing_sim_is_reported_without_stopping_the_queue(make_sim: Callable[..., SimItem]) -> None:
+    # Arrange
+    executor = LocalProcessExecutor(max_workers=1, sim_runner=fake_sim_runner)
+    results: list[SimResult] = []
+
+    # Act
+    executor.run(CONTEXT, [make_sim("bad", "broken"), make_sim("good")], results.append)
+
+    # Assert
+    errors = {result.sim_id: result.error for result in results}
+    assert errors["good"] is None
+    assert "Unknown strategy type" in str(errors["bad"])
+
+
+def timed_sim_runner(context: RunContext, sim_item: SimItem) -> SimResult:
+    start = time.time()
+    time.sleep(0.2)
+    return SimResult(
+        sim_id=sim_item.sim_id,
+        ticker=sim_item.data.ticker,
+        strategy=sim_item.strategy.type,
+        metrics={"start": start, "end": time.time()},
+    )
+
+
+def oom_sim_runner(context: RunContext, sim_item: SimItem) -> SimResult:
+    if sim_item.sim_id == "huge":
+        os._exit(137)  # simulate the worker being killed by the OOM killer
+    return fake_sim_runner(context, sim_item)
+
+
+def test_sims_run_one_at_a_time_when_only_one_fits_the_budget(make_sim: Callable[..., SimItem]) -> None:
+    # Arrange
+    executor = LocalProcessExecutor(max_workers=3, sim_runner=timed_sim_runner, memory_budget_bytes=1)
+    results: list[SimResult] = []
+
+    # Act
+    executor.run(CONTEXT, [make_sim(f"sim{i}") for i in range(3)], results.append)
+
+    # Assert
+    spans = sorted((float(r.metrics["start"]), float(r.metrics["end"])) for r in results)
+    assert len(spans) == 3
+    assert all(prev_end <= next_start for (_, prev_end), (next_start, _) in zip(spans, spans[1:]))
+
+
+def test_sim_of_a_killed_worker_is_reported_as_failed(make_sim: Callable[..., SimItem]) -> None:
+    # Arrange
+    executor = LocalProcessExecutor(max_workers=1, sim_runner=oom_sim_runner)
+    results: list[SimResult] = []
+
+    # Act
+    executor.run(CONTEXT, [make_sim("huge"), make_sim("small")], results.append)
+
+    # Assert
+    errors = {result.sim_id: result.error for result in results}
+    assert "exited with code 137" in str(errors["huge"])
+    assert errors["small"] is None
+
+
+def reporting_oom_sim_runner(context: RunContext, sim_item: SimItem) -> SimResult:
+    result = oom_sim_runner(context, sim_item)
+    result.memory = {WORKER_PEAK_RSS: 300 * 1024**2}
+    return result
+
+
+def test_error_of_a_killed_worker_includes_its_last_peak_rss(make_sim: Callable[..., SimItem]) -> None:
+    # Arrange
+    executor = LocalProcessExecutor(max_workers=1, sim_runner=reporting_oom_sim_runner)
+    results: list[SimResult] = []
+
+    # Act
+    executor.run(CONTEXT, [make_sim("small"), make_sim("huge")], results.append)
+
+    # Assert
+    errors = {result.sim_id: result.error for result in results}
+    assert "peak RSS over its earlier sims was 300 MiB" in str(errors["huge"])
+
+
+def affinity_sim_runner(context: RunContext, sim_item: SimItem) -> SimResult:
+    return SimResult(
+        sim_id=sim_item.sim_id,
+        ticker=sim_item.data.ticker,
+        strategy=sim_item.strategy.type,
+        metrics={"cpus": ",".join(str(cpu) for cpu in sorted(os.sched_getaffinity(0)))},
+    )
+
+
+@pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="CPU affinity is only supported on Linux")
+def test_pinned_workers_run_on_their_planned_core_sets(make_sim: Callable[..., SimItem]) -> None:
+    # Arrange
+    executor = LocalProcessExecutor(max_workers=2, sim_runner=affinity_sim_runner, pin_workers=True)
+    planned = {",".join(str(cpu) for cpu in cpus) for cpus in plan_core_sets(2)}
+    results: list[SimResult] = []
+
+    # Act
+    executor.run(CONTEXT, [make_sim(f"sim{i}") for i in range(4)], results.append)
+
+    # Assert
+    assert len(results) == 4
+    assert {result.metrics["cpus"] for result in results} <= planned
+
+
+def exiting_sim_runner(context: RunContext, sim_item: SimItem) -> SimResult:
+    if sim_item.sim_id == "exits_when_idle":
+        threading.Timer(0.2, os._exit, args=(1,)).start()  # the worker dies after reporting, while idle
+    else:
+        time.sleep(1.0)
+    return fake_sim_runner(context, sim_item)
+
+
+def test_run_continues_when_an_idle_worker_exits(make_sim: Callable[..., SimItem]) -> None:
+    # Arrange
+    executor = LocalProcessExecutor(max_workers=2, sim_runner=exiting_sim_runner)
+    results: list[SimResult] = []
+
+    # Act
+    executor.run(CONTEXT, [make_sim("slow"), make_sim("exits_when_idle")], results.append)
+
+    # Assert
+    assert sorted(result.sim_id for result in results) == ["exits_when_idle", "slow"]
+    assert all(result.error is None for result in results)
@@ -0,0 +1,79 @@
+import os
+
+from typing import Callable, Generator
+
+import pytest
+
+from backtesting_engine.execution.local import LocalProcessExecutor
+from backtesting_engine.execution.pool import WorkerPool
+from backtesting_engine.interfaces import RunContext, SimItem, SimResult
+
+
+CONTEXT = RunContext(sim_group="test_group", output_dir_location="unused", store_results=False)
+
+
+def pid_sim_runner(context: RunContext, sim_item: SimItem) -> SimResult:
+    return SimResult(
+        sim_id=sim_item.sim_id,
+        ticker=sim_item.data.ticker,
+        strategy=sim_item.strategy.type,
+        metrics={"pid": os.getpid()},
+    )
+
+
+@pytest.fixture
+def pool() -> Generator[WorkerPool, None, None]:
+    pool = WorkerPool(max_workers=2)
+    yield pool
+    pool.close()
+
+
+def test_workers_are_reused_across_runs(pool: WorkerPool, make_sim: Callable[..., SimItem]) -> None:
+    # Arrange
+    first_run: list[SimResult] = []
+    second_run: list[SimResult] = []
+
+    # Act
+    LocalProcessExecutor(pool=pool, sim_runner=pid_sim_runner).run(
+        CONTEXT, [make_sim(f"a{i}") for i in range(4)], first_run.append
+    )
+    LocalProcessExecutor(pool=pool, sim_runner=pid_sim_runner).run(
+        CONTEXT, [make_sim(f"b{i}") for i in range(4)], second_run.append
+    )
+
+    # Assert
+    worker_pids = {slot.process.pid for slot in pool.slots}
+    assert len(worker_pids) == 2
+    assert {result.metrics["pid"] for result in first_run + second_run} <= worker_pids
+    assert all(slot.process.is_alive() for slot in pool.slots)
+
+
+def test_executor_stops_its_own_workers_after_a_run(make_sim: Callable[..., SimItem]) -> None:
+    # Arrange
+    executor = LocalProcessExecutor(max_workers=2, sim_runner=pid_sim_runner)
+    results: list[SimResult] = []
+
+    # Act
+    executor.run(CONTEXT, [make_sim(f"sim{i}") for i in range(3)], results.append)
+
+    # Assert
+    assert len(results) == 3
+    assert executor.pool.slots == []
+    assert executor.time_to_first_result is not None
+
+
+def test_pool_recovers_from_an_aborted_run(pool: WorkerPool, make_sim: Callable[..., SimItem]) -> None:
+    # Arrange
+    executor = LocalProcessExecutor(pool=pool, sim_runner=pid_sim_runner)
+    results: list[SimResult] = []
+
+    def abort(result: SimResult) -> None:
+        raise KeyboardInterrupt
+
+    # Act
+    with pytest.raises(KeyboardInterrupt):
+        executor.run(CONTEXT, [make_sim(f"a{i}") for i in range(4)], abort)
+    executor.run(CONTEXT, [make_sim(f"b{i}") for i in range(4)], results.append)
+
+    # Assert
+    assert sorted(result.sim_id for result in results) == [f"b{i}" for i in range(4)]
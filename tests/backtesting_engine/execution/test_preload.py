@@ -0,0 +1,32 @@
+import json
+
+from typing import Any
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from backtesting_engine.execution import runner
+from backtesting_engine.execution.constants import PRELOAD_DATASETS_ENV_VAR
+from backtesting_engine.execution.preload import preload_datasets
+
+
+@patch("backtesting_engine.execution.runner.load_sim_data")
+def test_listed_datasets_are_loaded_into_the_warm_cache(mock_load: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Arrange
+    mock_load.side_effect = lambda data_config: (
+        pd.DataFrame({"Close": [1.0]}) if data_config.ticker == "GOOD" else pd.DataFrame().iloc[1]
+    )
+    datasets = [
+        {"ticker": "GOOD", "start_date": "2020-01-01", "end_date": "2020-12-31"},
+        {"ticker": "BAD", "start_date": "2020-01-01", "end_date": "2020-12-31"},
+    ]
+    monkeypatch.setenv(PRELOAD_DATASETS_ENV_VAR, json.dumps(datasets))
+    runner.clear_warm_data()
+
+    # Act
+    loaded = preload_datasets()
+
+    # Assert
+    assert loaded == 1
+    assert runner.clear_warm_data() == 1
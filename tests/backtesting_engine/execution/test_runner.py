@@ -0,0 +1,116 @@
+import os
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from backtesting_engine.constants import (
+    DATA_BYTES,
+    EXECUTION_STAGE,
+    LOAD_STAGE,
+    METRICS_STAGE,
+    OUTPUT_STAGE,
+    PEAK_RSS,
+    RESULT_BYTES,
+    SIGNALS_STAGE,
+)
+from backtesting_engine.execution import runner
+from backtesting_engine.execution.runner import run_sim, run_sim_safely
+from backtesting_engine.interfaces import DataConfig, RunContext, SimConfig, SimItem, StrategyConfig
+
+
+@pytest.fixture
+def sim_item() -> SimItem:
+    return SimItem(
+        sim_id="001",
+        strategy=StrategyConfig(type="buy_and_hold", fields={}),
+        data=DataConfig(ticker="TEST", start_date="2022-01-01", end_date="2022-01-10"),
+        sim_config=SimConfig(initial_cash=1000, slippage=0.0, commission=0.0),
+    )
+
+
+def load_fake_data(data_config: DataConfig) -> pd.DataFrame:
+    idx = pd.date_range("2022-01-01", periods=10, freq="D")
+    return pd.DataFrame({"Close": [100.0 + i for i in range(10)]}, index=idx)
+
+
+def test_run_sim_stores_results_in_output_dir(tmp_path: Path, sim_item: SimItem) -> None:
+    # Arrange
+    context = RunContext(sim_group="test_group", output_dir_location=str(tmp_path))
+
+    # Act
+    result = run_sim(context, sim_item, load_data=load_fake_data)
+
+    # Assert
+    assert result.error is None
+    assert result.result_path == os.path.join(str(tmp_path), "test_group", "test", "001_buy_and_hold_result.pkl")
+    assert len(pd.read_pickle(result.result_path)) == 10
+    assert result.metrics["Total Return"] > 0
+
+
+def test_run_sim_safely_reports_errors(tmp_path: Path, sim_item: SimItem) -> None:
+    # Arrange
+    context = RunContext(sim_group="test_group", output_dir_location=str(tmp_path), store_results=False)
+    sim_item.strategy.type = "unknown"
+
+    # Act
+    result = run_sim_safely(lambda ctx, sim: run_sim(ctx, sim, load_data=load_fake_data), context, sim_item)
+
+    # Assert
+    assert result.result_path is None
+    assert "Unknown strategy type" in str(result.error)
+
+
+def test_run_sim_reports_the_time_spent_in_each_stage(tmp_path: Path, sim_item: SimItem) -> None:
+    # Arrange
+    context = RunContext(sim_group="test_group", output_dir_location=str(tmp_path))
+
+    # Act
+    result = run_sim(context, sim_item, load_data=load_fake_data)
+
+    # Assert
+    assert list(result.timings) == [LOAD_STAGE, SIGNALS_STAGE, EXECUTION_STAGE, METRICS_STAGE, OUTPUT_STAGE]
+    assert all(seconds >= 0 for seconds in result.timings.values())
+
+
+def test_run_sim_without_stage_timing_reports_no_timings(tmp_path: Path, sim_item: SimItem) -> None:
+    # Arrange
+    context = RunContext(sim_group="test_group", output_dir_location=str(tmp_path), time_stages=False)
+
+    # Act
+    result = run_sim(context, sim_item, load_data=load_fake_data)
+
+    # Assert
+    assert result.timings == {}
+
+
+def test_run_sim_reports_its_memory_and_flags_a_crossed_threshold(tmp_path: Path, sim_item: SimItem) -> None:
+    # Arrange
+    context = RunContext(sim_group="test_group", output_dir_location=str(tmp_path), memory_threshold_bytes=1)
+
+    # Act
+    result = run_sim(context, sim_item, load_data=load_fake_data)
+
+    # Assert
+    assert result.memory[PEAK_RSS] > 0
+    assert 0 < result.memory[DATA_BYTES] < result.memory[RESULT_BYTES]
+    assert "over the 0 MiB threshold" in str(result.memory_warning)
+
+
+def test_run_sim_reports_whether_its_data_came_from_a_cache(
+    tmp_path: Path, sim_item: SimItem, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Arrange
+    context = RunContext(sim_group="test_group", output_dir_location=str(tmp_path), store_results=False)
+    monkeypatch.setattr(runner, "load_sim_data", load_fake_data)  # counts no cache lookups of its own
+    runner.clear_warm_data()
+
+    # Act
+    first = run_sim(context, sim_item, load_data=runner.load_warm_data)
+    second = run_sim(context, sim_item, load_data=runner.load_warm_data)
+    runner.clear_warm_data()
+
+    # Assert
+    assert first.cache_hit is None
+    assert second.cache_hit is True
@@ -0,0 +1,51 @@
+import sys
+
+import pandas as pd
+import pytest
+
+from backtesting_engine.strategies.interfaces import IStrategy
+from backtesting_engine.strategies.registry import STRATEGIES, StrategyRegistry
+
+
+class DummyStrategy(IStrategy):
+    def __init__(self, data: pd.DataFrame) -> None:
+        self.data = data
+
+    def validate_data(self) -> None:
+        pass
+
+    def generate_signals(self) -> pd.DataFrame:
+        return self.data
+
+
+def test_strategy_is_imported_on_first_lookup(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Arrange
+    module_name = "backtesting_engine.strategies.momentum"
+    monkeypatch.delitem(sys.modules, module_name, raising=False)
+    registry = StrategyRegistry({"momentum": f"{module_name}:MomentumStrategy"})
+
+    # Act
+    imported_before_lookup = module_name in sys.modules
+    strategy_cls = registry["momentum"]
+
+    # Assert
+    assert not imported_before_lookup
+    assert strategy_cls.__name__ == "MomentumStrategy"
+
+
+def test_registered_class_is_returned_as_is() -> None:
+    # Arrange
+    registry = StrategyRegistry({})
+
+    # Act
+    registry.register("dummy", DummyStrategy)
+
+    # Assert
+    assert registry["dummy"] is DummyStrategy
+    assert list(registry) == ["dummy"]
+
+
+def test_unknown_strategy_is_not_found() -> None:
+    # Arrange / Act / Assert
+    assert STRATEGIES.get("unknown") is None
+    assert set(STRATEGIES) == {"sma_crossover", "mean_reversion", "momentum", "buy_and_hold"}
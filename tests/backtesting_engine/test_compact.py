@@ -0,0 +1,119 @@
+import tracemalloc
+
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtesting_engine.analytics.metrics import BacktestMetricCreator
+from backtesting_engine.compact import compact_prices, compact_results, compact_signals
+from backtesting_engine.constants import CASH_COLUMN, CLOSE_COLUMN, POSITION_COLUMN, SIGNAL_COLUMN, TOTAL_VALUE_COLUMN
+from backtesting_engine.data.fake_server import make_fake_bars
+from backtesting_engine.engine import BTXEngine
+from backtesting_engine.interfaces import EngineConfig, EngineContext
+from backtesting_engine.strategies.constants import LONG_MA_COLUMN, SHORT_MA_COLUMN
+from backtesting_engine.strategies.sma_crossover import SMACrossoverStrategy
+
+
+def make_sma_engine(data: pd.DataFrame, compact: bool, keep_indicators: bool = True) -> BTXEngine:
+    return BTXEngine(
+        config=EngineConfig(commission=0.001, generate_output=False, compact=compact, keep_indicators=keep_indicators),
+        context=EngineContext(
+            sim_group="test",
+            sim_id="sim",
+            data=data,
+            ticker="TEST",
+            strategy=SMACrossoverStrategy(data=data, short_window=10, long_window=30),
+            metrics_creator=BacktestMetricCreator,
+            plot_generator=lambda *args: None,  # type: ignore[arg-type,return-value]
+        ),
+    )
+
+
+def run_sma_backtest(data: pd.DataFrame, compact: bool, keep_indicators: bool = True) -> BTXEngine:
+    engine = make_sma_engine(data, compact, keep_indicators)
+    engine.run_backtest()
+    return engine
+
+
+def get_peak(function: Callable[[], object]) -> int:
+    """Peak bytes traced while a function runs."""
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.fixture
+def bars() -> pd.DataFrame:
+    return make_fake_bars("TEST", "2015-01-01", "2020-01-01")
+
+
+def test_compact_prices_downcasts_only_price_columns(bars: pd.DataFrame) -> None:
+    # Act
+    compact = compact_prices(bars)
+
+    # Assert
+    assert compact[CLOSE_COLUMN].dtype == np.float32
+    assert compact["Volume"].dtype == bars["Volume"].dtype
+    assert bars[CLOSE_COLUMN].dtype == np.float64  # the original is left as it was
+
+
+def test_compact_signals_fill_missing_signals_with_hold() -> None:
+    # Act
+    signals = compact_signals(pd.Series([np.nan, 1.0, -1.0, 0.0]))
+
+    # Assert
+    assert signals.dtype == np.int8
+    assert signals.tolist() == [0, 1, -1, 0]
+
+
+def test_compact_backtest_matches_float64_backtest(bars: pd.DataFrame) -> None:
+    # Act
+    full = run_sma_backtest(bars, compact=False)
+    compact = run_sma_backtest(compact_prices(bars), compact=True)
+
+    # Assert
+    assert compact.data[SIGNAL_COLUMN].dtype == np.int8
+    assert compact.data[POSITION_COLUMN].dtype == np.int64
+    assert compact.data[CASH_COLUMN].dtype == np.float64
+    assert [(t.timestamp, t.action, t.shares) for t in compact.trade_log] == [
+        (t.timestamp, t.action, t.shares) for t in full.trade_log
+    ]
+    assert full.metrics is not None and compact.metrics is not None
+    for metric in ["total_return", "sharpe_ratio", "max_drawdown", "volatility"]:
+        assert getattr(compact.metrics, metric) == pytest.approx(getattr(full.metrics, metric), abs=1e-4)
+    np.testing.assert_allclose(compact.data[TOTAL_VALUE_COLUMN], full.data[TOTAL_VALUE_COLUMN], rtol=1e-5)
+
+
+def test_indicator_columns_are_dropped_when_not_kept(bars: pd.DataFrame) -> None:
+    # Act
+    engine = run_sma_backtest(bars, compact=False, keep_indicators=False)
+
+    # Assert
+    assert SHORT_MA_COLUMN not in engine.data.columns
+    assert LONG_MA_COLUMN not in engine.data.columns
+    assert TOTAL_VALUE_COLUMN in engine.data.columns
+
+
+def test_compact_positions_are_not_copied_to_be_cast(bars: pd.DataFrame) -> None:
+    # Arrange
+    data = compact_prices(bars)
+    signals = SMACrossoverStrategy(data=data, short_window=10, long_window=30).generate_signals()
+    signals[SIGNAL_COLUMN] = compact_signals(signals[SIGNAL_COLUMN])
+    cast_results = make_sma_engine(data, compact=False)._backtest_single_ticker(signals.copy(), "TEST")
+    built_results = make_sma_engine(data, compact=True)._backtest_single_ticker(signals.copy(), "TEST")
+    column_bytes = cast_results[POSITION_COLUMN].nbytes
+
+    # Act
+    cast_peak = get_peak(lambda: compact_results(cast_results))  # float64 positions, filled and cast afterwards
+    built_peak = get_peak(lambda: compact_results(built_results))
+
+    # Assert
+    assert built_results[POSITION_COLUMN].dtype == np.int64
+    assert (built_results[POSITION_COLUMN] == cast_results[POSITION_COLUMN]).all()
+    assert cast_peak > column_bytes
+    assert built_peak < column_bytes / 4
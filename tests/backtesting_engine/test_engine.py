@@ -7,10 +7,14 @@ from backtesting_engine.constants import (
     BUY,
     CASH_COLUMN,
     CLOSE_COLUMN,
+    EXECUTION_STAGE,
     HOLDINGS_COLUMN,
+    METRICS_STAGE,
+    PLOTTING_STAGE,
     POSITION_COLUMN,
     SELL,
     SIGNAL_COLUMN,
+    SIGNALS_STAGE,
     TOTAL_VALUE_COLUMN,
 )
 from backtesting_engine.engine import BTXEngine
@@ -186,3 +190,27 @@ def test_no_trade_when_no_signal(config: EngineConfig, sample_data: pd.DataFrame
     assert len(engine.trade_log) == 0
     assert all(df[POSITION_COLUMN] == 0)
     assert all(df[CASH_COLUMN] == config.initial_cash)
+
+
+def test_run_backtest_times_each_stage(config: EngineConfig, context: EngineContext) -> None:
+    # Arrange
+    config.generate_output = True
+    engine = BTXEngine(config, context)
+
+    # Act
+    engine.run_backtest()
+
+    # Assert
+    assert list(engine.timings) == [SIGNALS_STAGE, EXECUTION_STAGE, METRICS_STAGE, PLOTTING_STAGE]
+
+
+def test_run_backtest_without_stage_timing_records_nothing(config: EngineConfig, context: EngineContext) -> None:
+    # Arrange
+    config.time_stages = False
+    engine = BTXEngine(config, context)
+
+    # Act
+    engine.run_backtest()
+
+    # Assert
+    assert engine.timings == {}
@@ -0,0 +1,63 @@
+import json
+import os
+import subprocess
+import sys
+
+from pathlib import Path
+
+
+SRC_DIR = Path(__file__).parents[2] / "src"
+CORE_MODULES = [
+    "backtesting_engine.managers",
+    "backtesting_engine.engine",
+    "backtesting_engine.analytics.metrics",
+    "backtesting_engine.strategies.registry",
+]
+OPTIONAL_MODULES = [
+    "plotly",
+    "yfinance",
+    "ipyparallel",
+    "backtesting_engine.analytics.plotter",
+    "backtesting_engine.strategies.sma_crossover",
+    "backtesting_engine.strategies.mean_reversion",
+    "backtesting_engine.strategies.momentum",
+    "backtesting_engine.strategies.buy_and_hold",
+]
+CORE_IMPORT_BUDGET_SECONDS = 0.15  # on top of numpy and pandas, which the core cannot avoid
+
+
+def cold_import_core() -> dict[str, object]:
+    """Import the core in a fresh interpreter and report its import time and the optional modules it pulled in."""
+    code = f"""
+import json, sys, time
+import numpy, pandas
+start = time.perf_counter()
+for module in {CORE_MODULES!r}:
+    __import__(module)
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "loaded": [m for m in {OPTIONAL_MODULES!r} if m in sys.modules]}}))
+"""
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(SRC_DIR)},
+    ).stdout
+    return json.loads(output)
+
+
+def test_core_import_does_not_load_optional_modules() -> None:
+    # Arrange / Act
+    result = cold_import_core()
+
+    # Assert
+    assert result["loaded"] == []
+
+
+def test_core_cold_import_time_is_within_budget() -> None:
+    # Arrange / Act
+    fastest = min(float(cold_import_core()["elapsed"]) for _ in range(3))  # best of three to ignore noisy runs
+
+    # Assert
+    assert fastest < CORE_IMPORT_BUDGET_SECONDS
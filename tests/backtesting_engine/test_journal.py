@@ -0,0 +1,80 @@
+import dataclasses
+
+from pathlib import Path
+from typing import Callable
+
+from backtesting_engine.interfaces import SimItem, SimResult
+from backtesting_engine.journal import RunJournal
+
+
+def make_result(sim_id: str) -> SimResult:
+    return SimResult(
+        sim_id=sim_id,
+        ticker="TEST",
+        strategy="buy_and_hold",
+        metrics={"Sharpe Ratio": 1.2},
+        result_path=f"out/{sim_id}_result.pkl",
+    )
+
+
+def test_recorded_sims_are_read_back(tmp_path: Path, make_sim: Callable[..., SimItem]) -> None:
+    # Arrange
+    journal = RunJournal(str(tmp_path), "test_group")
+    sims = [make_sim("sim1"), make_sim("sim2")]
+
+    # Act
+    journal.record(sims[0], make_result("sim1"))
+    journal.close()
+    completed = RunJournal(str(tmp_path), "test_group").get_completed_results(sims)
+
+    # Assert
+    assert list(completed) == ["sim1"]
+    assert completed["sim1"].result_path == "out/sim1_result.pkl"
+    assert completed["sim1"].metrics == {"Sharpe Ratio": 1.2}
+
+
+def test_changed_sim_config_is_not_treated_as_completed(tmp_path: Path, make_sim: Callable[..., SimItem]) -> None:
+    # Arrange
+    journal = RunJournal(str(tmp_path), "test_group")
+    journal.record(make_sim("sim1"), make_result("sim1"))
+    journal.close()
+
+    # Act
+    completed = journal.get_completed_results([make_sim("sim1", initial_cash=5000)])
+
+    # Assert
+    assert completed == {}
+
+
+def test_partial_line_from_a_crash_is_ignored(tmp_path: Path, make_sim: Callable[..., SimItem]) -> None:
+    # Arrange
+    journal = RunJournal(str(tmp_path), "test_group", fsync_every=1)
+    journal.record(make_sim("sim1"), make_result("sim1"))
+    journal.close()
+    with open(journal.path, "a") as file:
+        file.write('{"sim_id": "sim2", "sim_ha')
+
+    # Act
+    completed = journal.load()
+
+    # Assert
+    assert list(completed) == ["sim1"]
+    assert dataclasses.asdict(completed["sim1"][1]) == dataclasses.asdict(make_result("sim1"))
+
+
+def test_record_after_a_crash_does_not_join_the_partial_line(tmp_path: Path, make_sim: Callable[..., SimItem]) -> None:
+    # Arrange
+    journal = RunJournal(str(tmp_path), "test_group")
+    journal.record(make_sim("sim1"), make_result("sim1"))
+    journal.close()
+    with open(journal.path, "a") as file:
+        file.write('{"sim_id": "sim2", "sim_ha')
+
+    # Act
+    resumed = RunJournal(str(tmp_path), "test_group")
+    resumed.record(make_sim("sim3"), make_result("sim3"))
+    resumed.close()
+
+    # Assert
+    assert list(resumed.load()) == ["sim1", "sim3"]
+    assert Path(journal.path).read_text().endswith("\n")
@@ -0,0 +1,31 @@
+from collections import OrderedDict
+
+from backtesting_engine.registry import LazyRegistry
+
+
+def test_factory_is_applied_once_to_what_the_path_names() -> None:
+    # Arrange
+    made: list[type] = []
+    registry = LazyRegistry({"ordered": "collections:OrderedDict"}, factory=lambda cls: made.append(cls) or cls())
+
+    # Act
+    first = registry["ordered"]
+    second = registry["ordered"]
+
+    # Assert
+    assert made == [OrderedDict]
+    assert isinstance(first, OrderedDict)
+    assert first is second
+
+
+def test_registered_object_is_not_passed_to_the_factory() -> None:
+    # Arrange
+    registry = LazyRegistry({}, factory=lambda cls: cls())
+    ordered = OrderedDict()
+
+    # Act
+    registry.register("ordered", ordered)
+
+    # Assert
+    assert registry["ordered"] is ordered
+    assert len(registry) == 1
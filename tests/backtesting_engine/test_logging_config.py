@@ -0,0 +1,62 @@
+import io
+import json
+import logging
+import os
+
+from collections.abc import Iterator
+
+import pytest
+
+from backtesting_engine.constants import LOG_FORMAT_ENV_VAR, LOG_LEVEL_ENV_VAR, PACKAGE_LOGGER
+from backtesting_engine.logging_config import configure_logging
+
+
+@pytest.fixture(autouse=True)
+def restore_logging(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.delenv(LOG_LEVEL_ENV_VAR, raising=False)
+    monkeypatch.delenv(LOG_FORMAT_ENV_VAR, raising=False)
+    logger = logging.getLogger(PACKAGE_LOGGER)
+    handlers, level, propagate = list(logger.handlers), logger.level, logger.propagate
+    yield
+    logger.handlers, logger.level, logger.propagate = handlers, level, propagate
+
+
+def test_structured_logging_writes_json_with_extra_fields() -> None:
+    # Arrange
+    stream = io.StringIO()
+    configure_logging(structured=True, stream=stream)
+
+    # Act
+    logging.getLogger("backtesting_engine.managers").info("done", extra={"sim_group": "g", "sim_id": "001"})
+
+    # Assert
+    entry = json.loads(stream.getvalue())
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "backtesting_engine.managers"
+    assert entry["message"] == "done"
+    assert (entry["sim_group"], entry["sim_id"]) == ("g", "001")
+
+
+def test_records_below_the_level_are_dropped() -> None:
+    # Arrange
+    stream = io.StringIO()
+    configure_logging(level=logging.INFO, stream=stream)
+
+    # Act
+    logging.getLogger("backtesting_engine.execution.pool").debug("[g:001] Starting...")
+
+    # Assert
+    assert stream.getvalue() == ""
+
+
+def test_configuring_again_replaces_the_handler_and_sets_the_environment() -> None:
+    # Arrange
+    configure_logging(stream=io.StringIO())
+
+    # Act
+    configure_logging(level="DEBUG", structured=True, stream=io.StringIO())
+
+    # Assert
+    assert len(logging.getLogger(PACKAGE_LOGGER).handlers) == 1
+    assert os.environ[LOG_LEVEL_ENV_VAR] == "DEBUG"
+    assert os.environ[LOG_FORMAT_ENV_VAR] == "json"
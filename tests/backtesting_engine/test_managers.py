@@ -1,10 +1,22 @@
 import json
+import urllib.request
 
 from pathlib import Path
+from typing import Any, Callable
 
+import pandas as pd
 import pytest
 
-from backtesting_engine.interfaces import SimItem
+from backtesting_engine.constants import (
+    EXECUTION_STAGE,
+    LOAD_STAGE,
+    MEMORY_FILE_SUFFIX,
+    PEAK_RSS,
+    STAGE_TIMINGS_FILE_SUFFIX,
+    WORKER_PEAK_RSS,
+    WORKER_PID,
+)
+from backtesting_engine.interfaces import ProfileConfig, SimItem
 from backtesting_engine.managers import QueueManager
 
 
@@ -54,3 +66,178 @@ def test_create_output_directory(sample_queue_file: Path) -> None:
     # Assert
     assert output_dir.exists()
     assert output_dir.is_dir()
+
+
+ExecutorFactory = Callable[..., Any]  # conftest's StubExecutor
+SHARPE_RESULT = {"metrics": {"Sharpe Ratio": 1.5}}
+
+
+def test_run_all_returns_one_row_per_sim(sample_queue_file: Path, make_executor: ExecutorFactory) -> None:
+    # Arrange
+    qm = QueueManager(str(sample_queue_file), executor=make_executor(SHARPE_RESULT), prefetch=False)
+
+    # Act
+    results = qm.run_all()
+
+    # Assert
+    assert isinstance(results, pd.DataFrame)
+    assert list(results["Sim ID"]) == ["sim1"]
+    assert results["Sharpe Ratio"].iloc[0] == 1.5
+    assert [result.sim_id for result in qm.results] == ["sim1"]
+
+
+def test_run_all_skips_sims_completed_in_an_earlier_run(
+    sample_queue_file: Path, make_executor: ExecutorFactory
+) -> None:
+    # Arrange
+    executor = make_executor()
+    QueueManager(str(sample_queue_file), executor=executor, prefetch=False).run_all()
+
+    # Act
+    results = QueueManager(str(sample_queue_file), executor=executor, prefetch=False).run_all()
+
+    # Assert
+    assert executor.runs == [["sim1"], []]
+    assert list(results["Sim ID"]) == ["sim1"]
+
+
+def test_run_all_reruns_a_completed_sim_whose_config_changed(
+    sample_queue_file: Path, make_executor: ExecutorFactory
+) -> None:
+    # Arrange
+    executor = make_executor()
+    QueueManager(str(sample_queue_file), executor=executor, prefetch=False).run_all()
+    config = json.loads(sample_queue_file.read_text())
+    config["sims"][0]["sim_config"]["initial_cash"] = 2000
+    sample_queue_file.write_text(json.dumps(config))
+
+    # Act
+    QueueManager(str(sample_queue_file), executor=executor, prefetch=False).run_all()
+
+    # Assert
+    assert executor.runs == [["sim1"], ["sim1"]]
+
+
+def test_queue_file_with_a_repeated_sim_id_is_rejected(sample_queue_file: Path) -> None:
+    # Arrange
+    config = json.loads(sample_queue_file.read_text())
+    config["sims"].append(config["sims"][0])
+    sample_queue_file.write_text(json.dumps(config))
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="more than one sim with sim_id 'sim1'"):
+        QueueManager(str(sample_queue_file))
+
+
+@pytest.mark.parametrize("pool_options", [{"max_workers": 2}, {"pin_workers": True}])
+def test_local_pool_options_with_an_executor_are_rejected(
+    sample_queue_file: Path, make_executor: ExecutorFactory, pool_options: dict[str, Any]
+) -> None:
+    # Act / Assert
+    with pytest.raises(ValueError, match=f"{next(iter(pool_options))} configure the local worker pool"):
+        QueueManager(str(sample_queue_file), executor=make_executor(), **pool_options)
+
+
+@pytest.mark.parametrize("plot_options", [{"plot_top_n": 3}, {"plot_sim_ids": ["sim1"]}])
+def test_plotting_without_stored_results_is_rejected(sample_queue_file: Path, plot_options: dict[str, Any]) -> None:
+    # Act / Assert
+    with pytest.raises(ValueError, match="need store_results"):
+        QueueManager(str(sample_queue_file), store_results=False, **plot_options)
+
+
+def test_run_all_without_resume_reruns_every_sim(sample_queue_file: Path, make_executor: ExecutorFactory) -> None:
+    # Arrange
+    executor = make_executor()
+    QueueManager(str(sample_queue_file), executor=executor, prefetch=False).run_all()
+
+    # Act
+    QueueManager(str(sample_queue_file), executor=executor, resume=False, prefetch=False).run_all()
+
+    # Assert
+    assert executor.runs == [["sim1"], ["sim1"]]
+
+
+def test_run_all_exports_stage_percentiles(sample_queue_file: Path, make_executor: ExecutorFactory) -> None:
+    # Arrange
+    executor = make_executor({"timings": {LOAD_STAGE: 0.5, EXECUTION_STAGE: 2.0}})
+    qm = QueueManager(str(sample_queue_file), executor=executor, prefetch=False)
+
+    # Act
+    qm.run_all()
+
+    # Assert
+    path = Path(qm.queue_config.output_dir_location) / f"{qm.queue_config.sim_group}{STAGE_TIMINGS_FILE_SUFFIX}"
+    exported = pd.read_csv(path, index_col="Stage")
+    assert list(exported.index) == [LOAD_STAGE, EXECUTION_STAGE]
+    assert exported.at[EXECUTION_STAGE, "p99"] == 2.0
+    pd.testing.assert_frame_equal(exported, qm.stage_percentiles, check_dtype=False)
+
+
+def test_run_all_merges_the_profiles_of_profiled_sims(sample_queue_file: Path, make_executor: ExecutorFactory) -> None:
+    # Arrange
+    qm = QueueManager(
+        str(sample_queue_file), executor=make_executor(), prefetch=False, profile=ProfileConfig(sim_ids=("sim1",))
+    )
+
+    # Act
+    qm.run_all()
+
+    # Assert
+    assert qm.profile_path == str(Path(qm.queue_config.output_dir_location) / f"{qm.queue_config.sim_group}.prof")
+    assert Path(qm.profile_path).exists()
+
+
+def test_run_all_exports_the_memory_of_each_sim(sample_queue_file: Path, make_executor: ExecutorFactory) -> None:
+    # Arrange
+    executor = make_executor(
+        {
+            "memory": {PEAK_RSS: 200, WORKER_PEAK_RSS: 300, WORKER_PID: 42},
+            "memory_warning": "Peak RSS of 200 MiB is over the 100 MiB threshold.",
+        }
+    )
+    qm = QueueManager(str(sample_queue_file), executor=executor, prefetch=False)
+
+    # Act
+    qm.run_all()
+
+    # Assert
+    path = Path(qm.queue_config.output_dir_location) / f"{qm.queue_config.sim_group}{MEMORY_FILE_SUFFIX}"
+    exported = pd.read_csv(path)
+    assert exported.loc[0, "sim_id"] == "sim1"
+    assert exported.loc[0, PEAK_RSS] == 200
+    assert exported.loc[0, "memory_warning"].startswith("Peak RSS")
+    assert qm.worker_peak_rss == {42: 300}
+
+
+def test_run_all_prefetches_the_data_of_pending_sims_first(
+    sample_queue_file: Path, make_executor: ExecutorFactory, prefetcher: Any
+) -> None:
+    # Arrange
+    executor = make_executor()
+    QueueManager(str(sample_queue_file), executor=executor, prefetcher=prefetcher).run_all()
+
+    # Act
+    QueueManager(str(sample_queue_file), executor=executor, prefetcher=prefetcher).run_all()
+
+    # Assert
+    assert prefetcher.prefetched == [["AAPL"]]  # nothing to fetch once the sim is completed
+
+
+def test_run_all_serves_live_metrics_while_running(sample_queue_file: Path, make_executor: ExecutorFactory) -> None:
+    # Arrange
+    scraped: list[str] = []
+
+    def scrape() -> None:
+        assert qm.metrics_server is not None
+        with urllib.request.urlopen(f"http://127.0.0.1:{qm.metrics_server.port}/metrics") as response:
+            scraped.append(response.read().decode())
+
+    qm = QueueManager(str(sample_queue_file), executor=make_executor(after_run=scrape), prefetch=False, metrics_port=0)
+
+    # Act
+    qm.run_all()
+
+    # Assert
+    assert 'btx_sims_total{sim_group="test_group",status="completed"} 1' in scraped[0]
+    assert 'btx_queue_depth{sim_group="test_group"} 0' in scraped[0]
+    assert qm.metrics_server is None
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+
+from backtesting_engine.constants import PEAK_RSS, TRACEMALLOC_PEAK, WORKER_PEAK_RSS
+from backtesting_engine.memory import MemoryTracker, check_memory_threshold, get_frame_bytes
+
+
+def test_tracker_measures_the_peaks_of_what_runs_inside_it() -> None:
+    # Arrange
+    tracker = MemoryTracker(trace_allocations=True)
+
+    # Act
+    with tracker:
+        array = np.ones(10_000_000)  # 80 MB
+        del array
+
+    # Assert
+    report = tracker.get_report()
+    assert report[TRACEMALLOC_PEAK] >= 80_000_000
+    assert report[PEAK_RSS] >= 80_000_000
+    assert report[WORKER_PEAK_RSS] >= report[PEAK_RSS]
+
+
+def test_tracker_records_the_size_of_frames() -> None:
+    # Arrange
+    tracker = MemoryTracker()
+    df = pd.DataFrame({"Close": np.ones(1000)}, index=pd.RangeIndex(1000))
+
+    # Act
+    with tracker:
+        tracker.add_frame("data_bytes", df)
+
+    # Assert
+    assert tracker.get_report()["data_bytes"] == get_frame_bytes(df) >= 8000
+    assert TRACEMALLOC_PEAK not in tracker.get_report()
+
+
+def test_a_disabled_tracker_reports_nothing() -> None:
+    # Arrange
+    tracker = MemoryTracker(enabled=False, trace_allocations=True)
+
+    # Act
+    with tracker:
+        tracker.add_frame("data_bytes", pd.DataFrame({"Close": [1.0]}))
+
+    # Assert
+    assert tracker.get_report() == {}
+
+
+def test_only_a_peak_over_the_threshold_is_flagged() -> None:
+    # Arrange
+    report = {PEAK_RSS: 300 * 1024**2}
+
+    # Act & Assert
+    assert check_memory_threshold(report, None) is None
+    assert check_memory_threshold(report, 400 * 1024**2) is None
+    assert check_memory_threshold(report, 200 * 1024**2) == "Peak RSS of 300 MiB is over the 200 MiB threshold."
@@ -0,0 +1,80 @@
+import urllib.error
+import urllib.request
+
+from typing import Optional
+
+import pytest
+
+from backtesting_engine.constants import LOAD_STAGE, WORKER_PEAK_RSS, WORKER_PID
+from backtesting_engine.interfaces import SimResult
+from backtesting_engine.metrics_server import MetricsServer, RunMetrics
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_result(sim_id: str, load_seconds: float, error: Optional[str] = None) -> SimResult:
+    return SimResult(
+        sim_id=sim_id,
+        ticker="TEST",
+        strategy="buy_and_hold",
+        error=error,
+        timings={LOAD_STAGE: load_seconds},
+        memory={WORKER_PID: 42, WORKER_PEAK_RSS: 1024},
+        cache_hit=error is None,
+    )
+
+
+def test_render_exports_counters_gauges_and_stage_histograms() -> None:
+    # Arrange
+    clock = FakeClock()
+    metrics = RunMetrics(buckets=(0.01, 0.1), clock=clock)
+    metrics.start_run("group", sims=4)
+
+    # Act
+    metrics.observe(make_result("001", 0.005))
+    metrics.observe(make_result("002", 0.05))
+    metrics.observe(make_result("003", 0.5, error="ValueError()"))
+    clock.now = 2.0
+    text = metrics.render()
+
+    # Assert
+    lines = set(text.splitlines())
+    assert 'btx_sims_total{sim_group="group",status="completed"} 2' in lines
+    assert 'btx_sims_total{sim_group="group",status="failed"} 1' in lines
+    assert 'btx_sims_per_second{sim_group="group"} 1.5' in lines
+    assert 'btx_queue_depth{sim_group="group"} 1' in lines
+    assert 'btx_cache_hit_ratio{sim_group="group"} 0.666667' in lines
+    assert 'btx_stage_seconds_bucket{sim_group="group",stage="load",le="0.01"} 1' in lines
+    assert 'btx_stage_seconds_bucket{sim_group="group",stage="load",le="0.1"} 2' in lines
+    assert 'btx_stage_seconds_bucket{sim_group="group",stage="load",le="+Inf"} 3' in lines
+    assert 'btx_stage_seconds_count{sim_group="group",stage="load"} 3' in lines
+    assert 'btx_worker_peak_rss_bytes{sim_group="group",pid="42"} 1024' in lines
+    assert "# TYPE btx_stage_seconds histogram" in lines
+
+
+def test_server_serves_metrics_until_closed() -> None:
+    # Arrange
+    metrics = RunMetrics()
+    metrics.start_run("group", sims=1)
+    server = MetricsServer(metrics).start()
+    url = f"http://127.0.0.1:{server.port}"
+
+    # Act
+    with urllib.request.urlopen(f"{url}/metrics") as response:
+        content_type = response.headers["Content-Type"]
+        body = response.read().decode()
+    with pytest.raises(urllib.error.HTTPError):
+        urllib.request.urlopen(f"{url}/other")
+    server.close()
+
+    # Assert
+    assert content_type.startswith("text/plain; version=0.0.4")
+    assert 'btx_queue_depth{sim_group="group"} 1' in body
+    with pytest.raises(urllib.error.URLError):
+        urllib.request.urlopen(f"{url}/metrics", timeout=1)
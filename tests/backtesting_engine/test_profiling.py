@@ -0,0 +1,89 @@
+import os
+import pstats
+
+from pathlib import Path
+from typing import Callable
+
+from backtesting_engine.execution.runner import run_sim_safely
+from backtesting_engine.interfaces import ProfileConfig, RunContext, SimItem, SimResult
+from backtesting_engine.profiling import merge_profiles, profile_sim, should_profile
+
+
+def fake_sim(context: RunContext, sim_item: SimItem) -> SimResult:
+    values = [i * i for i in range(10_000)]
+    return SimResult(sim_id=sim_item.sim_id, ticker="TEST", strategy="buy_and_hold", metrics={"Sum": sum(values)})
+
+
+def test_listed_sims_are_always_profiled() -> None:
+    # Arrange
+    profile = ProfileConfig(sim_ids=("007",))
+
+    # Act & Assert
+    assert should_profile(profile, "007")
+    assert not should_profile(profile, "008")
+
+
+def test_sampling_picks_about_the_requested_fraction_of_sims() -> None:
+    # Arrange
+    profile = ProfileConfig(sample_fraction=0.1)
+
+    # Act
+    picked = [sim_id for sim_id in (f"{i:05d}" for i in range(10_000)) if should_profile(profile, sim_id)]
+
+    # Assert
+    assert 800 < len(picked) < 1200
+    assert picked == [sim_id for sim_id in (f"{i:05d}" for i in range(10_000)) if should_profile(profile, sim_id)]
+
+
+def test_profile_sim_writes_a_profile_and_an_allocation_report(
+    tmp_path: Path, make_sim: Callable[..., SimItem]
+) -> None:
+    # Arrange
+    context = RunContext(sim_group="group", output_dir_location=str(tmp_path), profile=ProfileConfig())
+
+    # Act
+    result = profile_sim(fake_sim, context, make_sim("001"))
+
+    # Assert
+    assert result.profile_path == os.path.join(str(tmp_path), "group", "profiles", "001.prof")
+    assert any("fake_sim" in function for _, _, function in pstats.Stats(result.profile_path).stats)
+    report = (tmp_path / "group" / "profiles" / "001.allocations.txt").read_text()
+    assert report.startswith("Peak traced memory:")
+
+
+def test_run_sim_safely_only_profiles_the_picked_sims(tmp_path: Path, make_sim: Callable[..., SimItem]) -> None:
+    # Arrange
+    context = RunContext(sim_group="group", output_dir_location=str(tmp_path), profile=ProfileConfig(sim_ids=("001",)))
+
+    # Act
+    profiled = run_sim_safely(fake_sim, context, make_sim("001"))
+    unprofiled = run_sim_safely(fake_sim, context, make_sim("002"))
+
+    # Assert
+    assert profiled.profile_path is not None
+    assert unprofiled.profile_path is None
+    assert unprofiled.metrics == profiled.metrics
+
+
+def test_merge_profiles_adds_up_the_sims_and_skips_missing_files(
+    tmp_path: Path, make_sim: Callable[..., SimItem]
+) -> None:
+    # Arrange
+    context = RunContext(
+        sim_group="group", output_dir_location=str(tmp_path), profile=ProfileConfig(trace_memory=False)
+    )
+    paths = [profile_sim(fake_sim, context, make_sim(sim_id)).profile_path for sim_id in ("001", "002")]
+    merged_path = str(tmp_path / "group.prof")
+
+    # Act
+    merged = merge_profiles([*paths, str(tmp_path / "remote.prof")], merged_path)
+
+    # Assert
+    assert merged == merged_path
+    calls = {function: stats[1] for (_, _, function), stats in pstats.Stats(merged_path).stats.items()}
+    assert calls["fake_sim"] == 2
+
+
+def test_merge_profiles_without_profiles_returns_none(tmp_path: Path) -> None:
+    # Act & Assert
+    assert merge_profiles([], str(tmp_path / "group.prof")) is None
@@ -0,0 +1,72 @@
+import logging
+
+from typing import Optional
+
+import pytest
+
+from backtesting_engine.interfaces import SimResult
+from backtesting_engine.progress import ProgressReporter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_result(sim_id: str, error: Optional[str] = None, cache_hit: Optional[bool] = None) -> SimResult:
+    return SimResult(sim_id=sim_id, ticker="TEST", strategy="buy_and_hold", error=error, cache_hit=cache_hit)
+
+
+def test_snapshot_reports_rate_eta_failures_and_cache_hit_rate() -> None:
+    # Arrange
+    clock = FakeClock()
+    reporter = ProgressReporter("group", total=10, interval=60.0, clock=clock)
+
+    # Act
+    clock.now = 2.0
+    reporter.update(make_result("001", cache_hit=True))
+    reporter.update(make_result("002", cache_hit=False))
+    reporter.update(make_result("003", error="ValueError()"))
+    clock.now = 3.0
+    reporter.update(make_result("004", cache_hit=True))
+    snapshot = reporter.get_snapshot()
+
+    # Assert
+    assert snapshot["done"] == 4
+    assert snapshot["failed"] == 1
+    assert snapshot["sims_per_second"] == pytest.approx(4 / 3)
+    assert snapshot["eta_seconds"] == pytest.approx(4.5)
+    assert snapshot["cache_hit_rate"] == pytest.approx(2 / 3)
+
+
+def test_snapshot_before_any_result_has_no_eta_or_hit_rate() -> None:
+    # Arrange
+    reporter = ProgressReporter("group", total=10, clock=FakeClock())
+
+    # Act
+    snapshot = reporter.get_snapshot()
+
+    # Assert
+    assert snapshot["eta_seconds"] is None
+    assert snapshot["cache_hit_rate"] is None
+
+
+def test_progress_is_logged_at_most_once_per_interval(caplog: pytest.LogCaptureFixture) -> None:
+    # Arrange
+    clock = FakeClock()
+    reporter = ProgressReporter("group", total=100, interval=10.0, clock=clock)
+    caplog.set_level(logging.INFO, logger="backtesting_engine.progress")
+
+    # Act
+    for i in range(50):
+        clock.now = i * 0.5  # 25 seconds in all
+        reporter.update(make_result(f"{i:03d}"))
+    reporter.finish()
+
+    # Assert
+    assert len(caplog.records) == 3  # at 10s, at 20s and at the end
+    assert caplog.records[-1].done == 50  # type: ignore[attr-defined]
+    assert "Finished 50 sims" in caplog.records[-1].getMessage()
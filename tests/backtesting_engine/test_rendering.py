@@ -0,0 +1,68 @@
+import os
+
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from backtesting_engine.analytics.constants import PLOTLY_JS_FILE
+from backtesting_engine.execution.runner import run_sim
+from backtesting_engine.interfaces import DataConfig, RunContext, SimConfig, SimItem, SimResult, StrategyConfig
+from backtesting_engine.rendering import render_plots, select_sims
+
+
+def make_result(sim_id: str, sharpe: float, error: Optional[str] = None) -> SimResult:
+    return SimResult(
+        sim_id=sim_id,
+        ticker="TEST",
+        strategy="buy_and_hold",
+        metrics={"Sharpe Ratio": sharpe},
+        result_path=f"{sim_id}.pkl",
+        error=error,
+    )
+
+
+def load_fake_data(data_config: DataConfig) -> pd.DataFrame:
+    idx = pd.date_range("2022-01-01", periods=10, freq="D")
+    return pd.DataFrame({"Close": [100.0 + i for i in range(10)]}, index=idx)
+
+
+def test_select_sims_picks_the_listed_sims_and_the_top_n_by_sharpe() -> None:
+    # Arrange
+    results = [
+        make_result("001", 0.5),
+        make_result("002", 2.0),
+        make_result("003", 1.0),
+        make_result("004", 3.0, error="ValueError()"),
+        make_result("005", -1.0),
+    ]
+
+    # Act
+    selected = select_sims(results, top_n=2, sim_ids=["005", "003"])
+
+    # Assert
+    assert [result.sim_id for result in selected] == ["003", "005", "002"]
+
+
+def test_render_plots_writes_pages_that_share_one_plotly_js(tmp_path: Path) -> None:
+    # Arrange
+    context = RunContext(sim_group="group", output_dir_location=str(tmp_path))
+    sim_item = SimItem(
+        sim_id="001",
+        strategy=StrategyConfig(type="buy_and_hold", fields={}),
+        data=DataConfig(ticker="TEST", start_date="2022-01-01", end_date="2022-01-10"),
+        sim_config=SimConfig(initial_cash=1000, slippage=0.0, commission=0.0),
+    )
+    result = run_sim(context, sim_item, load_data=load_fake_data)
+
+    # Act
+    paths = render_plots([result], "group", str(tmp_path), max_workers=1)
+
+    # Assert
+    assert len(paths["001"]) == 3
+    plotly_js_path = tmp_path / "group" / PLOTLY_JS_FILE
+    assert plotly_js_path.exists()
+    for path in paths["001"]:
+        assert os.path.dirname(path) == str(tmp_path / "group" / "test")
+        assert os.path.getsize(path) < os.path.getsize(plotly_js_path) / 10
+        assert f'src="../{PLOTLY_JS_FILE}"' in Path(path).read_text()
@@ -0,0 +1,58 @@
+import pytest
+
+from backtesting_engine.timing import StageTimer, get_stage_percentiles
+
+
+def test_a_stage_entered_twice_accumulates_its_time() -> None:
+    # Arrange
+    timer = StageTimer()
+
+    # Act
+    with timer.stage("signals"):
+        pass
+    first = timer.timings["signals"]
+    with timer.stage("signals"):
+        pass
+
+    # Assert
+    assert list(timer.timings) == ["signals"]
+    assert timer.timings["signals"] >= first
+
+
+def test_a_stage_that_raises_is_still_timed() -> None:
+    # Arrange
+    timer = StageTimer()
+
+    # Act
+    with pytest.raises(ValueError):
+        with timer.stage("load"):
+            raise ValueError("no data")
+
+    # Assert
+    assert "load" in timer.timings
+
+
+def test_a_disabled_timer_records_nothing() -> None:
+    # Arrange
+    timer = StageTimer(enabled=False)
+
+    # Act
+    with timer.stage("load"):
+        pass
+
+    # Assert
+    assert timer.timings == {}
+
+
+def test_stage_percentiles_cover_every_stage_seen() -> None:
+    # Arrange
+    timings = [{"load": float(i), "execution": 1.0} for i in range(101)] + [{"plotting": 3.0}]
+
+    # Act
+    percentiles = get_stage_percentiles(timings)
+
+    # Assert
+    assert list(percentiles.index) == ["load", "execution", "plotting"]
+    assert list(percentiles.columns) == ["Sims", "p50", "p95", "p99"]
+    assert percentiles.loc["load"].tolist() == [101, 50.0, 95.0, 99.0]
+    assert percentiles.at["plotting", "Sims"] == 1
@@ -0,0 +1,88 @@
+from pathlib import Path
+
+from benchmarks.harness import (
+    BenchmarkResult,
+    BenchmarkRun,
+    SkippedCase,
+    compare_runs,
+    get_threshold,
+    load_run,
+    save_run,
+)
+
+
+def make_run(**times: float) -> BenchmarkRun:
+    results = [BenchmarkResult(key=key, name=key, params={}, times=[seconds]) for key, seconds in times.items()]
+    return BenchmarkRun(machine={}, created="2026-01-01T00:00:00", results=results)
+
+
+def test_threshold_is_that_of_the_longest_matching_prefix() -> None:
+    # Arrange
+    overrides = {"queue.": 0.5, "queue.local": 1.0}
+
+    # Act & Assert
+    assert get_threshold("queue.local[workers=2]", 0.25, overrides) == 1.0
+    assert get_threshold("queue.ipyparallel[workers=2]", 0.25, overrides) == 0.5
+    assert get_threshold("strategy.sma_crossover[bars=1000]", 0.25, overrides) == 0.25
+
+
+def test_cases_slower_than_their_threshold_are_regressions() -> None:
+    # Arrange
+    baseline = make_run(engine=1.0, metrics=1.0)
+    current = make_run(engine=1.3, metrics=1.2)
+
+    # Act
+    regressions = compare_runs(current, baseline, threshold=0.25)
+
+    # Assert
+    assert [(regression.key, regression.ratio) for regression in regressions] == [("engine", 1.3)]
+
+
+def test_override_raises_the_threshold_of_its_cases() -> None:
+    # Arrange
+    baseline = make_run(**{"queue.local": 1.0, "engine": 1.0})
+    current = make_run(**{"queue.local": 1.4, "engine": 1.4})
+
+    # Act
+    regressions = compare_runs(current, baseline, threshold=0.25, overrides={"queue.": 0.5})
+
+    # Assert
+    assert [regression.key for regression in regressions] == ["engine"]
+
+
+def test_slowdowns_under_the_minimum_are_not_regressions() -> None:
+    # Arrange
+    baseline = make_run(engine=0.001)
+    current = make_run(engine=0.0015)
+
+    # Act
+    regressions = compare_runs(current, baseline, threshold=0.25, min_seconds=0.001)
+
+    # Assert
+    assert regressions == []
+
+
+def test_cases_missing_from_either_run_are_not_compared() -> None:
+    # Arrange
+    baseline = make_run(engine=1.0, removed=1.0)
+    current = make_run(engine=1.0, added=10.0)
+
+    # Act
+    regressions = compare_runs(current, baseline, threshold=0.25)
+
+    # Assert
+    assert regressions == []
+
+
+def test_skipped_cases_are_saved_and_loaded_with_the_run(tmp_path: Path) -> None:
+    # Arrange
+    run = make_run(engine=1.0)
+    run.skipped.append(SkippedCase("engine[bars=10000000]", "over ENGINE_MAX_BARS (100,000)"))
+    path = str(tmp_path / "run.json")
+
+    # Act
+    save_run(run, path)
+    loaded = load_run(path)
+
+    # Assert
+    assert loaded.skipped == run.skipped
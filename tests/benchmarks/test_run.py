@@ -0,0 +1,30 @@
+import argparse
+
+import pytest
+
+from benchmarks.run import parse_args, parse_threshold_overrides
+
+
+def test_threshold_overrides_are_parsed_by_prefix() -> None:
+    # Act
+    overrides = parse_threshold_overrides(["queue.=0.5", "strategy.=1"])
+
+    # Assert
+    assert overrides == {"queue.": 0.5, "strategy.": 1.0}
+
+
+@pytest.mark.parametrize("value", ["queue.", "queue.=", "=0.5", "queue.=fast", "queue.=-0.5"])
+def test_malformed_threshold_overrides_raise(value: str) -> None:
+    # Act & Assert
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_threshold_overrides([value])
+
+
+def test_malformed_threshold_override_fails_before_the_suite_runs(capsys: pytest.CaptureFixture[str]) -> None:
+    # Act
+    with pytest.raises(SystemExit) as exit_info:
+        parse_args(["--threshold-for", "queue.=fast"])
+
+    # Assert
+    assert exit_info.value.code == 2
+    assert "Expected a number as the threshold of 'queue.'" in capsys.readouterr().err
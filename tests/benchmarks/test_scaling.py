@@ -0,0 +1,59 @@
+import pytest
+
+from benchmarks.scaling import COMPUTE, LOAD, OUTPUT, QUEUE, SHARES, STARTUP, STRONG, WEAK, ScalingPoint, set_speedups
+
+
+def make_point(mode: str, workers: int, wall: float) -> ScalingPoint:
+    return ScalingPoint(mode=mode, workers=workers, sims=8, wall=wall, startup=0.0, load=0.0, compute=0.0, output=0.0)
+
+
+def test_shares_split_the_worker_time_and_leave_the_rest_to_the_queue() -> None:
+    # Arrange
+    point = ScalingPoint(mode=STRONG, workers=2, sims=8, wall=10.0, startup=1.0, load=4.0, compute=8.0, output=2.0)
+
+    # Act
+    shares = point.get_shares()
+
+    # Assert
+    assert list(shares) == list(SHARES)
+    assert shares[STARTUP] == pytest.approx(0.1)  # both workers wait for the startup
+    assert shares[LOAD] == pytest.approx(0.2)
+    assert shares[COMPUTE] == pytest.approx(0.4)
+    assert shares[OUTPUT] == pytest.approx(0.1)
+    assert shares[QUEUE] == pytest.approx(0.2)
+    assert sum(shares.values()) == pytest.approx(1.0)
+
+
+def test_queue_share_is_never_negative() -> None:
+    # Arrange
+    point = ScalingPoint(mode=STRONG, workers=1, sims=8, wall=1.0, startup=0.0, load=0.5, compute=0.6, output=0.0)
+
+    # Act
+    shares = point.get_shares()
+
+    # Assert
+    assert shares[QUEUE] == 0.0
+
+
+def test_strong_scaling_speedup_is_relative_to_the_fewest_workers() -> None:
+    # Arrange
+    points = [make_point(STRONG, 4, 3.0), make_point(STRONG, 2, 4.0), make_point(STRONG, 8, 2.0)]
+
+    # Act
+    set_speedups(points)
+
+    # Assert
+    assert [point.speedup for point in points] == pytest.approx([8 / 3, 2.0, 4.0])
+    assert [point.efficiency for point in points] == pytest.approx([2 / 3, 1.0, 0.5])
+
+
+def test_weak_scaling_efficiency_is_the_base_time_over_the_time() -> None:
+    # Arrange
+    points = [make_point(WEAK, 1, 2.0), make_point(WEAK, 4, 2.5)]
+
+    # Act
+    set_speedups(points)
+
+    # Assert
+    assert [point.efficiency for point in points] == pytest.approx([1.0, 0.8])
+    assert [point.speedup for point in points] == pytest.approx([1.0, 3.2])
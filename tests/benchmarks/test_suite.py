@@ -0,0 +1,23 @@
+from pathlib import Path
+
+from benchmarks.constants import CACHE_MAX_BARS, ENGINE_MAX_BARS
+from benchmarks.suite import cache_cases, engine_cases
+
+
+def test_engine_case_past_its_size_limit_is_skipped_not_dropped() -> None:
+    # Act
+    within = list(engine_cases(ENGINE_MAX_BARS))
+    beyond = list(engine_cases(ENGINE_MAX_BARS * 10))
+
+    # Assert
+    assert [case.skip_reason for case in within] == [None]
+    assert [case.skip_reason for case in beyond] == [f"over ENGINE_MAX_BARS ({ENGINE_MAX_BARS:,})"]
+
+
+def test_cache_cases_past_their_size_limit_are_skipped_not_dropped(tmp_path: Path) -> None:
+    # Act
+    cases = list(cache_cases(CACHE_MAX_BARS + 1, str(tmp_path)))
+
+    # Assert
+    assert [case.name for case in cases] == ["cache.set", "cache.load", "cache.memory_get"]
+    assert {case.skip_reason for case in cases} == {f"over CACHE_MAX_BARS ({CACHE_MAX_BARS:,})"}